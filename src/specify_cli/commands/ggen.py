@@ -6,6 +6,7 @@ CLI command handler for ggen (Graph Generator) operations.
 
 This module provides Typer command interface for RDF-first code generation:
 - sync: Transform RDF specifications to code/markdown via ggen.toml configuration
+- verify: Check generated artifacts against their μ₅ receipts
 
 All transformations implement the constitutional equation: spec.md = μ(feature.ttl)
 
@@ -21,6 +22,7 @@ Examples
     $ specify ggen sync
     $ specify ggen sync --watch
     $ specify ggen sync --verbose
+    $ specify ggen verify --json
 
 See Also
 --------
@@ -29,9 +31,9 @@ See Also
 
 Notes
 -----
-All generation happens through ggen.toml configuration. The only supported
-subcommand is 'sync', which reads configuration from ggen.toml and executes
-the five-stage transformation pipeline.
+All generation happens through ggen.toml configuration. 'sync' reads
+configuration from ggen.toml and executes the five-stage transformation
+pipeline; 'verify' only reads receipts and the files they name.
 """
 
 from __future__ import annotations
@@ -60,6 +62,7 @@ from specify_cli.runtime.ggen import (
     is_ggen_available,
     sync_specs,
 )
+from specify_cli.runtime.receipt_verify import verify_tree
 
 console = Console()
 
@@ -462,3 +465,69 @@ def sync(  # noqa: PLR0912, PLR0915 - CLI command with user-facing output format
         # Release lock
         if lock:
             lock.release()
+
+
+@app.command("verify")
+@instrument_command("ggen.verify", track_args=True)
+def verify(
+    root: str = typer.Argument(
+        ".",
+        help="Directory to search for *.receipt.json files.",
+    ),
+    db: str = typer.Option(
+        ".ggen/hashes.db",
+        "--db",
+        help="Hash database path relative to ROOT (skips re-hashing unchanged files).",
+    ),
+    no_db: bool = typer.Option(
+        False,
+        "--no-db",
+        help="Hash every file instead of using the hash database.",
+    ),
+    workers: int | None = typer.Option(
+        None,
+        "--workers",
+        help="Hashing threads (default: CPU count).",
+    ),
+    json_output: bool = typer.Option(
+        False,
+        "--json",
+        help="Output results as JSON.",
+    ),
+) -> None:
+    """Verify every μ₅ receipt below ROOT against the current files.
+
+    Exits with code 1 if any input or output drifted from its receipt,
+    is missing, or a receipt cannot be read.
+
+    Examples:
+        specify ggen verify
+        specify ggen verify services/ --json
+        specify ggen verify --no-db --workers 16
+    """
+    report = verify_tree(root, db_path=None if no_db else db, max_workers=workers)
+    summary = report.summary()
+
+    if json_output:
+        dump_json(report.to_dict())
+    else:
+        console.print()
+        for check in report.failures:
+            detail = check.error or ", ".join(check.changed)
+            console.print(
+                f"  [red]✗ {check.status}[/red] {check.receipt_path} [dim]({detail})[/dim]"
+            )
+        console.print(
+            f"[cyan]Receipts:[/cyan] {summary['receipts']}  "
+            f"[green]ok {summary['ok']}[/green]  "
+            f"[red]drift {summary['drift']}  missing {summary['missing']}  "
+            f"invalid {summary['invalid']}[/red]"
+        )
+        console.print(
+            f"[dim]Hashed {summary['files_hashed']} files, "
+            f"{summary['cache_hits']} from the hash database, "
+            f"in {summary['duration_ms'] / 1000:.2f}s[/dim]"
+        )
+
+    if not report.success:
+        raise typer.Exit(1)
@@ -9,7 +9,8 @@ This module implements a sophisticated caching system that provides:
 
 Key Features
 -----------
-* **Multi-Level Cache**: L1 (memory LRU), L2 (disk pickle), L3 (remote-aware)
+* **Multi-Level Cache**: L1 (memory LRU), L1.5 (shared memory), L2 (disk codecs),
+  L3 (remote-aware)
 * **Smart Invalidation**: mtime-based, dependency tracking, content hashing
 * **Cache Statistics**: Hit rates, timings, size monitoring
 * **Thread Safety**: Lock-based synchronization for concurrent access
@@ -26,8 +27,14 @@ Cache Levels
     - Lost on process restart
     - Best for: Tool checks, version lookups, small computations
 
+**L1.5 Cache (Shared Memory, optional)**:
+    - mmap arena on /dev/shm shared by sibling processes on one host
+    - Holds bytes and numpy arrays without pickling round-trips
+    - Lock-free reads, flock-protected writes, LRU size cap
+    - Best for: parallel ggen sync workers and test runners
+
 **L2 Cache (Disk)**:
-    - pickle-based persistence
+    - Per-type codecs: .npy (memory-mapped on read), Parquet, compressed pickle
     - Survives process restarts
     - ~10-50ms access time
     - Best for: ggen transformations, RDF parsing, SPARQL results
@@ -105,7 +112,9 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, TypeVar
 
+from .cache_codecs import codec_extensions, get_codec, select_codec
 from .config import get_cache_dir
+from .shared_cache import DEFAULT_SHARED_MAX_SIZE_MB, SharedMemoryTier, is_shareable
 from .telemetry import metric_counter, metric_histogram, span
 
 if TYPE_CHECKING:
@@ -220,6 +229,8 @@ class CacheStats:
     ----------
     l1_hits : int
         L1 (memory) cache hits.
+    shared_hits : int
+        L1.5 (shared memory) cache hits.
     l2_hits : int
         L2 (disk) cache hits.
     misses : int
@@ -230,12 +241,18 @@ class CacheStats:
         Total cache requests.
     l1_size : int
         Current L1 cache size.
+    shared_size : int
+        Current L1.5 arena entry count (all processes).
+    shared_bytes : int
+        Current L1.5 arena usage in bytes (all processes).
     l2_size : int
         Current L2 cache size.
     l2_disk_bytes : int
         L2 disk usage in bytes.
     avg_l1_time_ms : float
         Average L1 access time in milliseconds.
+    avg_shared_time_ms : float
+        Average L1.5 (shared memory) access time in milliseconds.
     avg_l2_time_ms : float
         Average L2 access time in milliseconds.
     avg_compute_time_ms : float
@@ -245,14 +262,18 @@ class CacheStats:
     """
 
     l1_hits: int = 0
+    shared_hits: int = 0
     l2_hits: int = 0
     misses: int = 0
     invalidations: int = 0
     total_requests: int = 0
     l1_size: int = 0
+    shared_size: int = 0
+    shared_bytes: int = 0
     l2_size: int = 0
     l2_disk_bytes: int = 0
     avg_l1_time_ms: float = 0.0
+    avg_shared_time_ms: float = 0.0
     avg_l2_time_ms: float = 0.0
     avg_compute_time_ms: float = 0.0
 
@@ -261,7 +282,7 @@ class CacheStats:
         """Calculate overall hit rate."""
         if self.total_requests == 0:
             return 0.0
-        hits = self.l1_hits + self.l2_hits
+        hits = self.l1_hits + self.shared_hits + self.l2_hits
         return hits / self.total_requests
 
     @property
@@ -271,6 +292,13 @@ class CacheStats:
             return 0.0
         return self.l1_hits / self.total_requests
 
+    @property
+    def shared_hit_rate(self) -> float:
+        """Calculate L1.5 (shared memory) hit rate."""
+        if self.total_requests == 0:
+            return 0.0
+        return self.shared_hits / self.total_requests
+
     @property
     def l2_hit_rate(self) -> float:
         """Calculate L2 hit rate."""
@@ -282,17 +310,22 @@ class CacheStats:
         """Convert to dictionary for reporting."""
         return {
             "l1_hits": self.l1_hits,
+            "shared_hits": self.shared_hits,
             "l2_hits": self.l2_hits,
             "misses": self.misses,
             "invalidations": self.invalidations,
             "total_requests": self.total_requests,
             "l1_size": self.l1_size,
+            "shared_size": self.shared_size,
+            "shared_bytes": self.shared_bytes,
             "l2_size": self.l2_size,
             "l2_disk_bytes": self.l2_disk_bytes,
             "hit_rate": self.hit_rate,
             "l1_hit_rate": self.l1_hit_rate,
+            "shared_hit_rate": self.shared_hit_rate,
             "l2_hit_rate": self.l2_hit_rate,
             "avg_l1_time_ms": self.avg_l1_time_ms,
+            "avg_shared_time_ms": self.avg_shared_time_ms,
             "avg_l2_time_ms": self.avg_l2_time_ms,
             "avg_compute_time_ms": self.avg_compute_time_ms,
         }
@@ -304,7 +337,8 @@ class SmartCache:
 
     This class implements a sophisticated caching system with three levels:
     - L1: In-memory LRU cache (fastest, volatile)
-    - L2: Disk-based pickle cache (persistent, slower)
+    - L1.5: Optional shared-memory arena for sibling processes (bytes, arrays)
+    - L2: Disk cache with per-type codecs (persistent, slower)
     - L3: Remote cache awareness (future expansion)
 
     Parameters
@@ -317,6 +351,15 @@ class SmartCache:
         Directory for L2 cache. Default uses get_cache_dir().
     enable_stats : bool, optional
         Enable statistics tracking. Default is True.
+    enable_shared : bool, optional
+        Enable the cross-process L1.5 shared-memory tier. Default is False.
+    shared_max_size_mb : int, optional
+        Size cap of the L1.5 arena in MB. Default is 256.
+    shared_dir : Path | None, optional
+        Directory for the L1.5 arena. Default is a /dev/shm directory
+        namespaced by ``cache_dir``, so caches sharing a cache_dir share it.
+    l2_compress : bool, optional
+        Compress generic L2 pickles with zstd/lz4/zlib. Default is True.
 
     Examples
     --------
@@ -334,12 +377,18 @@ class SmartCache:
         l2_max_size_mb: int = DEFAULT_L2_MAX_SIZE_MB,
         cache_dir: Path | None = None,
         enable_stats: bool = True,
+        *,
+        enable_shared: bool = False,
+        shared_max_size_mb: int = DEFAULT_SHARED_MAX_SIZE_MB,
+        shared_dir: Path | None = None,
+        l2_compress: bool = True,
     ) -> None:
         """Initialize SmartCache."""
         self.l1_size = l1_size
         self.l2_max_size_mb = l2_max_size_mb
         self.cache_dir = cache_dir or get_cache_dir() / "advanced"
         self.enable_stats = enable_stats
+        self.l2_compress = l2_compress
 
         # Ensure cache directory exists
         self.cache_dir.mkdir(parents=True, exist_ok=True)
@@ -348,17 +397,31 @@ class SmartCache:
         self._l1_cache: OrderedDict[str, tuple[Any, CacheKey]] = OrderedDict()
         self._l1_lock = threading.Lock()
 
-        # L2 cache: Disk-based pickle storage
+        # L2 cache: Disk storage, codec recorded in CacheKey.metadata["codec"]
         self._l2_index: dict[str, CacheKey] = {}
         self._l2_lock = threading.Lock()
         self._load_l2_index()
 
+        # L1.5 cache: cross-process shared-memory arena (optional)
+        self._shared: SharedMemoryTier | None = None
+        if enable_shared:
+            namespace = hashlib.sha256(
+                str(self.cache_dir.resolve()).encode(), usedforsecurity=False
+            ).hexdigest()[:12]
+            tier = SharedMemoryTier(
+                namespace=namespace,
+                max_size_mb=shared_max_size_mb,
+                shared_dir=shared_dir,
+            )
+            self._shared = tier if tier.available else None
+
         # Statistics
         self._stats = CacheStats()
         self._stats_lock = threading.Lock()
 
         # Timing accumulators for averages
         self._l1_times: list[float] = []
+        self._shared_times: list[float] = []
         self._l2_times: list[float] = []
         self._compute_times: list[float] = []
 
@@ -373,8 +436,9 @@ class SmartCache:
         """
         Get cached result or compute and cache it.
 
-        This is the primary interface for the cache. It checks L1, then L2,
-        and if both miss, calls compute_fn and caches the result.
+        This is the primary interface for the cache. It checks L1, then the
+        shared L1.5 tier (if enabled), then L2, and if all miss, calls
+        compute_fn and caches the result.
 
         Parameters
         ----------
@@ -415,6 +479,21 @@ class SmartCache:
                 # Invalid - remove from L1
                 self._remove_from_l1(key)
 
+            # Try L1.5 shared-memory cache
+            shared_start = time.time()
+            result = self._get_from_shared(key)
+            shared_duration = (time.time() - shared_start) * 1000
+
+            if result is not None:
+                value, cache_key = result
+                if cache_key.is_valid():
+                    # Promote to L1
+                    self._set_in_l1(key, value, cache_key)
+                    self._record_shared_hit(shared_duration)
+                    return value
+                # Invalid - remove from shared tier
+                self._remove_from_shared(key)
+
             # Try L2 cache
             l2_start = time.time()
             result = self._get_from_l2(key)
@@ -423,8 +502,9 @@ class SmartCache:
             if result is not None:
                 value, cache_key = result
                 if cache_key.is_valid():
-                    # Promote to L1
+                    # Promote to L1 and publish to siblings
                     self._set_in_l1(key, value, cache_key)
+                    self._set_in_shared(key, value, cache_key)
                     self._record_l2_hit(l2_duration)
                     metric_counter("cache.advanced.l2.hit")(1)
                     return value
@@ -446,8 +526,9 @@ class SmartCache:
                 metadata=metadata,
             )
 
-            # Store in both L1 and L2
+            # Store in L1, L1.5 (if shareable) and L2
             self._set_in_l1(key, computed_value, cache_key)
+            self._set_in_shared(key, computed_value, cache_key)
             self._set_in_l2(key, computed_value, cache_key)
 
             self._record_miss(compute_duration)
@@ -467,6 +548,7 @@ class SmartCache:
         """
         with span("cache.invalidate", cache_key=key):
             self._remove_from_l1(key)
+            self._remove_from_shared(key)
             self._remove_from_l2(key)
 
             with self._stats_lock:
@@ -498,6 +580,10 @@ class SmartCache:
                     del self._l1_cache[key]
                     count += 1
 
+            # Invalidate from L1.5 (entries are also counted in L1/L2)
+            if self._shared is not None:
+                self._shared.remove_matching(pattern)
+
             # Invalidate from L2
             with self._l2_lock:
                 keys_to_remove = [k for k in self._l2_index if pattern in k]
@@ -518,9 +604,13 @@ class SmartCache:
             with self._l1_lock:
                 self._l1_cache.clear()
 
+            # Clear L1.5
+            if self._shared is not None:
+                self._shared.clear()
+
             # Clear L2
             with self._l2_lock:
-                for cache_file in self.cache_dir.glob("*.pkl"):
+                for cache_file in self._l2_files():
                     try:
                         cache_file.unlink()
                     except Exception:
@@ -532,6 +622,7 @@ class SmartCache:
             with self._stats_lock:
                 self._stats = CacheStats()
                 self._l1_times.clear()
+                self._shared_times.clear()
                 self._l2_times.clear()
                 self._compute_times.clear()
 
@@ -551,14 +642,36 @@ class SmartCache:
             self._stats.l1_size = len(self._l1_cache)
             self._stats.l2_size = len(self._l2_index)
 
+            # L1.5 arena usage is shared by every process on the host
+            if self._shared is not None:
+                shared_stats = self._shared.get_stats()
+                self._stats.shared_size = shared_stats.entries
+                self._stats.shared_bytes = shared_stats.bytes_used
+
             # Calculate L2 disk usage
-            total_bytes = sum(
-                f.stat().st_size for f in self.cache_dir.glob("*.pkl") if f.is_file()
-            )
+            total_bytes = sum(f.stat().st_size for f in self._l2_files())
             self._stats.l2_disk_bytes = total_bytes
 
             return self._stats
 
+    def get_l2_entry(self, key: str) -> CacheKey | None:
+        """
+        Get the L2 index entry for a key.
+
+        Parameters
+        ----------
+        key : str
+            Cache key to look up.
+
+        Returns
+        -------
+        CacheKey | None
+            Indexed entry (including its ``metadata["codec"]``), or None if
+            the key is not on disk.
+        """
+        with self._l2_lock:
+            return self._l2_index.get(key)
+
     # -------------------------------------------------------------------------
     # L1 Cache (Memory) Operations
     # -------------------------------------------------------------------------
@@ -587,6 +700,31 @@ class SmartCache:
         with self._l1_lock:
             self._l1_cache.pop(key, None)
 
+    # -------------------------------------------------------------------------
+    # L1.5 Cache (Shared Memory) Operations
+    # -------------------------------------------------------------------------
+
+    def _get_from_shared(self, key: str) -> tuple[Any, CacheKey] | None:
+        """Get value from the L1.5 shared-memory cache."""
+        if self._shared is None:
+            return None
+        result = self._shared.get(key)
+        if result is None:
+            return None
+        value, cache_key_data = result
+        return (value, CacheKey.from_dict(cache_key_data))
+
+    def _set_in_shared(self, key: str, value: Any, cache_key: CacheKey) -> None:
+        """Publish value to the L1.5 cache if it is shareable."""
+        if self._shared is None or not is_shareable(value):
+            return
+        self._shared.put(key, value, cache_key.to_dict())
+
+    def _remove_from_shared(self, key: str) -> None:
+        """Remove key from the L1.5 cache."""
+        if self._shared is not None:
+            self._shared.remove(key)
+
     # -------------------------------------------------------------------------
     # L2 Cache (Disk) Operations
     # -------------------------------------------------------------------------
@@ -598,7 +736,7 @@ class SmartCache:
                 return None
 
             cache_key = self._l2_index[key]
-            cache_file = self._get_l2_path(key)
+            cache_file = self._get_l2_path(key, cache_key)
 
             if not cache_file.exists():
                 # Index is stale
@@ -606,8 +744,8 @@ class SmartCache:
                 return None
 
             try:
-                with open(cache_file, "rb") as f:
-                    value = pickle.load(f)
+                codec = get_codec(cache_key.metadata.get("codec"))
+                value = codec.load(cache_file)
                 return (value, cache_key)
             except Exception:
                 # Corrupted cache file
@@ -617,12 +755,17 @@ class SmartCache:
     def _set_in_l2(self, key: str, value: Any, cache_key: CacheKey) -> None:
         """Set value in L2 cache."""
         with self._l2_lock:
-            cache_file = self._get_l2_path(key)
+            codec = select_codec(value, compress=self.l2_compress)
+
+            # Drop a previous entry for this key written with another codec
+            if key in self._l2_index:
+                self._remove_from_l2_unsafe(key)
+
+            cache_key.metadata = {**cache_key.metadata, "codec": codec.name}
+            cache_file = self._get_l2_path(key, cache_key)
 
             try:
-                # Write pickle file
-                with open(cache_file, "wb") as f:
-                    pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+                codec.dump(value, cache_file)
 
                 # Update index
                 self._l2_index[key] = cache_key
@@ -645,16 +788,23 @@ class SmartCache:
 
     def _remove_from_l2_unsafe(self, key: str) -> None:
         """Remove key from L2 cache (not thread-safe, must hold lock)."""
-        if key in self._l2_index:
-            del self._l2_index[key]
+        cache_key = self._l2_index.pop(key, None)
 
-        cache_file = self._get_l2_path(key)
+        cache_file = self._get_l2_path(key, cache_key)
         if cache_file.exists():
             cache_file.unlink()
 
-    def _get_l2_path(self, key: str) -> Path:
-        """Get L2 cache file path for key."""
-        return self.cache_dir / f"{key}.pkl"
+    def _get_l2_path(self, key: str, cache_key: CacheKey | None = None) -> Path:
+        """Get L2 cache file path for key, using the codec recorded in its metadata."""
+        codec_name = cache_key.metadata.get("codec") if cache_key is not None else None
+        return self.cache_dir / f"{key}{get_codec(codec_name).extension}"
+
+    def _l2_files(self) -> list[Path]:
+        """List L2 entry files written by any codec."""
+        extensions = tuple(codec_extensions())
+        return [
+            f for f in self.cache_dir.iterdir() if f.name.endswith(extensions) and f.is_file()
+        ]
 
     def _load_l2_index(self) -> None:
         """Load L2 cache index from disk."""
@@ -685,9 +835,7 @@ class SmartCache:
     def _maybe_prune_l2(self) -> None:
         """Prune L2 cache if it exceeds maximum size."""
         # Calculate total size
-        total_bytes = sum(
-            f.stat().st_size for f in self.cache_dir.glob("*.pkl") if f.is_file()
-        )
+        total_bytes = sum(f.stat().st_size for f in self._l2_files())
 
         max_bytes = self.l2_max_size_mb * 1024 * 1024
 
@@ -696,9 +844,9 @@ class SmartCache:
 
         # Sort by access time (oldest first)
         entries = [
-            (key, self._get_l2_path(key).stat().st_atime, cache_key)
+            (key, self._get_l2_path(key, cache_key).stat().st_atime, cache_key)
             for key, cache_key in self._l2_index.items()
-            if self._get_l2_path(key).exists()
+            if self._get_l2_path(key, cache_key).exists()
         ]
         entries.sort(key=lambda x: x[1])
 
@@ -706,11 +854,11 @@ class SmartCache:
         bytes_to_remove = total_bytes - max_bytes
         bytes_removed = 0
 
-        for key, _atime, _cache_key in entries:
+        for key, _atime, cache_key in entries:
             if bytes_removed >= bytes_to_remove:
                 break
 
-            cache_file = self._get_l2_path(key)
+            cache_file = self._get_l2_path(key, cache_key)
             if cache_file.exists():
                 bytes_removed += cache_file.stat().st_size
                 self._remove_from_l2_unsafe(key)
@@ -730,6 +878,15 @@ class SmartCache:
                 self._l1_times.pop(0)
             self._stats.avg_l1_time_ms = sum(self._l1_times) / len(self._l1_times)
 
+    def _record_shared_hit(self, duration_ms: float) -> None:
+        """Record L1.5 cache hit."""
+        with self._stats_lock:
+            self._stats.shared_hits += 1
+            self._shared_times.append(duration_ms)
+            if len(self._shared_times) > 100:
+                self._shared_times.pop(0)
+            self._stats.avg_shared_time_ms = sum(self._shared_times) / len(self._shared_times)
+
     def _record_l2_hit(self, duration_ms: float) -> None:
         """Record L2 cache hit."""
         with self._stats_lock:
@@ -0,0 +1,354 @@
+"""
+specify_cli.core.cache_codecs - Serialization Codecs for the L2 Cache
+=====================================================================
+
+Pluggable per-type serialization for the SmartCache L2 (disk) tier.
+
+Pickling every value with ``pickle.HIGHEST_PROTOCOL`` into one file and
+reading it back whole is wasteful for the values the ggen pipeline caches
+most: large numpy arrays and pandas DataFrames. This module selects a codec
+per value type and records its name in ``CacheKey.metadata["codec"]``:
+
+Codecs
+------
+* **npy**: Raw ``.npy`` files for numpy arrays. Arrays above
+  ``mmap_threshold`` are memory-mapped on read (no copy, no unpickling).
+* **parquet**: Arrow/Parquet for pandas DataFrames (requires ``pyarrow``).
+* **pickle+zstd / pickle+lz4 / pickle+zlib**: Compressed pickle for everything
+  else, using the fastest installed compressor (``zstandard``, then ``lz4``,
+  then stdlib ``zlib``).
+* **pickle**: Uncompressed pickle for small values and legacy entries.
+
+Optional Dependencies
+--------------------
+Install the ``cache`` dependency group for the faster codecs::
+
+    uv sync --group cache
+
+Examples
+--------
+    >>> from specify_cli.core.cache_codecs import select_codec, get_codec
+    >>> codec = select_codec(numpy.zeros((1000, 1000)))
+    >>> codec.name
+    'npy'
+    >>> codec.dump(array, path)
+    >>> get_codec("npy").load(path)  # memory-mapped
+
+See Also
+--------
+- :mod:`specify_cli.core.advanced_cache` : Multi-level SmartCache
+"""
+
+from __future__ import annotations
+
+import pickle
+import zlib
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any, ClassVar
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:  # pragma: no cover - numpy is a core dependency
+    NUMPY_AVAILABLE = False
+
+try:
+    import pandas as pd  # type: ignore[import-untyped]
+
+    PANDAS_AVAILABLE = True
+except ImportError:
+    PANDAS_AVAILABLE = False
+
+try:
+    import pyarrow  # noqa: F401
+
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+try:
+    import lz4.frame
+
+    LZ4_AVAILABLE = True
+except ImportError:
+    LZ4_AVAILABLE = False
+
+__all__ = [
+    "CacheCodec",
+    "CompressedPickleCodec",
+    "NumpyCodec",
+    "ParquetCodec",
+    "PickleCodec",
+    "codec_extensions",
+    "get_codec",
+    "select_codec",
+]
+
+# Pickles smaller than this are stored uncompressed (compression overhead wins)
+DEFAULT_COMPRESS_THRESHOLD = 4096
+
+# Arrays at least this large are memory-mapped on read
+DEFAULT_MMAP_THRESHOLD = 1024 * 1024
+
+
+class CacheCodec(ABC):
+    """
+    Base class for L2 cache codecs.
+
+    Attributes
+    ----------
+    name : str
+        Codec name recorded in ``CacheKey.metadata["codec"]``.
+    extension : str
+        File extension for entries written by this codec.
+    """
+
+    name = ""
+    extension = ""
+
+    @abstractmethod
+    def can_encode(self, value: Any) -> bool:
+        """Check whether this codec handles the value."""
+
+    @abstractmethod
+    def dump(self, value: Any, path: Path) -> None:
+        """Write the value to ``path``."""
+
+    @abstractmethod
+    def load(self, path: Path) -> Any:
+        """Read a value previously written to ``path``."""
+
+
+class PickleCodec(CacheCodec):
+    """Uncompressed pickle (the original L2 format)."""
+
+    name = "pickle"
+    extension = ".pkl"
+
+    def can_encode(self, value: Any) -> bool:  # noqa: ARG002
+        """Pickle accepts any picklable value."""
+        return True
+
+    def dump(self, value: Any, path: Path) -> None:
+        """Pickle the value with the highest protocol."""
+        with path.open("wb") as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def load(self, path: Path) -> Any:
+        """Unpickle the value."""
+        with path.open("rb") as f:
+            return pickle.load(f)
+
+
+class CompressedPickleCodec(CacheCodec):
+    """
+    Pickle compressed with zstd, lz4 or zlib.
+
+    Parameters
+    ----------
+    algorithm : str
+        One of ``"zstd"``, ``"lz4"`` or ``"zlib"``.
+    """
+
+    _EXTENSIONS: ClassVar[dict[str, str]] = {
+        "zstd": ".pkl.zst",
+        "lz4": ".pkl.lz4",
+        "zlib": ".pkl.zz",
+    }
+
+    def __init__(self, algorithm: str) -> None:
+        """Initialize the codec for a compression algorithm."""
+        if algorithm not in self._EXTENSIONS:
+            raise ValueError(f"Unknown compression algorithm: {algorithm}")
+        self.algorithm = algorithm
+        self.name = f"pickle+{algorithm}"
+        self.extension = self._EXTENSIONS[algorithm]
+
+    @property
+    def available(self) -> bool:
+        """Whether the compressor library is installed."""
+        if self.algorithm == "zstd":
+            return ZSTD_AVAILABLE
+        if self.algorithm == "lz4":
+            return LZ4_AVAILABLE
+        return True
+
+    def can_encode(self, value: Any) -> bool:  # noqa: ARG002
+        """Compressed pickle accepts any picklable value."""
+        return self.available
+
+    def dump(self, value: Any, path: Path) -> None:
+        """Pickle and compress the value."""
+        path.write_bytes(self.compress(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)))
+
+    def load(self, path: Path) -> Any:
+        """Decompress and unpickle the value."""
+        return pickle.loads(self.decompress(path.read_bytes()))
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress raw pickle bytes."""
+        if self.algorithm == "zstd":
+            return zstandard.ZstdCompressor(level=3).compress(data)
+        if self.algorithm == "lz4":
+            return lz4.frame.compress(data)
+        return zlib.compress(data, 1)
+
+    def decompress(self, data: bytes) -> bytes:
+        """Decompress raw pickle bytes."""
+        if self.algorithm == "zstd":
+            return zstandard.ZstdDecompressor().decompress(data)
+        if self.algorithm == "lz4":
+            return lz4.frame.decompress(data)
+        return zlib.decompress(data)
+
+
+class NumpyCodec(CacheCodec):
+    """
+    Raw ``.npy`` storage for numpy arrays.
+
+    Parameters
+    ----------
+    mmap_threshold : int, optional
+        Arrays with at least this many bytes are memory-mapped read-only on
+        load instead of being read into memory. Default is 1 MiB.
+    """
+
+    name = "npy"
+    extension = ".npy"
+
+    def __init__(self, mmap_threshold: int = DEFAULT_MMAP_THRESHOLD) -> None:
+        """Initialize the codec."""
+        self.mmap_threshold = mmap_threshold
+
+    def can_encode(self, value: Any) -> bool:
+        """Handle numpy arrays without object dtype."""
+        return NUMPY_AVAILABLE and isinstance(value, np.ndarray) and not value.dtype.hasobject
+
+    def dump(self, value: Any, path: Path) -> None:
+        """Save the array without pickling."""
+        with path.open("wb") as f:
+            np.save(f, value, allow_pickle=False)
+
+    def load(self, path: Path) -> Any:
+        """Load the array, memory-mapping it when large."""
+        if path.stat().st_size >= self.mmap_threshold:
+            return np.load(path, mmap_mode="r", allow_pickle=False)
+        return np.load(path, allow_pickle=False)
+
+
+class ParquetCodec(CacheCodec):
+    """Arrow/Parquet storage for pandas DataFrames."""
+
+    name = "parquet"
+    extension = ".parquet"
+
+    def can_encode(self, value: Any) -> bool:
+        """Handle DataFrames with string column names when pyarrow is installed."""
+        return (
+            PANDAS_AVAILABLE
+            and PYARROW_AVAILABLE
+            and isinstance(value, pd.DataFrame)
+            and all(isinstance(col, str) for col in value.columns)
+        )
+
+    def dump(self, value: Any, path: Path) -> None:
+        """Write the DataFrame as Parquet."""
+        value.to_parquet(path, engine="pyarrow")
+
+    def load(self, path: Path) -> Any:
+        """Read the DataFrame with memory mapping."""
+        return pd.read_parquet(path, engine="pyarrow", memory_map=True)
+
+
+# Registry of codecs by name
+_PICKLE = PickleCodec()
+_COMPRESSED = [CompressedPickleCodec(alg) for alg in ("zstd", "lz4", "zlib")]
+_CODECS: dict[str, CacheCodec] = {
+    codec.name: codec for codec in (_PICKLE, NumpyCodec(), ParquetCodec(), *_COMPRESSED)
+}
+
+
+def get_codec(name: str | None) -> CacheCodec:
+    """
+    Get a codec by name.
+
+    Parameters
+    ----------
+    name : str | None
+        Codec name from ``CacheKey.metadata["codec"]``. None (entries written
+        before codecs existed) maps to plain pickle.
+
+    Returns
+    -------
+    CacheCodec
+        Registered codec.
+
+    Raises
+    ------
+    KeyError
+        If no codec with that name is registered.
+    """
+    if name is None:
+        return _PICKLE
+    return _CODECS[name]
+
+
+def select_codec(value: Any, compress: bool = True) -> CacheCodec:
+    """
+    Choose the codec for a value.
+
+    Parameters
+    ----------
+    value : Any
+        Value to store.
+    compress : bool, optional
+        Allow compressed pickle for generic values. Default is True.
+
+    Returns
+    -------
+    CacheCodec
+        Type-specific codec, compressed pickle, or plain pickle.
+    """
+    for name in ("npy", "parquet"):
+        codec = _CODECS[name]
+        if codec.can_encode(value):
+            return codec
+
+    if compress and _pickled_size_hint(value) >= DEFAULT_COMPRESS_THRESHOLD:
+        for codec in _COMPRESSED:
+            if codec.available:
+                return codec
+
+    return _PICKLE
+
+
+def codec_extensions() -> set[str]:
+    """
+    Get the file extensions of all registered codecs.
+
+    Returns
+    -------
+    set[str]
+        Extensions such as ``".pkl"`` and ``".npy"``.
+    """
+    return {codec.extension for codec in _CODECS.values()}
+
+
+def _pickled_size_hint(value: Any) -> int:
+    """Cheaply estimate whether a value is large enough to compress."""
+    if isinstance(value, bytes | bytearray | str):
+        return len(value)
+    if isinstance(value, list | tuple | dict | set):
+        return len(value) * 64
+    return DEFAULT_COMPRESS_THRESHOLD
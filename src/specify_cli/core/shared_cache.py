@@ -0,0 +1,547 @@
+"""
+specify_cli.core.shared_cache - Cross-Process Shared-Memory Cache Tier
+======================================================================
+
+Host-local L1.5 tier for :class:`~specify_cli.core.advanced_cache.SmartCache`.
+
+Each CLI process and worker owns a private L1, so parallel ``ggen sync``
+workers and test runners would otherwise re-read the same pickles from L2.
+This tier stores hot ``bytes`` and numpy arrays in an mmap arena on a
+shared-memory filesystem (``/dev/shm`` where available) so sibling processes
+on the same host can share them without pickling round-trips.
+
+Design
+------
+* **One file per entry**: Entry file names are derived from the cache key, so
+  a lookup is a single ``open`` + ``mmap`` with no index to consult.
+* **Lock-free reads**: Writers stage into a temporary file and publish with
+  ``os.replace``, so readers never observe a partially written entry.
+* **flock-protected writes**: Publishing and eviction hold an exclusive
+  ``fcntl.flock`` on the arena lock file, which keeps the size cap exact
+  when many processes write at once.
+* **Zero-copy arrays**: Numpy arrays are returned as read-only views over the
+  mapped entry; an evicted entry stays readable until the view is dropped.
+* **LRU by mtime**: Hits touch the entry's mtime; eviction removes the
+  least recently used entries until the arena fits under its size cap.
+
+Entry Layout
+-----------
+    magic (8 bytes) | header length (uint32) | JSON header | padding | payload
+
+The JSON header records the original key, the payload kind (``bytes`` or
+``ndarray``), dtype/shape for arrays, and the serialized ``CacheKey`` so
+validity (TTL, file dependencies) is checked exactly as for L1/L2.
+
+Examples
+--------
+    >>> from specify_cli.core.shared_cache import SharedMemoryTier
+    >>> tier = SharedMemoryTier(namespace="demo", max_size_mb=64)
+    >>> tier.put("blob", b"payload", {"key": "blob"})
+    True
+    >>> value, key_data = tier.get("blob")
+    >>> tier.get_stats().hits
+    1
+
+See Also
+--------
+- :mod:`specify_cli.core.advanced_cache` : Multi-level SmartCache
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import mmap
+import os
+import struct
+import tempfile
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from .telemetry import metric_counter, span
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is a core dependency
+    np = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+__all__ = [
+    "SharedMemoryTier",
+    "SharedTierStats",
+    "default_shared_dir",
+    "is_shareable",
+]
+
+# Default arena configuration
+DEFAULT_SHARED_MAX_SIZE_MB = 256
+
+_MAGIC = b"SPKSHM1\x00"
+_HEADER_LEN = struct.Struct("<I")
+_PAYLOAD_ALIGN = 64
+_ENTRY_SUFFIX = ".shm"
+_LOCK_NAME = ".arena.lock"
+
+
+def default_shared_dir(namespace: str) -> Path:
+    """
+    Get the arena directory for a namespace.
+
+    Uses ``/dev/shm`` when it exists (memory-backed on Linux), otherwise the
+    system temporary directory.
+
+    Parameters
+    ----------
+    namespace : str
+        Namespace isolating unrelated caches (e.g. derived from cache_dir).
+
+    Returns
+    -------
+    Path
+        Arena directory path (not created).
+    """
+    base = Path("/dev/shm")
+    if not (base.is_dir() and os.access(base, os.W_OK)):
+        base = Path(tempfile.gettempdir())
+    uid = os.getuid() if hasattr(os, "getuid") else 0
+    return base / f"specify-cli-{uid}-{namespace}"
+
+
+def is_shareable(value: Any) -> bool:
+    """
+    Check whether a value can be stored in the shared tier.
+
+    Only ``bytes``-like values and numpy arrays with a fixed-size dtype are
+    shared; everything else stays in the per-process L1 and the L2 disk tier.
+
+    Parameters
+    ----------
+    value : Any
+        Candidate value.
+
+    Returns
+    -------
+    bool
+        True if the value can be stored without pickling.
+    """
+    if isinstance(value, bytes | bytearray | memoryview):
+        return True
+    if np is not None and isinstance(value, np.ndarray):
+        return not value.dtype.hasobject
+    return False
+
+
+@dataclass
+class SharedTierStats:
+    """
+    Statistics for the shared-memory tier.
+
+    Attributes
+    ----------
+    hits : int
+        Lookups served from the arena.
+    misses : int
+        Lookups not found in the arena.
+    writes : int
+        Entries published by this process.
+    evictions : int
+        Entries evicted by this process to respect the size cap.
+    rejected : int
+        Values skipped because they were unshareable or too large.
+    entries : int
+        Entries currently in the arena (all processes).
+    bytes_used : int
+        Arena size in bytes (all processes).
+    """
+
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    evictions: int = 0
+    rejected: int = 0
+    entries: int = 0
+    bytes_used: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Calculate hit rate for lookups served by this process."""
+        total = self.hits + self.misses
+        if total == 0:
+            return 0.0
+        return self.hits / total
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for reporting."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "evictions": self.evictions,
+            "rejected": self.rejected,
+            "entries": self.entries,
+            "bytes_used": self.bytes_used,
+            "hit_rate": self.hit_rate,
+        }
+
+
+class SharedMemoryTier:
+    """
+    Cross-process cache tier backed by an mmap arena.
+
+    Parameters
+    ----------
+    namespace : str
+        Namespace isolating unrelated caches on the same host.
+    max_size_mb : int, optional
+        Arena size cap in MB. Default is 256.
+    shared_dir : Path | None, optional
+        Arena directory. Default uses :func:`default_shared_dir`.
+
+    Notes
+    -----
+    The tier disables itself (``available`` is False) on platforms without
+    ``fcntl``; all operations then behave as misses.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        max_size_mb: int = DEFAULT_SHARED_MAX_SIZE_MB,
+        shared_dir: Path | None = None,
+    ) -> None:
+        """Initialize SharedMemoryTier."""
+        self.namespace = namespace
+        self.max_size_mb = max_size_mb
+        self.shared_dir = shared_dir or default_shared_dir(namespace)
+        self.available = fcntl is not None
+
+        self._stats = SharedTierStats()
+        self._stats_lock = threading.Lock()
+
+        if self.available:
+            try:
+                self.shared_dir.mkdir(parents=True, exist_ok=True, mode=0o700)
+            except OSError:
+                self.available = False
+
+    @property
+    def max_bytes(self) -> int:
+        """Arena size cap in bytes."""
+        return self.max_size_mb * 1024 * 1024
+
+    # -------------------------------------------------------------------------
+    # Public API
+    # -------------------------------------------------------------------------
+
+    def get(self, key: str) -> tuple[Any, dict[str, Any]] | None:
+        """
+        Look up an entry without taking the arena lock.
+
+        Parameters
+        ----------
+        key : str
+            Cache key.
+
+        Returns
+        -------
+        tuple[Any, dict[str, Any]] | None
+            ``(value, cache_key_dict)`` on hit, None on miss. Arrays are
+            read-only views over the shared mapping.
+        """
+        if not self.available:
+            return None
+
+        path = self._entry_path(key)
+        try:
+            with path.open("rb") as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (FileNotFoundError, ValueError, OSError):
+            self._record("misses")
+            metric_counter("cache.advanced.shared.miss")(1)
+            return None
+
+        decoded = self._decode(mapped)
+        if decoded is None or decoded[2] != key:
+            mapped.close()
+            self._record("misses")
+            metric_counter("cache.advanced.shared.miss")(1)
+            return None
+
+        value, cache_key_data, _ = decoded
+        if isinstance(value, bytes):
+            # bytes were copied out of the mapping; arrays keep it alive
+            mapped.close()
+
+        # Touch for LRU; a concurrent eviction may already have removed it
+        with contextlib.suppress(OSError):
+            os.utime(path)
+
+        self._record("hits")
+        metric_counter("cache.advanced.shared.hit")(1)
+        return value, cache_key_data
+
+    def put(self, key: str, value: Any, cache_key_data: dict[str, Any]) -> bool:
+        """
+        Publish a value to the arena.
+
+        Parameters
+        ----------
+        key : str
+            Cache key.
+        value : Any
+            ``bytes``-like value or numpy array.
+        cache_key_data : dict[str, Any]
+            Serialized ``CacheKey`` used for validity checks on read.
+
+        Returns
+        -------
+        bool
+            True if the value was published, False if it was skipped.
+        """
+        if not self.available or not is_shareable(value):
+            if self.available:
+                self._record("rejected")
+            return False
+
+        with span("cache.shared.put", cache_key=key):
+            header, payload = self._encode(key, value, cache_key_data)
+            payload_offset = self._payload_offset(len(header))
+            entry_size = payload_offset + payload.nbytes
+
+            if entry_size > self.max_bytes:
+                self._record("rejected")
+                metric_counter("cache.advanced.shared.rejected")(1)
+                return False
+
+            with self._arena_lock():
+                self._evict_for(entry_size, keep=self._entry_path(key))
+                fd, tmp_name = tempfile.mkstemp(dir=self.shared_dir, suffix=".tmp")
+                try:
+                    with os.fdopen(fd, "wb") as f:
+                        f.write(_MAGIC)
+                        f.write(_HEADER_LEN.pack(len(header)))
+                        f.write(header)
+                        f.write(b"\x00" * (payload_offset - len(_MAGIC) - 4 - len(header)))
+                        f.write(payload)
+                    Path(tmp_name).replace(self._entry_path(key))
+                except OSError:
+                    with contextlib.suppress(OSError):
+                        Path(tmp_name).unlink()
+                    metric_counter("cache.advanced.shared.write_error")(1)
+                    return False
+
+            self._record("writes")
+            metric_counter("cache.advanced.shared.write")(1)
+            return True
+
+    def remove(self, key: str) -> bool:
+        """
+        Remove an entry from the arena.
+
+        Parameters
+        ----------
+        key : str
+            Cache key.
+
+        Returns
+        -------
+        bool
+            True if an entry was removed.
+        """
+        if not self.available:
+            return False
+        try:
+            self._entry_path(key).unlink()
+        except OSError:
+            return False
+        return True
+
+    def remove_matching(self, pattern: str) -> int:
+        """
+        Remove all entries whose key contains ``pattern``.
+
+        Parameters
+        ----------
+        pattern : str
+            Substring to match against the original keys.
+
+        Returns
+        -------
+        int
+            Number of entries removed.
+        """
+        if not self.available:
+            return 0
+
+        count = 0
+        with self._arena_lock():
+            for path, _size, _mtime in self._iter_entries():
+                key = self._read_key(path)
+                if key is not None and pattern in key:
+                    with contextlib.suppress(OSError):
+                        path.unlink()
+                        count += 1
+        return count
+
+    def clear(self) -> None:
+        """Remove every entry in the arena and reset local statistics."""
+        if self.available:
+            with self._arena_lock():
+                for path, _size, _mtime in self._iter_entries():
+                    with contextlib.suppress(OSError):
+                        path.unlink()
+        with self._stats_lock:
+            self._stats = SharedTierStats()
+
+    def get_stats(self) -> SharedTierStats:
+        """
+        Get tier statistics.
+
+        Returns
+        -------
+        SharedTierStats
+            Local hit/miss counters plus arena-wide size figures.
+        """
+        entries = list(self._iter_entries()) if self.available else []
+        with self._stats_lock:
+            self._stats.entries = len(entries)
+            self._stats.bytes_used = sum(size for _path, size, _mtime in entries)
+            return self._stats
+
+    # -------------------------------------------------------------------------
+    # Encoding
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _encode(
+        key: str, value: Any, cache_key_data: dict[str, Any]
+    ) -> tuple[bytes, memoryview]:
+        """Build the JSON header and payload view for a value."""
+        meta: dict[str, Any] = {"key": key, "cache_key": cache_key_data}
+        if np is not None and isinstance(value, np.ndarray):
+            array = np.ascontiguousarray(value)
+            meta.update(kind="ndarray", dtype=array.dtype.str, shape=list(array.shape))
+            payload = memoryview(array).cast("B") if array.size else memoryview(b"")
+        else:
+            meta["kind"] = "bytes"
+            payload = memoryview(value).cast("B")
+        header = json.dumps(meta, separators=(",", ":")).encode()
+        return header, payload
+
+    @staticmethod
+    def _payload_offset(header_len: int) -> int:
+        """Compute the aligned payload offset for a header length."""
+        raw = len(_MAGIC) + _HEADER_LEN.size + header_len
+        return -(-raw // _PAYLOAD_ALIGN) * _PAYLOAD_ALIGN
+
+    def _decode(self, mapped: mmap.mmap) -> tuple[Any, dict[str, Any], str] | None:
+        """Decode an entry mapping into ``(value, cache_key_dict, key)``."""
+        meta = self._decode_header(mapped)
+        if meta is None:
+            return None
+
+        offset = self._payload_offset(meta["_header_len"])
+        if meta.get("kind") == "ndarray":
+            if np is None:
+                return None
+            dtype = np.dtype(meta["dtype"])
+            shape = tuple(meta["shape"])
+            value: Any = np.ndarray(shape, dtype=dtype, buffer=mapped, offset=offset)
+        else:
+            value = mapped[offset:]
+        return value, meta.get("cache_key", {}), meta.get("key", "")
+
+    @staticmethod
+    def _decode_header(buffer: Any) -> dict[str, Any] | None:
+        """Parse the entry header, returning None for foreign or torn files."""
+        prefix = len(_MAGIC) + _HEADER_LEN.size
+        if len(buffer) < prefix or bytes(buffer[: len(_MAGIC)]) != _MAGIC:
+            return None
+        (header_len,) = _HEADER_LEN.unpack(bytes(buffer[len(_MAGIC) : prefix]))
+        try:
+            meta = json.loads(bytes(buffer[prefix : prefix + header_len]))
+        except ValueError:
+            return None
+        meta["_header_len"] = header_len
+        return meta
+
+    def _read_key(self, path: Path) -> str | None:
+        """Read the original key from an entry header."""
+        try:
+            with path.open("rb") as f:
+                prefix = f.read(len(_MAGIC) + _HEADER_LEN.size)
+                if len(prefix) < len(_MAGIC) + _HEADER_LEN.size:
+                    return None
+                (header_len,) = _HEADER_LEN.unpack(prefix[len(_MAGIC) :])
+                meta = self._decode_header(prefix + f.read(header_len))
+        except OSError:
+            return None
+        return meta.get("key") if meta else None
+
+    # -------------------------------------------------------------------------
+    # Arena management
+    # -------------------------------------------------------------------------
+
+    def _entry_path(self, key: str) -> Path:
+        """Get the entry file path for a key."""
+        digest = hashlib.sha256(key.encode(), usedforsecurity=False).hexdigest()[:40]
+        return self.shared_dir / f"{digest}{_ENTRY_SUFFIX}"
+
+    def _iter_entries(self) -> Iterator[tuple[Path, int, float]]:
+        """Yield ``(path, size, mtime)`` for every entry in the arena."""
+        try:
+            with os.scandir(self.shared_dir) as it:
+                for entry in it:
+                    if not entry.name.endswith(_ENTRY_SUFFIX):
+                        continue
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    yield Path(entry.path), st.st_size, st.st_mtime
+        except OSError:
+            return
+
+    def _evict_for(self, incoming: int, keep: Path) -> None:
+        """Evict least recently used entries so ``incoming`` bytes fit (lock held)."""
+        entries = [e for e in self._iter_entries() if e[0] != keep]
+        used = sum(size for _path, size, _mtime in entries)
+        if used + incoming <= self.max_bytes:
+            return
+
+        entries.sort(key=lambda e: e[2])
+        for path, size, _mtime in entries:
+            if used + incoming <= self.max_bytes:
+                break
+            with contextlib.suppress(OSError):
+                path.unlink()
+                used -= size
+                self._record("evictions")
+                metric_counter("cache.advanced.shared.eviction")(1)
+
+    @contextlib.contextmanager
+    def _arena_lock(self) -> Iterator[None]:
+        """Hold the exclusive arena lock for writers."""
+        lock_path = self.shared_dir / _LOCK_NAME
+        fd = os.open(lock_path, os.O_CREAT | os.O_RDWR, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
+
+    def _record(self, counter: str) -> None:
+        """Increment a local statistics counter."""
+        with self._stats_lock:
+            setattr(self._stats, counter, getattr(self._stats, counter) + 1)
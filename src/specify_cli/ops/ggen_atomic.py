@@ -14,6 +14,12 @@ Key Features:
 - Atomic rename to final location
 - Automatic rollback on errors
 - Manifest of changes for recovery
+- Parallel staging: a thread pool writes staged files while the caller keeps
+  rendering
+- Durability policy: no fsync, fsync per file, or one filesystem sync per
+  commit
+- Skip-if-identical: files whose content matches the existing output are
+  not rewritten, so their mtime is preserved
 
 Examples:
     >>> from specify_cli.ops.ggen_atomic import AtomicWriter
@@ -25,6 +31,12 @@ Examples:
     ... except Exception:
     ...     writer.rollback()  # Clean up
 
+    >>> writer = AtomicWriter("output/", parallel=True, durability="commit",
+    ...                       skip_identical=True)
+    >>> for name, content in rendered:
+    ...     writer.write(name, content)  # Returns while the file is written
+    >>> writer.commit()  # Waits for staging, renames changed files, syncs once
+
 See Also:
     - specify_cli.ops.ggen_manifest : Manifest validation
     - docs/GGEN_SYNC_POKA_YOKE.md : Error-proofing design
@@ -36,17 +48,29 @@ Notes:
 
 from __future__ import annotations
 
+import contextlib
+import ctypes
+import ctypes.util
+import hashlib
+import os
 import shutil
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
 __all__ = [
+    "DURABILITY_POLICIES",
     "AtomicWriter",
     "TransactionManifest",
 ]
 
+# "none": rely on the OS; "file": fsync every file and its directory;
+# "commit": one filesystem sync after all renames
+DURABILITY_POLICIES = ("none", "file", "commit")
+
 
 @dataclass
 class TransactionManifest:
@@ -79,6 +103,16 @@ class AtomicWriter:
         Target output directory.
     staging_dir : str | Path | None
         Staging directory (default: .ggen-staging in output_dir).
+    parallel : bool
+        Stage files on a thread pool; write() returns before the file is on
+        disk and commit() waits for all of them (default: False).
+    max_workers : int | None
+        Staging threads in parallel mode (default: 4).
+    durability : str
+        One of DURABILITY_POLICIES (default: "none").
+    skip_identical : bool
+        Leave existing outputs whose content equals the staged content
+        untouched (default: False).
 
     Examples
     --------
@@ -92,6 +126,11 @@ class AtomicWriter:
         self,
         output_dir: str | Path,
         staging_dir: str | Path | None = None,
+        *,
+        parallel: bool = False,
+        max_workers: int | None = None,
+        durability: str = "none",
+        skip_identical: bool = False,
     ) -> None:
         """Initialize atomic writer.
 
@@ -101,7 +140,28 @@ class AtomicWriter:
             Target output directory.
         staging_dir : str | Path | None
             Staging directory (auto-created in output_dir if not specified).
+        parallel : bool
+            Stage files on a thread pool.
+        max_workers : int | None
+            Staging threads in parallel mode.
+        durability : str
+            One of DURABILITY_POLICIES.
+        skip_identical : bool
+            Skip rewriting outputs whose content is unchanged.
+
+        Raises
+        ------
+        ValueError
+            If durability is not a known policy.
         """
+        if durability not in DURABILITY_POLICIES:
+            raise ValueError(
+                f"Unknown durability policy: {durability} "
+                f"(expected one of {', '.join(DURABILITY_POLICIES)})"
+            )
+        self.durability = durability
+        self.skip_identical = skip_identical
+
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
@@ -120,6 +180,17 @@ class AtomicWriter:
             status="in_progress",
         )
 
+        # Parallel staging: bound queued content so a fast producer cannot
+        # hold every rendered file in memory at once
+        workers = max_workers or 4
+        self._executor = (
+            ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ggen-stage")
+            if parallel
+            else None
+        )
+        self._slots = threading.BoundedSemaphore(workers * 4)
+        self._pending: dict[str, Future[None]] = {}
+
     def write(self, relative_path: str, content: str) -> Path:
         """Stage a file for writing.
 
@@ -148,20 +219,45 @@ class AtomicWriter:
         if ".." in rel.parts or rel.is_absolute():
             raise ValueError(f"Invalid output path: {relative_path}")
 
-        # Stage file
+        # Stage file (on the pool in parallel mode)
         staged_path = self.staging_dir / relative_path
-        staged_path.parent.mkdir(parents=True, exist_ok=True)
-        staged_path.write_text(content)
+        data = content.encode()
+        previous = self._pending.pop(relative_path, None)
+        if previous is not None:
+            previous.result()  # Same path staged twice: keep write order
+        if self._executor is None:
+            self._stage(staged_path, data)
+        else:
+            self._slots.acquire()
+            future = self._executor.submit(self._stage, staged_path, data)
+            future.add_done_callback(lambda _: self._slots.release())
+            self._pending[relative_path] = future
 
         # Record in manifest
         self.manifest.files[relative_path] = {
             "size": len(content),
+            "bytes": len(data),
+            "sha256": hashlib.sha256(data).hexdigest(),
             "timestamp": datetime.now(tz=UTC).isoformat(),
             "status": "staged",
         }
 
         return staged_path
 
+    def flush(self) -> None:
+        """Wait until every staged file has been written.
+
+        Raises
+        ------
+        OSError
+            The first error raised while staging a file.
+        """
+        pending, self._pending = self._pending, {}
+        errors = [f.exception() for f in pending.values()]
+        for error in errors:
+            if error is not None:
+                raise error
+
     def commit(self) -> None:
         """Commit all staged files to output directory.
 
@@ -180,37 +276,77 @@ class AtomicWriter:
             )
 
         try:
+            self.flush()
+            directories: set[Path] = set()
+
             # Move each staged file to final location
-            for relative_path in self.manifest.files:
+            for relative_path, info in self.manifest.files.items():
                 staged_file = self.staging_dir / relative_path
                 final_file = self.output_dir / relative_path
 
                 if staged_file.exists():
+                    if self.skip_identical and _same_content(final_file, info):
+                        # Unchanged output keeps its mtime
+                        staged_file.unlink()
+                        info["status"] = "unchanged"
+                        continue
+
                     # Ensure parent directory exists
                     final_file.parent.mkdir(parents=True, exist_ok=True)
 
                     # Atomic rename (on same filesystem)
                     staged_file.replace(final_file)
+                    directories.add(final_file.parent)
+                    if self.durability == "file":
+                        _fsync_directory(final_file.parent)
 
                     # Update manifest
-                    self.manifest.files[relative_path]["status"] = "committed"
+                    info["status"] = "committed"
+
+            if self.durability == "commit" and directories:
+                _sync_filesystem(self.output_dir, directories)
 
             self.manifest.status = "committed"
 
         except Exception as e:
             self.manifest.status = "failed"
             raise RuntimeError(f"Commit failed: {e}") from e
+        finally:
+            self._shutdown()
+
+    @property
+    def unchanged_files(self) -> list[str]:
+        """Relative paths skipped at commit because their content was unchanged."""
+        return [path for path, info in self.manifest.files.items() if info["status"] == "unchanged"]
 
     def rollback(self) -> None:
         """Roll back transaction, discarding all staged files.
 
         Removes entire staging directory. Output directory is untouched.
         """
+        for future in self._pending.values():
+            future.cancel()
+        self._shutdown()
+        self._pending = {}
         if self.staging_dir.exists():
             shutil.rmtree(self.staging_dir)
 
         self.manifest.status = "rolled_back"
 
+    def _stage(self, staged_path: Path, data: bytes) -> None:
+        """Write one staged file (fsynced under the "file" policy)."""
+        staged_path.parent.mkdir(parents=True, exist_ok=True)
+        with staged_path.open("wb") as f:
+            f.write(data)
+            if self.durability == "file":
+                f.flush()
+                os.fsync(f.fileno())
+
+    def _shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
     def __enter__(self) -> AtomicWriter:
         """Context manager entry."""
         return self
@@ -237,3 +373,63 @@ class AtomicWriter:
         """
         if exc_type is not None:
             self.rollback()
+
+
+def _same_content(path: Path, info: dict[str, Any]) -> bool:
+    """Whether ``path`` already holds the staged content."""
+    try:
+        if path.stat().st_size != info["bytes"]:
+            return False
+        with path.open("rb") as f:
+            return hashlib.file_digest(f, "sha256").hexdigest() == info["sha256"]
+    except OSError:
+        return False
+
+
+def _fsync_directory(directory: Path) -> None:
+    """Persist a directory's entries (renames) where the platform allows it."""
+    if not hasattr(os, "O_DIRECTORY"):
+        return  # e.g. Windows: directories cannot be opened for fsync
+    fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _sync_filesystem(output_dir: Path, directories: set[Path]) -> None:
+    """Flush a commit with one ``syncfs`` call, or per-directory fsyncs.
+
+    ``syncfs`` (Linux) writes back every dirty file and directory entry of
+    the output filesystem at once. Elsewhere the staged files were written
+    without fsync, so each touched directory is fsynced after a global
+    ``os.sync``.
+    """
+    syncfs = _libc_syncfs()
+    if syncfs is not None:
+        fd = os.open(output_dir, os.O_RDONLY)
+        try:
+            if syncfs(fd) == 0:
+                return
+        finally:
+            os.close(fd)
+
+    if hasattr(os, "sync"):
+        os.sync()
+    for directory in sorted(directories):
+        with contextlib.suppress(OSError):
+            _fsync_directory(directory)
+
+
+def _libc_syncfs() -> Any:
+    """The C library's ``syncfs`` function, or None if unavailable."""
+    name = ctypes.util.find_library("c")
+    if name is None:
+        return None
+    try:
+        syncfs = ctypes.CDLL(name, use_errno=True).syncfs
+    except (OSError, AttributeError):
+        return None
+    syncfs.argtypes = [ctypes.c_int]
+    syncfs.restype = ctypes.c_int
+    return syncfs
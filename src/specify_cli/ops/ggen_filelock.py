@@ -9,11 +9,12 @@ access corruption (RPN 288). Uses lock files with process IDs for
 debugging.
 
 Key Features:
-- Simple lock file mechanism
+- Shared (reader) and exclusive (writer) modes via ``fcntl.flock``
+- Blocking waits (no sleep-polling) with timeout support
+- Locks die with their process - no stale lock files to clean up
 - PID-based ownership for debugging
-- Timeout support
-- Safe cleanup
-- Cross-platform (uses tempfile for atomicity)
+- Lock wait-time histograms for contention visibility
+- Falls back to an exclusive O_EXCL lock file where fcntl is unavailable
 
 Examples:
     >>> from specify_cli.ops.ggen_filelock import FileLock
@@ -28,27 +29,50 @@ Examples:
     >>> with FileLock(".ggen.lock", timeout=30):
     ...     # Work here, auto-released
 
+    >>> # Read-only work (preflight, receipt checks) runs alongside other
+    >>> # readers and only waits for writers
+    >>> with FileLock(".ggen.lock", mode="shared"):
+    ...     verify_receipt(receipt)
+
 See Also:
     - specify_cli.ops.ggen_atomic : Atomic writes
     - docs/GGEN_SYNC_POKA_YOKE.md : Error-proofing design
 
 Notes:
-    Uses simple file-based locking. PID stored for debugging
-    (to identify which process holds lock).
+    flock locks belong to the open file, so two FileLock instances in one
+    process exclude each other just like two processes do. An exclusive
+    holder removes the lock file on release; waiters re-open it if the
+    file they locked was removed meanwhile. flock does not queue writers
+    ahead of readers, so a steady stream of shared holders can delay an
+    exclusive one.
 """
 
 from __future__ import annotations
 
+import contextlib
 import os
+import threading
 import time
 from pathlib import Path
 from typing import Any
 
+from specify_cli.core.telemetry import metric_counter, metric_histogram
+
+try:
+    import fcntl
+
+    FCNTL_AVAILABLE = True
+except ImportError:  # pragma: no cover - Windows
+    FCNTL_AVAILABLE = False
+
 __all__ = [
+    "LOCK_MODES",
     "FileLock",
     "LockTimeoutError",
 ]
 
+LOCK_MODES = ("exclusive", "shared")
+
 
 class LockTimeoutError(Exception):
     """Raised when lock acquisition times out."""
@@ -75,10 +99,10 @@ class LockTimeoutError(Exception):
 
 
 class FileLock:
-    """Simple file-based lock.
+    """File-based shared/exclusive lock.
 
-    Uses lock file to serialize access. PID is stored in lock file
-    for debugging concurrent access issues.
+    Exclusive holders write their PID into the lock file for debugging
+    concurrent access issues.
 
     Parameters
     ----------
@@ -86,9 +110,11 @@ class FileLock:
         Path to lock file.
     timeout : float
         Timeout in seconds (0 = no timeout).
+    mode : str
+        "exclusive" (default, one writer) or "shared" (many readers).
     """
 
-    def __init__(self, lock_file: str | Path, timeout: float = 30) -> None:
+    def __init__(self, lock_file: str | Path, timeout: float = 30, mode: str = "exclusive") -> None:
         """Initialize file lock.
 
         Parameters
@@ -97,10 +123,27 @@ class FileLock:
             Path to lock file.
         timeout : float
             Timeout in seconds (0 = no timeout).
+        mode : str
+            "exclusive" or "shared".
+
+        Raises
+        ------
+        ValueError
+            If ``mode`` is unknown.
         """
+        self.acquired = False
+        if mode not in LOCK_MODES:
+            raise ValueError(f"Unknown lock mode: {mode} (expected one of {LOCK_MODES})")
         self.lock_file = Path(lock_file)
         self.timeout = timeout
-        self.acquired = False
+        self.mode = mode
+        self.wait_time = 0.0
+        self._fd: int | None = None
+
+    @property
+    def shared(self) -> bool:
+        """Whether this is a shared (reader) lock."""
+        return self.mode == "shared"
 
     def acquire(self) -> None:
         """Acquire lock, blocking until available or timeout.
@@ -110,56 +153,35 @@ class FileLock:
         LockTimeoutError
             If lock cannot be acquired within timeout.
         """
-        start_time = time.time()
-        poll_interval = 0.1
-
-        while True:
-            try:
-                # Try to create lock file (atomic on most systems)
-                # Using O_EXCL for atomicity
-                fd = os.open(
-                    str(self.lock_file),
-                    os.O_CREAT | os.O_EXCL | os.O_WRONLY,
-                    0o644,
-                )
-                # Write current PID for debugging
-                os.write(fd, str(os.getpid()).encode())
-                os.close(fd)
-
-                self.acquired = True
-                return
-
-            except FileExistsError:
-                # Lock already held
-                elapsed = time.time() - start_time
-
-                if self.timeout > 0 and elapsed > self.timeout:
-                    # Try to read owner PID for error message
-                    owner_pid = None
-                    try:
-                        if self.lock_file.exists():
-                            content = self.lock_file.read_text()
-                            owner_pid = int(content.strip())
-                    except (ValueError, OSError):
-                        pass
-
-                    raise LockTimeoutError(str(self.lock_file), self.timeout, owner_pid)
-
-                # Wait a bit before retrying
-                time.sleep(poll_interval)
+        start = time.monotonic()
+        if FCNTL_AVAILABLE:
+            contended = self._acquire_flock(start)
+        else:
+            contended = self._acquire_exclusive_file(start)
+        self.acquired = True
+
+        self.wait_time = time.monotonic() - start
+        metric_histogram(f"ggen.lock.{self.mode}.wait")(self.wait_time)
+        if contended:
+            metric_counter(f"ggen.lock.{self.mode}.contended")(1)
 
     def release(self) -> None:
         """Release lock.
 
         Safe to call even if lock not held.
         """
-        if self.lock_file.exists():
-            try:
+        if not self.acquired:
+            return
+        self.acquired = False
+
+        fd, self._fd = self._fd, None
+        if fd is None or not self.shared:
+            # O_EXCL fallback: the file itself is the lock. flock: remove it
+            # while still held; waiters notice and re-open
+            with contextlib.suppress(OSError):
                 self.lock_file.unlink()
-                self.acquired = False
-            except OSError:
-                # Best effort - ignore errors on cleanup
-                pass
+        if fd is not None:
+            os.close(fd)  # Closing the file releases the flock
 
     def __enter__(self) -> FileLock:
         """Context manager entry."""
@@ -189,3 +211,135 @@ class FileLock:
         """Ensure lock is released on garbage collection."""
         if self.acquired:
             self.release()
+
+    # -------------------------------------------------------------------------
+    # Acquisition
+    # -------------------------------------------------------------------------
+
+    def _acquire_flock(self, start: float) -> bool:
+        """Take the flock; returns whether another holder had to be waited for."""
+        operation = fcntl.LOCK_SH if self.shared else fcntl.LOCK_EX
+        contended = False
+
+        while True:
+            fd = os.open(str(self.lock_file), os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                taken = _try_flock(fd, operation)
+                if not taken:
+                    contended = True
+                    remaining = None
+                    if self.timeout > 0:
+                        remaining = self.timeout - (time.monotonic() - start)
+                    taken = _wait_flock(fd, operation, remaining)
+            except BaseException:
+                os.close(fd)
+                raise
+            if not taken:
+                # The waiter thread owns (and closes) fd from here
+                raise LockTimeoutError(str(self.lock_file), self.timeout, self._owner_pid())
+
+            if _is_current_file(fd, self.lock_file):
+                break
+            # An exclusive holder removed the file while we waited
+            os.close(fd)
+
+        if not self.shared:
+            # Write current PID for debugging
+            os.ftruncate(fd, 0)
+            os.write(fd, str(os.getpid()).encode())
+        self._fd = fd
+        return contended
+
+    def _acquire_exclusive_file(self, start: float) -> bool:
+        """O_EXCL lock file fallback (no shared mode)."""
+        poll_interval = 0.1
+        contended = False
+
+        while True:
+            try:
+                # Using O_EXCL for atomicity
+                fd = os.open(
+                    str(self.lock_file),
+                    os.O_CREAT | os.O_EXCL | os.O_WRONLY,
+                    0o644,
+                )
+                os.write(fd, str(os.getpid()).encode())
+                os.close(fd)
+            except FileExistsError:
+                contended = True
+                if self.timeout > 0 and time.monotonic() - start > self.timeout:
+                    raise LockTimeoutError(
+                        str(self.lock_file), self.timeout, self._owner_pid()
+                    ) from None
+                time.sleep(poll_interval)
+            else:
+                return contended
+
+    def _owner_pid(self) -> int | None:
+        """PID of the exclusive holder, if recorded."""
+        try:
+            return int(self.lock_file.read_text().strip())
+        except (ValueError, OSError):
+            return None
+
+
+def _try_flock(fd: int, operation: int) -> bool:
+    """Non-blocking ``flock``; False if another holder conflicts."""
+    try:
+        fcntl.flock(fd, operation | fcntl.LOCK_NB)
+    except BlockingIOError:
+        return False
+    else:
+        return True
+
+
+def _wait_flock(fd: int, operation: int, timeout: float | None) -> bool:
+    """Block in ``flock`` for at most ``timeout`` seconds.
+
+    flock has no timeout, so with one the call blocks in a daemon thread.
+    If the timeout expires first, that thread keeps ``fd`` and closes it
+    (dropping the lock) once its flock call returns.
+
+    Returns
+    -------
+    bool
+        True if the lock was taken, False on timeout.
+    """
+    if timeout is None:
+        fcntl.flock(fd, operation)
+        return True
+
+    taken = threading.Event()
+    guard = threading.Lock()
+    state: dict[str, Any] = {"abandoned": False, "error": None}
+
+    def _wait() -> None:
+        try:
+            fcntl.flock(fd, operation)
+        except OSError as e:
+            state["error"] = e
+        with guard:
+            if state["abandoned"]:
+                os.close(fd)
+                return
+            taken.set()
+
+    threading.Thread(target=_wait, name="ggen-lock-wait", daemon=True).start()
+    taken.wait(max(timeout, 0))
+    with guard:
+        if not taken.is_set():
+            state["abandoned"] = True
+            return False
+    if state["error"] is not None:
+        raise state["error"]
+    return True
+
+
+def _is_current_file(fd: int, path: Path) -> bool:
+    """Whether ``fd`` still refers to the file at ``path``."""
+    try:
+        on_disk = path.stat()
+    except FileNotFoundError:
+        return False
+    held = os.fstat(fd)
+    return (held.st_dev, held.st_ino) == (on_disk.st_dev, on_disk.st_ino)
@@ -12,6 +12,10 @@ Key Features:
 - Skip unchanged transformations (5-10x faster)
 - Manifest of processed files for audit
 - Automatic cleanup of stale data
+- Stat memo: files whose mtime/size are unchanged are not re-hashed
+- Rule fingerprints over ontology, shapes, SPARQL, template, template
+  includes and generator version (skip every μ stage when unchanged)
+- Cached SPARQL result sets (template-only edits re-run emit only)
 
 Examples:
     >>> from specify_cli.ops.ggen_incremental import IncrementalTracker
@@ -20,6 +24,10 @@ Examples:
     ...     # Process transformation
     ...     tracker.record_processed(\"output/spec.md\")
     >>> tracker.cleanup_stale()
+    >>>
+    >>> fingerprint = tracker.fingerprint(config)
+    >>> if tracker.is_fresh(config, fingerprint):
+    ...     pass  # Output and receipt are up to date
 
 See Also:
     - specify_cli.ops.ggen_manifest : Manifest validation
@@ -33,16 +41,35 @@ Notes:
 from __future__ import annotations
 
 import hashlib
+import importlib.metadata
 import json
+import re
+import time
 from dataclasses import asdict, dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from specify_cli.ops.transform import TransformConfig
 
 __all__ = [
     "FileHashRecord",
     "IncrementalTracker",
+    "RuleFingerprint",
+    "template_dependencies",
 ]
 
+# Files modified this close to the time they were hashed are always re-hashed,
+# since a same-size edit within the filesystem's mtime granularity would
+# otherwise go unnoticed ("racy" entries, as in git's index)
+RACY_WINDOW_NS = 2_000_000_000
+
+# Tera/Jinja statements that pull in other templates
+_TEMPLATE_REFERENCE = re.compile(
+    r"""{%-?\s*(?:include|extends|import|from)\s+["']([^"']+)["']"""
+)
+
 
 @dataclass
 class FileHashRecord:
@@ -64,6 +91,80 @@ class FileHashRecord:
     hash: str
     timestamp: str
     size: int
+    mtime_ns: int = 0
+    hashed_at_ns: int = 0
+
+    def matches_stat(self, size: int, mtime_ns: int) -> bool:
+        """Check whether the record still describes a file with this stat.
+
+        Parameters
+        ----------
+        size : int
+            Current file size.
+        mtime_ns : int
+            Current modification time in nanoseconds.
+
+        Returns
+        -------
+        bool
+            True if size and mtime are unchanged and the record is not racy.
+        """
+        return (
+            self.mtime_ns != 0
+            and self.size == size
+            and self.mtime_ns == mtime_ns
+            and self.hashed_at_ns - mtime_ns > RACY_WINDOW_NS
+        )
+
+
+@dataclass
+class RuleFingerprint:
+    """Fingerprint of everything a rule's output depends on.
+
+    Attributes
+    ----------
+    rule : str
+        Rule (transformation) name.
+    input_hashes : dict[str, str]
+        SHA256 of each ontology and SHACL shapes file.
+    query_hash : str
+        SHA256 of the SPARQL query text.
+    template_hash : str
+        SHA256 of the template text.
+    include_hashes : dict[str, str]
+        SHA256 of each template included/extended/imported by the template.
+    generator_version : str
+        Version of the generator (specify-cli) producing the output.
+    """
+
+    rule: str
+    input_hashes: dict[str, str]
+    query_hash: str
+    template_hash: str
+    include_hashes: dict[str, str] = field(default_factory=dict)
+    generator_version: str = ""
+
+    @property
+    def extract_key(self) -> str:
+        """Key of the SPARQL result set (ontology + shapes + query + version)."""
+        return _digest(
+            sorted(self.input_hashes.values()),
+            self.query_hash,
+            self.generator_version,
+        )
+
+    @property
+    def digest(self) -> str:
+        """Key of the whole rule output."""
+        return _digest(
+            self.extract_key,
+            self.template_hash,
+            sorted(self.include_hashes.items()),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        return asdict(self)
 
 
 @dataclass
@@ -78,11 +179,18 @@ class IncrementalState:
         Map of input file paths to their hashes.
     output_files : dict[str, list[str]]
         Map of transformation name to output file list.
+    file_cache : dict[str, FileHashRecord]
+        Stat memo of every file hashed, so unchanged files are not re-read.
+    fingerprints : dict[str, dict[str, Any]]
+        Map of rule name to its last successful fingerprint digest and
+        output hashes.
     """
 
     last_sync: str
     input_hashes: dict[str, FileHashRecord] = field(default_factory=dict)
     output_files: dict[str, list[str]] = field(default_factory=dict)
+    file_cache: dict[str, FileHashRecord] = field(default_factory=dict)
+    fingerprints: dict[str, dict[str, Any]] = field(default_factory=dict)
 
 
 class IncrementalTracker:
@@ -109,6 +217,7 @@ class IncrementalTracker:
         self.state_dir = self.output_dir / ".ggen-incremental"
         self.state_dir.mkdir(parents=True, exist_ok=True)
         self.state_file = self.state_dir / "state.json"
+        self.sparql_dir = self.state_dir / "sparql"
 
         self.state = self._load_state()
 
@@ -131,11 +240,16 @@ class IncrementalTracker:
             input_hashes = {}
             for path, record_data in data.get("input_hashes", {}).items():
                 input_hashes[path] = FileHashRecord(**record_data)
+            file_cache = {}
+            for path, record_data in data.get("file_cache", {}).items():
+                file_cache[path] = FileHashRecord(**record_data)
 
             return IncrementalState(
                 last_sync=data.get("last_sync", ""),
                 input_hashes=input_hashes,
                 output_files=data.get("output_files", {}),
+                file_cache=file_cache,
+                fingerprints=data.get("fingerprints", {}),
             )
         except Exception:
             # On error, start fresh
@@ -157,11 +271,10 @@ class IncrementalTracker:
             True if any file changed or if tracking data missing.
         """
         for file_path in file_paths:
-            path = Path(file_path)
-            if not path.exists():
+            current_hash = self.file_hash(file_path)
+            if current_hash is None:
                 return True
 
-            current_hash = self._compute_hash(path)
             record = self.state.input_hashes.get(file_path)
 
             if record is None or record.hash != current_hash:
@@ -177,19 +290,167 @@ class IncrementalTracker:
         file_path : str
             Relative path to file.
         """
-        path = Path(file_path)
-        if not path.exists():
+        if self.file_hash(file_path) is None:
             return
 
-        hash_value = self._compute_hash(path)
-        size = path.stat().st_size
+        self.state.input_hashes[file_path] = self.state.file_cache[file_path]
+
+    def file_hash(self, file_path: str) -> str | None:
+        """Get the SHA256 of a file, re-hashing only if its stat changed.
+
+        Parameters
+        ----------
+        file_path : str
+            Path to file.
+
+        Returns
+        -------
+        str | None
+            Hex digest, or None if the file does not exist.
+        """
+        path = Path(file_path)
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+
+        record = self.state.file_cache.get(file_path)
+        if record is not None and record.matches_stat(st.st_size, st.st_mtime_ns):
+            return record.hash
 
-        self.state.input_hashes[file_path] = FileHashRecord(
+        record = FileHashRecord(
             file_path=file_path,
-            hash=hash_value,
+            hash=self._compute_hash(path),
             timestamp=datetime.now(tz=UTC).isoformat(),
-            size=size,
+            size=st.st_size,
+            mtime_ns=st.st_mtime_ns,
+            hashed_at_ns=time.time_ns(),
         )
+        self.state.file_cache[file_path] = record
+        return record.hash
+
+    def fingerprint(
+        self,
+        config: TransformConfig,
+        generator_version: str | None = None,
+    ) -> RuleFingerprint:
+        """Compute the fingerprint of a rule from its current inputs.
+
+        Parameters
+        ----------
+        config : TransformConfig
+            Rule configuration.
+        generator_version : str | None, optional
+            Generator version. Default is the installed specify-cli version.
+
+        Returns
+        -------
+        RuleFingerprint
+            Fingerprint (missing files hash to "missing").
+        """
+        include_hashes = {
+            str(dep): self.file_hash(str(dep)) or "missing"
+            for dep in template_dependencies(config.template)
+        }
+        return RuleFingerprint(
+            rule=config.name,
+            input_hashes={
+                f: self.file_hash(f) or "missing"
+                for f in [*config.input_files, *config.schema_files]
+            },
+            query_hash=self.file_hash(config.sparql_query) or "missing",
+            template_hash=self.file_hash(config.template) or "missing",
+            include_hashes=include_hashes,
+            generator_version=generator_version or _generator_version(),
+        )
+
+    def is_fresh(self, config: TransformConfig, fingerprint: RuleFingerprint) -> bool:
+        """Check whether a rule's output is up to date.
+
+        Parameters
+        ----------
+        config : TransformConfig
+            Rule configuration.
+        fingerprint : RuleFingerprint
+            Current fingerprint from :meth:`fingerprint`.
+
+        Returns
+        -------
+        bool
+            True if the fingerprint matches the last successful run and the
+            output file still has the content that run produced.
+        """
+        recorded = self.state.fingerprints.get(config.name)
+        if recorded is None or recorded.get("digest") != fingerprint.digest:
+            return False
+        if recorded.get("output_file") != config.output_file:
+            return False
+        return self.file_hash(config.output_file) == recorded.get("output_file_hash")
+
+    def record_fingerprint(
+        self,
+        config: TransformConfig,
+        fingerprint: RuleFingerprint,
+        input_hash: str = "",
+        output_hash: str = "",
+    ) -> None:
+        """Record a successful rule run.
+
+        Parameters
+        ----------
+        config : TransformConfig
+            Rule configuration.
+        fingerprint : RuleFingerprint
+            Fingerprint the output was generated from.
+        input_hash : str, optional
+            Transform input hash (reported again when the rule is skipped).
+        output_hash : str, optional
+            Transform output hash (reported again when the rule is skipped).
+        """
+        self.state.fingerprints[config.name] = {
+            "digest": fingerprint.digest,
+            "extract_key": fingerprint.extract_key,
+            "output_file": config.output_file,
+            "output_file_hash": self.file_hash(config.output_file),
+            "input_hash": input_hash,
+            "output_hash": output_hash,
+        }
+        self.record_outputs(config.name, [config.output_file])
+
+    def load_sparql_results(self, extract_key: str) -> str | None:
+        """Load a cached SPARQL result set.
+
+        Parameters
+        ----------
+        extract_key : str
+            ``RuleFingerprint.extract_key``.
+
+        Returns
+        -------
+        str | None
+            Result set JSON as produced by μ₂ EXTRACT, or None on a miss.
+        """
+        path = self.sparql_dir / f"{extract_key}.json"
+        try:
+            return path.read_text()
+        except OSError:
+            return None
+
+    def store_sparql_results(self, extract_key: str, results_json: str) -> None:
+        """Cache a SPARQL result set.
+
+        Parameters
+        ----------
+        extract_key : str
+            ``RuleFingerprint.extract_key``.
+        results_json : str
+            Result set JSON as produced by μ₂ EXTRACT.
+        """
+        self.sparql_dir.mkdir(parents=True, exist_ok=True)
+        path = self.sparql_dir / f"{extract_key}.json"
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(results_json)
+        tmp_path.replace(path)
 
     def record_outputs(self, transformation: str, output_files: list[str]) -> None:
         """Record output files for transformation.
@@ -209,11 +470,16 @@ class IncrementalTracker:
         input_hashes_dict = {}
         for path, record in self.state.input_hashes.items():
             input_hashes_dict[path] = asdict(record)
+        file_cache_dict = {}
+        for path, record in self.state.file_cache.items():
+            file_cache_dict[path] = asdict(record)
 
         data = {
             "last_sync": datetime.now(tz=UTC).isoformat(),
             "input_hashes": input_hashes_dict,
             "output_files": self.state.output_files,
+            "file_cache": file_cache_dict,
+            "fingerprints": self.state.fingerprints,
         }
 
         self.state_file.write_text(json.dumps(data, indent=2))
@@ -225,6 +491,16 @@ class IncrementalTracker:
         for path in to_remove:
             del self.state.input_hashes[path]
 
+        for path in [p for p in self.state.file_cache if not Path(p).exists()]:
+            del self.state.file_cache[path]
+
+        # Drop cached SPARQL result sets no recorded rule refers to
+        live_keys = {fp.get("extract_key") for fp in self.state.fingerprints.values()}
+        if self.sparql_dir.exists():
+            for cached in self.sparql_dir.glob("*.json"):
+                if cached.stem not in live_keys:
+                    cached.unlink(missing_ok=True)
+
         # Clean up output files from deleted transformations
         # Only remove output file entries if the tracked files don't exist
         to_remove_transforms = []
@@ -260,3 +536,51 @@ class IncrementalTracker:
             for chunk in iter(lambda: f.read(8192), b""):
                 sha256.update(chunk)
         return sha256.hexdigest()
+
+
+def template_dependencies(template: str | Path) -> list[Path]:
+    """Find the templates a template includes, extends or imports.
+
+    References are resolved relative to the referencing template's directory
+    and followed recursively.
+
+    Parameters
+    ----------
+    template : str | Path
+        Path to the root template.
+
+    Returns
+    -------
+    list[Path]
+        Referenced template paths (excluding the root), sorted. Unresolvable
+        references are returned as written so their absence is fingerprinted.
+    """
+    root = Path(template)
+    seen: set[Path] = set()
+    pending = [root]
+    while pending:
+        current = pending.pop()
+        try:
+            text = current.read_text()
+        except OSError:
+            continue
+        for reference in _TEMPLATE_REFERENCE.findall(text):
+            candidate = current.parent / reference
+            dep = candidate if candidate.exists() else Path(reference)
+            if dep not in seen and dep != root:
+                seen.add(dep)
+                pending.append(dep)
+    return sorted(seen)
+
+
+def _generator_version() -> str:
+    """Get the installed specify-cli version."""
+    try:
+        return importlib.metadata.version("specify-cli")
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def _digest(*parts: Any) -> str:
+    """SHA256 over the JSON encoding of ``parts``."""
+    return hashlib.sha256(json.dumps(parts, sort_keys=True).encode()).hexdigest()
@@ -12,6 +12,8 @@ Key Features:
 - Validate manifest structure and required sections
 - Path validation and security checks
 - Rich error messages for common issues
+- Convert [[transformations]] and ggen.toml [[rules]] into TransformConfig
+- Discover every ggen.toml below a directory (multi-project sync)
 
 Examples:
     >>> from specify_cli.ops.ggen_manifest import load_manifest, validate_manifest
@@ -30,18 +32,38 @@ Notes:
 
 from __future__ import annotations
 
+import os
 import tomllib
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from specify_cli.ops.transform import TransformConfig, validate_transform_config
+
 __all__ = [
     "GgenManifest",
     "ManifestValidationResult",
+    "discover_manifests",
     "load_manifest",
+    "manifest_entries",
+    "manifest_transform_configs",
     "validate_manifest",
 ]
 
+# Directories never searched for manifests
+DEFAULT_EXCLUDE_DIRS = frozenset(
+    {".git", ".hg", ".venv", "venv", ".tox", "node_modules", "__pycache__", ".ggen"}
+)
+
+# ggen.toml [[rules]] keys -> TransformConfig fields
+_RULE_FIELD_MAP = {
+    "ontology": "input_files",
+    "shapes": "schema_files",
+    "sparql": "sparql_query",
+    "template": "template",
+    "output": "output_file",
+}
+
 
 @dataclass
 class ManifestValidationResult:
@@ -127,7 +149,62 @@ def load_manifest(manifest_path: str | Path) -> GgenManifest:
     )
 
 
-def validate_manifest(manifest: GgenManifest) -> ManifestValidationResult:
+def discover_manifests(
+    root: str | Path,
+    filename: str = "ggen.toml",
+    exclude_dirs: frozenset[str] = DEFAULT_EXCLUDE_DIRS,
+) -> list[Path]:
+    """Find every manifest below a directory.
+
+    Parameters
+    ----------
+    root : str | Path
+        Directory to search (recursively).
+    filename : str, optional
+        Manifest file name. Default is "ggen.toml".
+    exclude_dirs : frozenset[str], optional
+        Directory names that are not descended into.
+
+    Returns
+    -------
+    list[Path]
+        Manifest paths, sorted.
+    """
+    found = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in exclude_dirs]
+        if filename in filenames:
+            found.append(Path(dirpath) / filename)
+    return sorted(found)
+
+
+def manifest_entries(manifest: GgenManifest) -> list[dict[str, Any]]:
+    """Get all transformations, with ggen.toml [[rules]] in transformation form.
+
+    Parameters
+    ----------
+    manifest : GgenManifest
+        Parsed manifest.
+
+    Returns
+    -------
+    list[dict[str, Any]]
+        ``[[transformations]]`` entries followed by converted ``[[rules]]``
+        (``ontology`` -> ``input_files``, ``output`` -> ``output_file``, ...).
+    """
+    entries = list(manifest.transformations)
+    for rule in manifest.raw.get("rules", []):
+        converted = {_RULE_FIELD_MAP.get(k, k): v for k, v in rule.items()}
+        for list_field in ("input_files", "schema_files"):
+            if isinstance(converted.get(list_field), str):
+                converted[list_field] = [converted[list_field]]
+        entries.append(converted)
+    return entries
+
+
+def validate_manifest(
+    manifest: GgenManifest, base_dir: str | Path | None = None
+) -> ManifestValidationResult:
     """Validate manifest structure and content.
 
     Checks:
@@ -140,6 +217,9 @@ def validate_manifest(manifest: GgenManifest) -> ManifestValidationResult:
     ----------
     manifest : GgenManifest
         Parsed manifest to validate.
+    base_dir : str | Path | None, optional
+        Directory that relative paths are checked against (usually the
+        manifest's directory). Default is the current directory.
 
     Returns
     -------
@@ -148,19 +228,21 @@ def validate_manifest(manifest: GgenManifest) -> ManifestValidationResult:
     """
     errors: list[str] = []
     warnings: list[str] = []
+    base = Path(base_dir) if base_dir is not None else Path()
 
     # Check required sections
     if not manifest.project:
         warnings.append("Missing [project] section (optional)")
 
-    if not manifest.transformations:
-        errors.append("Missing [transformations] section (required)")
+    entries = manifest_entries(manifest)
+    if not entries:
+        errors.append("Missing [transformations] or [[rules]] section (required)")
         return ManifestValidationResult(valid=False, errors=errors, warnings=warnings)
 
     # Validate each transformation
     seen_outputs: set[str] = set()
 
-    for i, transform in enumerate(manifest.transformations):
+    for i, transform in enumerate(entries):
         transform_name = transform.get("name", f"transform_{i}")
 
         # Check required fields
@@ -178,7 +260,7 @@ def validate_manifest(manifest: GgenManifest) -> ManifestValidationResult:
             input_files = [input_files]
 
         for input_file in input_files:
-            input_path = Path(input_file)
+            input_path = base / input_file
             if not input_path.exists():
                 errors.append(
                     f"{transform_name}: Input file not found: {input_file}"
@@ -190,7 +272,7 @@ def validate_manifest(manifest: GgenManifest) -> ManifestValidationResult:
             schema_files = [schema_files]
 
         for schema_file in schema_files:
-            schema_path = Path(schema_file)
+            schema_path = base / schema_file
             if not schema_path.exists():
                 errors.append(
                     f"{transform_name}: Schema file not found: {schema_file}"
@@ -198,7 +280,7 @@ def validate_manifest(manifest: GgenManifest) -> ManifestValidationResult:
 
         # Validate template file if present
         if "template" in transform:
-            template_path = Path(transform["template"])
+            template_path = base / transform["template"]
             if not template_path.exists():
                 errors.append(
                     f"{transform_name}: Template file not found: {transform['template']}"
@@ -206,7 +288,7 @@ def validate_manifest(manifest: GgenManifest) -> ManifestValidationResult:
 
         # Validate SPARQL query file if present
         if "sparql_query" in transform:
-            query_path = Path(transform["sparql_query"])
+            query_path = base / transform["sparql_query"]
             if not query_path.exists():
                 errors.append(
                     f"{transform_name}: SPARQL query file not found: {transform['sparql_query']}"
@@ -237,3 +319,50 @@ def validate_manifest(manifest: GgenManifest) -> ManifestValidationResult:
         errors=errors,
         warnings=warnings,
     )
+
+
+def manifest_transform_configs(
+    manifest: GgenManifest,
+    base_dir: str | Path | None = None,
+) -> list[TransformConfig]:
+    """Build transformation configs from a manifest.
+
+    Supports both the ``[[transformations]]`` table (``input_files``,
+    ``sparql_query``, ``output_file``) and the ggen.toml ``[[rules]]`` table
+    (``ontology``, ``sparql``, ``template``, ``output`` and optional
+    ``shapes``).
+
+    Parameters
+    ----------
+    manifest : GgenManifest
+        Parsed manifest.
+    base_dir : str | Path | None, optional
+        Directory that relative paths are resolved against (usually the
+        manifest's directory). Default keeps paths as written.
+
+    Returns
+    -------
+    list[TransformConfig]
+        One config per transformation/rule, in manifest order.
+
+    Raises
+    ------
+    ValueError
+        If a transformation or rule is missing required fields.
+    """
+    configs = [validate_transform_config(raw) for raw in manifest_entries(manifest)]
+    if base_dir is None:
+        return configs
+
+    base = Path(base_dir)
+
+    def _resolve(path: str) -> str:
+        return path if Path(path).is_absolute() else str(base / path)
+
+    for config in configs:
+        config.input_files = [_resolve(f) for f in config.input_files]
+        config.schema_files = [_resolve(f) for f in config.schema_files]
+        config.sparql_query = _resolve(config.sparql_query)
+        config.template = _resolve(config.template)
+        config.output_file = _resolve(config.output_file)
+    return configs
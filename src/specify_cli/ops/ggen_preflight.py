@@ -39,7 +39,7 @@ import os
 from dataclasses import dataclass
 from pathlib import Path
 
-from specify_cli.ops.ggen_manifest import GgenManifest, validate_manifest
+from specify_cli.ops.ggen_manifest import GgenManifest, manifest_entries, validate_manifest
 
 __all__ = [
     "PreFlightCheckResult",
@@ -73,7 +73,9 @@ class PreFlightCheckResult:
         return self.passed
 
 
-def run_preflight_checks(manifest: GgenManifest) -> PreFlightCheckResult:
+def run_preflight_checks(
+    manifest: GgenManifest, base_dir: str | Path | None = None
+) -> PreFlightCheckResult:
     """Run all pre-flight checks before sync.
 
     Checks performed (in order):
@@ -89,6 +91,9 @@ def run_preflight_checks(manifest: GgenManifest) -> PreFlightCheckResult:
     ----------
     manifest : GgenManifest
         Parsed manifest to check.
+    base_dir : str | Path | None, optional
+        Directory that relative paths are resolved against (usually the
+        manifest's directory). Default is the current directory.
 
     Returns
     -------
@@ -98,9 +103,10 @@ def run_preflight_checks(manifest: GgenManifest) -> PreFlightCheckResult:
     errors: list[str] = []
     warnings: list[str] = []
     checks_run: dict[str, bool] = {}
+    base = Path(base_dir) if base_dir is not None else Path()
 
     # Check 1: Manifest structure
-    manifest_result = validate_manifest(manifest)
+    manifest_result = validate_manifest(manifest, base_dir)
     checks_run["manifest_structure"] = manifest_result.valid
 
     if not manifest_result.valid:
@@ -111,101 +117,40 @@ def run_preflight_checks(manifest: GgenManifest) -> PreFlightCheckResult:
         warnings.extend(manifest_result.warnings)
 
     # Check 2-7: For each transformation
-    for i, transform in enumerate(manifest.transformations):
+    for i, transform in enumerate(manifest_entries(manifest)):
         transform_name = transform.get("name", f"transform_{i}")
 
         # Check 2: Input files readable
-        input_files = transform.get("input_files", [])
-        if isinstance(input_files, str):
-            input_files = [input_files]
-
-        for input_file in input_files:
-            path = Path(input_file)
-            checks_run[f"{transform_name}_input_readable"] = (
-                path.exists() and os.access(path, os.R_OK)
-            )
-            if not checks_run[f"{transform_name}_input_readable"]:
+        for input_file in _as_list(transform.get("input_files", [])):
+            can_read = _is_readable(base / input_file)
+            checks_run[f"{transform_name}_input_readable"] = can_read
+            if not can_read:
                 errors.append(f"{transform_name}: Cannot read input file: {input_file}")
 
-        # Check 3: Output directory writable
-        output_file = transform.get("output_file", "")
-        output_dir = Path(output_file).parent or Path()
-
-        try:
-            # Test write permission
-            test_file = output_dir / ".ggen-write-test"
-            test_file.touch()
-            test_file.unlink()
-            checks_run[f"{transform_name}_output_writable"] = True
-        except (OSError, PermissionError):
-            checks_run[f"{transform_name}_output_writable"] = False
-            errors.append(
-                f"{transform_name}: Output directory not writable: {output_dir}"
-            )
-
-        # Check 4: Disk space (simple check - at least 10MB free)
-        try:
-            statvfs = os.statvfs(str(output_dir))
-            free_bytes = statvfs.f_bavail * statvfs.f_frsize
-            min_bytes = 10 * 1024 * 1024  # 10MB minimum
-            checks_run[f"{transform_name}_disk_space"] = free_bytes > min_bytes
-            if not checks_run[f"{transform_name}_disk_space"]:
-                free_mb = free_bytes / (1024 * 1024)
-                warnings.append(
-                    f"{transform_name}: Low disk space: {free_mb:.1f}MB available"
-                )
-        except (OSError, AttributeError):
-            # Graceful degradation if statvfs not available
-            checks_run[f"{transform_name}_disk_space"] = True
+        # Check 3-4: Output directory writable, disk space available
+        output_dir = _existing_output_dir(base, transform.get("output_file", ""))
+        _check_output_dir(
+            transform_name, output_dir, checks_run=checks_run, errors=errors, warnings=warnings
+        )
 
         # Check 5: Schema files valid (if present)
-        schema_files = transform.get("schema_files", [])
-        if isinstance(schema_files, str):
-            schema_files = [schema_files]
-
-        for schema_file in schema_files:
-            path = Path(schema_file)
-            can_read = path.exists() and os.access(path, os.R_OK)
-            checks_run[f"{transform_name}_schema_readable"] = can_read
-            if not can_read:
-                errors.append(
-                    f"{transform_name}: Cannot read schema file: {schema_file}"
-                )
-
-            # Try to validate basic RDF syntax
-            if can_read:
-                try:
-                    content = path.read_text()
-                    if not _is_valid_rdf_syntax(content):
-                        warnings.append(
-                            f"{transform_name}: Schema file may have invalid RDF syntax: {schema_file}"
-                        )
-                except (OSError, ValueError) as e:
-                    warnings.append(
-                        f"{transform_name}: Error reading schema file: {e}"
-                    )
-
-        # Check 6: Template files readable
-        if "template" in transform:
-            template_file = transform["template"]
-            path = Path(template_file)
-            can_read = path.exists() and os.access(path, os.R_OK)
-            checks_run[f"{transform_name}_template_readable"] = can_read
-            if not can_read:
-                errors.append(
-                    f"{transform_name}: Cannot read template file: {template_file}"
-                )
-
-        # Check 7: SPARQL query files readable
-        if "sparql_query" in transform:
-            query_file = transform["sparql_query"]
-            path = Path(query_file)
-            can_read = path.exists() and os.access(path, os.R_OK)
-            checks_run[f"{transform_name}_query_readable"] = can_read
-            if not can_read:
-                errors.append(
-                    f"{transform_name}: Cannot read SPARQL query file: {query_file}"
-                )
+        for schema_file in _as_list(transform.get("schema_files", [])):
+            _check_schema_file(
+                transform_name,
+                base,
+                schema_file,
+                checks_run=checks_run,
+                errors=errors,
+                warnings=warnings,
+            )
+
+        # Check 6-7: Template and SPARQL query files readable
+        for key, check, label in _READABLE_FILES:
+            if key in transform:
+                can_read = _is_readable(base / transform[key])
+                checks_run[f"{transform_name}_{check}_readable"] = can_read
+                if not can_read:
+                    errors.append(f"{transform_name}: Cannot read {label} file: {transform[key]}")
 
     return PreFlightCheckResult(
         passed=len(errors) == 0,
@@ -215,6 +160,96 @@ def run_preflight_checks(manifest: GgenManifest) -> PreFlightCheckResult:
     )
 
 
+# (transform key, check name, error label) for single files that must be readable
+_READABLE_FILES = (
+    ("template", "template", "template"),
+    ("sparql_query", "query", "SPARQL query"),
+)
+
+
+def _as_list(value: str | list[str]) -> list[str]:
+    """Return a manifest field that may be a single path as a list."""
+    return [value] if isinstance(value, str) else value
+
+
+def _is_readable(path: Path) -> bool:
+    """Return True if ``path`` exists and can be read."""
+    return path.exists() and os.access(path, os.R_OK)
+
+
+def _existing_output_dir(base: Path, output_file: str) -> Path:
+    """Return the nearest existing directory ``output_file`` will be written under.
+
+    Missing output directories are created on emit, so their closest existing
+    parent is the one that has to be writable.
+    """
+    output_dir = (base / output_file).parent if output_file else base
+    while not output_dir.exists() and output_dir != output_dir.parent:
+        output_dir = output_dir.parent
+    return output_dir
+
+
+def _check_output_dir(
+    transform_name: str,
+    output_dir: Path,
+    *,
+    checks_run: dict[str, bool],
+    errors: list[str],
+    warnings: list[str],
+) -> None:
+    """Check that ``output_dir`` is writable and has disk space to spare."""
+    try:
+        # Test write permission
+        test_file = output_dir / ".ggen-write-test"
+        test_file.touch()
+        test_file.unlink()
+        checks_run[f"{transform_name}_output_writable"] = True
+    except (OSError, PermissionError):
+        checks_run[f"{transform_name}_output_writable"] = False
+        errors.append(f"{transform_name}: Output directory not writable: {output_dir}")
+
+    # Disk space (simple check - at least 10MB free)
+    try:
+        statvfs = os.statvfs(str(output_dir))
+        free_bytes = statvfs.f_bavail * statvfs.f_frsize
+        min_bytes = 10 * 1024 * 1024  # 10MB minimum
+        checks_run[f"{transform_name}_disk_space"] = free_bytes > min_bytes
+        if not checks_run[f"{transform_name}_disk_space"]:
+            free_mb = free_bytes / (1024 * 1024)
+            warnings.append(f"{transform_name}: Low disk space: {free_mb:.1f}MB available")
+    except (OSError, AttributeError):
+        # Graceful degradation if statvfs not available
+        checks_run[f"{transform_name}_disk_space"] = True
+
+
+def _check_schema_file(
+    transform_name: str,
+    base: Path,
+    schema_file: str,
+    *,
+    checks_run: dict[str, bool],
+    errors: list[str],
+    warnings: list[str],
+) -> None:
+    """Check that a schema file is readable and looks like RDF."""
+    path = base / schema_file
+    can_read = _is_readable(path)
+    checks_run[f"{transform_name}_schema_readable"] = can_read
+    if not can_read:
+        errors.append(f"{transform_name}: Cannot read schema file: {schema_file}")
+        return
+
+    # Try to validate basic RDF syntax
+    try:
+        content = path.read_text()
+        if not _is_valid_rdf_syntax(content):
+            warnings.append(
+                f"{transform_name}: Schema file may have invalid RDF syntax: {schema_file}"
+            )
+    except (OSError, ValueError) as e:
+        warnings.append(f"{transform_name}: Error reading schema file: {e}")
+
+
 def _is_valid_rdf_syntax(content: str) -> bool:
     """Check if content looks like valid RDF/Turtle.
 
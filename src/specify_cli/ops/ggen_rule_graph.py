@@ -0,0 +1,199 @@
+"""
+specify_cli.ops.ggen_rule_graph - Rule Dependency Graph for ggen sync
+=====================================================================
+
+Pure planning of the μ pipeline across all rules in a manifest.
+
+ggen.toml declares many ``[[rules]]`` that share the same ontology and SPARQL
+query (e.g. ``agi-command-ops`` and ``agi-reasoner-ops`` both use
+``cli-commands-agi.ttl`` + ``extract-agi-commands.rq``). Running each rule
+through the whole pipeline repeats μ₁/μ₂ work. This module builds a DAG:
+
+    normalize(ontology set, shapes) → extract(query) → emit(template → output)
+
+Identical normalize and extract nodes are deduplicated, so each ontology set
+is loaded once and each SPARQL query runs once per ontology set. Emit nodes
+(μ₃ through μ₅) stay one per rule and are independent of each other.
+
+This module contains PURE FUNCTIONS - execution is in
+:mod:`specify_cli.runtime.ggen_scheduler`.
+
+Examples:
+    >>> from specify_cli.ops.ggen_rule_graph import build_rule_graph
+    >>> graph = build_rule_graph(configs)
+    >>> graph.summary()
+    {'rules': 19, 'normalize': 9, 'extract': 10, 'emit': 19, ...}
+
+See Also:
+    - specify_cli.runtime.ggen_scheduler : Parallel DAG execution
+    - specify_cli.ops.ggen_manifest : Manifest → TransformConfig
+"""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from specify_cli.ops.transform import TransformConfig
+
+__all__ = [
+    "NODE_KINDS",
+    "RuleGraph",
+    "RuleNode",
+    "build_rule_graph",
+]
+
+# Node kinds in dependency order
+NODE_KINDS = ("normalize", "extract", "emit")
+
+
+@dataclass
+class RuleNode:
+    """Node in the rule graph.
+
+    Attributes
+    ----------
+    node_id : str
+        Stable identifier ("<kind>:<hash>").
+    kind : str
+        "normalize", "extract" or "emit".
+    label : str
+        Human-readable description for reports.
+    config : TransformConfig
+        Representative config (its inputs/query/template define the node).
+    depends_on : list[str]
+        Parent node ids (at most one: the previous stage).
+    rules : list[str]
+        Names of the rules this node serves.
+    """
+
+    node_id: str
+    kind: str
+    label: str
+    config: TransformConfig
+    depends_on: list[str] = field(default_factory=list)
+    rules: list[str] = field(default_factory=list)
+
+
+@dataclass
+class RuleGraph:
+    """DAG of deduplicated pipeline nodes for a set of rules.
+
+    Attributes
+    ----------
+    nodes : dict[str, RuleNode]
+        Nodes by id, in topological order.
+    configs : dict[str, TransformConfig]
+        Rule configs by rule name.
+    """
+
+    nodes: dict[str, RuleNode] = field(default_factory=dict)
+    configs: dict[str, TransformConfig] = field(default_factory=dict)
+
+    def children(self, node_id: str) -> list[RuleNode]:
+        """Get nodes that depend on ``node_id``."""
+        return [n for n in self.nodes.values() if node_id in n.depends_on]
+
+    def roots(self) -> list[RuleNode]:
+        """Get nodes without dependencies."""
+        return [n for n in self.nodes.values() if not n.depends_on]
+
+    def of_kind(self, kind: str) -> list[RuleNode]:
+        """Get all nodes of one kind."""
+        return [n for n in self.nodes.values() if n.kind == kind]
+
+    def summary(self) -> dict[str, Any]:
+        """Count nodes per kind and the stage runs saved by deduplication."""
+        counts = {kind: len(self.of_kind(kind)) for kind in NODE_KINDS}
+        rules = len(self.configs)
+        return {
+            "rules": rules,
+            **counts,
+            "normalize_saved": rules - counts["normalize"],
+            "extract_saved": rules - counts["extract"],
+        }
+
+
+def build_rule_graph(configs: list[TransformConfig]) -> RuleGraph:
+    """Build the deduplicated rule graph.
+
+    Parameters
+    ----------
+    configs : list[TransformConfig]
+        Rule configurations (names must be unique).
+
+    Returns
+    -------
+    RuleGraph
+        Graph whose normalize/extract nodes are shared by rules with the same
+        ontology set, shapes and SPARQL query.
+
+    Raises
+    ------
+    ValueError
+        If two rules share a name or an output file.
+    """
+    graph = RuleGraph()
+    outputs: set[str] = set()
+
+    for config in configs:
+        if config.name in graph.configs:
+            raise ValueError(f"Duplicate rule name: {config.name}")
+        if config.output_file in outputs:
+            raise ValueError(f"Output file used by more than one rule: {config.output_file}")
+        graph.configs[config.name] = config
+        outputs.add(config.output_file)
+
+        normalize_id = _node_id(
+            "normalize", *config.input_files, "|shapes|", *config.schema_files
+        )
+        normalize = graph.nodes.get(normalize_id)
+        if normalize is None:
+            normalize = RuleNode(
+                node_id=normalize_id,
+                kind="normalize",
+                label=", ".join(config.input_files),
+                config=config,
+            )
+            graph.nodes[normalize_id] = normalize
+        normalize.rules.append(config.name)
+
+        extract_id = _node_id("extract", normalize_id, config.sparql_query)
+        extract = graph.nodes.get(extract_id)
+        if extract is None:
+            extract = RuleNode(
+                node_id=extract_id,
+                kind="extract",
+                label=config.sparql_query,
+                config=config,
+                depends_on=[normalize_id],
+            )
+            graph.nodes[extract_id] = extract
+        extract.rules.append(config.name)
+
+        emit_id = _node_id("emit", config.name)
+        graph.nodes[emit_id] = RuleNode(
+            node_id=emit_id,
+            kind="emit",
+            label=f"{config.template} → {config.output_file}",
+            config=config,
+            depends_on=[extract_id],
+            rules=[config.name],
+        )
+
+    # Keep nodes in stage order so iteration is topological
+    graph.nodes = {
+        node_id: node
+        for kind in NODE_KINDS
+        for node_id, node in graph.nodes.items()
+        if node.kind == kind
+    }
+    return graph
+
+
+def _node_id(kind: str, *parts: str) -> str:
+    """Derive a stable node id from its defining parts."""
+    digest = hashlib.sha256("\0".join(parts).encode()).hexdigest()[:12]
+    return f"{kind}:{digest}"
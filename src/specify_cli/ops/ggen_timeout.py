@@ -23,17 +23,24 @@ Examples:
 
 See Also:
     - specify_cli.runtime.ggen : Runtime ggen operations
+    - specify_cli.runtime.sparql_pool : Killable worker-process execution
     - docs/GGEN_SYNC_POKA_YOKE.md : Error-proofing design
 
 Notes:
     Prevents SPARQL query hangs which can block entire pipelines.
-    Uses thread-based timeout that works across platforms.
+    Uses thread-based timeout that works across platforms. A timed-out
+    thread cannot be killed and keeps running; use
+    ``specify_cli.runtime.sparql_pool.SPARQLWorkerPool`` where runaway
+    queries must actually be cancelled.
 """
 
 from __future__ import annotations
 
 import threading
-from typing import Any, TypeVar
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
 __all__ = [
     "SPARQLTimeoutError",
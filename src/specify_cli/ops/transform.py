@@ -45,6 +45,8 @@ class StageResult:
         Intermediate output for debugging
     errors : list[str]
         Error messages from this stage
+    duration_ms : float
+        Wall-clock time spent in this stage (0.0 if not measured)
     """
 
     stage: str
@@ -53,6 +55,7 @@ class StageResult:
     output_hash: str
     output: str | None
     errors: list[str]
+    duration_ms: float = 0.0
 
 
 @dataclass
@@ -311,6 +314,115 @@ def emit_template(
         )
 
 
+class StreamingCanonicalizer:
+    """Single-pass μ₄ CANONICALIZE over rendered chunks.
+
+    Produces exactly the output of :func:`canonicalize_output` for the
+    concatenated chunks, but holds at most one partial line plus a count of
+    pending blank lines. SHA256 of the raw input (the μ₃ EMIT hash) and of
+    the canonical output are updated as text passes through.
+
+    Examples
+    --------
+        >>> canon = StreamingCanonicalizer()
+        >>> canon.feed("a  \r") + canon.feed("\nb\n\n") + canon.finish()
+        'a\nb\n'
+        >>> canon.output_hash == sha256(b"a\nb\n").hexdigest()
+        True
+    """
+
+    def __init__(self) -> None:
+        """Initialize canonicalizer state."""
+        self._input = sha256()
+        self._output = sha256()
+        self._partial = ""  # Current line, not yet terminated
+        self._pending_cr = False  # Chunk ended in "\r" (maybe half of "\r\n")
+        self._blank_lines = 0  # Blank lines not yet known to be non-trailing
+        self._wrote_line = False
+        self._saw_newline = False
+        self.original_length = 0
+        self.canonical_length = 0
+        self.line_count = 1
+
+    def feed(self, chunk: str) -> str:
+        """Consume a chunk and return the canonical text now final.
+
+        Parameters
+        ----------
+        chunk : str
+            Next piece of rendered output.
+
+        Returns
+        -------
+        str
+            Canonical text to append to the output (possibly empty).
+        """
+        self._input.update(chunk.encode())
+        self.original_length += len(chunk)
+
+        if self._pending_cr:
+            chunk = "\r" + chunk
+            self._pending_cr = False
+        if chunk.endswith("\r"):
+            chunk = chunk[:-1]
+            self._pending_cr = True
+
+        lines = (self._partial + chunk).replace("\r\n", "\n").replace("\r", "\n").split("\n")
+        self._partial = lines.pop()
+        return self._emit(self._line(line.rstrip()) for line in lines)
+
+    def finish(self) -> str:
+        """Flush the last line and the final newline.
+
+        Returns
+        -------
+        str
+            Remaining canonical text.
+        """
+        pieces = []
+        if self._pending_cr:
+            self._pending_cr = False
+            pieces.append(self._line(self._partial.rstrip()))
+            self._partial = ""
+        last = self._partial.rstrip()
+        self._partial = ""
+        if last:
+            pieces.append(self._line(last, terminated=False))
+        if self._wrote_line or self._saw_newline:
+            pieces.append("\n")
+        return self._emit(pieces)
+
+    @property
+    def input_hash(self) -> str:
+        """SHA256 of the raw text fed so far."""
+        return self._input.hexdigest()
+
+    @property
+    def output_hash(self) -> str:
+        """SHA256 of the canonical text returned so far."""
+        return self._output.hexdigest()
+
+    def _line(self, line: str, terminated: bool = True) -> str:
+        """Canonical text for one trailing-whitespace-trimmed line."""
+        if terminated:
+            self._saw_newline = True
+            self.line_count += 1
+        if not line:
+            self._blank_lines += 1
+            return ""
+        separators = self._blank_lines + (1 if self._wrote_line else 0)
+        self._blank_lines = 0
+        self._wrote_line = True
+        return "\n" * separators + line
+
+    def _emit(self, pieces: Any) -> str:
+        text = "".join(pieces)
+        if text:
+            self._output.update(text.encode())
+            self.canonical_length += len(text)
+        return text
+
+
 def canonicalize_output(content: str) -> StageResult:
     """μ₄ CANONICALIZE: Normalize output format.
 
@@ -326,35 +438,26 @@ def canonicalize_output(content: str) -> StageResult:
     Returns
     -------
     StageResult
-        Canonicalized content
+        Canonicalized content (hashes of the raw and canonical text)
     """
     with span("ops.canonicalize_output"):
-        original_length = len(content)
-
-        # Normalize line endings
-        normalized = content.replace("\r\n", "\n").replace("\r", "\n")
-
-        # Trim trailing whitespace per line
-        lines = [line.rstrip() for line in normalized.split("\n")]
-        trimmed = "\n".join(lines)
-
-        # Ensure exactly one final newline
-        canonical = trimmed.rstrip() + "\n" if trimmed else ""
+        canon = StreamingCanonicalizer()
+        canonical = canon.feed(content) + canon.finish()
 
         add_span_event(
             "canonicalize.completed",
             {
-                "original_length": original_length,
-                "canonical_length": len(canonical),
-                "line_count": len(lines),
+                "original_length": canon.original_length,
+                "canonical_length": canon.canonical_length,
+                "line_count": canon.line_count,
             },
         )
 
         return StageResult(
             stage="canonicalize",
             success=True,
-            input_hash="",
-            output_hash="",
+            input_hash=canon.input_hash,
+            output_hash=canon.output_hash,
             output=canonical,
             errors=[],
         )
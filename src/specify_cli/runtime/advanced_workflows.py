@@ -1,11 +1,20 @@
 from __future__ import annotations
 
+import contextlib
+import heapq
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
 from dataclasses import dataclass, field
 from enum import Enum
+from multiprocessing import shared_memory
 from typing import Any, Callable
 
+import numpy as np
+
 from specify_cli.core.shell import timed
 from specify_cli.core.telemetry import metric_counter, metric_histogram, span
+from specify_cli.runtime.parallel import ParallelExecutor, close_pool, new_pool
 
 
 class WorkflowPattern(Enum):
@@ -25,6 +34,7 @@ class WorkflowNode:
     loop_count: int = 1
     dependencies: list[str] = field(default_factory=list)
     timeout: float = 30.0
+    pass_results: bool = False
 
 
 @dataclass
@@ -36,87 +46,329 @@ class WorkflowExecution:
     errors: dict[str, str] = field(default_factory=dict)
     duration: float = 0.0
     success: bool = True
+    nodes_skipped: list[str] = field(default_factory=list)
+    node_timings: dict[str, dict[str, float]] = field(default_factory=dict)
+    critical_path: list[str] = field(default_factory=list)
+    critical_path_duration: float = 0.0
+    # Process mode: node id -> shared memory reference of its array result,
+    # and the blocks backing those arrays (kept open while results are used)
+    shared_refs: dict[str, Any] = field(default_factory=dict, repr=False)
+    shared_blocks: list[Any] = field(default_factory=list, repr=False)
 
 
 class AdvancedWorkflow:
-    def __init__(self, workflow_id: str):
+    """DAG of workflow nodes, each started as soon as its dependencies finish.
+
+    Each ``execute`` runs ready nodes on a pool of its own (``mode``
+    "thread" or "process") with at most ``max_workers`` running, longest
+    remaining critical path first; path lengths use the node durations of
+    earlier runs. A node with ``pass_results=True`` is called with
+    ``{dependency_id: result}``. Threads share the result objects; in
+    process mode NumPy array results travel through shared memory instead of
+    being pickled. Nodes whose dependencies failed are skipped.
+
+    A node that exceeds its ``timeout`` fails with ``TimeoutError``. In
+    thread mode the timeout does not stop the handler: it keeps running in
+    the background and its result is discarded. In process mode the workers
+    still running timed-out nodes are terminated when ``execute`` returns.
+    """
+
+    def __init__(self, workflow_id: str, max_workers: int | None = None, mode: str = "thread"):
+        if mode not in ("thread", "process"):
+            raise ValueError(f"Unknown workflow mode: {mode} (expected 'thread' or 'process')")
         self.workflow_id = workflow_id
         self.nodes: dict[str, WorkflowNode] = {}
         self.execution_order = []
+        self.max_workers = max(1, max_workers or os.cpu_count() or 1)
+        self.mode = mode
+        self.node_durations: dict[str, float] = {}
 
     def add_node(self, node: WorkflowNode) -> None:
         self.nodes[node.node_id] = node
 
+    def _dependencies(self, node_id: str) -> list[str]:
+        return [dep for dep in self.nodes[node_id].dependencies if dep in self.nodes]
+
     def _topological_sort(self) -> list[str]:
-        visited = set()
+        """Dependencies-first order; raises ValueError on a cycle."""
+        state: dict[str, int] = {}  # 1 = visiting, 2 = done
         order = []
 
-        def visit(node_id: str) -> None:
-            if node_id in visited:
+        def visit(node_id: str, path: list[str]) -> None:
+            if state.get(node_id) == 2:
                 return
-            visited.add(node_id)
-
-            node = self.nodes[node_id]
-            for dep in node.dependencies:
-                if dep in self.nodes:
-                    visit(dep)
-
+            if state.get(node_id) == 1:
+                cycle = [*path[path.index(node_id) :], node_id]
+                raise ValueError(f"Dependency cycle: {' -> '.join(cycle)}")
+            state[node_id] = 1
+            for dep in self._dependencies(node_id):
+                visit(dep, [*path, node_id])
+            state[node_id] = 2
             order.append(node_id)
 
         for node_id in self.nodes:
-            visit(node_id)
+            visit(node_id, [])
 
         return order
 
+    def _critical_path_lengths(self, order: list[str]) -> dict[str, float]:
+        """Longest estimated time from each node to the end of the workflow."""
+        dependents: dict[str, list[str]] = {node_id: [] for node_id in order}
+        for node_id in order:
+            for dep in self._dependencies(node_id):
+                dependents[dep].append(node_id)
+
+        lengths: dict[str, float] = {}
+        for node_id in reversed(order):
+            cost = self.node_durations.get(node_id, 1.0)
+            lengths[node_id] = cost + max((lengths[d] for d in dependents[node_id]), default=0.0)
+        return lengths
+
     @timed
     def execute(self) -> WorkflowExecution:
-        with span("workflow.execute", workflow=self.workflow_id):
+        with span("workflow.execute", workflow=self.workflow_id, mode=self.mode):
             execution = WorkflowExecution(workflow_id=self.workflow_id)
             order = self._topological_sort()
+            self.execution_order = order
 
-            for node_id in order:
-                node = self.nodes[node_id]
+            start = time.perf_counter()
+            _DagRun(self, execution, order).run()
+            execution.duration = time.perf_counter() - start
+            execution.critical_path, execution.critical_path_duration = self._critical_path(
+                execution
+            )
 
-                try:
-                    if node.pattern == WorkflowPattern.SEQUENTIAL:
-                        result = node.handler()
-                    elif node.pattern == WorkflowPattern.CONDITIONAL:
-                        if node.condition and node.condition():
-                            result = node.handler()
-                        else:
-                            result = {"skipped": True}
-                    elif node.pattern == WorkflowPattern.LOOP:
-                        results = []
-                        for _ in range(node.loop_count):
-                            results.append(node.handler())
-                        result = {"iterations": len(results)}
-                    else:
-                        result = node.handler()
-
-                    execution.nodes_executed.append(node_id)
-                    execution.results[node_id] = result
-
-                except Exception as e:
-                    execution.nodes_failed.append(node_id)
-                    execution.errors[node_id] = str(e)
-                    execution.success = False
-
-                    metric_counter("workflow.node_failed", 1, {
-                        "workflow": self.workflow_id,
-                        "node": node_id,
-                    })
-
-            metric_histogram("workflow.nodes_executed", len(execution.nodes_executed))
-            metric_counter("workflow.completed", 1, {
-                "success": str(execution.success),
-            })
+            metric_histogram("workflow.nodes_executed", unit="1")(len(execution.nodes_executed))
+            metric_histogram("workflow.duration")(execution.duration)
+            metric_counter("workflow.completed")(1)
 
             return execution
 
+    def _submit(self, pool: Executor, node: WorkflowNode, execution: WorkflowExecution) -> Future:
+        inputs = None
+        if node.pass_results:
+            inputs = {dep: execution.results[dep] for dep in self._dependencies(node.node_id)}
+            if self.mode == "process":
+                inputs = {
+                    dep: execution.shared_refs.get(dep, value) for dep, value in inputs.items()
+                }
+        return pool.submit(
+            _run_node,
+            node.pattern,
+            node.handler,
+            condition=node.condition,
+            loop_count=node.loop_count,
+            inputs=inputs,
+            in_process=self.mode == "process",
+        )
+
+    def _receive(self, node_id: str, result: Any, execution: WorkflowExecution) -> Any:
+        """Map a shared-memory array result into this process (no copy)."""
+        if not isinstance(result, _SharedArray):
+            return result
+        array, block = result.attach()
+        execution.shared_blocks.append(block)
+        execution.shared_refs[node_id] = result
+        return array
+
+    def _critical_path(self, execution: WorkflowExecution) -> tuple[list[str], float]:
+        """Chain of executed nodes that determined the finish time."""
+        timings = execution.node_timings
+        finished = [n for n in execution.nodes_executed if n in timings]
+        if not finished:
+            return [], 0.0
+        path = [max(finished, key=lambda n: timings[n]["end"])]
+        while True:
+            deps = [d for d in self._dependencies(path[-1]) if d in timings]
+            if not deps:
+                break
+            path.append(max(deps, key=lambda d: timings[d]["end"]))
+        path.reverse()
+        return path, sum(timings[n]["duration"] for n in path)
+
+
+class _DagRun:
+    """Scheduling state of one ``AdvancedWorkflow.execute`` call."""
+
+    def __init__(self, workflow: AdvancedWorkflow, execution: WorkflowExecution, order: list[str]):
+        self.workflow = workflow
+        self.execution = execution
+        self.position = {node_id: i for i, node_id in enumerate(order)}
+        self.priority = workflow._critical_path_lengths(order)  # noqa: SLF001
+        self.waiting = {n: set(workflow._dependencies(n)) for n in order}  # noqa: SLF001
+        self.dependents: dict[str, list[str]] = {node_id: [] for node_id in order}
+        for node_id, deps in self.waiting.items():
+            for dep in deps:
+                self.dependents[dep].append(node_id)
+        self.ready = [
+            (-self.priority[n], self.position[n], n) for n in order if not self.waiting[n]
+        ]
+        heapq.heapify(self.ready)
+        # future -> (node id, start time)
+        self.running: dict[Future, tuple[str, float]] = {}
+        self.start = time.perf_counter()
+        # A timed-out node may still be running on the pool
+        self.abandoned = False
+
+    def run(self) -> None:
+        workflow = self.workflow
+        pool = new_pool(
+            workflow.mode, workflow.max_workers, name=f"workflow-{workflow.workflow_id}"
+        )
+        try:
+            while self.ready or self.running:
+                while self.ready and len(self.running) < self.workflow.max_workers:
+                    node_id = heapq.heappop(self.ready)[2]
+                    node = self.workflow.nodes[node_id]
+                    future = self.workflow._submit(pool, node, self.execution)  # noqa: SLF001
+                    self.running[future] = (node_id, time.perf_counter())
+
+                done, _ = wait(
+                    self.running, timeout=self._wait_timeout(), return_when=FIRST_COMPLETED
+                )
+                self._collect(done, time.perf_counter())
+        finally:
+            for future in self.running:
+                if not future.cancel():
+                    self.abandoned = True
+            close_pool(pool, abandoned=self.abandoned)
+            for block in self.execution.shared_blocks:
+                with contextlib.suppress(FileNotFoundError):
+                    block.unlink()
+
+    def _wait_timeout(self) -> float | None:
+        """Seconds until the earliest running node times out."""
+        if not self.running:
+            return None
+        now = time.perf_counter()
+        nodes = self.workflow.nodes
+        return max(0.0, min(t + nodes[n].timeout - now for n, t in self.running.values()))
+
+    def _collect(self, done: set[Future], now: float) -> None:
+        """Record finished and timed-out nodes."""
+        for future, (node_id, started) in list(self.running.items()):
+            timeout = self.workflow.nodes[node_id].timeout
+            if future not in done and now - started < timeout:
+                continue
+            del self.running[future]
+            self.execution.node_timings[node_id] = {
+                "start": started - self.start,
+                "end": now - self.start,
+                "duration": now - started,
+            }
+            if future not in done:
+                if not future.cancel():
+                    self.abandoned = True
+                self._fail(node_id, TimeoutError(f"timed out after {timeout}s"))
+                continue
+            try:
+                result = self.workflow._receive(node_id, future.result(), self.execution)  # noqa: SLF001
+            except Exception as e:
+                self._fail(node_id, e)
+            else:
+                self.execution.nodes_executed.append(node_id)
+                self.execution.results[node_id] = result
+                self.workflow.node_durations[node_id] = now - started
+                self._release_dependents(node_id)
+
+    def _release_dependents(self, node_id: str) -> None:
+        for child in self.dependents[node_id]:
+            self.waiting[child].discard(node_id)
+            if not self.waiting[child] and child not in self.execution.nodes_skipped:
+                heapq.heappush(self.ready, (-self.priority[child], self.position[child], child))
+
+    def _fail(self, node_id: str, error: BaseException) -> None:
+        execution = self.execution
+        execution.nodes_failed.append(node_id)
+        execution.errors[node_id] = str(error) or type(error).__name__
+        execution.success = False
+        metric_counter("workflow.node_failed")(1)
+
+        blocked = list(self.dependents[node_id])
+        while blocked:
+            child = blocked.pop()
+            if child not in execution.nodes_skipped:
+                execution.nodes_skipped.append(child)
+                execution.errors[child] = f"skipped: dependency {node_id} failed"
+                blocked.extend(self.dependents[child])
+
+
+@dataclass(frozen=True)
+class _SharedArray:
+    """Reference to a NumPy array in a shared memory block."""
+
+    name: str
+    shape: tuple[int, ...]
+    dtype: str
+
+    @classmethod
+    def export(cls, array: np.ndarray) -> _SharedArray:
+        """Copy ``array`` into a new block; the block outlives this handle."""
+        block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        np.ndarray(array.shape, array.dtype, buffer=block.buf)[...] = array
+        ref = cls(block.name, array.shape, array.dtype.str)
+        block.close()
+        return ref
+
+    def attach(self) -> tuple[np.ndarray, shared_memory.SharedMemory]:
+        block = shared_memory.SharedMemory(name=self.name)
+        return np.ndarray(self.shape, np.dtype(self.dtype), buffer=block.buf), block
+
+
+def _run_node(
+    pattern: WorkflowPattern,
+    handler: Callable,
+    *,
+    condition: Callable | None,
+    loop_count: int,
+    inputs: dict[str, Any] | None,
+    in_process: bool,
+) -> Any:
+    """Run one node (possibly in a worker process)."""
+    blocks = []
+    attached = None
+    if inputs is not None and in_process:
+        attached = {}
+        for dep, value in inputs.items():
+            if isinstance(value, _SharedArray):
+                array, block = value.attach()
+                blocks.append(block)
+                attached[dep] = array
+            else:
+                attached[dep] = value
+        inputs = attached
+    args = () if inputs is None else (inputs,)
+
+    if pattern == WorkflowPattern.CONDITIONAL:
+        result = handler(*args) if condition and condition() else {"skipped": True}
+    elif pattern == WorkflowPattern.LOOP:
+        results = [handler(*args) for _ in range(loop_count)]
+        result = {"iterations": len(results)}
+    else:
+        result = handler(*args)
+
+    if in_process and isinstance(result, np.ndarray):
+        result = _SharedArray.export(result)
+    inputs = args = attached = None
+    for block in blocks:
+        # Fails (and keeps the mapping) while the result still views the block
+        with contextlib.suppress(BufferError):
+            block.close()
+    return result
+
+
+def _call(handler: Callable) -> Any:
+    return handler()
+
 
 class ParallelWorkflowExecutor:
-    def __init__(self):
+    """Runs independent tasks concurrently on a shared ParallelExecutor."""
+
+    def __init__(
+        self, mode: str = "thread", max_workers: int | None = None, timeout: float | None = None
+    ):
         self.tasks = []
+        self.executor = ParallelExecutor(mode, max_workers, chunk_size=1, timeout=timeout)
 
     def add_task(self, task_id: str, handler: Callable) -> None:
         self.tasks.append((task_id, handler))
@@ -127,14 +379,16 @@ class ParallelWorkflowExecutor:
             results = {}
             errors = {}
 
-            for task_id, handler in self.tasks:
-                try:
-                    results[task_id] = handler()
-                except Exception as e:
-                    errors[task_id] = str(e)
+            handlers = [handler for _, handler in self.tasks]
+            for outcome in self.executor.imap(_call, handlers, ordered=False):
+                task_id = self.tasks[outcome.index][0]
+                if outcome.ok:
+                    results[task_id] = outcome.value
+                else:
+                    errors[task_id] = str(outcome.error) or type(outcome.error).__name__
 
-            metric_counter("parallel_workflow.completed", 1)
-            metric_histogram("parallel_workflow.task_count", len(self.tasks))
+            metric_counter("parallel_workflow.completed")(1)
+            metric_histogram("parallel_workflow.task_count", unit="1")(len(self.tasks))
 
             return {
                 "successful_tasks": len(results),
@@ -1,11 +1,33 @@
+"""Autonomous agents and a multi-agent orchestrator.
+
+The orchestrator dispatches tasks to agents of the task's role concurrently.
+Each agent runs at most ``AgentCapabilities.max_concurrent_tasks`` tasks at a
+time. Agents with a free slot sit in a per-role idle deque, so assigning a
+task is O(1). ``dispatch_multiple_tasks`` runs tasks on the orchestrator's own
+thread pool, so agent handlers may run parallel work of their own without
+starving the dispatcher; ``dispatch_multiple_tasks_async`` runs them on the
+caller's event loop via ``AutonomousAgent.execute_task_async``.
+"""
+
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import threading
+import time
+import weakref
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, wait
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Callable
+from typing import Any
 
 from specify_cli.core.shell import timed
 from specify_cli.core.telemetry import metric_counter, metric_histogram, span
+from specify_cli.runtime.parallel import ThreadPool
+
+# Upper bound on the dispatch thread pool
+MAX_DISPATCH_THREADS = 32
 
 
 class AgentRole(Enum):
@@ -41,6 +63,12 @@ class AutonomousAgent:
         self.task_queue = []
         self.completed_tasks = []
         self.current_task = None
+        # Slots in use; maintained by the orchestrator
+        self.active_tasks = 0
+
+    @property
+    def capacity(self) -> int:
+        return max(1, self.capabilities.max_concurrent_tasks)
 
     def accept_task(self, task: AgentTask) -> bool:
         if task.required_role == self.capabilities.role:
@@ -48,11 +76,12 @@ class AutonomousAgent:
             return True
         return False
 
-    @timed
     def execute_task(self, task: AgentTask) -> dict[str, Any]:
-        with span(f"agent.execute", agent=self.agent_id, task=task.task_id):
+        with span("agent.execute", agent=self.agent_id, task=task.task_id):
             self.current_task = task
             task.status = "running"
+            with contextlib.suppress(ValueError):
+                self.task_queue.remove(task)
 
             try:
                 result = self._process_task(task)
@@ -60,18 +89,22 @@ class AutonomousAgent:
                 task.output_data = result
                 self.completed_tasks.append(task)
 
-                metric_counter("agent.task_completed", 1, {
-                    "agent": self.agent_id,
-                    "role": self.capabilities.role.value,
-                })
+                metric_counter("agent.task_completed")(1)
 
                 return {"success": True, "result": result}
 
             except Exception as e:
                 task.status = "failed"
-                metric_counter("agent.task_failed", 1, {"agent": self.agent_id})
+                metric_counter("agent.task_failed")(1)
                 return {"success": False, "error": str(e)}
 
+    async def execute_task_async(self, task: AgentTask) -> dict[str, Any]:
+        """Asyncio variant of ``execute_task``; runs it in a worker thread.
+
+        Agents whose work is natively asynchronous override this.
+        """
+        return await asyncio.to_thread(self.execute_task, task)
+
     def _process_task(self, task: AgentTask) -> dict[str, Any]:
         if self.capabilities.role == AgentRole.ANALYZER:
             return self._analyze(task)
@@ -117,6 +150,8 @@ class AutonomousAgent:
             "current_task": self.current_task.task_id if self.current_task else None,
             "completed_tasks": len(self.completed_tasks),
             "pending_tasks": len(self.task_queue),
+            "active_tasks": self.active_tasks,
+            "capacity": self.capacity,
         }
 
 
@@ -127,31 +162,107 @@ class AgentCoordinationResult:
     tasks_completed: int = 0
     tasks_failed: int = 0
     total_duration: float = 0.0
+    # Busy time of successful tasks over wall-clock time times usable slots
     coordination_efficiency: float = 0.0
+    # Completed tasks per wall-clock second
+    throughput: float = 0.0
 
 
 class MultiAgentOrchestrator:
-    def __init__(self):
+    def __init__(self, max_workers: int | None = None):
         self.agents: dict[str, AutonomousAgent] = {}
         self.task_log = []
+        self.max_workers = max_workers
+        # Role -> agents with a free slot, in round-robin order
+        self._idle: dict[AgentRole, deque[AutonomousAgent]] = {}
+        # Role -> total slots of registered agents
+        self._capacity: dict[AgentRole, int] = {}
+        self._slots = threading.Condition()
+        # Threads start as tasks need them; each running task holds an agent slot
+        self._executor = ThreadPool(max_workers or MAX_DISPATCH_THREADS, name="orchestrator")
+        weakref.finalize(self, self._executor.shutdown, wait=False)
 
     def register_agent(self, agent: AutonomousAgent) -> None:
-        self.agents[agent.agent_id] = agent
+        role = agent.capabilities.role
+        with self._slots:
+            previous = self.agents.get(agent.agent_id)
+            if previous is not None:
+                old_role = previous.capabilities.role
+                self._capacity[old_role] -= previous.capacity
+                with contextlib.suppress(ValueError):
+                    self._idle[old_role].remove(previous)
+
+            self.agents[agent.agent_id] = agent
+            self._capacity[role] = self._capacity.get(role, 0) + agent.capacity
+            if agent.active_tasks < agent.capacity:
+                self._idle.setdefault(role, deque()).append(agent)
+            self._slots.notify_all()
 
     def _get_agent_for_task(self, task: AgentTask) -> AutonomousAgent | None:
-        candidates = [
-            a for a in self.agents.values()
-            if a.capabilities.role == task.required_role
-        ]
-
-        if candidates:
-            return min(candidates, key=lambda a: len(a.task_queue))
-        return None
+        """Reserve a slot on an idle agent of the task's role; caller holds ``_slots``."""
+        idle = self._idle.get(task.required_role)
+        if not idle:
+            return None
+        agent = idle.popleft()
+        agent.active_tasks += 1
+        if agent.active_tasks < agent.capacity:
+            idle.append(agent)
+        return agent
+
+    def _release_agent(self, agent: AutonomousAgent) -> None:
+        with self._slots:
+            agent.active_tasks -= 1
+            registered = self.agents.get(agent.agent_id) is agent
+            if registered and agent.active_tasks == agent.capacity - 1:
+                self._idle.setdefault(agent.capabilities.role, deque()).append(agent)
+            self._slots.notify_all()
+
+    def _wait_for_agent(self, task: AgentTask, timeout: float | None) -> AutonomousAgent | None:
+        """Reserve a slot, waiting while every agent of the role is busy."""
+        role = task.required_role
+        with self._slots:
+            self._slots.wait_for(
+                lambda: self._idle.get(role) or not self._capacity.get(role), timeout
+            )
+            return self._get_agent_for_task(task)
+
+    def _log(self, task: AgentTask, result: dict[str, Any]) -> None:
+        self.task_log.append((task.task_id, result))
+
+    def _run(self, agent: AutonomousAgent, task: AgentTask) -> tuple[dict[str, Any], float]:
+        """Run ``task`` on a reserved ``agent``; returns the result and its duration."""
+        start = time.perf_counter()
+        try:
+            if not agent.accept_task(task):
+                return {"success": False, "error": "Agent rejected task"}, 0.0
+            result = agent.execute_task(task)
+        finally:
+            self._release_agent(agent)
+        self._log(task, result)
+        return result, time.perf_counter() - start
+
+    async def _run_async(
+        self, agent: AutonomousAgent, task: AgentTask
+    ) -> tuple[dict[str, Any], float]:
+        start = time.perf_counter()
+        try:
+            if not agent.accept_task(task):
+                return {"success": False, "error": "Agent rejected task"}, 0.0
+            result = await agent.execute_task_async(task)
+        finally:
+            self._release_agent(agent)
+        self._log(task, result)
+        return result, time.perf_counter() - start
 
     @timed
-    def dispatch_task(self, task: AgentTask) -> dict[str, Any]:
+    def dispatch_task(self, task: AgentTask, timeout: float | None = 0) -> dict[str, Any]:
+        """Run ``task`` on an idle agent of its role.
+
+        Fails at once when every agent of the role is busy, unless
+        ``timeout`` gives seconds to wait for a slot (None waits indefinitely).
+        """
         with span("orchestration.dispatch_task", task=task.task_id):
-            agent = self._get_agent_for_task(task)
+            agent = self._wait_for_agent(task, timeout)
 
             if not agent:
                 return {
@@ -159,12 +270,7 @@ class MultiAgentOrchestrator:
                     "error": f"No agent available for role {task.required_role}",
                 }
 
-            if agent.accept_task(task):
-                result = agent.execute_task(task)
-                self.task_log.append((task.task_id, result))
-                return result
-
-            return {"success": False, "error": "Agent rejected task"}
+            return self._run(agent, task)[0]
 
     @timed
     def dispatch_multiple_tasks(
@@ -172,24 +278,72 @@ class MultiAgentOrchestrator:
         tasks: list[AgentTask],
     ) -> AgentCoordinationResult:
         with span("orchestration.dispatch_multiple", count=len(tasks)):
-            result = AgentCoordinationResult(success=True)
-
-            for task in tasks:
-                dispatch_result = self.dispatch_task(task)
-                if dispatch_result["success"]:
-                    result.tasks_completed += 1
-                    result.agents_used.append(task.task_id)
-                else:
-                    result.tasks_failed += 1
-
-            result.coordination_efficiency = (
-                result.tasks_completed / len(tasks) if tasks else 0
-            )
-
-            metric_counter("orchestration.tasks_dispatched", len(tasks))
-            metric_histogram("orchestration.success_rate", result.coordination_efficiency)
-
-            return result
+            run = self._start_run(tasks)
+            pool = self._executor
+            running: dict[Future, AutonomousAgent] = {}
+
+            while run.backlog or running:
+                for agent, task in self._assign(run):
+                    running[pool.submit(self._run, agent, task)] = agent
+                if not running:
+                    # Other callers hold every slot we could use
+                    self._wait_for_slot(run)
+                    continue
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    run.record(running.pop(future), *future.result())
+
+            return self._finish(run, len(tasks))
+
+    async def dispatch_multiple_tasks_async(
+        self,
+        tasks: list[AgentTask],
+    ) -> AgentCoordinationResult:
+        """Asyncio variant of ``dispatch_multiple_tasks``."""
+        with span("orchestration.dispatch_multiple_async", count=len(tasks)):
+            run = self._start_run(tasks)
+            running: dict[asyncio.Task, AutonomousAgent] = {}
+
+            while run.backlog or running:
+                for agent, task in self._assign(run):
+                    running[asyncio.create_task(self._run_async(agent, task))] = agent
+                if not running:
+                    await asyncio.to_thread(self._wait_for_slot, run)
+                    continue
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for finished in done:
+                    run.record(running.pop(finished), *finished.result())
+
+            return self._finish(run, len(tasks))
+
+    def _start_run(self, tasks: list[AgentTask]) -> _DispatchRun:
+        with self._slots:
+            capacity = dict(self._capacity)
+        return _DispatchRun(tasks, capacity)
+
+    def _assign(self, run: _DispatchRun) -> list[tuple[AutonomousAgent, AgentTask]]:
+        """Reserve slots for as many waiting tasks as idle agents allow."""
+        assigned = []
+        with self._slots:
+            for role, queue in list(run.backlog.items()):
+                while queue and (agent := self._get_agent_for_task(queue[0])):
+                    assigned.append((agent, queue.popleft()))
+                if not queue:
+                    del run.backlog[role]
+        return assigned
+
+    def _wait_for_slot(self, run: _DispatchRun, timeout: float = 1.0) -> None:
+        with self._slots:
+            self._slots.wait_for(lambda: any(self._idle.get(role) for role in run.backlog), timeout)
+
+    def _finish(self, run: _DispatchRun, count: int) -> AgentCoordinationResult:
+        result = run.finish()
+        metric_counter("orchestration.tasks_dispatched")(count)
+        metric_histogram("orchestration.coordination_efficiency", unit="1")(
+            result.coordination_efficiency
+        )
+        metric_histogram("orchestration.throughput", unit="1/s")(result.throughput)
+        return result
 
     def get_system_status(self) -> dict[str, Any]:
         return {
@@ -197,8 +351,7 @@ class MultiAgentOrchestrator:
             "agents_by_role": self._count_by_role(),
             "tasks_completed": len(self.task_log),
             "agent_status": {
-                agent_id: agent.get_status()
-                for agent_id, agent in self.agents.items()
+                agent_id: agent.get_status() for agent_id, agent in self.agents.items()
             },
         }
 
@@ -210,6 +363,45 @@ class MultiAgentOrchestrator:
         return counts
 
 
+class _DispatchRun:
+    """Backlog and accounting for one multi-task dispatch."""
+
+    def __init__(self, tasks: list[AgentTask], capacity: dict[AgentRole, int]):
+        self.result = AgentCoordinationResult(success=True)
+        # Role -> tasks waiting for a slot, in submission order
+        self.backlog: dict[AgentRole, deque[AgentTask]] = {}
+        self.busy_time = 0.0
+        self.start = time.perf_counter()
+
+        for task in tasks:
+            if capacity.get(task.required_role):
+                self.backlog.setdefault(task.required_role, deque()).append(task)
+            else:
+                self.result.tasks_failed += 1
+        # Tasks that can run at once, given the roles involved
+        queued = sum(len(queue) for queue in self.backlog.values())
+        self.slots = min(queued, sum(capacity[role] for role in self.backlog))
+
+    def record(self, agent: AutonomousAgent, outcome: dict[str, Any], duration: float) -> None:
+        if outcome["success"]:
+            self.result.tasks_completed += 1
+            self.busy_time += duration
+            if agent.agent_id not in self.result.agents_used:
+                self.result.agents_used.append(agent.agent_id)
+        else:
+            self.result.tasks_failed += 1
+
+    def finish(self) -> AgentCoordinationResult:
+        result = self.result
+        wall = time.perf_counter() - self.start
+        result.total_duration = wall
+        if wall > 0:
+            result.throughput = result.tasks_completed / wall
+            if self.slots:
+                result.coordination_efficiency = min(1.0, self.busy_time / (wall * self.slots))
+        return result
+
+
 @timed
 def create_agent_team(team_config: dict[str, Any]) -> MultiAgentOrchestrator:
     with span("agent_team.creation", size=team_config.get("size", 0)):
@@ -251,5 +443,5 @@ def create_agent_team(team_config: dict[str, Any]) -> MultiAgentOrchestrator:
         )
         orchestrator.register_agent(coordinator)
 
-        metric_counter("agent_team.created", 1)
+        metric_counter("agent_team.created")(1)
         return orchestrator
@@ -2,21 +2,35 @@
 
 Manages multi-node clusters with service discovery, membership tracking,
 and health monitoring.
+
+Heartbeat expiry is kept in a min-heap keyed on each node's last heartbeat
+time, with at most one entry per node. A heartbeat only records its time;
+when a node's entry reaches the timeout it is either re-armed with the
+newer heartbeat or the node is declared dead, so detecting failures costs
+O(log n) per expiring node rather than a scan of the cluster. The set of
+healthy nodes and the capacity totals are maintained as health changes.
 """
 
 from __future__ import annotations
 
 import hashlib
+import heapq
 import json
+import threading
 import time
 import uuid
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Callable
+from typing import TYPE_CHECKING, Any, Callable
 
-from specify_cli.core.shell import timed
 from specify_cli.core.telemetry import metric_counter, metric_histogram, span
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+# Rebuild the expiry heap when stale entries outnumber live ones this much
+HEAP_COMPACT_FACTOR = 4
+
 
 class NodeRole(Enum):
     """Role of node in cluster."""
@@ -72,9 +86,15 @@ class ClusterNode:
             "version": self.version,
         }
 
-    def is_alive(self, timeout_seconds: float = 30.0) -> bool:
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        # Let the owning ClusterManager track health set from outside it
+        if name == "health" and (listener := self.__dict__.get("_health_listener")):
+            listener(self)
+
+    def is_alive(self, timeout_seconds: float = 30.0, now: float | None = None) -> bool:
         """Check if node is considered alive."""
-        age = time.time() - self.last_heartbeat
+        age = (time.time() if now is None else now) - self.last_heartbeat
         return age < timeout_seconds
 
 
@@ -126,20 +146,36 @@ class ClusterMembershipResult:
 
 
 class ClusterManager:
-    """Manages distributed cluster operations."""
+    """Manages distributed cluster operations.
 
-    def __init__(self, cluster_name: str):
+    ``clock`` supplies heartbeat timestamps and the current time for expiry,
+    so simulations can drive time explicitly.
+    """
+
+    def __init__(self, cluster_name: str, clock: Callable[[], float] = time.time):
         self.cluster_name = cluster_name
         self.cluster_id = str(uuid.uuid4())[:8]
         self.nodes: dict[str, ClusterNode] = {}
         self.state = ClusterState(
             cluster_name=cluster_name,
             cluster_id=self.cluster_id,
-            created_at=time.time(),
+            created_at=clock(),
         )
         self.event_handlers: dict[str, list[Callable]] = {}
         self.heartbeat_timeout_seconds = 30.0
         self.health_check_interval_seconds = 5.0
+        self.clock = clock
+
+        self._lock = threading.RLock()
+        # (heartbeat time, node_id); _armed holds the live entry's time per node
+        self._expiry: list[tuple[float, str]] = []
+        self._armed: dict[str, float] = {}
+        self._dead: set[str] = set()
+        # Healthy nodes, with positions for O(1) removal
+        self._available: list[ClusterNode] = []
+        self._available_pos: dict[str, int] = {}
+        self._monitor: threading.Thread | None = None
+        self._monitor_stop = threading.Event()
 
     def register_event_handler(self, event_type: str, handler: Callable) -> None:
         """Register handler for cluster events."""
@@ -147,7 +183,6 @@ class ClusterManager:
             self.event_handlers[event_type] = []
         self.event_handlers[event_type].append(handler)
 
-    @timed
     def add_node(
         self,
         hostname: str,
@@ -156,7 +191,7 @@ class ClusterManager:
         version: str = "1.0.0",
     ) -> ClusterMembershipResult:
         """Add node to cluster."""
-        with span("cluster.add_node", cluster=self.cluster_name, hostname=hostname):
+        with span("cluster.add_node", cluster=self.cluster_name, hostname=hostname), self._lock:
             node_id = f"{hostname}:{port}"
 
             if node_id in self.nodes:
@@ -174,31 +209,23 @@ class ClusterManager:
                 port=port,
                 role=role,
                 version=version,
+                last_heartbeat=self.clock(),
             )
 
             self.nodes[node_id] = node
             self.state.total_nodes = len(self.nodes)
+            self.state.total_capacity += 100.0  # Assume 100 units per node
+            self._arm(node)
+            node._health_listener = self._health_changed  # noqa: SLF001
+            self._health_changed(node)
 
             # Update master if this is first master role
             if role == NodeRole.MASTER and self.state.master_node_id is None:
                 self.state.master_node_id = node_id
 
-            event = ClusterEvent(
-                event_id=str(uuid.uuid4())[:8],
-                timestamp=time.time(),
-                event_type="node_joined",
-                node_id=node_id,
-                details={"role": role.value, "version": version},
-            )
-            self.state.events.append(event)
+            self._record_event("node_joined", node_id, {"role": role.value, "version": version})
 
-            self._emit_event("node_joined", event)
-
-            metric_counter(
-                "cluster.node_added",
-                1,
-                {"cluster": self.cluster_name, "role": role.value},
-            )
+            metric_counter("cluster.node_added")(1)
 
             return ClusterMembershipResult(
                 success=True,
@@ -207,12 +234,9 @@ class ClusterManager:
                 cluster_size=len(self.nodes),
             )
 
-    @timed
     def remove_node(self, node_id: str) -> ClusterMembershipResult:
         """Remove node from cluster."""
-        with span(
-            "cluster.remove_node", cluster=self.cluster_name, node=node_id
-        ):
+        with span("cluster.remove_node", cluster=self.cluster_name, node=node_id), self._lock:
             if node_id not in self.nodes:
                 return ClusterMembershipResult(
                     success=False,
@@ -223,24 +247,22 @@ class ClusterManager:
                 )
 
             node = self.nodes.pop(node_id)
+            node._health_listener = None  # noqa: SLF001
+            self._set_available(node, available=False)
+            self._armed.pop(node_id, None)  # Its heap entry is skipped when popped
+            self._dead.discard(node_id)
             self.state.total_nodes = len(self.nodes)
+            self.state.total_capacity -= 100.0
+            self.state.used_capacity -= node.cpu_usage + node.memory_usage + node.disk_usage
+            self._update_cluster_health()
 
             # Update master if removed node was master
             if self.state.master_node_id == node_id:
                 self.state.master_node_id = None
 
-            event = ClusterEvent(
-                event_id=str(uuid.uuid4())[:8],
-                timestamp=time.time(),
-                event_type="node_left",
-                node_id=node_id,
-                details={"role": node.role.value},
-            )
-            self.state.events.append(event)
+            self._record_event("node_left", node_id, {"role": node.role.value})
 
-            self._emit_event("node_left", event)
-
-            metric_counter("cluster.node_removed", 1, {"cluster": self.cluster_name})
+            metric_counter("cluster.node_removed")(1)
 
             return ClusterMembershipResult(
                 success=True,
@@ -249,7 +271,6 @@ class ClusterManager:
                 cluster_size=len(self.nodes),
             )
 
-    @timed
     def heartbeat(
         self,
         node_id: str,
@@ -261,8 +282,9 @@ class ClusterManager:
         failed_tasks: int = 0,
     ) -> ClusterMembershipResult:
         """Process heartbeat from node."""
-        with span("cluster.heartbeat", cluster=self.cluster_name, node=node_id):
-            if node_id not in self.nodes:
+        with span("cluster.heartbeat", cluster=self.cluster_name, node=node_id), self._lock:
+            node = self.nodes.get(node_id)
+            if node is None:
                 return ClusterMembershipResult(
                     success=False,
                     node_id=node_id,
@@ -271,9 +293,18 @@ class ClusterManager:
                     error="unknown node",
                 )
 
-            node = self.nodes[node_id]
             old_health = node.health
-            node.last_heartbeat = time.time()
+            node.last_heartbeat = self.clock()
+            # A live heap entry is re-armed when it expires; only dead nodes need one
+            if node_id not in self._armed:
+                self._arm(node)
+            self._dead.discard(node_id)
+            self.state.used_capacity += (
+                cpu_usage
+                + memory_usage
+                + disk_usage
+                - (node.cpu_usage + node.memory_usage + node.disk_usage)
+            )
             node.cpu_usage = cpu_usage
             node.memory_usage = memory_usage
             node.disk_usage = disk_usage
@@ -283,32 +314,20 @@ class ClusterManager:
 
             # Determine health
             if cpu_usage > 90 or memory_usage > 90 or disk_usage > 90:
-                node.health = NodeHealth.DEGRADED
+                new_health = NodeHealth.DEGRADED
             else:
-                node.health = NodeHealth.HEALTHY
+                new_health = NodeHealth.HEALTHY
 
             # Emit event if health changed
-            if old_health != node.health:
-                event = ClusterEvent(
-                    event_id=str(uuid.uuid4())[:8],
-                    timestamp=time.time(),
-                    event_type="node_health_changed",
-                    node_id=node_id,
-                    details={
-                        "old_health": old_health.value,
-                        "new_health": node.health.value,
-                    },
+            if old_health != new_health:
+                node.health = new_health
+                self._record_event(
+                    "node_health_changed",
+                    node_id,
+                    {"old_health": old_health.value, "new_health": new_health.value},
                 )
-                self.state.events.append(event)
-                self._emit_event("node_health_changed", event)
-
-            metric_counter(
-                "cluster.heartbeat_received",
-                1,
-                {"cluster": self.cluster_name, "node": node_id},
-            )
 
-            self._update_cluster_health()
+            metric_counter("cluster.heartbeat_received")(1)
 
             return ClusterMembershipResult(
                 success=True,
@@ -318,58 +337,132 @@ class ClusterManager:
             )
 
     def check_node_health(self) -> dict[str, Any]:
-        """Check health of all nodes."""
-        with span("cluster.check_health", cluster=self.cluster_name):
-            dead_nodes = []
-
-            for node_id, node in list(self.nodes.items()):
-                if not node.is_alive(self.heartbeat_timeout_seconds):
-                    dead_nodes.append(node_id)
-                    node.health = NodeHealth.DEAD
-
-                    event = ClusterEvent(
-                        event_id=str(uuid.uuid4())[:8],
-                        timestamp=time.time(),
-                        event_type="node_dead",
-                        node_id=node_id,
-                        details={"timeout_seconds": self.heartbeat_timeout_seconds},
-                    )
-                    self.state.events.append(event)
-                    self._emit_event("node_dead", event)
-
-            self._update_cluster_health()
+        """Expire nodes whose heartbeat timed out and report the dead ones."""
+        with span("cluster.check_health", cluster=self.cluster_name), self._lock:
+            now = self.clock()
+            self.expire_nodes(now)
 
             return {
-                "timestamp": time.time(),
+                "timestamp": now,
                 "total_nodes": len(self.nodes),
-                "dead_nodes": dead_nodes,
+                "dead_nodes": list(self._dead),
                 "healthy_nodes": self.state.healthy_nodes,
             }
 
+    def expire_nodes(self, now: float | None = None) -> list[str]:
+        """Mark nodes dead whose heartbeat is older than the timeout.
+
+        Only heap entries that are due are visited. Returns the nodes that
+        died in this call.
+        """
+        with self._lock:
+            now = self.clock() if now is None else now
+            timeout = self.heartbeat_timeout_seconds
+            expired = []
+            while self._expiry and self._expiry[0][0] + timeout <= now:
+                beat, node_id = heapq.heappop(self._expiry)
+                if self._armed.get(node_id) != beat:
+                    continue  # Node was removed
+                node = self.nodes[node_id]
+                if node.last_heartbeat + timeout > now:
+                    self._arm(node)  # Heartbeats arrived since the entry was armed
+                    continue
+
+                del self._armed[node_id]
+                self._dead.add(node_id)
+                node.health = NodeHealth.DEAD
+                expired.append(node_id)
+                self._record_event("node_dead", node_id, {"timeout_seconds": timeout})
+
+            if expired:
+                metric_counter("cluster.node_expired")(len(expired))
+            return expired
+
+    def next_expiry(self) -> float | None:
+        """Earliest time at which a node can expire, or None without nodes."""
+        with self._lock:
+            if not self._expiry:
+                return None
+            return self._expiry[0][0] + self.heartbeat_timeout_seconds
+
+    def _arm(self, node: ClusterNode) -> None:
+        """Track the node's latest heartbeat in the expiry heap; caller holds the lock."""
+        self._armed[node.node_id] = node.last_heartbeat
+        heapq.heappush(self._expiry, (node.last_heartbeat, node.node_id))
+        if len(self._expiry) > HEAP_COMPACT_FACTOR * (len(self._armed) + 1):
+            self._expiry = [(beat, node_id) for node_id, beat in self._armed.items()]
+            heapq.heapify(self._expiry)
+
+    def _health_changed(self, node: ClusterNode) -> None:
+        with self._lock:
+            if self.nodes.get(node.node_id) is node:
+                self._set_available(node, available=node.health == NodeHealth.HEALTHY)
+                self._update_cluster_health()
+
+    def _set_available(self, node: ClusterNode, *, available: bool) -> None:
+        position = self._available_pos.get(node.node_id)
+        if available and position is None:
+            self._available_pos[node.node_id] = len(self._available)
+            self._available.append(node)
+        elif not available and position is not None:
+            # Swap with the last node so removal is O(1)
+            last = self._available.pop()
+            del self._available_pos[node.node_id]
+            if last is not node:
+                self._available[position] = last
+                self._available_pos[last.node_id] = position
+
+    # ------------------------------------------------------------------ #
+    # Background expiry                                                  #
+    # ------------------------------------------------------------------ #
+
+    def start_health_monitor(self) -> None:
+        """Expire nodes from a background thread as their deadlines pass.
+
+        The thread sleeps until the earliest deadline, or at most
+        ``health_check_interval_seconds``, measured in real seconds.
+        """
+        with self._lock:
+            if self._monitor is not None and self._monitor.is_alive():
+                return
+            self._monitor_stop.clear()
+            self._monitor = threading.Thread(
+                target=self._monitor_loop, name=f"cluster-{self.cluster_name}", daemon=True
+            )
+            self._monitor.start()
+
+    def stop_health_monitor(self) -> None:
+        """Stop the background expiry thread."""
+        self._monitor_stop.set()
+        if self._monitor is not None:
+            self._monitor.join()
+            self._monitor = None
+
+    def _monitor_loop(self) -> None:
+        while not self._monitor_stop.is_set():
+            deadline = self.next_expiry()
+            wait = self.health_check_interval_seconds
+            if deadline is not None:
+                wait = min(wait, max(0.0, deadline - self.clock()))
+            if self._monitor_stop.wait(wait):
+                return
+            self.expire_nodes()
+
     def _update_cluster_health(self) -> None:
         """Update cluster health metrics."""
-        healthy = sum(
-            1 for node in self.nodes.values()
-            if node.health == NodeHealth.HEALTHY
-        )
-        self.state.healthy_nodes = healthy
-
-        total_capacity = sum(
-            100.0 for _ in self.nodes.values()
-        )  # Assume 100 units per node
-        used_capacity = sum(
-            node.cpu_usage + node.memory_usage + node.disk_usage
-            for node in self.nodes.values()
-        )
-
-        self.state.total_capacity = total_capacity
-        self.state.used_capacity = used_capacity
-
-        metric_histogram(
-            "cluster.healthy_nodes",
-            float(healthy),
-            {"cluster": self.cluster_name},
+        self.state.healthy_nodes = len(self._available)
+        metric_histogram("cluster.healthy_nodes", unit="1")(float(self.state.healthy_nodes))
+
+    def _record_event(self, event_type: str, node_id: str, details: dict[str, Any]) -> None:
+        event = ClusterEvent(
+            event_id=str(uuid.uuid4())[:8],
+            timestamp=self.clock(),
+            event_type=event_type,
+            node_id=node_id,
+            details=details,
         )
+        self.state.events.append(event)
+        self._emit_event(event_type, event)
 
     def _emit_event(self, event_type: str, event: ClusterEvent) -> None:
         """Emit event to registered handlers."""
@@ -377,26 +470,37 @@ class ClusterManager:
             for handler in self.event_handlers[event_type]:
                 try:
                     handler(event)
-                except Exception as e:
-                    metric_counter(
-                        "cluster.event_handler_error",
-                        1,
-                        {"cluster": self.cluster_name, "event_type": event_type},
-                    )
+                except Exception:
+                    metric_counter("cluster.event_handler_error")(1)
 
     def get_nodes_by_role(self, role: NodeRole) -> list[ClusterNode]:
         """Get all nodes with specific role."""
-        return [
-            node for node in self.nodes.values() if node.role == role
-        ]
+        return [node for node in self.nodes.values() if node.role == role]
+
+    @property
+    def available_nodes(self) -> Sequence[ClusterNode]:
+        """Live read-only view of the healthy nodes, in no particular order."""
+        return self._available
+
+    def get_available_node(self, index: int) -> ClusterNode | None:
+        """The healthy node at ``index`` modulo their count, or None without any."""
+        with self._lock:
+            if not self._available:
+                return None
+            return self._available[index % len(self._available)]
+
+    def is_available(self, node_id: str) -> bool:
+        """Whether the node is in the cluster and healthy."""
+        return node_id in self._available_pos
 
     def get_available_nodes(self) -> list[ClusterNode]:
         """Get all healthy available nodes."""
-        return [
-            node
-            for node in self.nodes.values()
-            if node.health == NodeHealth.HEALTHY
-        ]
+        with self._lock:
+            if self._expiry and self._expiry[0][0] + self.heartbeat_timeout_seconds <= (
+                self.clock()
+            ):
+                self.expire_nodes()
+            return list(self._available)
 
     def get_cluster_state(self) -> dict[str, Any]:
         """Get current cluster state."""
@@ -413,14 +517,8 @@ class ClusterManager:
                 if self.state.total_capacity > 0
                 else 0.0
             ),
-            "nodes": {
-                node_id: node.to_dict()
-                for node_id, node in self.nodes.items()
-            },
-            "recent_events": [
-                event.to_dict()
-                for event in self.state.events[-10:]
-            ],
+            "nodes": {node_id: node.to_dict() for node_id, node in self.nodes.items()},
+            "recent_events": [event.to_dict() for event in self.state.events[-10:]],
         }
 
 
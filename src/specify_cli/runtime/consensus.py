@@ -2,19 +2,44 @@
 
 Implements Raft consensus algorithm for leader election and log replication
 in distributed task coordination systems.
+
+The log is a ``RaftLog``: in memory by default, or segment files under
+``log_dir`` with group commit, snapshots and compaction. With a ``Transport``
+the leader replicates to its peers. One replicator thread per peer keeps up
+to ``max_inflight`` AppendEntries batches of up to ``max_batch_entries``
+entries outstanding, so throughput is bound by disk and network batching
+rather than per-entry round trips. Commands commit once a majority of nodes
+have them on disk.
+
+Command handlers keep their state in ``state_machine`` so that snapshots
+capture it.
 """
 
 from __future__ import annotations
 
-import hashlib
-import json
+import contextlib
+import copy
+import threading
 import time
+from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Callable
+from typing import TYPE_CHECKING, Any, Callable
 
 from specify_cli.core.shell import timed
 from specify_cli.core.telemetry import metric_counter, metric_histogram, span
+from specify_cli.runtime.raft_log import LogEntry, RaftLog
+
+if TYPE_CHECKING:
+    from multiprocessing.connection import Connection
+    from pathlib import Path
+
+# Methods a transport may invoke on a remote engine
+RPC_METHODS = frozenset({"append_entry", "request_vote", "install_snapshot"})
+# A replicator gives up on an unanswered request after this long
+RPC_TIMEOUT_S = 5.0
 
 
 class NodeState(Enum):
@@ -25,34 +50,13 @@ class NodeState(Enum):
     LEADER = "leader"
 
 
-@dataclass
-class LogEntry:
-    """Entry in distributed log."""
-
-    index: int
-    term: int
-    command: str
-    data: dict[str, Any] = field(default_factory=dict)
-    timestamp: float = field(default_factory=time.time)
-
-    def to_dict(self) -> dict:
-        """Convert to dictionary."""
-        return {
-            "index": self.index,
-            "term": self.term,
-            "command": self.command,
-            "data": self.data,
-            "timestamp": self.timestamp,
-        }
-
-
 @dataclass
 class RaftState:
     """State of a Raft node."""
 
     current_term: int = 0
     voted_for: str | None = None
-    log: list[LogEntry] = field(default_factory=list)
+    log: RaftLog = field(default_factory=RaftLog)
     commit_index: int = 0
     last_applied: int = 0
     state: NodeState = NodeState.FOLLOWER
@@ -85,6 +89,154 @@ class LeaderState:
     replication_status: dict[str, bool] = field(default_factory=dict)
 
 
+# --------------------------------------------------------------------------- #
+# Transports                                                                  #
+# --------------------------------------------------------------------------- #
+
+
+class Transport(ABC):
+    """Delivers RPCs to peers. Calls to one peer are handled in send order."""
+
+    @abstractmethod
+    def send(self, peer: str, method: str, payload: dict[str, Any]) -> Future:
+        """Invoke ``method(**payload)`` on ``peer``; resolves to its result."""
+
+    @abstractmethod
+    def close(self) -> None:
+        """Release connections and threads."""
+
+
+def _dispatch(engine: ConsensusEngine, method: str, payload: dict[str, Any]) -> Any:
+    if method not in RPC_METHODS:
+        raise ValueError(f"Unknown consensus RPC: {method}")
+    return getattr(engine, method)(**payload)
+
+
+class LocalTransport(Transport):
+    """Transport between engines in one process, with one handler thread per node."""
+
+    def __init__(self):
+        self.engines: dict[str, ConsensusEngine] = {}
+        self.disconnected: set[str] = set()
+        self._executors: dict[str, ThreadPoolExecutor] = {}
+        self._lock = threading.Lock()
+
+    def register(self, engine: ConsensusEngine) -> None:
+        self.engines[engine.node_id] = engine
+
+    def send(self, peer: str, method: str, payload: dict[str, Any]) -> Future:
+        engine = self.engines.get(peer)
+        if engine is None or peer in self.disconnected:
+            future: Future = Future()
+            future.set_exception(ConnectionError(f"Node {peer} is unreachable"))
+            return future
+        with self._lock:
+            executor = self._executors.get(peer)
+            if executor is None:
+                executor = self._executors[peer] = ThreadPoolExecutor(
+                    1, thread_name_prefix=f"raft-{peer}"
+                )
+        return executor.submit(_dispatch, engine, method, payload)
+
+    def close(self) -> None:
+        with self._lock:
+            executors, self._executors = list(self._executors.values()), {}
+        for executor in executors:
+            executor.shutdown(wait=True)
+
+
+class ConnectionTransport(Transport):
+    """Transport over ``multiprocessing.connection`` connections (pipes or sockets).
+
+    The other end of each connection runs ``serve_connection``.
+    """
+
+    def __init__(self, connections: dict[str, Connection]):
+        self._peers = {peer: _PeerConnection(peer, conn) for peer, conn in connections.items()}
+
+    def send(self, peer: str, method: str, payload: dict[str, Any]) -> Future:
+        connection = self._peers.get(peer)
+        if connection is None:
+            future: Future = Future()
+            future.set_exception(ConnectionError(f"No connection to {peer}"))
+            return future
+        return connection.send(method, payload)
+
+    def close(self) -> None:
+        for connection in self._peers.values():
+            connection.close()
+
+
+class _PeerConnection:
+    """Outstanding calls on one connection, answered in order by a reader thread."""
+
+    def __init__(self, peer: str, conn: Connection):
+        self.peer = peer
+        self.conn = conn
+        self.pending: deque[Future] = deque()
+        self._lock = threading.Lock()
+        self._reader = threading.Thread(target=self._read, name=f"raft-rpc-{peer}", daemon=True)
+        self._reader.start()
+
+    def send(self, method: str, payload: dict[str, Any]) -> Future:
+        future: Future = Future()
+        with self._lock:
+            try:
+                self.conn.send((method, payload))
+            except (OSError, ValueError) as e:
+                future.set_exception(ConnectionError(f"Connection to {self.peer} failed: {e}"))
+                return future
+            self.pending.append(future)
+        return future
+
+    def _read(self) -> None:
+        while True:
+            try:
+                ok, value = self.conn.recv()
+            except (EOFError, OSError):
+                break
+            with self._lock:
+                future = self.pending.popleft()
+            if ok:
+                future.set_result(value)
+            else:
+                future.set_exception(value)
+        with self._lock:
+            orphaned, self.pending = list(self.pending), deque()
+        for future in orphaned:
+            future.set_exception(ConnectionError(f"Connection to {self.peer} closed"))
+
+    def close(self) -> None:
+        # Ask the server to hang up, so the reader sees EOF after the last answer
+        with self._lock, contextlib.suppress(OSError, ValueError):
+            self.conn.send(None)
+        self._reader.join(timeout=RPC_TIMEOUT_S)
+        self.conn.close()
+
+
+def serve_connection(engine: ConsensusEngine, conn: Connection) -> None:
+    """Answer RPCs arriving on ``conn`` in order until it closes or the client hangs up."""
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, OSError):
+            return
+        if message is None:
+            conn.close()
+            return
+        method, payload = message
+        try:
+            response: tuple[bool, Any] = (True, _dispatch(engine, method, payload))
+        except Exception as e:
+            response = (False, e)
+        conn.send(response)
+
+
+# --------------------------------------------------------------------------- #
+# Engine                                                                      #
+# --------------------------------------------------------------------------- #
+
+
 class ConsensusEngine:
     """Implements Raft consensus algorithm."""
 
@@ -94,23 +246,60 @@ class ConsensusEngine:
         cluster_nodes: list[str],
         election_timeout_ms: float = 150.0,
         heartbeat_interval_ms: float = 50.0,
+        *,
+        log_dir: str | Path | None = None,
+        transport: Transport | None = None,
+        max_batch_entries: int = 256,
+        max_inflight: int = 8,
+        snapshot_threshold: int | None = None,
     ):
         self.node_id = node_id
         self.cluster_nodes = cluster_nodes
         self.peers = [n for n in cluster_nodes if n != node_id]
+        self.transport = transport
+        self.max_batch_entries = max_batch_entries
+        self.max_inflight = max_inflight
+        self.snapshot_threshold = snapshot_threshold
+
+        log = RaftLog(log_dir)
         self.state = RaftState(
+            current_term=log.term,
+            voted_for=log.voted_for,
+            log=log,
             election_timeout=election_timeout_ms,
             heartbeat_interval=heartbeat_interval_ms,
         )
         self.leader_state: LeaderState | None = None
         self.state_machine: dict[str, Any] = {}
         self.command_handlers: dict[str, Callable] = {}
+        if log.snapshot_state is not None:
+            self.state_machine = copy.deepcopy(log.snapshot_state)
+            self.state.commit_index = self.state.last_applied = log.snapshot_index
+
+        self._lock = threading.RLock()
+        # Log index -> future of the command waiting for it to commit
+        self._waiters: dict[int, Future] = {}
+        self._replicators: dict[str, _Replicator] = {}
+        self._flush_needed = threading.Event()
+        self._flusher: threading.Thread | None = None
+        self._flusher_term = 0
 
     def register_command_handler(self, command: str, handler: Callable) -> None:
         """Register handler for state machine command."""
         self.command_handlers[command] = handler
 
-    @timed
+    def _set_term(self, term: int, voted_for: str | None) -> None:
+        self.state.current_term = term
+        self.state.voted_for = voted_for
+        self.state.log.save_meta(term, voted_for)
+
+    def _observe_term(self, term: int) -> None:
+        """Adopt a higher term seen in an RPC and fall back to follower."""
+        if term > self.state.current_term:
+            self._set_term(term, None)
+            self._step_down()
+            metric_counter("consensus.term_updated")(1)
+
     def append_entry(
         self,
         term: int,
@@ -121,60 +310,118 @@ class ConsensusEngine:
         leader_commit: int,
     ) -> ConsensusResult:
         """Handle AppendEntries RPC from leader."""
-        with span("consensus.append_entry", node=self.node_id, leader=leader_id):
-            # Update term
-            if term > self.state.current_term:
-                self.state.current_term = term
-                self.state.voted_for = None
-                self.state.state = NodeState.FOLLOWER
-
-                metric_counter(
-                    "consensus.term_updated",
-                    1,
-                    {"node": self.node_id, "new_term": str(term)},
+        with span("consensus.append_entry", node=self.node_id, leader=leader_id), self._lock:
+            if term < self.state.current_term:
+                return ConsensusResult(
+                    success=False,
+                    term=self.state.current_term,
+                    leader_id=None,
+                    log_index=len(self.state.log),
+                    message="stale term",
                 )
 
+            # Update term
+            self._observe_term(term)
+            if self.state.state != NodeState.FOLLOWER:
+                self._step_down()
+            self.state.last_heartbeat = time.time()
+            log = self.state.log
+
             # Check log consistency
-            if prev_log_index > 0:
-                if prev_log_index > len(self.state.log) - 1:
-                    return ConsensusResult(
-                        success=False,
-                        term=self.state.current_term,
-                        leader_id=leader_id,
-                        log_index=len(self.state.log),
-                        message="log mismatch",
-                    )
+            if prev_log_index > log.last_index:
+                return ConsensusResult(
+                    success=False,
+                    term=self.state.current_term,
+                    leader_id=leader_id,
+                    log_index=len(log),
+                    message="log mismatch",
+                )
 
-                if self.state.log[prev_log_index].term != prev_log_term:
-                    return ConsensusResult(
-                        success=False,
-                        term=self.state.current_term,
-                        leader_id=leader_id,
-                        log_index=prev_log_index,
-                        message="log term mismatch",
-                    )
+            if (
+                prev_log_index >= log.snapshot_index
+                and log.term_at(prev_log_index) != prev_log_term
+            ):
+                return ConsensusResult(
+                    success=False,
+                    term=self.state.current_term,
+                    leader_id=leader_id,
+                    log_index=self._first_index_of_term(prev_log_index),
+                    message="log term mismatch",
+                )
 
-            # Append entries
-            for entry in entries:
-                self.state.log.append(entry)
+            # Append entries, dropping a conflicting suffix; entries covered by
+            # the snapshot are committed and already match
+            entries = [e for e in entries if e.index > log.snapshot_index]
+            for position, entry in enumerate(entries):
+                if entry.index <= log.last_index and log.term_at(entry.index) == entry.term:
+                    continue
+                if entry.index <= log.last_index:
+                    log.truncate_from(entry.index)
+                log.extend(entries[position:])
+                break
+            # Acknowledge only what is on disk; one fsync covers the batch
+            log.sync()
 
             # Update commit index
-            old_commit = self.state.commit_index
-            self.state.commit_index = min(leader_commit, len(self.state.log) - 1)
-
-            if self.state.commit_index > old_commit:
+            last_new = prev_log_index + len(entries)
+            if leader_commit > self.state.commit_index:
+                old_commit = self.state.commit_index
+                self.state.commit_index = max(old_commit, min(leader_commit, last_new))
                 self._apply_committed_entries(old_commit + 1, self.state.commit_index)
 
+            metric_counter("consensus.append_entries_received")(1)
+
+            return ConsensusResult(
+                success=True,
+                term=self.state.current_term,
+                leader_id=leader_id,
+                log_index=len(log),
+                message="entries appended",
+            )
+
+    def _first_index_of_term(self, index: int) -> int:
+        """First index of the run of entries sharing ``index``'s term."""
+        log = self.state.log
+        term = log.term_at(index)
+        while index - 1 > log.snapshot_index and log.term_at(index - 1) == term:
+            index -= 1
+        return index
+
+    def install_snapshot(
+        self,
+        term: int,
+        leader_id: str,
+        *,
+        last_included_index: int,
+        last_included_term: int,
+        state: dict[str, Any],
+    ) -> ConsensusResult:
+        """Handle InstallSnapshot RPC from a leader whose log no longer has our next entry."""
+        with span("consensus.install_snapshot", node=self.node_id, leader=leader_id), self._lock:
+            if term < self.state.current_term:
+                return ConsensusResult(
+                    success=False,
+                    term=self.state.current_term,
+                    leader_id=None,
+                    log_index=len(self.state.log),
+                    message="stale term",
+                )
+            self._observe_term(term)
             self.state.last_heartbeat = time.time()
 
-            metric_counter("consensus.append_entries_received", 1, {"node": self.node_id})
+            if last_included_index > self.state.commit_index:
+                state = copy.deepcopy(state)
+                self.state.log.install_snapshot(last_included_index, last_included_term, state)
+                self.state_machine = copy.deepcopy(state)
+                self.state.commit_index = self.state.last_applied = last_included_index
+                metric_counter("consensus.snapshot_installed")(1)
 
             return ConsensusResult(
                 success=True,
                 term=self.state.current_term,
                 leader_id=leader_id,
                 log_index=len(self.state.log),
-                message="entries appended",
+                message="snapshot installed",
             )
 
     @timed
@@ -186,17 +433,21 @@ class ConsensusEngine:
         last_log_term: int,
     ) -> ConsensusResult:
         """Handle RequestVote RPC from candidate."""
-        with span(
-            "consensus.request_vote", node=self.node_id, candidate=candidate_id
-        ):
+        with span("consensus.request_vote", node=self.node_id, candidate=candidate_id), self._lock:
+            if term < self.state.current_term:
+                return ConsensusResult(
+                    success=False,
+                    term=self.state.current_term,
+                    leader_id=None,
+                    log_index=len(self.state.log),
+                    message="stale term",
+                )
+
             # Update term if needed
-            if term > self.state.current_term:
-                self.state.current_term = term
-                self.state.voted_for = None
-                self.state.state = NodeState.FOLLOWER
+            self._observe_term(term)
 
             # Check if already voted in this term
-            if term == self.state.current_term and self.state.voted_for is not None:
+            if self.state.voted_for not in (None, candidate_id):
                 return ConsensusResult(
                     success=False,
                     term=self.state.current_term,
@@ -206,14 +457,11 @@ class ConsensusEngine:
                 )
 
             # Check log recency
-            last_log_term_local = (
-                self.state.log[-1].term if self.state.log else 0
-            )
-            last_log_index_local = len(self.state.log) - 1
+            last_log_term_local = self.state.log.last_term
+            last_log_index_local = self.state.log.last_index
 
             if last_log_term < last_log_term_local or (
-                last_log_term == last_log_term_local
-                and last_log_index < last_log_index_local
+                last_log_term == last_log_term_local and last_log_index < last_log_index_local
             ):
                 return ConsensusResult(
                     success=False,
@@ -224,12 +472,9 @@ class ConsensusEngine:
                 )
 
             # Grant vote
-            self.state.voted_for = candidate_id
-            metric_counter(
-                "consensus.vote_granted",
-                1,
-                {"node": self.node_id, "candidate": candidate_id},
-            )
+            self._set_term(self.state.current_term, candidate_id)
+            self.state.last_heartbeat = time.time()
+            metric_counter("consensus.vote_granted")(1)
 
             return ConsensusResult(
                 success=True,
@@ -241,95 +486,252 @@ class ConsensusEngine:
 
     @timed
     def start_election(self) -> bool:
-        """Start leader election."""
+        """Start leader election.
+
+        Without a transport, peer votes are simulated.
+        """
         with span("consensus.start_election", node=self.node_id):
-            self.state.current_term += 1
-            self.state.state = NodeState.CANDIDATE
-            self.state.voted_for = self.node_id
-            self.state.last_election_start = time.time()
+            with self._lock:
+                self._step_down()
+                self._set_term(self.state.current_term + 1, self.node_id)
+                self.state.state = NodeState.CANDIDATE
+                self.state.last_election_start = time.time()
+                term = self.state.current_term
+                request = {
+                    "term": term,
+                    "candidate_id": self.node_id,
+                    "last_log_index": self.state.log.last_index,
+                    "last_log_term": self.state.log.last_term,
+                }
 
             votes_received = 1  # Vote for self
             total_votes = len(self.cluster_nodes)
 
-            metric_counter(
-                "consensus.election_started",
-                1,
-                {"node": self.node_id, "term": str(self.state.current_term)},
+            metric_counter("consensus.election_started")(1)
+
+            if self.transport is None:
+                # Simulate votes from peers
+                votes_received += len(self.peers) // 2
+            else:
+                votes_received += self._collect_votes(request)
+
+            with self._lock:
+                if self.state.state != NodeState.CANDIDATE or self.state.current_term != term:
+                    return False
+                if votes_received > total_votes // 2:
+                    self._become_leader()
+                    metric_counter("consensus.leader_elected")(1)
+                    return True
+                return False
+
+    def _collect_votes(self, request: dict[str, Any]) -> int:
+        assert self.transport is not None
+        pending = {self.transport.send(peer, "request_vote", dict(request)) for peer in self.peers}
+        deadline = time.monotonic() + self.state.election_timeout / 1000
+        granted = 0
+        while pending and (remaining := deadline - time.monotonic()) > 0:
+            done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is not None:
+                    continue
+                result = future.result()
+                if result.success:
+                    granted += 1
+                else:
+                    with self._lock:
+                        self._observe_term(result.term)
+        return granted
+
+    def _become_leader(self) -> None:
+        """Take leadership; caller holds the lock."""
+        log = self.state.log
+        self.state.state = NodeState.LEADER
+        self.leader_state = LeaderState(
+            node_id=self.node_id,
+            next_index={peer: len(log) for peer in self.peers},
+            match_index=dict.fromkeys(self.peers, 0),
+        )
+        if self.transport is not None:
+            term = self.state.current_term
+            for peer in self.peers:
+                replicator = _Replicator(self, peer, term)
+                self._replicators[peer] = replicator
+                replicator.start()
+
+    def _step_down(self) -> None:
+        """Stop leading; caller holds the lock. Waiting commands fail."""
+        was_leader = self.state.state == NodeState.LEADER
+        self.state.state = NodeState.FOLLOWER
+        if not was_leader:
+            return
+        for replicator in self._replicators.values():
+            replicator.stop()
+        self._replicators = {}
+        self._flush_needed.set()
+        waiters, self._waiters = self._waiters, {}
+        for index, future in waiters.items():
+            future.set_result(
+                ConsensusResult(
+                    success=False,
+                    term=self.state.current_term,
+                    leader_id=None,
+                    log_index=index,
+                    message="leadership lost",
+                )
             )
+        metric_counter("consensus.stepped_down")(1)
 
-            # Simulate votes from peers
-            votes_received += len(self.peers) // 2
+    def propose(self, command: str, data: dict[str, Any] | None = None) -> Future:
+        """Append a command and return a future resolving once it commits.
 
-            if votes_received > total_votes // 2:
-                self.state.state = NodeState.LEADER
-                self.leader_state = LeaderState(
-                    node_id=self.node_id,
-                    next_index={peer: len(self.state.log) for peer in self.peers},
-                    match_index={peer: 0 for peer in self.peers},
-                )
-
-                metric_counter(
-                    "consensus.leader_elected",
-                    1,
-                    {"node": self.node_id, "term": str(self.state.current_term)},
+        Many proposals in flight share fsyncs and AppendEntries batches.
+        """
+        future: Future = Future()
+        with self._lock:
+            if self.state.state != NodeState.LEADER:
+                future.set_result(
+                    ConsensusResult(
+                        success=False,
+                        term=self.state.current_term,
+                        leader_id=None,
+                        log_index=len(self.state.log),
+                        message="not leader",
+                    )
                 )
+                return future
 
-                return True
+            # Create log entry
+            entry = LogEntry(
+                index=len(self.state.log),
+                term=self.state.current_term,
+                command=command,
+                data=data if data is not None else {},
+            )
+            self.state.log.append(entry)
+            self._waiters[entry.index] = future
+            self._ensure_flusher()
 
-            return False
+        self._flush_needed.set()
+        for replicator in list(self._replicators.values()):
+            replicator.wake.set()
+        metric_counter("consensus.command_submitted")(1)
+        return future
 
-    @timed
     def submit_command(
-        self, command: str, data: dict[str, Any] = None
+        self, command: str, data: dict[str, Any] | None = None, timeout: float | None = None
     ) -> ConsensusResult:
-        """Submit command for replication."""
+        """Submit command for replication and wait until it commits."""
         with span("consensus.submit_command", node=self.node_id, command=command):
-            if data is None:
-                data = {}
-
-            if self.state.state != NodeState.LEADER:
+            future = self.propose(command, data)
+            try:
+                return future.result(timeout)
+            except TimeoutError:
                 return ConsensusResult(
                     success=False,
                     term=self.state.current_term,
-                    leader_id=None,
+                    leader_id=self.get_leader_id(),
                     log_index=len(self.state.log),
-                    message="not leader",
+                    message="commit timed out",
                 )
 
-            # Create log entry
-            entry = LogEntry(
-                index=len(self.state.log),
-                term=self.state.current_term,
-                command=command,
-                data=data,
-            )
-
-            self.state.log.append(entry)
-
-            metric_counter(
-                "consensus.command_submitted",
-                1,
-                {"node": self.node_id, "command": command},
+    def _ensure_flusher(self) -> None:
+        """Start the leader's group-commit thread; caller holds the lock."""
+        term = self.state.current_term
+        if self._flusher is None or not self._flusher.is_alive() or self._flusher_term != term:
+            self._flusher_term = term
+            self._flusher = threading.Thread(
+                target=self._flush_loop,
+                args=(term,),
+                name=f"raft-flush-{self.node_id}",
+                daemon=True,
             )
+            self._flusher.start()
+
+    def _flush_loop(self, term: int) -> None:
+        """Fsync appended entries in batches and advance the commit index."""
+        idle_wait = self.state.heartbeat_interval / 1000
+        while True:
+            self._flush_needed.wait(idle_wait)
+            self._flush_needed.clear()
+            with self._lock:
+                if self.state.state != NodeState.LEADER or self.state.current_term != term:
+                    return
+            self.state.log.sync()
+            self._advance_commit()
+
+    def _advance_commit(self) -> None:
+        """Commit what a majority has on disk and resolve the waiting commands."""
+        resolved = []
+        with self._lock:
+            if self.state.state != NodeState.LEADER or self.leader_state is None:
+                return
+            log = self.state.log
+            if self.peers and self.transport is None:
+                # Nothing replicates: acknowledge once durable, without committing
+                target = log.durable_index
+                message = "command appended"
+            else:
+                matches = sorted(
+                    [log.durable_index, *self.leader_state.match_index.values()], reverse=True
+                )
+                target = matches[len(self.cluster_nodes) // 2]
+                message = "command committed"
+                # Only entries of the current term commit by counting replicas
+                if target > self.state.commit_index and log.term_at(target) == (
+                    self.state.current_term
+                ):
+                    old_commit = self.state.commit_index
+                    self.state.commit_index = target
+                    self._apply_committed_entries(old_commit + 1, target)
+                    metric_counter("consensus.entries_committed")(target - old_commit)
+                target = self.state.commit_index
+
+            for index in [i for i in self._waiters if i <= target]:
+                result = ConsensusResult(
+                    success=True,
+                    term=self.state.current_term,
+                    leader_id=self.node_id,
+                    log_index=index,
+                    message=message,
+                )
+                resolved.append((self._waiters.pop(index), result))
 
-            return ConsensusResult(
-                success=True,
-                term=self.state.current_term,
-                leader_id=self.node_id,
-                log_index=entry.index,
-                message="command replicated",
-            )
+        for future, result in resolved:
+            future.set_result(result)
 
     def _apply_committed_entries(self, start_index: int, end_index: int) -> None:
         """Apply committed entries to state machine."""
-        for i in range(start_index, end_index + 1):
-            if i < len(self.state.log):
-                entry = self.state.log[i]
+        log = self.state.log
+        for i in range(max(start_index, log.snapshot_index + 1), end_index + 1):
+            if i < len(log):
+                entry = log[i]
                 if entry.command in self.command_handlers:
                     self.command_handlers[entry.command](entry.data)
 
                 self.state.last_applied = i
 
+        if (
+            self.snapshot_threshold
+            and self.state.last_applied - log.snapshot_index >= self.snapshot_threshold
+        ):
+            self.take_snapshot()
+
+    def take_snapshot(self) -> bool:
+        """Snapshot the state machine at the last applied entry and compact the log."""
+        with self._lock:
+            log = self.state.log
+            index = self.state.last_applied
+            if index <= log.snapshot_index:
+                return False
+            log.compact(index, log.term_at(index), copy.deepcopy(self.state_machine))
+            return True
+
+    def close(self) -> None:
+        """Stop replication and close the log."""
+        with self._lock:
+            self._step_down()
+        self.state.log.close()
+
     def get_state(self) -> dict[str, Any]:
         """Get current consensus state."""
         return {
@@ -338,6 +740,9 @@ class ConsensusEngine:
             "term": self.state.current_term,
             "log_length": len(self.state.log),
             "commit_index": self.state.commit_index,
+            "last_applied": self.state.last_applied,
+            "durable_index": self.state.log.durable_index,
+            "snapshot_index": self.state.log.snapshot_index,
             "voted_for": self.state.voted_for,
             "peers": self.peers,
         }
@@ -350,6 +755,153 @@ class ConsensusEngine:
         return None
 
 
+class _Replicator:
+    """Pipelines AppendEntries batches to one peer while the engine leads a term."""
+
+    def __init__(self, engine: ConsensusEngine, peer: str, term: int):
+        self.engine = engine
+        self.peer = peer
+        self.term = term
+        self.wake = threading.Event()
+        self._stopped = threading.Event()
+        # Next index to send; runs ahead of leader_state.next_index while
+        # batches are in flight
+        self.next_index = len(engine.state.log)
+        # (future, prev_log_index, entry count, generation)
+        self.inflight: deque[tuple[Future, int, int, int]] = deque()
+        # Bumped when the pipeline restarts; older responses are ignored
+        self.generation = 0
+        self._thread = threading.Thread(
+            target=self._run, name=f"raft-{engine.node_id}-{peer}", daemon=True
+        )
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self.wake.set()
+
+    def _run(self) -> None:
+        heartbeat = self.engine.state.heartbeat_interval / 1000
+        last_sent = 0.0
+        while not self._stopped.is_set():
+            request = self._next_request()
+            if request is None and not self.inflight:
+                idle = heartbeat - (time.monotonic() - last_sent)
+                if idle > 0:
+                    self.wake.wait(idle)
+                    self.wake.clear()
+                    continue
+                request = self._heartbeat()
+            if request is not None:
+                method, payload, prev_index, count = request
+                future = self.engine.transport.send(self.peer, method, payload)
+                self.inflight.append((future, prev_index, count, self.generation))
+                last_sent = time.monotonic()
+
+            # Handle answered requests in order, then block on the oldest when
+            # the window is full or there is nothing new to send
+            while self.inflight and self.inflight[0][0].done():
+                self._handle_oldest()
+            if self.inflight and (
+                request is None or len(self.inflight) >= self.engine.max_inflight
+            ):
+                self._handle_oldest()
+
+    def _handle_oldest(self) -> None:
+        future, prev_index, count, generation = self.inflight.popleft()
+        done, _ = wait([future], timeout=RPC_TIMEOUT_S)
+        if generation == self.generation:
+            self._handle(future if done else None, prev_index, count)
+
+    def _next_request(self) -> tuple[str, dict[str, Any], int, int] | None:
+        engine = self.engine
+        with engine._lock:  # noqa: SLF001
+            if engine.state.state != NodeState.LEADER or engine.state.current_term != self.term:
+                self._stopped.set()
+                return None
+            log = engine.state.log
+            if self.next_index <= log.snapshot_index:
+                if self.inflight:
+                    return None
+                payload = {
+                    "term": self.term,
+                    "leader_id": engine.node_id,
+                    "last_included_index": log.snapshot_index,
+                    "last_included_term": log.snapshot_term,
+                    "state": log.snapshot_state or {},
+                }
+                self.next_index = log.snapshot_index + 1
+                return "install_snapshot", payload, log.snapshot_index, 0
+            entries = log.entries_from(self.next_index, engine.max_batch_entries)
+            if not entries:
+                return None
+            request = self._append_request(entries)
+            self.next_index += len(entries)
+            return request
+
+    def _heartbeat(self) -> tuple[str, dict[str, Any], int, int] | None:
+        with self.engine._lock:  # noqa: SLF001
+            if self.next_index <= self.engine.state.log.snapshot_index:
+                return None
+            return self._append_request([])
+
+    def _append_request(self, entries: list[LogEntry]) -> tuple[str, dict[str, Any], int, int]:
+        """AppendEntries for ``entries`` starting at ``next_index``; caller holds the lock."""
+        engine = self.engine
+        prev_index = self.next_index - 1
+        payload = {
+            "term": self.term,
+            "leader_id": engine.node_id,
+            "prev_log_index": prev_index,
+            "prev_log_term": engine.state.log.term_at(prev_index),
+            "entries": entries,
+            "leader_commit": engine.state.commit_index,
+        }
+        if entries:
+            metric_histogram("consensus.append_batch_size", unit="1")(len(entries))
+        return "append_entry", payload, prev_index, len(entries)
+
+    def _handle(self, future: Future | None, prev_index: int, count: int) -> None:
+        engine = self.engine
+        if future is None or future.exception() is not None:
+            # Unreachable peer: restart from what it acknowledged, after a pause
+            self._restart(engine.leader_state.match_index.get(self.peer, 0) + 1)
+            self._stopped.wait(engine.state.heartbeat_interval / 1000)
+            return
+
+        result: ConsensusResult = future.result()
+        with engine._lock:  # noqa: SLF001
+            if result.term > self.term:
+                engine._observe_term(result.term)  # noqa: SLF001
+                self._stopped.set()
+                return
+            if engine.leader_state is None or engine.state.current_term != self.term:
+                return
+            leader_state = engine.leader_state
+            leader_state.replication_status[self.peer] = result.success
+            leader_state.heartbeat_last_sent[self.peer] = time.time()
+            if not result.success:
+                self._restart(max(1, min(result.log_index, prev_index)))
+                return
+            match = prev_index + count
+            if match > leader_state.match_index[self.peer]:
+                leader_state.match_index[self.peer] = match
+                leader_state.next_index[self.peer] = match + 1
+        if count or result.message == "snapshot installed":
+            engine._advance_commit()  # noqa: SLF001
+
+    def _restart(self, next_index: int) -> None:
+        self.generation += 1
+        self.inflight.clear()
+        self.next_index = next_index
+        with self.engine._lock:  # noqa: SLF001
+            if self.engine.leader_state is not None:
+                self.engine.leader_state.next_index[self.peer] = next_index
+        metric_counter("consensus.replication_restarts")(1)
+
+
 @dataclass
 class ConsensusCluster:
     """Manages consensus across cluster."""
@@ -357,19 +909,25 @@ class ConsensusCluster:
     cluster_name: str
     nodes: dict[str, ConsensusEngine] = field(default_factory=dict)
     term_history: list[int] = field(default_factory=list)
+    transport: LocalTransport | None = None
 
     def add_node(
         self,
         node_id: str,
         cluster_nodes: list[str],
         election_timeout_ms: float = 150.0,
+        **engine_options: Any,
     ) -> None:
         """Add node to consensus cluster."""
         engine = ConsensusEngine(
             node_id,
             cluster_nodes,
             election_timeout_ms=election_timeout_ms,
+            transport=self.transport,
+            **engine_options,
         )
+        if self.transport is not None:
+            self.transport.register(engine)
         self.nodes[node_id] = engine
 
     def get_leader(self) -> str | None:
@@ -385,8 +943,5 @@ class ConsensusCluster:
         return {
             "cluster": self.cluster_name,
             "leader": self.get_leader(),
-            "nodes": {
-                node_id: engine.get_state()
-                for node_id, engine in self.nodes.items()
-            },
+            "nodes": {node_id: engine.get_state() for node_id, engine in self.nodes.items()},
         }
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 import json
-import sqlite3
 import uuid
+import weakref
 from dataclasses import asdict, dataclass
 from datetime import datetime
 from pathlib import Path
@@ -10,6 +10,7 @@ from typing import Any
 
 from specify_cli.core.shell import timed
 from specify_cli.core.telemetry import metric_counter, span
+from specify_cli.runtime.sqlite_pool import SQLitePool, WriteBehindQueue
 
 
 @dataclass
@@ -32,14 +33,47 @@ class WorkflowRecord:
     execution_count: int = 0
 
 
+_SAVE_EXECUTION_SQL = """
+    INSERT INTO executions
+    (execution_id, workflow_id, status, result_data, duration, timestamp)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+
+def _row_to_workflow(row: tuple) -> WorkflowRecord:
+    return WorkflowRecord(
+        workflow_id=row[0],
+        name=row[1],
+        config=json.loads(row[2]),
+        created_at=row[3],
+        last_executed=row[4],
+        execution_count=row[5],
+    )
+
+
 class DatabaseStore:
-    def __init__(self, db_path: str | Path = ".spec-kit/database.db"):
+    """Workflows, executions and artifacts in SQLite.
+
+    Connections are pooled per thread. By default ``save_execution`` commits
+    the record before returning, so a rejected execution (such as a
+    duplicate id) raises there. With ``write_behind``, it queues the record
+    and a writer thread commits queued records in batches; reads and
+    ``flush`` wait for queued records first, and a rejected record is raised
+    by the next ``flush`` or read.
+    """
+
+    def __init__(self, db_path: str | Path = ".spec-kit/database.db", write_behind: bool = False):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._pool = SQLitePool(self.db_path)
         self._init_schema()
+        self._writes = WriteBehindQueue(self._pool, _SAVE_EXECUTION_SQL) if write_behind else None
+        if self._writes is not None:
+            # Commit queued records when the store is collected or at exit
+            weakref.finalize(self, self._writes.close)
 
     def _init_schema(self) -> None:
-        with sqlite3.connect(self.db_path) as conn:
+        with self._pool.transaction() as conn:
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS workflows (
                     workflow_id TEXT PRIMARY KEY,
@@ -74,80 +108,96 @@ class DatabaseStore:
                 )
             """)
 
+            # Covers lookups by workflow and their newest-first ordering
+            conn.execute("DROP INDEX IF EXISTS idx_workflow_executions")
             conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_workflow_executions
-                ON executions(workflow_id)
+                CREATE INDEX IF NOT EXISTS idx_executions_workflow_timestamp
+                ON executions(workflow_id, timestamp)
             """)
 
-            conn.commit()
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_artifacts_execution
+                ON artifacts(execution_id)
+            """)
+
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_workflows_created_at
+                ON workflows(created_at)
+            """)
+
+    def flush(self) -> None:
+        """Wait until every saved execution is committed."""
+        if self._writes is not None:
+            self._writes.flush()
+
+    def close(self) -> None:
+        """Commit queued executions and close the connections."""
+        if self._writes is not None:
+            self._writes.close()
+        self._pool.close()
+
+    def _query(self, sql: str, params: tuple = ()) -> list[tuple]:
+        self.flush()
+        return self._pool.connection().execute(sql, params).fetchall()
 
-    @timed
     def save_workflow(self, workflow: WorkflowRecord) -> None:
         with span("db.save_workflow", workflow_id=workflow.workflow_id):
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute("""
+            with self._pool.transaction() as conn:
+                conn.execute(
+                    """
                     INSERT OR REPLACE INTO workflows
                     (workflow_id, name, config, created_at, last_executed, execution_count)
                     VALUES (?, ?, ?, ?, ?, ?)
-                """, (
-                    workflow.workflow_id,
-                    workflow.name,
-                    json.dumps(workflow.config),
-                    workflow.created_at,
-                    workflow.last_executed,
-                    workflow.execution_count,
-                ))
-                conn.commit()
-            metric_counter("db.workflows.saved", 1)
+                    """,
+                    (
+                        workflow.workflow_id,
+                        workflow.name,
+                        json.dumps(workflow.config),
+                        workflow.created_at,
+                        workflow.last_executed,
+                        workflow.execution_count,
+                    ),
+                )
+            metric_counter("db.workflows.saved")(1)
 
-    @timed
     def save_execution(self, execution: ExecutionRecord) -> None:
         with span("db.save_execution", execution_id=execution.execution_id):
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute("""
-                    INSERT INTO executions
-                    (execution_id, workflow_id, status, result_data, duration, timestamp)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                """, (
-                    execution.execution_id,
-                    execution.workflow_id,
-                    execution.status,
-                    json.dumps(execution.result_data),
-                    execution.duration,
-                    execution.timestamp,
-                ))
-                conn.commit()
-            metric_counter("db.executions.saved", 1)
+            row = (
+                execution.execution_id,
+                execution.workflow_id,
+                execution.status,
+                json.dumps(execution.result_data),
+                execution.duration,
+                execution.timestamp,
+            )
+            if self._writes is not None:
+                self._writes.put(row)
+            else:
+                with self._pool.transaction() as conn:
+                    conn.execute(_SAVE_EXECUTION_SQL, row)
+            metric_counter("db.executions.saved")(1)
 
-    @timed
     def get_workflow(self, workflow_id: str) -> WorkflowRecord | None:
         with span("db.get_workflow", workflow_id=workflow_id):
-            with sqlite3.connect(self.db_path) as conn:
-                row = conn.execute("""
-                    SELECT workflow_id, name, config, created_at, last_executed, execution_count
-                    FROM workflows WHERE workflow_id = ?
-                """, (workflow_id,)).fetchone()
-
-            if not row:
-                return None
-
-            return WorkflowRecord(
-                workflow_id=row[0],
-                name=row[1],
-                config=json.loads(row[2]),
-                created_at=row[3],
-                last_executed=row[4],
-                execution_count=row[5],
+            rows = self._query(
+                """
+                SELECT workflow_id, name, config, created_at, last_executed, execution_count
+                FROM workflows WHERE workflow_id = ?
+                """,
+                (workflow_id,),
             )
+            return _row_to_workflow(rows[0]) if rows else None
 
     @timed
     def get_workflow_executions(self, workflow_id: str) -> list[ExecutionRecord]:
         with span("db.get_workflow_executions", workflow_id=workflow_id):
-            with sqlite3.connect(self.db_path) as conn:
-                rows = conn.execute("""
-                    SELECT execution_id, workflow_id, status, result_data, duration, timestamp
-                    FROM executions WHERE workflow_id = ? ORDER BY timestamp DESC
-                """, (workflow_id,)).fetchall()
+            rows = self._query(
+                """
+                SELECT execution_id, workflow_id, status, result_data, duration, timestamp
+                FROM executions WHERE workflow_id = ? ORDER BY timestamp DESC
+                """,
+                (workflow_id,),
+            )
 
             return [
                 ExecutionRecord(
@@ -161,7 +211,6 @@ class DatabaseStore:
                 for row in rows
             ]
 
-    @timed
     def save_artifact(
         self,
         execution_id: str,
@@ -172,35 +221,38 @@ class DatabaseStore:
             artifact_id = str(uuid.uuid4())[:8]
             timestamp = datetime.now().isoformat()
 
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute("""
+            with self._pool.transaction() as conn:
+                conn.execute(
+                    """
                     INSERT INTO artifacts
                     (artifact_id, execution_id, artifact_type, content, created_at)
                     VALUES (?, ?, ?, ?, ?)
-                """, (artifact_id, execution_id, artifact_type, content, timestamp))
-                conn.commit()
+                    """,
+                    (artifact_id, execution_id, artifact_type, content, timestamp),
+                )
 
-            metric_counter("db.artifacts.saved", 1)
+            metric_counter("db.artifacts.saved")(1)
             return artifact_id
 
     @timed
     def get_execution_artifacts(self, execution_id: str) -> dict[str, str]:
         with span("db.get_execution_artifacts", execution_id=execution_id):
-            with sqlite3.connect(self.db_path) as conn:
-                rows = conn.execute("""
-                    SELECT artifact_type, content FROM artifacts
-                    WHERE execution_id = ?
-                """, (execution_id,)).fetchall()
+            rows = self._query(
+                """
+                SELECT artifact_type, content FROM artifacts
+                WHERE execution_id = ?
+                """,
+                (execution_id,),
+            )
 
             return {row[0]: row[1] for row in rows}
 
     @timed
     def get_workflow_statistics(self, workflow_id: str) -> dict[str, Any]:
         with span("db.get_workflow_statistics", workflow_id=workflow_id):
-            with sqlite3.connect(self.db_path) as conn:
-                executions = conn.execute("""
-                    SELECT status, duration FROM executions WHERE workflow_id = ?
-                """, (workflow_id,)).fetchall()
+            executions = self._query(
+                "SELECT status, duration FROM executions WHERE workflow_id = ?", (workflow_id,)
+            )
 
             total = len(executions)
             successful = sum(1 for e in executions if e[0] == "completed")
@@ -218,23 +270,15 @@ class DatabaseStore:
     @timed
     def list_workflows(self, limit: int = 100) -> list[WorkflowRecord]:
         with span("db.list_workflows", limit=limit):
-            with sqlite3.connect(self.db_path) as conn:
-                rows = conn.execute("""
-                    SELECT workflow_id, name, config, created_at, last_executed, execution_count
-                    FROM workflows ORDER BY created_at DESC LIMIT ?
-                """, (limit,)).fetchall()
+            rows = self._query(
+                """
+                SELECT workflow_id, name, config, created_at, last_executed, execution_count
+                FROM workflows ORDER BY created_at DESC LIMIT ?
+                """,
+                (limit,),
+            )
 
-            return [
-                WorkflowRecord(
-                    workflow_id=row[0],
-                    name=row[1],
-                    config=json.loads(row[2]),
-                    created_at=row[3],
-                    last_executed=row[4],
-                    execution_count=row[5],
-                )
-                for row in rows
-            ]
+            return [_row_to_workflow(row) for row in rows]
 
 
 _global_db: DatabaseStore | None = None
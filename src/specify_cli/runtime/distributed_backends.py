@@ -0,0 +1,317 @@
+"""Execution backends for the distributed executor.
+
+A backend runs tasks on behalf of a named cluster node and returns a
+future resolving to ``(result, execution_time)``:
+
+- ``ThreadPoolBackend``: a thread pool per node (handlers need not pickle)
+- ``ProcessPoolBackend``: a process pool per node
+- ``SubprocessAgentBackend``: one worker agent subprocess per node, spoken
+  to over its stdin/stdout pipe, to emulate a multi-node cluster on one box
+
+The agent is this module run as a script::
+
+    python -m specify_cli.runtime.distributed_backends --workers 4
+
+It reads length-prefixed pickled ``(handler, args, kwargs)`` requests and
+answers with pickled ``(ok, payload)`` responses, running up to
+``--workers`` tasks at a time. Handlers and arguments must be picklable
+for the process and agent backends.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import pickle
+import struct
+import subprocess
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any
+
+from specify_cli.core.telemetry import metric_counter
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Frame header: call id, payload length
+_HEADER = struct.Struct(">QI")
+
+
+class RemoteTaskError(Exception):
+    """A task failed in an agent with an exception that could not be pickled."""
+
+
+def run_task(handler: Callable, args: tuple, kwargs: dict[str, Any]) -> tuple[Any, float]:
+    """Run ``handler`` and return its result with the time it took."""
+    start = time.perf_counter()
+    result = handler(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+class ExecutionBackend(ABC):
+    """Runs tasks for cluster nodes."""
+
+    name = "abstract"
+
+    @abstractmethod
+    def submit(
+        self, node_id: str, handler: Callable, args: tuple, kwargs: dict[str, Any]
+    ) -> Future:
+        """Start ``handler(*args, **kwargs)`` on ``node_id``.
+
+        The future resolves to ``(result, execution_time)`` or raises the
+        task's exception.
+        """
+
+    @abstractmethod
+    def shutdown(self, wait: bool = True) -> None:
+        """Release the backend's workers."""
+
+
+class _PerNodeExecutorBackend(ExecutionBackend):
+    """One ``concurrent.futures`` executor per node, created on first use."""
+
+    def __init__(self, workers_per_node: int = 1):
+        self.workers_per_node = workers_per_node
+        self._executors: dict[str, Executor] = {}
+        self._lock = threading.Lock()
+
+    @abstractmethod
+    def _create(self) -> Executor: ...
+
+    def _executor(self, node_id: str) -> Executor:
+        with self._lock:
+            executor = self._executors.get(node_id)
+            if executor is None:
+                executor = self._executors[node_id] = self._create()
+            return executor
+
+    def submit(
+        self, node_id: str, handler: Callable, args: tuple, kwargs: dict[str, Any]
+    ) -> Future:
+        return self._executor(node_id).submit(run_task, handler, args, kwargs)
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            executors, self._executors = list(self._executors.values()), {}
+        for executor in executors:
+            executor.shutdown(wait=wait, cancel_futures=not wait)
+
+
+class ThreadPoolBackend(_PerNodeExecutorBackend):
+    """Thread pool per node."""
+
+    name = "thread"
+
+    def _create(self) -> Executor:
+        return ThreadPoolExecutor(self.workers_per_node, thread_name_prefix="node")
+
+
+class ProcessPoolBackend(_PerNodeExecutorBackend):
+    """Process pool per node."""
+
+    name = "process"
+
+    def _create(self) -> Executor:
+        return ProcessPoolExecutor(self.workers_per_node)
+
+
+class _AgentConnection:
+    """A running agent subprocess and the calls waiting on it."""
+
+    def __init__(self, node_id: str, workers: int):
+        self.node_id = node_id
+        env = dict(os.environ)
+        # Make this package importable in the agent even when not installed
+        package_root = str(Path(__file__).resolve().parents[2])
+        env["PYTHONPATH"] = os.pathsep.join(filter(None, [package_root, env.get("PYTHONPATH")]))
+        self.process = subprocess.Popen(
+            [sys.executable, "-m", __name__, "--workers", str(workers)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            env=env,
+        )
+        self.pending: dict[int, Future] = {}
+        self._next_id = 0
+        self._lock = threading.Lock()
+        self._reader = threading.Thread(
+            target=self._read_responses, name=f"agent-{node_id}", daemon=True
+        )
+        self._reader.start()
+
+    def submit(self, handler: Callable, args: tuple, kwargs: dict[str, Any]) -> Future:
+        future: Future = Future()
+        try:
+            body = pickle.dumps((handler, args, kwargs))
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            future.set_exception(e)
+            return future
+
+        with self._lock:
+            call_id = self._next_id
+            self._next_id += 1
+            self.pending[call_id] = future
+            try:
+                _write_frame(self.process.stdin, call_id, body)
+            except OSError as e:
+                del self.pending[call_id]
+                future.set_exception(RuntimeError(f"Agent for {self.node_id} is gone: {e}"))
+        return future
+
+    def _read_responses(self) -> None:
+        stdout = self.process.stdout
+        while (frame := _read_frame(stdout)) is not None:
+            call_id, body = frame
+            with self._lock:
+                future = self.pending.pop(call_id, None)
+            if future is None:
+                continue
+            try:
+                ok, payload = pickle.loads(body)  # Sent by our own child process
+            except Exception as e:  # e.g. exception class not importable here
+                ok, payload = False, RemoteTaskError(f"Undecodable response: {e}")
+            if ok:
+                future.set_result(payload)
+            else:
+                future.set_exception(payload)
+
+        # Agent exited: fail whatever it did not answer
+        with self._lock:
+            orphaned, self.pending = list(self.pending.values()), {}
+        for future in orphaned:
+            future.set_exception(RuntimeError(f"Agent for {self.node_id} exited"))
+        if orphaned:
+            metric_counter("distributed_execution.agent_lost_tasks")(len(orphaned))
+
+    def close(self, wait: bool = True) -> None:
+        if self.process.stdin:
+            self.process.stdin.close()  # Agent finishes running tasks, then exits
+        if not wait:
+            self.process.kill()
+        try:
+            self.process.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+        self._reader.join(timeout=5)
+
+
+class SubprocessAgentBackend(ExecutionBackend):
+    """One worker agent subprocess per node, connected over pipes."""
+
+    name = "agent"
+
+    def __init__(self, workers_per_node: int = 1):
+        self.workers_per_node = workers_per_node
+        self._agents: dict[str, _AgentConnection] = {}
+        self._lock = threading.Lock()
+
+    def _agent(self, node_id: str) -> _AgentConnection:
+        with self._lock:
+            agent = self._agents.get(node_id)
+            if agent is None or agent.process.poll() is not None:
+                agent = self._agents[node_id] = _AgentConnection(node_id, self.workers_per_node)
+                metric_counter("distributed_execution.agent_started")(1)
+            return agent
+
+    def submit(
+        self, node_id: str, handler: Callable, args: tuple, kwargs: dict[str, Any]
+    ) -> Future:
+        return self._agent(node_id).submit(handler, args, kwargs)
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            agents, self._agents = list(self._agents.values()), {}
+        for agent in agents:
+            agent.close(wait=wait)
+
+
+BACKENDS: dict[str, type[ExecutionBackend]] = {
+    "thread": ThreadPoolBackend,
+    "process": ProcessPoolBackend,
+    "agent": SubprocessAgentBackend,
+}
+
+
+def create_backend(name: str, workers_per_node: int = 1) -> ExecutionBackend:
+    """Create a backend by name ("thread", "process" or "agent")."""
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown execution backend: {name} (expected one of {list(BACKENDS)})")
+    return BACKENDS[name](workers_per_node)
+
+
+# --------------------------------------------------------------------------- #
+# Wire format and agent                                                       #
+# --------------------------------------------------------------------------- #
+
+
+def _write_frame(stream: IO[bytes], call_id: int, body: bytes) -> None:
+    stream.write(_HEADER.pack(call_id, len(body)) + body)
+    stream.flush()
+
+
+def _read_exact(stream: IO[bytes], size: int) -> bytes | None:
+    data = b""
+    while len(data) < size:
+        chunk = stream.read(size - len(data))
+        if not chunk:
+            return None
+        data += chunk
+    return data
+
+
+def _read_frame(stream: IO[bytes]) -> tuple[int, bytes] | None:
+    """Read one frame; None at end of stream."""
+    header = _read_exact(stream, _HEADER.size)
+    if header is None:
+        return None
+    call_id, size = _HEADER.unpack(header)
+    body = _read_exact(stream, size)
+    return None if body is None else (call_id, body)
+
+
+def _serve_call(body: bytes) -> bytes:
+    """Run one request and pickle its response."""
+    try:
+        handler, args, kwargs = pickle.loads(body)
+        response: tuple[bool, Any] = (True, run_task(handler, args, kwargs))
+    except Exception as e:
+        response = (False, e)
+    try:
+        return pickle.dumps(response)
+    except Exception:  # Unpicklable result or exception
+        error = response[1] if not response[0] else "result could not be pickled"
+        return pickle.dumps((False, RemoteTaskError(repr(error))))
+
+
+def agent_main(workers: int = 1) -> int:
+    """Serve requests from stdin until it closes."""
+    requests = sys.stdin.buffer
+    responses = sys.stdout.buffer
+    # Keep task output off the protocol stream
+    sys.stdout = sys.stderr
+    write_lock = threading.Lock()
+
+    def _serve(call_id: int, body: bytes) -> None:
+        response = _serve_call(body)
+        with write_lock:
+            _write_frame(responses, call_id, response)
+
+    with ThreadPoolExecutor(max(1, workers), thread_name_prefix="agent") as pool:
+        while (frame := _read_frame(requests)) is not None:
+            pool.submit(_serve, *frame)
+    return 0
+
+
+if __name__ == "__main__":
+    # Run from the importable module so pickled exceptions resolve in the parent
+    from specify_cli.runtime.distributed_backends import agent_main as _agent_main
+
+    parser = argparse.ArgumentParser(description="Distributed execution worker agent")
+    parser.add_argument("--workers", type=int, default=1)
+    sys.exit(_agent_main(parser.parse_args().workers))
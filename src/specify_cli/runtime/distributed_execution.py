@@ -1,13 +1,18 @@
 """Distributed execution coordinator for multi-node task distribution.
 
 Coordinates task execution across cluster with load balancing,
-task affinity, and work stealing.
+task affinity, and work stealing. Tasks run concurrently on a pluggable
+execution backend (see ``specify_cli.runtime.distributed_backends``).
 """
 
 from __future__ import annotations
 
+import heapq
+import itertools
+import threading
 import time
 import uuid
+from concurrent.futures import Future, wait
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Callable
@@ -15,6 +20,7 @@ from typing import Any, Callable
 from specify_cli.core.shell import timed
 from specify_cli.core.telemetry import metric_counter, metric_histogram, span
 from specify_cli.runtime.cluster import ClusterManager, NodeRole
+from specify_cli.runtime.distributed_backends import ExecutionBackend, create_backend
 
 
 class TaskState(Enum):
@@ -103,22 +109,36 @@ class ExecutionStats:
 
 
 class DistributedExecutor:
-    """Executes tasks across distributed cluster."""
+    """Executes tasks across distributed cluster.
+
+    Tasks wait in a priority heap until ``execute_batch`` (or
+    ``dispatch_pending``) assigns them to nodes and hands them to the
+    execution backend, which runs them concurrently. Completions update
+    ``stats`` from the backend's threads as they arrive.
+    """
 
     def __init__(
         self,
         cluster_manager: ClusterManager,
         scheduling_strategy: TaskSchedulingStrategy = TaskSchedulingStrategy.LEAST_LOADED,
+        backend: ExecutionBackend | str = "thread",
+        workers_per_node: int = 1,
     ):
         self.cluster = cluster_manager
         self.strategy = scheduling_strategy
+        self.backend = (
+            create_backend(backend, workers_per_node) if isinstance(backend, str) else backend
+        )
         self.tasks: dict[str, DistributedTask] = {}
-        self.task_queue: list[DistributedTask] = []
+        self.task_queue: list[tuple[int, int, DistributedTask]] = []
         self.completed_tasks: dict[str, DistributedTask] = {}
         self.node_workloads: dict[str, int] = {}
         self.stats = ExecutionStats()
+        self._futures: dict[str, Future] = {}
+        self._sequence = itertools.count()
+        self._round_robin = itertools.count()
+        self._lock = threading.Lock()
 
-    @timed
     def submit_task(
         self,
         task_name: str,
@@ -144,21 +164,13 @@ class DistributedExecutor:
                 affinity_node=affinity_node,
             )
 
-            self.tasks[task.task_id] = task
-            self.task_queue.append(task)
-            self.task_queue.sort(key=lambda t: t.priority, reverse=True)
-            self.stats.total_tasks += 1
-            self.stats.pending_tasks += 1
-
-            metric_counter(
-                "distributed_execution.task_submitted",
-                1,
-                {
-                    "cluster": self.cluster.cluster_name,
-                    "task": task_name,
-                    "priority": str(priority),
-                },
-            )
+            with self._lock:
+                self.tasks[task.task_id] = task
+                heapq.heappush(self.task_queue, (-priority, next(self._sequence), task))
+                self.stats.total_tasks += 1
+                self.stats.pending_tasks += 1
+
+            metric_counter("distributed_execution.task_submitted")(1)
 
             return TaskScheduleResult(
                 success=True,
@@ -167,7 +179,6 @@ class DistributedExecutor:
                 message="task submitted to queue",
             )
 
-    @timed
     def schedule_task(self, task: DistributedTask) -> TaskScheduleResult:
         """Schedule task to appropriate node."""
         with span(
@@ -189,17 +200,13 @@ class DistributedExecutor:
 
             task.assigned_node = node_id
             task.state = TaskState.ASSIGNED
-            self.node_workloads[node_id] = self.node_workloads.get(node_id, 0) + 1
-
-            metric_counter(
-                "distributed_execution.task_scheduled",
-                1,
-                {
-                    "cluster": self.cluster.cluster_name,
-                    "node": node_id,
-                    "strategy": self.strategy.value,
-                },
-            )
+            with self._lock:
+                self.node_workloads[node_id] = self.node_workloads.get(node_id, 0) + 1
+                node = self.cluster.nodes.get(node_id)
+                if node is not None:
+                    node.task_count += 1
+
+            metric_counter("distributed_execution.task_scheduled")(1)
 
             return TaskScheduleResult(
                 success=True,
@@ -208,118 +215,133 @@ class DistributedExecutor:
                 message=f"task assigned to {node_id}",
             )
 
+    def dispatch_pending(self) -> dict[str, Future]:
+        """Assign queued tasks to nodes and start them without waiting.
+
+        Tasks stay queued if no node is available. Returns the futures of
+        the dispatched tasks by task id.
+        """
+        dispatched: dict[str, Future] = {}
+        while True:
+            with self._lock:
+                if not self.task_queue:
+                    break
+                task = heapq.heappop(self.task_queue)[2]
+
+            if not self.schedule_task(task).success:
+                with self._lock:
+                    heapq.heappush(self.task_queue, (-task.priority, next(self._sequence), task))
+                break
+
+            task.state = TaskState.RUNNING
+            task.started_at = time.time()
+            try:
+                future = self.backend.submit(task.assigned_node, task.handler, task.args, task.kwargs)
+            except Exception as e:
+                future = Future()
+                future.set_exception(e)
+            with self._lock:
+                self._futures[task.task_id] = future
+            future.add_done_callback(lambda f, task=task: self._complete(task, f))
+            dispatched[task.task_id] = future
+
+        metric_counter("distributed_execution.task_dispatched")(len(dispatched))
+        return dispatched
+
     @timed
-    def execute_batch(self) -> int:
-        """Execute batch of pending tasks."""
+    def execute_batch(self, timeout: float | None = None) -> int:
+        """Run all queued tasks concurrently and wait for them.
+
+        Returns the number of tasks that completed successfully.
+        """
         with span(
             "distributed_execution.execute_batch",
             cluster=self.cluster.cluster_name,
         ):
-            executed = 0
-
-            # Sort by priority
-            self.task_queue.sort(key=lambda t: t.priority, reverse=True)
-
-            # Schedule pending tasks
-            for task in self.task_queue[:]:
-                if task.state == TaskState.PENDING:
-                    result = self.schedule_task(task)
-                    if result.success:
-                        task.state = TaskState.QUEUED
-
-            # Execute assigned tasks
-            tasks_to_execute = [
-                t for t in self.tasks.values()
-                if t.state == TaskState.ASSIGNED
-            ]
-
-            for task in tasks_to_execute:
-                try:
-                    task.state = TaskState.RUNNING
-                    task.started_at = time.time()
-
-                    result = task.handler(*task.args, **task.kwargs)
-                    task.result = result
-                    task.state = TaskState.COMPLETED
-
-                    task.completed_at = time.time()
-                    task.execution_time = (
-                        task.completed_at - task.started_at
-                    )
-
-                    self.completed_tasks[task.task_id] = task
-                    self.stats.completed_tasks += 1
-                    self.stats.total_execution_time += task.execution_time
-                    self.stats.pending_tasks -= 1
-
-                    executed += 1
-
-                    metric_counter(
-                        "distributed_execution.task_completed",
-                        1,
-                        {
-                            "cluster": self.cluster.cluster_name,
-                            "task": task.task_name,
-                        },
-                    )
-
-                except Exception as e:
-                    task.state = TaskState.FAILED
-                    task.error = str(e)
-                    task.completed_at = time.time()
-                    task.execution_time = (
-                        task.completed_at - task.started_at
-                    ) if task.started_at else 0.0
-
-                    self.completed_tasks[task.task_id] = task
-                    self.stats.failed_tasks += 1
-                    self.stats.pending_tasks -= 1
-
-                    metric_counter(
-                        "distributed_execution.task_failed",
-                        1,
-                        {
-                            "cluster": self.cluster.cluster_name,
-                            "task": task.task_name,
-                        },
-                    )
-
-                # Remove from queue
-                if task in self.task_queue:
-                    self.task_queue.remove(task)
-
-            # Update stats
-            if self.stats.completed_tasks > 0:
-                self.stats.average_execution_time = (
-                    self.stats.total_execution_time / self.stats.completed_tasks
-                )
-
-            metric_histogram(
-                "distributed_execution.batch_size",
-                float(executed),
-                {"cluster": self.cluster.cluster_name},
+            futures = self.dispatch_pending()
+            wait(futures.values(), timeout=timeout)
+            executed = sum(
+                1
+                for task_id in futures
+                if self.tasks[task_id].state == TaskState.COMPLETED
             )
 
+            metric_histogram("distributed_execution.batch_size", unit="1")(float(executed))
             return executed
 
+    def wait_all(self, timeout: float | None = None) -> bool:
+        """Wait for every dispatched task; False on timeout."""
+        with self._lock:
+            futures = list(self._futures.values())
+        return not wait(futures, timeout=timeout).not_done
+
+    def _complete(self, task: DistributedTask, future: Future) -> None:
+        """Record a finished task (runs on the backend's thread)."""
+        task.completed_at = time.time()
+        try:
+            task.result, task.execution_time = future.result()
+        except BaseException as e:
+            task.state = TaskState.CANCELLED if future.cancelled() else TaskState.FAILED
+            task.error = str(e) or type(e).__name__
+            task.execution_time = task.completed_at - (task.started_at or task.completed_at)
+        else:
+            task.state = TaskState.COMPLETED
+
+        with self._lock:
+            self._futures.pop(task.task_id, None)
+            self.completed_tasks[task.task_id] = task
+            self.stats.pending_tasks -= 1
+            node_id = task.assigned_node
+            self.node_workloads[node_id] = max(0, self.node_workloads.get(node_id, 0) - 1)
+            node = self.cluster.nodes.get(node_id)
+
+            if task.state == TaskState.COMPLETED:
+                stats = self.stats
+                stats.completed_tasks += 1
+                stats.total_execution_time += task.execution_time
+                stats.average_execution_time = stats.total_execution_time / stats.completed_tasks
+                stats.max_execution_time = max(stats.max_execution_time, task.execution_time)
+                stats.min_execution_time = (
+                    task.execution_time
+                    if stats.completed_tasks == 1
+                    else min(stats.min_execution_time, task.execution_time)
+                )
+                if node is not None:
+                    node.completed_tasks += 1
+            else:
+                self.stats.failed_tasks += 1
+                if node is not None:
+                    node.failed_tasks += 1
+            if node is not None:
+                node.task_count = max(0, node.task_count - 1)
+
+        if task.state == TaskState.COMPLETED:
+            metric_counter("distributed_execution.task_completed")(1)
+            metric_histogram("distributed_execution.task_duration")(task.execution_time)
+        else:
+            metric_counter("distributed_execution.task_failed")(1)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the execution backend."""
+        self.backend.shutdown(wait=wait)
+
     def _select_node(self, task: DistributedTask) -> str | None:
         """Select node for task execution."""
-        available = self.cluster.get_available_nodes()
+        # O(1) unless a heartbeat deadline has passed
+        self.cluster.expire_nodes()
+        available = self.cluster.available_nodes
 
         if not available:
             return None
 
         # Affinity strategy
-        if task.affinity_node:
-            for node in available:
-                if node.node_id == task.affinity_node:
-                    return node.node_id
+        if task.affinity_node and self.cluster.is_available(task.affinity_node):
+            return task.affinity_node
 
         # Round robin
         if self.strategy == TaskSchedulingStrategy.ROUND_ROBIN:
-            return available[
-                len(self.completed_tasks) % len(available)
-            ].node_id
+            node = self.cluster.get_available_node(next(self._round_robin))
+            return node.node_id if node is not None else None
 
         # Least loaded
         elif self.strategy == TaskSchedulingStrategy.LEAST_LOADED:
@@ -347,7 +369,8 @@ class DistributedExecutor:
             ).node_id
 
         # Default
-        return available[0].node_id
+        node = self.cluster.get_available_node(0)
+        return node.node_id if node is not None else None
 
     def get_task_status(self, task_id: str) -> dict[str, Any] | None:
         """Get status of task."""
@@ -368,6 +391,11 @@ class DistributedExecutor:
             "pending_tasks": self.stats.pending_tasks,
             "total_execution_time": self.stats.total_execution_time,
             "average_execution_time": self.stats.average_execution_time,
+            "max_execution_time": self.stats.max_execution_time,
+            "min_execution_time": self.stats.min_execution_time,
+            "queued_tasks": len(self.task_queue),
+            "running_tasks": len(self._futures),
+            "backend": self.backend.name,
             "success_rate": (
                 self.stats.completed_tasks / self.stats.total_tasks
                 if self.stats.total_tasks > 0
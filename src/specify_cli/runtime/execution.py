@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+import copy
+import threading
 import uuid
 from datetime import datetime
 from typing import Any, Callable, TypeVar
 
 from specify_cli.core.shell import timed
 from specify_cli.core.telemetry import metric_counter, span
-from specify_cli.runtime.state import ExecutionState, get_state_store
+from specify_cli.runtime.state import ExecutionState, StateStore, get_state_store
 
 T = TypeVar("T")
 
@@ -26,7 +28,7 @@ class ExecutionTracker:
     def __enter__(self) -> ExecutionTracker:
         self.state.status = "running"
         self.state.start_time = datetime.now().isoformat()
-        metric_counter("execution.started", 1, {"phase": self.phase})
+        metric_counter("execution.started")(1, attributes={"phase": self.phase})
         return self
 
     def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
@@ -35,10 +37,10 @@ class ExecutionTracker:
         if exc_type is not None:
             self.state.status = "failed"
             self.state.errors.append(str(exc_val))
-            metric_counter("execution.failed", 1, {"phase": self.phase})
+            metric_counter("execution.failed")(1, attributes={"phase": self.phase})
         else:
             self.state.status = "completed"
-            metric_counter("execution.completed", 1, {"phase": self.phase})
+            metric_counter("execution.completed")(1, attributes={"phase": self.phase})
 
         start = datetime.fromisoformat(self.state.start_time)
         end = datetime.fromisoformat(self.state.end_time)
@@ -106,53 +108,77 @@ def get_execution_report(execution_id: str) -> dict[str, Any] | None:
     }
 
 
-def get_phase_report(phase: str) -> dict[str, Any]:
-    store = get_state_store()
-    executions = store.get_phase_executions(phase)
+# (db path, report, phase) -> (store revision, report)
+_report_cache: dict[tuple[str, str, str | None], tuple[Any, dict[str, Any]]] = {}
+_report_cache_lock = threading.Lock()
+
+
+def _cached_report(
+    store: StateStore, phase: str | None, build: Callable[[], dict[str, Any]]
+) -> dict[str, Any]:
+    """Rebuild a report only when executions were saved or cleared since the last build."""
+    key = (str(store.db_path), "overall" if phase is None else "phase", phase)
+    revision = store.revision()
+    with _report_cache_lock:
+        cached = _report_cache.get(key)
+    if cached is not None and cached[0] == revision:
+        metric_counter("execution.report_cache_hit")(1)
+        return copy.deepcopy(cached[1])
 
-    total_count = len(executions)
-    successful = sum(1 for e in executions if e.status == "completed")
-    failed = sum(1 for e in executions if e.status == "failed")
-    avg_duration = sum(e.duration for e in executions) / total_count if total_count > 0 else 0
+    report = build()
+    with _report_cache_lock:
+        _report_cache[key] = (revision, report)
+    return copy.deepcopy(report)
+
+
+def _phase_report(store: StateStore, phase: str, summary: dict[str, Any] | None) -> dict[str, Any]:
+    total_count = summary["total"] if summary else 0
+    successful = summary["successful"] if summary else 0
 
     return {
         "phase": phase,
         "total_executions": total_count,
         "successful": successful,
-        "failed": failed,
+        "failed": summary["failed"] if summary else 0,
         "success_rate": successful / total_count if total_count > 0 else 0,
-        "average_duration": avg_duration,
-        "recent_executions": [
-            {
-                "id": e.execution_id,
-                "status": e.status,
-                "duration": e.duration,
-                "errors": len(e.errors),
-            }
-            for e in executions[:10]
-        ],
+        "average_duration": summary["total_duration"] / total_count if total_count > 0 else 0,
+        "max_duration": summary["max_duration"] if summary else 0,
+        "duration_percentiles": summary["percentiles"] if summary else {},
+        "recent_executions": store.get_recent_summaries(phase, limit=10),
     }
 
 
-def get_overall_report() -> dict[str, Any]:
+def get_phase_report(phase: str) -> dict[str, Any]:
+    """Counts, success rate and duration percentiles for one phase, aggregated in SQL."""
     store = get_state_store()
-    history = store.get_execution_history(limit=1000)
 
-    phases = set(e.phase for e in history)
-    total_executions = len(history)
-    successful = sum(1 for e in history if e.status == "completed")
-    failed = sum(1 for e in history if e.status == "failed")
-    avg_duration = sum(e.duration for e in history) / total_executions if total_executions > 0 else 0
+    def build() -> dict[str, Any]:
+        summary = store.summarize_phases(phase).get(phase)
+        return _phase_report(store, phase, summary)
 
-    return {
-        "total_executions": total_executions,
-        "successful": successful,
-        "failed": failed,
-        "success_rate": successful / total_executions if total_executions > 0 else 0,
-        "average_duration": avg_duration,
-        "phases_executed": list(phases),
-        "phase_reports": {
-            phase: get_phase_report(phase)
-            for phase in phases
-        },
-    }
+    return _cached_report(store, phase, build)
+
+
+def get_overall_report() -> dict[str, Any]:
+    """Totals over all executions plus a report per phase, aggregated in SQL."""
+    store = get_state_store()
+
+    def build() -> dict[str, Any]:
+        summaries = store.summarize_phases()
+        total_executions = sum(s["total"] for s in summaries.values())
+        successful = sum(s["successful"] for s in summaries.values())
+        total_duration = sum(s["total_duration"] for s in summaries.values())
+
+        return {
+            "total_executions": total_executions,
+            "successful": successful,
+            "failed": sum(s["failed"] for s in summaries.values()),
+            "success_rate": successful / total_executions if total_executions > 0 else 0,
+            "average_duration": total_duration / total_executions if total_executions > 0 else 0,
+            "phases_executed": list(summaries),
+            "phase_reports": {
+                phase: _phase_report(store, phase, summary) for phase, summary in summaries.items()
+            },
+        }
+
+    return _cached_report(store, None, build)
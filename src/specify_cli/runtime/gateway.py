@@ -1,19 +1,47 @@
+"""API gateway: load balancing, circuit breaking and rate limiting.
+
+``LoadBalancer`` selects endpoints in O(1) or O(log n) per request:
+
+- ``LEAST_LOADED``: a heap keyed on current load, with stale entries
+  skipped lazily and compacted when the heap grows
+- ``WEIGHTED``: a Vose alias table, rebuilt only when the endpoint set,
+  weights or health change
+- ``POWER_OF_TWO``: the less loaded of two random endpoints
+- ``ROUND_ROBIN`` and ``RANDOM``
+
+Endpoints that are full are rejected and re-sampled; after a few misses
+selection falls back to a scan of the available endpoints. Selection and
+load accounting happen under one lock, so the balancer is safe to share
+between threads. Change health and weights through ``update_endpoint`` so
+that the selection structures see the change.
+"""
+
 from __future__ import annotations
 
-import uuid
-from dataclasses import dataclass, field
+import heapq
+import itertools
+import random
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Callable
 
-from specify_cli.core.shell import timed
 from specify_cli.core.telemetry import metric_counter, metric_histogram, span
 
+# Random picks tried before falling back to a scan of available endpoints
+MAX_SAMPLES = 8
+# Least-loaded heap is rebuilt when it holds this many entries per endpoint
+HEAP_COMPACT_FACTOR = 4
+
 
 class LoadBalancingStrategy(Enum):
     ROUND_ROBIN = "round_robin"
     LEAST_LOADED = "least_loaded"
     RANDOM = "random"
     WEIGHTED = "weighted"
+    POWER_OF_TWO = "power_of_two"
 
 
 @dataclass
@@ -44,92 +72,278 @@ class Request:
     error: str | None = None
 
 
+class AtomicCounter:
+    """Monotonic counter that can be incremented from many threads.
+
+    ``next()`` on an ``itertools.count`` is a single C call, so increments
+    need no lock. Reads advance a second count to cancel out their own
+    increment of the first.
+    """
+
+    def __init__(self):
+        self._increments = itertools.count()
+        self._reads = itertools.count()
+        self._read_lock = threading.Lock()
+
+    def increment(self) -> None:
+        next(self._increments)
+
+    @property
+    def value(self) -> int:
+        with self._read_lock:
+            return next(self._increments) - next(self._reads)
+
+
+class AliasTable:
+    """Vose alias table: O(1) sampling from a fixed discrete distribution."""
+
+    def __init__(self, weights: list[float]):
+        count = len(weights)
+        total = sum(weights)
+        if total <= 0:
+            weights, total = [1.0] * count, float(count)
+        scaled = [w * count / total for w in weights]
+        self.prob = [1.0] * count
+        self.alias = list(range(count))
+
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            self.prob[less] = scaled[less]
+            self.alias[less] = more
+            scaled[more] -= 1.0 - scaled[less]
+            (small if scaled[more] < 1.0 else large).append(more)
+        # Leftovers are 1.0 up to rounding error
+
+    def sample(self, rng: random.Random) -> int:
+        u = rng.random() * len(self.prob)
+        i = int(u)
+        return i if u - i < self.prob[i] else self.alias[i]
+
+
 class LoadBalancer:
-    def __init__(self, strategy: LoadBalancingStrategy = LoadBalancingStrategy.LEAST_LOADED):
+    def __init__(
+        self,
+        strategy: LoadBalancingStrategy = LoadBalancingStrategy.LEAST_LOADED,
+        seed: int | None = None,
+    ):
         self.endpoints: list[Endpoint] = []
         self.strategy = strategy
+        # In-flight requests; completed and failed ones are only counted
         self.requests: dict[str, Request] = {}
         self.round_robin_index = 0
+        self.requests_routed = AtomicCounter()
+        self.requests_completed = AtomicCounter()
+        self.requests_failed = AtomicCounter()
+
+        self._lock = threading.Lock()
+        self._rng = random.Random(seed)
+        self._request_ids = itertools.count()
+        # Least-loaded heap of (load, tiebreak, version, endpoint)
+        self._heap: list[tuple[int, int, int, Endpoint]] = []
+        self._versions: dict[str, int] = {}
+        self._tiebreak = itertools.count()
+        # Alias table over healthy endpoints, rebuilt lazily
+        self._weighted_endpoints: list[Endpoint] = []
+        self._alias: AliasTable | None = None
+
+        self._routed_metric = metric_counter("lb.requests_routed")
+        self._load_metric = metric_histogram("lb.endpoint_load", unit="1")
 
     def register_endpoint(self, endpoint: Endpoint) -> None:
-        self.endpoints.append(endpoint)
+        with self._lock:
+            self.endpoints.append(endpoint)
+            self._versions.setdefault(endpoint.endpoint_id, 0)
+            self._changed(endpoint)
+            self._alias = None
 
     def deregister_endpoint(self, endpoint_id: str) -> None:
-        self.endpoints = [e for e in self.endpoints if e.endpoint_id != endpoint_id]
+        with self._lock:
+            self.endpoints = [e for e in self.endpoints if e.endpoint_id != endpoint_id]
+            # Invalidates the endpoint's heap entries
+            self._versions.pop(endpoint_id, None)
+            self._alias = None
+
+    def update_endpoint(
+        self, endpoint_id: str, *, healthy: bool | None = None, weight: float | None = None
+    ) -> None:
+        """Change an endpoint's health or weight."""
+        with self._lock:
+            for endpoint in self.endpoints:
+                if endpoint.endpoint_id == endpoint_id:
+                    if healthy is not None:
+                        endpoint.healthy = healthy
+                    if weight is not None:
+                        endpoint.weight = weight
+                    self._changed(endpoint)
+                    self._alias = None
+
+    def _changed(self, endpoint: Endpoint) -> None:
+        """Invalidate the endpoint's heap entry and push its current load."""
+        versions = self._versions
+        endpoint_id = endpoint.endpoint_id
+        if endpoint_id not in versions:
+            return
+        version = versions[endpoint_id] = versions[endpoint_id] + 1
+        if self.strategy is LoadBalancingStrategy.LEAST_LOADED and endpoint.is_available():
+            heap = self._heap
+            heapq.heappush(heap, (endpoint.current_load, next(self._tiebreak), version, endpoint))
+            if len(heap) > HEAP_COMPACT_FACTOR * len(self.endpoints) + 64:
+                self._rebuild_heap()
+
+    def _rebuild_heap(self) -> None:
+        self._heap = [
+            (e.current_load, next(self._tiebreak), self._versions[e.endpoint_id], e)
+            for e in self.endpoints
+            if e.is_available()
+        ]
+        heapq.heapify(self._heap)
 
     def _select_endpoint(self) -> Endpoint | None:
-        available = [e for e in self.endpoints if e.is_available()]
-
-        if not available:
+        if not self.endpoints:
             return None
 
         if self.strategy == LoadBalancingStrategy.ROUND_ROBIN:
-            selected = available[self.round_robin_index % len(available)]
-            self.round_robin_index += 1
-            return selected
+            return self._round_robin()
 
         elif self.strategy == LoadBalancingStrategy.LEAST_LOADED:
-            return min(available, key=lambda e: e.current_load)
+            return self._least_loaded()
 
         elif self.strategy == LoadBalancingStrategy.WEIGHTED:
-            total_weight = sum(e.weight for e in available)
-            weights = [e.weight / total_weight for e in available]
-            import random
+            return self._weighted()
 
-            return random.choices(available, weights=weights)[0]
+        elif self.strategy == LoadBalancingStrategy.POWER_OF_TWO:
+            return self._power_of_two()
 
         else:
-            import random
+            return self._random()
 
-            return random.choice(available)
+    def _round_robin(self) -> Endpoint | None:
+        endpoints = self.endpoints
+        for _ in range(len(endpoints)):
+            selected = endpoints[self.round_robin_index % len(endpoints)]
+            self.round_robin_index += 1
+            if selected.is_available():
+                return selected
+        return None
+
+    def _least_loaded(self) -> Endpoint | None:
+        if not self._heap:
+            # Also picks up a strategy switch or health set directly on endpoints
+            self._rebuild_heap()
+        heap = self._heap
+        while heap:
+            _, _, version, endpoint = heap[0]
+            if self._versions.get(endpoint.endpoint_id) == version and endpoint.is_available():
+                return endpoint
+            heapq.heappop(heap)
+        return None
+
+    def _random_index(self) -> int:
+        return int(self._rng.random() * len(self.endpoints))
+
+    def _random(self) -> Endpoint | None:
+        for _ in range(MAX_SAMPLES):
+            endpoint = self.endpoints[self._random_index()]
+            if endpoint.is_available():
+                return endpoint
+        return self._scan(weighted=False)
+
+    def _weighted(self) -> Endpoint | None:
+        if self._alias is None:
+            self._weighted_endpoints = [e for e in self.endpoints if e.healthy]
+            if not self._weighted_endpoints:
+                return None
+            self._alias = AliasTable([max(e.weight, 0.0) for e in self._weighted_endpoints])
+        for _ in range(MAX_SAMPLES):
+            endpoint = self._weighted_endpoints[self._alias.sample(self._rng)]
+            if endpoint.is_available():
+                return endpoint
+        return self._scan(weighted=True)
+
+    def _power_of_two(self) -> Endpoint | None:
+        endpoints = self.endpoints
+        for _ in range(MAX_SAMPLES):
+            first = endpoints[self._random_index()]
+            second = endpoints[self._random_index()]
+            if not first.is_available():
+                first, second = second, first
+            if not first.is_available():
+                continue
+            if second.is_available() and second.current_load < first.current_load:
+                return second
+            return first
+        return self._scan(weighted=False)
+
+    def _scan(self, weighted: bool) -> Endpoint | None:
+        """Fallback when sampling keeps hitting full endpoints."""
+        available = [e for e in self.endpoints if e.is_available()]
+        if not available:
+            return None
+        if weighted and sum(e.weight for e in available) > 0:
+            return self._rng.choices(available, weights=[e.weight for e in available])[0]
+        return self._rng.choice(available)
 
-    @timed
     def route_request(self, payload: dict[str, Any]) -> str:
-        with span("lb.route_request"):
+        with self._lock:
             endpoint = self._select_endpoint()
 
             if not endpoint:
                 raise RuntimeError("No available endpoints")
 
             request = Request(
-                request_id=str(uuid.uuid4())[:8],
+                request_id=str(next(self._request_ids)),
                 endpoint=endpoint,
                 payload=payload,
-                timestamp=__import__("time").time(),
+                timestamp=time.time(),
             )
 
             endpoint.current_load += 1
+            self._changed(endpoint)
             self.requests[request.request_id] = request
+            load = endpoint.current_load
+
+        self.requests_routed.increment()
+        self._routed_metric(1)
+        self._load_metric(load)
 
-            metric_counter("lb.requests_routed", 1)
-            metric_histogram("lb.endpoint_load", endpoint.current_load)
+        return request.request_id
 
-            return request.request_id
+    def _finish(self, request_id: str) -> Request | None:
+        with self._lock:
+            request = self.requests.pop(request_id, None)
+            if request is not None:
+                request.endpoint.current_load -= 1
+                self._changed(request.endpoint)
+            return request
 
     def complete_request(self, request_id: str, response: Any | None = None) -> None:
-        if request_id in self.requests:
-            request = self.requests[request_id]
+        request = self._finish(request_id)
+        if request is not None:
             request.status = "completed"
             request.response = response
-            request.endpoint.current_load -= 1
+            self.requests_completed.increment()
 
     def fail_request(self, request_id: str, error: str) -> None:
-        if request_id in self.requests:
-            request = self.requests[request_id]
+        request = self._finish(request_id)
+        if request is not None:
             request.status = "failed"
             request.error = error
-            request.endpoint.current_load -= 1
+            self.requests_failed.increment()
 
     def get_status(self) -> dict[str, Any]:
-        return {
-            "total_endpoints": len(self.endpoints),
-            "healthy_endpoints": sum(1 for e in self.endpoints if e.healthy),
-            "total_load": sum(e.current_load for e in self.endpoints),
-            "total_capacity": sum(e.capacity for e in self.endpoints),
-            "pending_requests": sum(
-                1 for r in self.requests.values() if r.status == "pending"
-            ),
-        }
+        with self._lock:
+            return {
+                "total_endpoints": len(self.endpoints),
+                "healthy_endpoints": sum(1 for e in self.endpoints if e.healthy),
+                "total_load": sum(e.current_load for e in self.endpoints),
+                "total_capacity": sum(e.capacity for e in self.endpoints),
+                "pending_requests": len(self.requests),
+                "requests_routed": self.requests_routed.value,
+                "requests_completed": self.requests_completed.value,
+                "requests_failed": self.requests_failed.value,
+            }
 
 
 class CircuitBreaker:
@@ -168,7 +382,6 @@ class CircuitBreaker:
         if self.failure_count >= self.failure_threshold:
             self.state = "open"
 
-    @timed
     def execute(self, func: Callable, *args: Any, **kwargs: Any) -> Any:
         with span("circuit_breaker.execute", state=self.state):
             if self.is_open():
@@ -184,28 +397,33 @@ class CircuitBreaker:
 
 
 class RateLimitingGateway:
+    """Sliding one-second window limiter; amortized O(1) per check."""
+
     def __init__(self, max_requests_per_second: int = 1000):
         self.max_requests_per_second = max_requests_per_second
-        self.request_times: list[float] = []
+        self.request_times: deque[float] = deque()
+        self._lock = threading.Lock()
 
-    @timed
-    def check_rate_limit(self) -> bool:
-        import time
+    def _expire(self, now: float) -> None:
+        times = self.request_times
+        while times and now - times[0] >= 1.0:
+            times.popleft()
 
-        now = time.time()
-        self.request_times = [t for t in self.request_times if now - t < 1.0]
+    def check_rate_limit(self) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            self._expire(now)
 
-        if len(self.request_times) < self.max_requests_per_second:
-            self.request_times.append(now)
-            return True
+            if len(self.request_times) < self.max_requests_per_second:
+                self.request_times.append(now)
+                return True
 
-        return False
+            return False
 
     def get_current_rate(self) -> int:
-        import time
-
-        now = time.time()
-        return len([t for t in self.request_times if now - t < 1.0])
+        with self._lock:
+            self._expire(time.monotonic())
+            return len(self.request_times)
 
 
 @dataclass
@@ -223,11 +441,10 @@ class APIGateway:
         self.circuit_breaker = CircuitBreaker(config.circuit_breaker_threshold)
         self.rate_limiter = RateLimitingGateway(config.rate_limit_per_second)
 
-    @timed
     def handle_request(self, payload: dict[str, Any]) -> dict[str, Any]:
         with span("gateway.handle_request"):
             if not self.rate_limiter.check_rate_limit():
-                metric_counter("gateway.rate_limited", 1)
+                metric_counter("gateway.rate_limited")(1)
                 return {"error": "Rate limit exceeded"}
 
             try:
@@ -239,11 +456,11 @@ class APIGateway:
                 result = self.circuit_breaker.execute(process)
                 self.load_balancer.complete_request(request_id, result)
 
-                metric_counter("gateway.requests_handled", 1)
+                metric_counter("gateway.requests_handled")(1)
                 return result
 
             except Exception as e:
-                metric_counter("gateway.errors", 1)
+                metric_counter("gateway.errors")(1)
                 raise
 
     def get_status(self) -> dict[str, Any]:
@@ -37,29 +37,50 @@ See Also
 
 from __future__ import annotations
 
+import hashlib
 import json
+import os
+import threading
 import time
-from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 
 from specify_cli.core.instrumentation import add_span_event
 from specify_cli.core.process import run, run_logged
 from specify_cli.core.shell import timed
 from specify_cli.core.telemetry import metric_counter, metric_histogram, span
+from specify_cli.ops.ggen_shacl import (
+    SHACLValidationResult,
+    get_validation_cache,
+    validate_cached,
+    validation_key,
+)
+from specify_cli.ops.ggen_timeout import SPARQLTimeoutError
 from specify_cli.ops.transform import (
     StageResult,
+    StreamingCanonicalizer,
     TransformConfig,
     TransformResult,
-    canonicalize_output,
     compose_transform,
 )
+from specify_cli.runtime.graph_cache import ParsedGraph, get_graph_cache
 from specify_cli.runtime.receipt import (
     generate_receipt,
     sha256_string,
 )
+from specify_cli.runtime.sparql_pool import DEFAULT_CHUNK_SIZE, SPARQLWorkerError
+from specify_cli.runtime.tera import get_renderer
 from specify_cli.runtime.tools import check_tool
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from rdflib import Graph
+
+    from specify_cli.ops.ggen_incremental import IncrementalTracker
+    from specify_cli.runtime.sparql_pool import SPARQLWorkerPool
+
 __all__ = [
     "GgenError",
     "get_ggen_version",
@@ -69,6 +90,9 @@ __all__ = [
     "sync_specs",
 ]
 
+# Serializes SPARQL parsing (rdflib's pyparsing grammar is not thread-safe)
+_SPARQL_PARSE_LOCK = threading.Lock()
+
 
 class GgenError(Exception):
     """ggen operation error."""
@@ -117,6 +141,7 @@ def sync_specs(
     *,
     watch: bool = False,
     verbose: bool = False,
+    native_watch: bool = False,
 ) -> bool:
     """Synchronize specification files using ggen sync.
 
@@ -135,6 +160,12 @@ def sync_specs(
         Watch for file changes. Default is False.
     verbose : bool, optional
         Enable verbose output. Default is False.
+    native_watch : bool, optional
+        With ``watch``, watch in-process instead of running
+        ``ggen sync --watch``: only rules affected by an edit are re-run,
+        with warm graph and template caches (see
+        :func:`specify_cli.runtime.ggen_watch.watch_project`). Does not
+        require the ggen binary. Default is False.
 
     Returns
     -------
@@ -146,6 +177,13 @@ def sync_specs(
     GgenError
         If ggen is not available or sync fails.
     """
+    if watch and native_watch:
+        from specify_cli.runtime.ggen_watch import watch_project  # noqa: PLC0415
+
+        with span("ggen.sync", project=str(project_path), watch=watch, native=True):
+            watch_project(project_path)
+        return True
+
     if not is_ggen_available():
         raise GgenError(
             "ggen is not installed. Install with: "
@@ -181,15 +219,38 @@ def sync_specs(
 
 
 @timed
-def run_transform(config: TransformConfig) -> TransformResult:
+def run_transform(
+    config: TransformConfig,
+    tracker: IncrementalTracker | None = None,
+    sparql_pool: SPARQLWorkerPool | None = None,
+) -> TransformResult:
     """Execute complete μ transformation pipeline.
 
     Implements: output = μ₅(μ₄(μ₃(μ₂(μ₁(input)))))
 
+    The input files are parsed once by μ₁ into a :class:`ParsedGraph` taken
+    from the process-wide graph cache; SHACL validation and μ₂ reuse that
+    graph, and rules sharing the same ontology files share one parse.
+
+    With an incremental ``tracker``, a rule whose fingerprint (ontology,
+    shapes, SPARQL, template, template includes, generator version) is
+    unchanged skips every stage, and a rule whose ontology, shapes and query
+    are unchanged reuses the cached SPARQL result set, re-running only μ₃
+    through μ₅. The caller saves the tracker.
+
+    With a ``sparql_pool``, μ₂ runs the query in one of the pool's worker
+    processes (with the pool's timeout and memory limit) instead of on the
+    μ₁ graph; a query that times out or fails in the worker fails the
+    stage.
+
     Parameters
     ----------
     config : TransformConfig
         Transformation configuration from ggen.toml
+    tracker : IncrementalTracker | None, optional
+        Incremental state for fingerprint skipping and SPARQL result caching.
+    sparql_pool : SPARQLWorkerPool | None, optional
+        Killable worker processes for μ₂ EXTRACT.
 
     Returns
     -------
@@ -197,16 +258,32 @@ def run_transform(config: TransformConfig) -> TransformResult:
         Complete result with all stage outputs and receipt
     """
     with span("ggen.transform", {"name": config.name}):
+        fingerprint = tracker.fingerprint(config) if tracker is not None else None
+        if tracker is not None and fingerprint is not None:
+            if tracker.is_fresh(config, fingerprint):
+                return _skipped_transform(config, tracker)
+
+            cached_results = tracker.load_sparql_results(fingerprint.extract_key)
+            if cached_results is not None:
+                metric_counter("ggen.incremental.sparql_cache.hit")(1)
+                stage_results = _cached_extract_stages(config, cached_results)
+                if stage_results is not None:
+                    result = _run_emit_through_receipt(config, stage_results)
+                    if result.success:
+                        tracker.record_fingerprint(
+                            config, fingerprint, result.input_hash, result.output_hash
+                        )
+                    return result
+
         stage_results = {}
 
         # μ₁ NORMALIZE: Load and validate RDF
-        stage_results["normalize"] = _run_normalize(config)
+        stage_results["normalize"], parsed_graph = _run_normalize(config)
         if not stage_results["normalize"].success:
             return compose_transform(config, stage_results)
 
-        # μ₂ EXTRACT: Execute SPARQL
-        normalize_output = stage_results["normalize"].output
-        if normalize_output is None:
+        # μ₂ EXTRACT: Execute SPARQL against the graph parsed by μ₁
+        if parsed_graph is None:
             stage_results["extract"] = StageResult(
                 stage="extract",
                 success=False,
@@ -217,39 +294,108 @@ def run_transform(config: TransformConfig) -> TransformResult:
             )
             return compose_transform(config, stage_results)
 
-        stage_results["extract"] = _run_extract(config, normalize_output)
+        stage_results["extract"] = _run_extract(config, parsed_graph, sparql_pool)
         if not stage_results["extract"].success:
             return compose_transform(config, stage_results)
 
-        # μ₃ EMIT: Render template
-        stage_results["emit"] = _run_emit(
+        extract_output = stage_results["extract"].output
+        if tracker is not None and fingerprint is not None and extract_output is not None:
+            tracker.store_sparql_results(fingerprint.extract_key, extract_output)
+
+        result = _run_emit_through_receipt(config, stage_results)
+        if tracker is not None and fingerprint is not None and result.success:
+            tracker.record_fingerprint(config, fingerprint, result.input_hash, result.output_hash)
+        return result
+
+
+def _skipped_transform(config: TransformConfig, tracker: IncrementalTracker) -> TransformResult:
+    """Result for a rule whose fingerprint and output are unchanged."""
+    recorded = tracker.state.fingerprints.get(config.name, {})
+    metric_counter("ggen.incremental.skipped")(1)
+    add_span_event("ggen.transform.skipped", {"name": config.name})
+    return TransformResult(
+        success=True,
+        input_file=config.input_files[0] if config.input_files else "",
+        output_file=config.output_file,
+        input_hash=recorded.get("input_hash", ""),
+        output_hash=recorded.get("output_hash", ""),
+        stage_results={},
+        errors=[],
+        warnings=["Unchanged since last sync; all stages skipped"],
+    )
+
+
+def _cached_extract_stages(
+    config: TransformConfig,
+    cached_results: str,
+) -> dict[str, StageResult] | None:
+    """Rebuild μ₁/μ₂ results from a cached SPARQL result set.
+
+    The inputs are read but not parsed; the normalize output must match a
+    full run so receipts stay identical. SHACL validation passed when the
+    result set was cached and the shapes are part of its key.
+
+    Returns None if an input file has disappeared.
+    """
+    try:
+        content = "".join(Path(f).read_text() + "\n" for f in config.input_files)
+    except OSError:
+        return None
+
+    content_hash = sha256_string(content)
+    return {
+        "normalize": StageResult(
+            stage="normalize",
+            success=True,
+            input_hash=content_hash,
+            output_hash=content_hash,
+            output=content,
+            errors=[],
+        ),
+        "extract": StageResult(
+            stage="extract",
+            success=True,
+            input_hash=content_hash,
+            output_hash=sha256_string(cached_results),
+            output=cached_results,
+            errors=[],
+        ),
+    }
+
+
+def _run_emit_through_receipt(
+    config: TransformConfig,
+    stage_results: dict[str, StageResult],
+) -> TransformResult:
+    """Run μ₃ through μ₅ for one rule from existing normalize/extract results.
+
+    Split out of :func:`run_transform` so the rule scheduler can share one
+    normalize/extract result across rules and render each rule separately
+    (module-level, so it can also run in a worker process).
+
+    Parameters
+    ----------
+    config : TransformConfig
+        Transformation configuration for the rule.
+    stage_results : dict[str, StageResult]
+        Successful "normalize" and "extract" results.
+
+    Returns
+    -------
+    TransformResult
+        Complete result with all stage outputs and receipt.
+    """
+    with span("ggen.transform.emit", rule=config.name):
+        stage_results = dict(stage_results)
+
+        # μ₃ EMIT + μ₄ CANONICALIZE: Render, format and write in one pass
+        stage_results["emit"], canonicalize = _run_emit(
             config,
             stage_results["extract"].output,
         )
-        if not stage_results["emit"].success:
+        if canonicalize is None:
             return compose_transform(config, stage_results)
-
-        # μ₄ CANONICALIZE: Format output
-        emit_output = stage_results["emit"].output
-        if not isinstance(emit_output, str):
-            stage_results["canonicalize"] = StageResult(
-                stage="canonicalize",
-                success=False,
-                input_hash="",
-                output_hash="",
-                output=None,
-                errors=["Emit stage produced no output"],
-            )
-            return compose_transform(config, stage_results)
-
-        stage_results["canonicalize"] = canonicalize_output(emit_output)
-
-        # Write output file
-        output_path = Path(config.output_file)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        canonical_output = stage_results["canonicalize"].output
-        if canonical_output is not None:
-            output_path.write_text(canonical_output)
+        stage_results["canonicalize"] = canonicalize
 
         # μ₅ RECEIPT: Generate proof
         stage_results["receipt"] = _run_receipt(config, stage_results)
@@ -257,22 +403,24 @@ def run_transform(config: TransformConfig) -> TransformResult:
         return compose_transform(config, stage_results)
 
 
-def _run_normalize(config: TransformConfig) -> StageResult:
-    """μ₁ NORMALIZE: Load RDF and validate SHACL."""
+def _run_normalize(config: TransformConfig) -> tuple[StageResult, ParsedGraph | None]:
+    """μ₁ NORMALIZE: Load RDF (parsed once, cached) and validate SHACL."""
     stage_start = time.time()
     with span("ggen.normalize"):
-        errors = []
-
-        # Load input files
-        rdf_content = ""
-        for input_file in config.input_files:
-            path = Path(input_file)
-            if not path.exists():
-                errors.append(f"Input file not found: {input_file}")
-                continue
-            rdf_content += path.read_text() + "\n"
-
-        if errors:
+        errors = [
+            f"Input file not found: {input_file}"
+            for input_file in config.input_files
+            if not Path(input_file).exists()
+        ]
+
+        parsed_graph: ParsedGraph | None = None
+        if not errors:
+            try:
+                parsed_graph = get_graph_cache().load(config.input_files)
+            except Exception as e:
+                errors.append(f"RDF parse error: {e}")
+
+        if parsed_graph is None:
             return StageResult(
                 stage="normalize",
                 success=False,
@@ -280,15 +428,22 @@ def _run_normalize(config: TransformConfig) -> StageResult:
                 output_hash="",
                 output=None,
                 errors=errors,
-            )
+            ), None
+
+        rdf_content = parsed_graph.content
 
         # Validate SHACL shapes if specified
         if config.schema_files:
-            validation = _validate_shacl(rdf_content, config.schema_files)
+            validation = _validate_shacl(
+                parsed_graph.graph,
+                config.schema_files,
+                data_hashes=list(parsed_graph.cache_key),
+                scope=json.dumps(sorted(config.input_files)),
+            )
             if not validation["valid"]:
                 errors.extend(validation["violations"])
 
-        input_hash = sha256_string(rdf_content)
+        input_hash = parsed_graph.content_hash
         output_hash = input_hash  # Normalize is identity for valid RDF
 
         # Record stage duration histogram
@@ -303,19 +458,29 @@ def _run_normalize(config: TransformConfig) -> StageResult:
             output_hash=output_hash,
             output=rdf_content,
             errors=errors,
-        )
+            duration_ms=stage_duration * 1000,
+        ), parsed_graph
 
 
-def _run_extract(config: TransformConfig, rdf_content: str) -> StageResult:
-    """μ₂ EXTRACT: Execute SPARQL query."""
+def _run_extract(
+    config: TransformConfig,
+    parsed_graph: ParsedGraph,
+    sparql_pool: SPARQLWorkerPool | None = None,
+) -> StageResult:
+    """μ₂ EXTRACT: Execute SPARQL and stream the rows into the stage output.
+
+    Rows run against the graph parsed by μ₁, or in a ``sparql_pool`` worker,
+    and are serialized and hashed chunk by chunk.
+    """
     stage_start = time.time()
-    with span("ggen.extract"):
+    with span("ggen.extract", pooled=sparql_pool is not None):
+        input_hash = parsed_graph.content_hash
         query_path = Path(config.sparql_query)
         if not query_path.exists():
             return StageResult(
                 stage="extract",
                 success=False,
-                input_hash=sha256_string(rdf_content),
+                input_hash=input_hash,
                 output_hash="",
                 output=None,
                 errors=[f"SPARQL query not found: {config.sparql_query}"],
@@ -323,60 +488,171 @@ def _run_extract(config: TransformConfig, rdf_content: str) -> StageResult:
 
         query = query_path.read_text()
 
-        # Execute SPARQL via ggen or local engine
-        result = _execute_sparql(rdf_content, query)
+        try:
+            if sparql_pool is None:
+                # The shared parsed graph (no re-parse)
+                chunks = _sparql_chunks(parsed_graph.graph, query)
+            else:
+                # A killable worker with its own warm graph cache
+                chunks = sparql_pool.stream(config.input_files, query)
+            result_json, output_hash, count = _encode_extract(chunks)
+        except (SPARQLTimeoutError, SPARQLWorkerError) as e:
+            metric_counter("ggen.sparql.failed")(1)
+            return StageResult(
+                stage="extract",
+                success=False,
+                input_hash=input_hash,
+                output_hash="",
+                output=None,
+                errors=[str(e)],
+            )
 
-        output_hash = sha256_string(json.dumps(result))
+        metric_counter("ggen.sparql.queries")(1)
+        metric_histogram("ggen.sparql.result_count")(float(count))
 
         # Record stage duration histogram
         stage_duration = time.time() - stage_start
         metric_histogram("ggen.stage.extract.duration")(stage_duration)
-        add_span_event("ggen.extract.completed", {"duration_ms": stage_duration * 1000})
+        add_span_event(
+            "ggen.extract.completed", {"duration_ms": stage_duration * 1000, "rows": count}
+        )
 
-        # Convert result dict to JSON string for output
-        result_json = json.dumps(result)
         return StageResult(
             stage="extract",
             success=True,
-            input_hash=sha256_string(rdf_content),
+            input_hash=input_hash,
             output_hash=output_hash,
             output=result_json,
             errors=[],
+            duration_ms=stage_duration * 1000,
         )
 
 
-def _run_emit(config: TransformConfig, extracted_data: Any) -> StageResult:
-    """μ₃ EMIT: Render Tera template."""
+def _sparql_chunks(
+    graph: Graph, query: str, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[list[dict[str, Any]]]:
+    """Rows of an in-process query in chunks of ``chunk_size``."""
+    rows = _iter_sparql_rows(graph, query)
+    while chunk := list(islice(rows, chunk_size)):
+        yield chunk
+
+
+def _encode_extract(chunks: Iterable[list[dict[str, Any]]]) -> tuple[str, str, int]:
+    """Serialize row chunks as ``{"results": [...], "count": n}``.
+
+    The text matches ``json.dumps`` of the whole result dict, but each chunk
+    is encoded and hashed as it arrives, so the rows are never held as
+    Python objects all at once.
+
+    Returns
+    -------
+    tuple[str, str, int]
+        JSON text, its SHA-256 hex digest, and the row count.
+    """
+    hasher = hashlib.sha256()
+    parts: list[str] = []
+    count = 0
+
+    def add(text: str) -> None:
+        parts.append(text)
+        hasher.update(text.encode())
+
+    add('{"results": [')
+    for chunk in chunks:
+        if not chunk:
+            continue
+        # "[a, b]" -> "a, b": the list separators json.dumps would use
+        add((", " if count else "") + json.dumps(chunk)[1:-1])
+        count += len(chunk)
+    add(f'], "count": {count}}}')
+    return "".join(parts), hasher.hexdigest(), count
+
+
+def _run_emit(
+    config: TransformConfig,
+    extracted_data: Any,
+) -> tuple[StageResult, StageResult | None]:
+    """μ₃ EMIT and μ₄ CANONICALIZE: Stream the rendered template to the output.
+
+    Rendered chunks pass through a :class:`StreamingCanonicalizer` into a
+    staging file next to the output, which atomically replaces the output
+    once complete. Both stage hashes are computed on the way, so neither
+    stage keeps its text in memory (their outputs are None).
+
+    Returns
+    -------
+    tuple[StageResult, StageResult | None]
+        Emit and canonicalize results; canonicalize is None if emit failed.
+    """
     stage_start = time.time()
     with span("ggen.emit"):
+        input_hash = sha256_string(json.dumps(extracted_data))
         template_path = Path(config.template)
         if not template_path.exists():
             return StageResult(
                 stage="emit",
                 success=False,
-                input_hash=sha256_string(json.dumps(extracted_data)),
+                input_hash=input_hash,
                 output_hash="",
                 output=None,
                 errors=[f"Template not found: {config.template}"],
-            )
+            ), None
 
-        template = template_path.read_text()
+        output_path = Path(config.output_file)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        staging_path = output_path.parent / (
+            f".{output_path.name}.tmp.{os.getpid()}.{threading.get_ident()}"
+        )
 
-        # Render Tera template via ggen or local engine
-        rendered = _render_tera(template, extracted_data)
+        # Render through the shared renderer (compiled once per path + mtime;
+        # includes resolve relative to the template)
+        canon = StreamingCanonicalizer()
+        canonicalize_s = 0.0  # Time spent canonicalizing and writing
+        try:
+            with staging_path.open("wb") as f:
+                for chunk in get_renderer().stream_file(template_path, extracted_data):
+                    chunk_start = time.perf_counter()
+                    text = canon.feed(chunk)
+                    if text:
+                        f.write(text.encode())
+                    canonicalize_s += time.perf_counter() - chunk_start
+                chunk_start = time.perf_counter()
+                f.write(canon.finish().encode())
+            staging_path.replace(output_path)
+            canonicalize_s += time.perf_counter() - chunk_start
+        except BaseException:
+            staging_path.unlink(missing_ok=True)
+            raise
 
         # Record stage duration histogram
         stage_duration = time.time() - stage_start
         metric_histogram("ggen.stage.emit.duration")(stage_duration)
-        add_span_event("ggen.emit.completed", {"duration_ms": stage_duration * 1000})
+        add_span_event(
+            "ggen.emit.completed",
+            {
+                "duration_ms": stage_duration * 1000,
+                "original_length": canon.original_length,
+                "canonical_length": canon.canonical_length,
+                "line_count": canon.line_count,
+            },
+        )
 
         return StageResult(
             stage="emit",
             success=True,
-            input_hash=sha256_string(json.dumps(extracted_data)),
-            output_hash=sha256_string(rendered),
-            output=rendered,
+            input_hash=input_hash,
+            output_hash=canon.input_hash,
+            output=None,
             errors=[],
+            duration_ms=(stage_duration - canonicalize_s) * 1000,
+        ), StageResult(
+            stage="canonicalize",
+            success=True,
+            input_hash=canon.input_hash,
+            output_hash=canon.output_hash,
+            output=None,
+            errors=[],
+            duration_ms=canonicalize_s * 1000,
         )
 
 
@@ -385,6 +661,7 @@ def _run_receipt(
     stage_results: dict[str, StageResult],
 ) -> StageResult:
     """μ₅ RECEIPT: Generate cryptographic proof."""
+    stage_start = time.time()
     with span("ggen.receipt"):
         input_path = Path(config.input_files[0])
         output_path = Path(config.output_file)
@@ -394,8 +671,21 @@ def _run_receipt(
             for stage, result in stage_results.items()
             if result.output is not None and isinstance(result.output, str)
         }
-
-        receipt = generate_receipt(input_path, output_path, stage_outputs)
+        # Streamed stages were hashed while the output was written
+        stage_hashes = {
+            stage: result.output_hash
+            for stage, result in stage_results.items()
+            if result.output is None and result.output_hash
+        }
+        canonicalize = stage_results.get("canonicalize")
+
+        receipt = generate_receipt(
+            input_path,
+            output_path,
+            stage_outputs,
+            stage_hashes=stage_hashes,
+            output_hash=canonicalize.output_hash if canonicalize is not None else None,
+        )
 
         # Write receipt file
         receipt_path = output_path.with_suffix(output_path.suffix + ".receipt.json")
@@ -408,23 +698,40 @@ def _run_receipt(
             output_hash=receipt.output_hash,
             output=receipt.to_json(),
             errors=[],
+            duration_ms=(time.time() - stage_start) * 1000,
         )
 
 
-def _validate_shacl(rdf_content: str, schema_files: list[str]) -> dict[str, Any]:
+def _validate_shacl(
+    rdf_content: str | Graph,
+    schema_files: list[str],
+    data_hashes: list[str] | None = None,
+    scope: str | None = None,
+) -> dict[str, Any]:
     """Validate RDF against SHACL shapes.
 
+    Shapes files are loaded through the process-wide graph cache, so rules
+    sharing shapes parse them once. Results are cached by (data hashes,
+    shapes hashes) in the process-wide SHACL validation cache, so unchanged
+    combinations are not re-validated.
+
     Parameters
     ----------
-    rdf_content : str
-        RDF data in Turtle format to validate.
+    rdf_content : str | Graph
+        RDF data in Turtle format, or an already parsed graph, to validate.
     schema_files : list[str]
         List of SHACL shape file paths.
+    data_hashes : list[str] | None, optional
+        SHA256 of each data file. Required to cache results for a parsed
+        graph; text content is hashed directly.
+    scope : str | None, optional
+        Snapshot scope for incremental validation (e.g. the input paths).
 
     Returns
     -------
     dict[str, Any]
-        Validation result with 'valid' bool and 'violations' list.
+        Validation result with 'valid' bool and 'violations' list, plus
+        'cached' when the result came from the cache.
     """
     try:
         # Import rdflib here to avoid import errors if not installed
@@ -435,63 +742,82 @@ def _validate_shacl(rdf_content: str, schema_files: list[str]) -> dict[str, Any]
 
     with span("ggen.shacl_validate"):
         try:
-            # Load data graph
-            data_graph = Graph()
-            data_graph.parse(data=rdf_content, format="turtle")
-
-            # Load SHACL shapes
-            shapes_graph = Graph()
             for schema_file in schema_files:
-                path = Path(schema_file)
-                if not path.exists():
+                if not Path(schema_file).exists():
                     return {"valid": False, "violations": [f"Schema not found: {schema_file}"]}
-                shapes_graph.parse(str(path), format="turtle")
-
-            # Try to use pyshacl if available
-            try:
-                import pyshacl  # noqa: PLC0415
 
-                conforms, _results_graph, results_text = pyshacl.validate(
-                    data_graph,
-                    shacl_graph=shapes_graph,
-                    inference="rdfs",
-                    abort_on_first=False,
-                )
-
-                violations = []
-                if not conforms:
-                    # Parse validation report for violations
-                    violations = [results_text]
+            # Load SHACL shapes (parsed once per process)
+            shapes = get_graph_cache().load(schema_files) if schema_files else None
+            shapes_hashes = list(shapes.cache_key) if shapes else []
+            shapes_graph = shapes.graph if shapes else Graph()
+
+            if isinstance(rdf_content, str):
+                data_hashes = data_hashes or [sha256_string(rdf_content)]
+
+            cache = get_validation_cache()
+            key = validation_key(data_hashes, shapes_hashes) if data_hashes else None
+            result = cache.get(key) if key else None
+            if result is not None:
+                add_span_event("ggen.shacl_cached", {"conforms": result.valid})
+                return _shacl_result_dict(result)
+
+            # Load data graph (reuse the caller's parsed graph when given)
+            if isinstance(rdf_content, str):
+                data_graph = Graph()
+                data_graph.parse(data=rdf_content, format="turtle")
+            else:
+                data_graph = rdf_content
+
+            result = validate_cached(
+                cache,
+                data_graph,
+                shapes_graph,
+                scope or key or "",
+                ",".join(shapes_hashes),
+                incremental=cache.incremental and scope is not None,
+            )
+            if key:
+                cache.put(key, result)
 
+            if result.details.get("validator") == "basic":
+                add_span_event("ggen.shacl_skipped", {"reason": "pyshacl not installed"})
+            else:
                 add_span_event(
                     "ggen.shacl_validated",
-                    {"conforms": conforms, "violations_count": len(violations)},
-                )
-                return {"valid": conforms, "violations": violations}  # noqa: TRY300
-
-            except ImportError:
-                # pyshacl not available - basic validation only
-                # Just check that shapes can be parsed
-                add_span_event(
-                    "ggen.shacl_skipped",
-                    {"reason": "pyshacl not installed"},
+                    {
+                        "conforms": result.valid,
+                        "violations_count": len(result.violations),
+                        "focus_nodes": result.details.get("focus_nodes", -1),
+                    },
                 )
-                return {"valid": True, "violations": [], "warning": "pyshacl not available"}
+            return _shacl_result_dict(result)
 
         except Exception as e:
             add_span_event("ggen.shacl_failed", {"error": str(e)})
             return {"valid": False, "violations": [f"SHACL validation error: {e}"]}
 
 
-def _execute_sparql(rdf_content: str, query: str) -> dict[str, Any]:
+def _shacl_result_dict(result: SHACLValidationResult) -> dict[str, Any]:
+    """Convert a SHACL validation result into the runtime's dict form."""
+    output: dict[str, Any] = {
+        "valid": result.valid,
+        "violations": result.violations,
+        "cached": bool(result.details.get("cached")),
+    }
+    if result.details.get("validator") == "basic":
+        output["warning"] = "pyshacl not available"
+    return output
+
+
+def _execute_sparql(rdf_content: str | Graph, query: str) -> dict[str, Any]:
     """Execute SPARQL query against RDF content.
 
     Uses rdflib's SPARQL engine to execute queries against RDF data.
 
     Parameters
     ----------
-    rdf_content : str
-        RDF data in Turtle format.
+    rdf_content : str | Graph
+        RDF data in Turtle format, or an already parsed graph (not re-parsed).
     query : str
         SPARQL SELECT query.
 
@@ -523,40 +849,18 @@ def _execute_sparql(rdf_content: str, query: str) -> dict[str, Any]:
 
     with span("ggen.sparql_execute", {"query_length": len(query)}):
         try:
-            # Create and load graph
-            graph = Graph()
-            graph.parse(data=rdf_content, format="turtle")
+            # Reuse a parsed graph, or parse Turtle text
+            if isinstance(rdf_content, str):
+                graph = Graph()
+                graph.parse(data=rdf_content, format="turtle")
+            else:
+                graph = rdf_content
 
             add_span_event("ggen.sparql_graph_loaded", {"triples_count": len(graph)})
 
-            # Execute SPARQL query
-            query_results = graph.query(query)
-
             # Convert results to list of dicts
-            results = []
             vars_list: list[str] = []
-            if query_results.vars:
-                vars_list = [str(v) for v in query_results.vars]
-
-            for row in query_results:
-                result_dict: dict[str, Any] = {}
-                for var_name in query_results.vars or []:
-                    var_str = str(var_name)
-                    # Access by position since row is a tuple-like object
-                    if isinstance(query_results.vars, list):
-                        idx = query_results.vars.index(var_name)
-                        row_tuple = cast("tuple[Any, ...]", row)
-                        value = row_tuple[idx]
-                    else:
-                        # Fallback if vars is not a list
-                        continue
-
-                    # Convert RDF terms to Python types
-                    if value is not None:
-                        result_dict[var_str] = _rdf_term_to_python(value)
-                    else:
-                        result_dict[var_str] = None
-                results.append(result_dict)
+            results = list(_iter_sparql_rows(graph, query, vars_list))
 
             add_span_event(
                 "ggen.sparql_executed",
@@ -573,6 +877,55 @@ def _execute_sparql(rdf_content: str, query: str) -> dict[str, Any]:
             raise
 
 
+def _iter_sparql_rows(
+    graph: Graph,
+    query: str,
+    vars_out: list[str] | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Execute a SPARQL query and yield result rows one at a time.
+
+    Rows are converted to Python values as they are produced, so callers
+    can stream them (e.g. in chunks from a worker process) instead of
+    materializing the whole result set.
+
+    Parameters
+    ----------
+    graph : Graph
+        Parsed rdflib graph.
+    query : str
+        SPARQL SELECT query.
+    vars_out : list[str] | None, optional
+        Filled with the projected variable names before the first row.
+
+    Yields
+    ------
+    dict[str, Any]
+        Variable name to Python value (None when unbound).
+    """
+    from rdflib.plugins.sparql import prepareQuery  # noqa: PLC0415
+
+    # Parse under the lock, evaluate concurrently. Prefixes bound in the data
+    # stay usable in the query, as with graph.query(str).
+    with _SPARQL_PARSE_LOCK:
+        prepared = prepareQuery(query, initNs=dict(graph.namespaces()))
+
+    query_results = graph.query(prepared)
+    variables = [str(v) for v in query_results.vars or []]
+    if vars_out is not None:
+        vars_out[:] = variables
+
+    for row in query_results:
+        if not variables:
+            # ASK/CONSTRUCT results have no projected variables
+            yield {}
+            continue
+        row_tuple = cast("tuple[Any, ...]", row)
+        yield {
+            var: _rdf_term_to_python(value) if value is not None else None
+            for var, value in zip(variables, row_tuple, strict=False)
+        }
+
+
 def _rdf_term_to_python(term: Any) -> Any:
     """Convert RDF term to Python type.
 
@@ -600,7 +953,7 @@ def _rdf_term_to_python(term: Any) -> Any:
     return str(term)
 
 
-def _render_tera(template: str, data: Any) -> str:  # noqa: PLR0915
+def _render_tera(template: str, data: Any) -> str:
     """Render Tera template with data using Jinja2 (Tera-compatible).
 
     Tera templates use syntax very similar to Jinja2:
@@ -609,7 +962,9 @@ def _render_tera(template: str, data: Any) -> str:  # noqa: PLR0915
     - {% if condition %}...{% endif %} for conditionals
     - Filters: | filter_name(args...)
 
-    This implements μ₃ EMIT stage of the constitutional equation.
+    This implements μ₃ EMIT stage of the constitutional equation. Rendering
+    goes through the process-wide :class:`~specify_cli.runtime.tera.TeraRenderer`,
+    so filters are registered once and each distinct source compiles once.
 
     Parameters
     ----------
@@ -628,161 +983,7 @@ def _render_tera(template: str, data: Any) -> str:  # noqa: PLR0915
     ValueError
         If template rendering fails
     """
-    with span("ggen.render_tera"):
-        try:
-            # Import jinja2 here to provide better error handling for missing dependency
-            import jinja2  # noqa: PLC0415
-
-            environment_class = jinja2.Environment
-            strict_undefined = jinja2.StrictUndefined
-            select_autoescape_func = jinja2.select_autoescape
-
-            # Create Jinja2 environment with Tera-compatible settings
-            env = environment_class(
-                autoescape=select_autoescape_func(default=False),
-                undefined=strict_undefined,
-                trim_blocks=True,
-                lstrip_blocks=True,
-            )
-
-            # Add Tera-compatible filters
-            def tera_replace(value: str, from_str: str = "", to: str = "") -> str:
-                """Tera replace filter: | replace(from="x", to="y")"""
-                return str(value).replace(from_str, to)
-
-            def tera_default(value: Any, value_: Any = "") -> Any:
-                """Tera default filter: | default(value="x")"""
-                return value if value is not None and value != "" else value_
-
-            def tera_first(value: list[Any]) -> Any:
-                """Tera first filter: | first"""
-                if isinstance(value, (list, tuple)) and len(value) > 0:
-                    return value[0]
-                return None
-
-            def tera_unique(value: list, attribute: str | None = None) -> list[Any]:
-                """Tera unique filter: | unique(attribute="x")"""
-                if not isinstance(value, (list, tuple)):
-                    return []
-                if attribute:
-                    seen = set()
-                    result = []
-                    for item in value:
-                        key = (
-                            item.get(attribute)
-                            if isinstance(item, dict)
-                            else getattr(item, attribute, None)
-                        )
-                        if key not in seen:
-                            seen.add(key)
-                            result.append(item)
-                    return result
-                return list(dict.fromkeys(value))
-
-            def tera_filter(value: list, attribute: str | None = None, value_: Any = None) -> list[Any]:
-                """Tera filter filter: | filter(attribute="x", value="y") or | filter(attribute="x")"""
-                if not isinstance(value, (list, tuple)):
-                    return []
-                result = []
-                for item in value:
-                    if isinstance(item, dict):
-                        if attribute:
-                            item_val = item.get(attribute)
-                            if value_ is not None:
-                                if item_val == value_:
-                                    result.append(item)
-                            elif item_val:  # Just check attribute exists and is truthy
-                                result.append(item)
-                        else:
-                            result.append(item)
-                    else:
-                        result.append(item)
-                return result
-
-            def tera_sort(value: list, attribute: str | None = None) -> list[Any]:
-                """Tera sort filter: | sort(attribute="x")"""
-                if not isinstance(value, (list, tuple)):
-                    return []
-                if attribute:
-                    return sorted(
-                        value,
-                        key=lambda x: x.get(attribute, "")
-                        if isinstance(x, dict)
-                        else getattr(x, attribute, ""),
-                    )
-                return sorted(value)
-
-            def tera_repeat(value: str, count: int = 1) -> str:
-                """Tera repeat filter: | repeat(count=N)"""
-                return str(value) * count
-
-            def tera_indent(
-                value: str, first: bool = False, blank: bool = False, prefix: str = "    "
-            ) -> str:
-                """Tera indent filter: | indent(first=true, blank=false)"""
-                lines = str(value).split("\n")
-                result = []
-                for i, line in enumerate(lines):
-                    if (i == 0 and not first) or (not line.strip() and not blank):
-                        result.append(line)
-                    else:
-                        result.append(prefix + line)
-                return "\n".join(result)
-
-            def tera_date(value: datetime, format_str: str = "%Y-%m-%d") -> str:
-                """Tera date filter: | date(format="%Y-%m-%d")"""
-                if isinstance(value, datetime):
-                    return value.strftime(format_str)
-                return str(value)
-
-            # Register filters with Tera-compatible names
-            env.filters["replace"] = tera_replace
-            env.filters["default"] = tera_default
-            env.filters["first"] = tera_first
-            env.filters["unique"] = tera_unique
-            env.filters["filter"] = tera_filter
-            env.filters["sort"] = tera_sort
-            env.filters["repeat"] = tera_repeat
-            env.filters["indent"] = tera_indent
-            env.filters["date"] = tera_date
-
-            # Add Tera-compatible functions
-            env.globals["now"] = datetime.now
-
-            # Prepare data context
-            context: dict[str, Any] = {}
-            if isinstance(data, dict):
-                context = data.copy()
-                # Tera templates often use 'results' or 'sparql_results'
-                if "results" not in context and "sparql_results" not in context:
-                    context["results"] = data
-            elif isinstance(data, (list, tuple)):
-                context["results"] = data
-                context["sparql_results"] = data
-            else:
-                context["data"] = data
-
-            # Compile and render template
-            jinja_template = env.from_string(template)
-            rendered = jinja_template.render(**context)
-
-            metric_counter("ggen.tera_render.success")(1)
-            add_span_event(
-                "tera.rendered",
-                {
-                    "template_length": len(template),
-                    "output_length": len(rendered),
-                },
-            )
-        except ImportError as e:
-            metric_counter("ggen.tera_render.import_error")(1)
-            raise ValueError(f"Jinja2 not installed for Tera rendering: {e}") from e
-        except Exception as e:
-            metric_counter("ggen.tera_render.error")(1)
-            add_span_event("tera.render_error", {"error": str(e)})
-            raise ValueError(f"Tera template rendering failed: {e}") from e
-        else:
-            return rendered
+    return get_renderer().render_string(template, data)
 
 
 def write_file_atomic(
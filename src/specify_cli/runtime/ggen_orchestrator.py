@@ -0,0 +1,369 @@
+"""
+specify_cli.runtime.ggen_orchestrator - Multi-Project ggen sync
+===============================================================
+
+Runs ``ggen sync`` for every ``ggen.toml`` below a directory in one process,
+instead of invoking ``specify ggen sync`` once per project directory.
+
+Phases
+------
+1. **Discover**: :func:`specify_cli.ops.ggen_manifest.discover_manifests`
+2. **Preflight**: Every manifest is loaded, validated and pre-flight checked
+   concurrently (paths resolve against the manifest's directory) under a
+   shared project lock
+3. **Lock**: Each project's ``.ggen.lock`` is taken with
+   :class:`specify_cli.ops.ggen_filelock.FileLock`, in sorted path order so
+   two orchestrators over overlapping trees cannot deadlock. A project whose
+   lock times out is skipped, not waited on forever
+4. **Schedule**: The rules of all locked projects run as one DAG through
+   :func:`specify_cli.runtime.ggen_scheduler.run_rules`, on one bounded
+   worker pool
+
+Because rule paths are resolved to absolute paths, projects that import the
+same TTL files share normalize (μ₁) nodes, and the process-wide
+:mod:`specify_cli.runtime.graph_cache` shares parsed graphs between projects
+whose ontologies have identical content.
+
+Examples
+--------
+    >>> from specify_cli.runtime.ggen_orchestrator import sync_projects
+    >>> result = sync_projects("~/work/specs", max_workers=8)
+    >>> result.success
+    True
+    >>> [p.name for p in result.projects]
+    ['billing', 'identity', 'search']
+
+See Also
+--------
+- :mod:`specify_cli.runtime.ggen_scheduler` : Rule-graph execution
+- :mod:`specify_cli.ops.ggen_preflight` : Pre-flight checks
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from specify_cli.core.instrumentation import add_span_event
+from specify_cli.core.telemetry import metric_counter, metric_histogram, span
+from specify_cli.ops.ggen_filelock import FileLock, LockTimeoutError
+from specify_cli.ops.ggen_manifest import (
+    discover_manifests,
+    load_manifest,
+    manifest_transform_configs,
+)
+from specify_cli.ops.ggen_preflight import PreFlightCheckResult, run_preflight_checks
+from specify_cli.runtime.ggen_scheduler import ScheduleResult, run_rules
+
+if TYPE_CHECKING:
+    from specify_cli.ops.ggen_incremental import IncrementalTracker
+    from specify_cli.ops.transform import TransformConfig, TransformResult
+
+__all__ = [
+    "OrchestrationResult",
+    "ProjectRun",
+    "run_projects",
+    "sync_projects",
+]
+
+LOCK_FILE = ".ggen.lock"
+
+# Separates the project name from the rule name in scheduler rule names
+RULE_SEPARATOR = "::"
+
+
+@dataclass
+class ProjectRun:
+    """State and outcome of one project.
+
+    Attributes
+    ----------
+    name : str
+        Project label (directory relative to the search root).
+    manifest_path : Path
+        Resolved path to the project's ggen.toml.
+    preflight : PreFlightCheckResult | None
+        Pre-flight result (None if skipped or the manifest failed to load).
+    results : dict[str, TransformResult]
+        Transform result per rule name, in manifest order.
+    error : str | None
+        Why the project did not run (load, preflight or lock failure).
+    configs : list[TransformConfig]
+        Resolved rule configs (rule names carry the project prefix).
+    """
+
+    name: str
+    manifest_path: Path
+    preflight: PreFlightCheckResult | None = None
+    results: dict[str, TransformResult] = field(default_factory=dict)
+    error: str | None = None
+    configs: list[TransformConfig] = field(default_factory=list, repr=False)
+
+    @property
+    def project_dir(self) -> Path:
+        """Directory containing the manifest."""
+        return self.manifest_path.parent
+
+    @property
+    def success(self) -> bool:
+        """Whether the project ran and every rule succeeded."""
+        return self.error is None and all(r.success for r in self.results.values())
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        return {
+            "name": self.name,
+            "manifest": str(self.manifest_path),
+            "success": self.success,
+            "error": self.error,
+            "preflight_errors": self.preflight.errors if self.preflight else [],
+            "rules": {name: r.success for name, r in self.results.items()},
+        }
+
+
+@dataclass
+class OrchestrationResult:
+    """Result of a multi-project sync.
+
+    Attributes
+    ----------
+    projects : list[ProjectRun]
+        One entry per discovered manifest, sorted by path.
+    schedule : ScheduleResult | None
+        Combined scheduler result (None if no project reached scheduling).
+    wall_ms : float
+        Total wall time.
+    """
+
+    projects: list[ProjectRun] = field(default_factory=list)
+    schedule: ScheduleResult | None = None
+    wall_ms: float = 0.0
+
+    @property
+    def success(self) -> bool:
+        """Whether every project succeeded."""
+        return all(p.success for p in self.projects)
+
+    @property
+    def failed_projects(self) -> list[str]:
+        """Names of projects that failed or did not run."""
+        return [p.name for p in self.projects if not p.success]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        return {
+            "success": self.success,
+            "wall_ms": self.wall_ms,
+            "failed_projects": self.failed_projects,
+            "projects": [p.to_dict() for p in self.projects],
+            "schedule": self.schedule.to_dict() if self.schedule else None,
+        }
+
+
+def sync_projects(
+    root: str | Path,
+    max_workers: int | None = None,
+    executor: str = "thread",
+    preflight: bool = True,
+    lock_timeout: float = 30,
+    *,
+    tracker: IncrementalTracker | None = None,
+) -> OrchestrationResult:
+    """Discover every ggen.toml below ``root`` and sync all projects.
+
+    Parameters
+    ----------
+    root : str | Path
+        Directory to search for manifests.
+    max_workers : int | None, optional
+        Size of the shared worker pool. Default is ``os.cpu_count()``.
+    executor : str, optional
+        Pool for emit nodes: "thread" (default) or "process".
+    preflight : bool, optional
+        Run pre-flight checks (default True).
+    lock_timeout : float, optional
+        Seconds to wait for each project's lock (0 = no timeout).
+    tracker : IncrementalTracker | None, optional
+        Incremental state shared by all projects; unchanged rules are skipped.
+
+    Returns
+    -------
+    OrchestrationResult
+        Per-project results and the combined schedule.
+    """
+    root_path = Path(root).expanduser().resolve()
+    manifests = discover_manifests(root_path)
+    return run_projects(
+        manifests,
+        root=root_path,
+        max_workers=max_workers,
+        executor=executor,
+        preflight=preflight,
+        lock_timeout=lock_timeout,
+        tracker=tracker,
+    )
+
+
+def run_projects(
+    manifests: list[Path],
+    *,
+    root: Path | None = None,
+    max_workers: int | None = None,
+    executor: str = "thread",
+    preflight: bool = True,
+    lock_timeout: float = 30,
+    tracker: IncrementalTracker | None = None,
+) -> OrchestrationResult:
+    """Sync the given projects as one scheduled run.
+
+    Parameters
+    ----------
+    manifests : list[Path]
+        Paths to ggen.toml files.
+    root : Path | None, optional
+        Directory project names are relative to. Default uses the manifest
+        directories as given.
+    max_workers : int | None, optional
+        Size of the shared worker pool. Default is ``os.cpu_count()``.
+    executor : str, optional
+        Pool for emit nodes: "thread" (default) or "process".
+    preflight : bool, optional
+        Run pre-flight checks (default True).
+    lock_timeout : float, optional
+        Seconds to wait for each project's lock (0 = no timeout).
+    tracker : IncrementalTracker | None, optional
+        Incremental state shared by all projects; unchanged rules are skipped.
+
+    Returns
+    -------
+    OrchestrationResult
+        Per-project results and the combined schedule.
+    """
+    workers = max(1, max_workers or os.cpu_count() or 1)
+    projects = [
+        ProjectRun(name=_project_name(Path(m), root), manifest_path=Path(m).resolve())
+        for m in sorted(manifests)
+    ]
+
+    with span("ggen.orchestrate", projects=len(projects), workers=workers):
+        start = time.time()
+        result = OrchestrationResult(projects=projects)
+
+        # Phase 2: load + preflight every project concurrently
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ggen-preflight") as pool:
+            list(pool.map(lambda p: _prepare(p, preflight, lock_timeout), projects))
+
+        with ExitStack() as locks:
+            # Phase 3: lock in a global order
+            ready = []
+            for project in sorted(projects, key=lambda p: p.project_dir):
+                if project.error is not None:
+                    continue
+                try:
+                    locks.enter_context(FileLock(project.project_dir / LOCK_FILE, lock_timeout))
+                except LockTimeoutError as e:
+                    project.error = str(e)
+                    metric_counter("ggen.orchestrate.lock_timeouts")(1)
+                    continue
+                ready.append(project)
+
+            # Phase 4: all rules on one pool
+            if ready:
+                result.schedule = _schedule(ready, workers, executor, tracker)
+
+        result.wall_ms = (time.time() - start) * 1000
+
+        metric_histogram("ggen.orchestrate.duration")(result.wall_ms / 1000)
+        metric_counter("ggen.orchestrate.projects")(len(projects))
+        add_span_event(
+            "ggen.orchestrate.completed",
+            {
+                "success": result.success,
+                "projects": len(projects),
+                "failed_projects": len(result.failed_projects),
+                "wall_ms": result.wall_ms,
+            },
+        )
+        return result
+
+
+# -----------------------------------------------------------------------------
+# Phases
+# -----------------------------------------------------------------------------
+
+
+def _prepare(project: ProjectRun, preflight: bool, lock_timeout: float) -> None:
+    """Load, check and resolve one project's rules (errors go on the project)."""
+    try:
+        manifest = load_manifest(project.manifest_path)
+    except (FileNotFoundError, ValueError) as e:
+        project.error = str(e)
+        return
+
+    if preflight:
+        # Read-only: runs alongside other readers, waits only for a writer
+        try:
+            with FileLock(project.project_dir / LOCK_FILE, lock_timeout, mode="shared"):
+                project.preflight = run_preflight_checks(manifest, base_dir=project.project_dir)
+        except LockTimeoutError as e:
+            project.error = str(e)
+            return
+        if not project.preflight.passed:
+            project.error = "Pre-flight checks failed: " + "; ".join(project.preflight.errors)
+            return
+
+    try:
+        configs = manifest_transform_configs(manifest, base_dir=project.project_dir)
+    except ValueError as e:
+        project.error = str(e)
+        return
+
+    for config in configs:
+        config.name = f"{project.name}{RULE_SEPARATOR}{config.name}"
+        # Normalized paths make shared TTL files share normalize nodes
+        config.input_files = [os.path.normpath(f) for f in config.input_files]
+        config.schema_files = [os.path.normpath(f) for f in config.schema_files]
+        config.sparql_query = os.path.normpath(config.sparql_query)
+    project.configs = configs
+
+
+def _schedule(
+    projects: list[ProjectRun],
+    workers: int,
+    executor: str,
+    tracker: IncrementalTracker | None = None,
+) -> ScheduleResult | None:
+    """Run the rules of ``projects`` as one DAG and hand results back."""
+    configs = [config for project in projects for config in project.configs]
+    try:
+        schedule = run_rules(configs, max_workers=workers, executor=executor, tracker=tracker)
+    except ValueError as e:
+        # Duplicate outputs across projects: nothing ran
+        for project in projects:
+            project.error = str(e)
+        return None
+
+    prefix_len = len(RULE_SEPARATOR)
+    for project in projects:
+        for config in project.configs:
+            rule = config.name[len(project.name) + prefix_len :]
+            if config.name in schedule.results:
+                project.results[rule] = schedule.results[config.name]
+    return schedule
+
+
+def _project_name(manifest: Path, root: Path | None) -> str:
+    """Label a project by its directory relative to ``root``."""
+    project_dir = manifest.resolve().parent
+    if root is not None:
+        try:
+            relative = project_dir.relative_to(root.resolve())
+        except ValueError:
+            return str(project_dir)
+        return relative.as_posix() if relative.parts else project_dir.name
+    return str(project_dir)
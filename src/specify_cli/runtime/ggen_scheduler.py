@@ -0,0 +1,486 @@
+"""
+specify_cli.runtime.ggen_scheduler - Rule-Graph Scheduler for ggen sync
+=======================================================================
+
+Executes every rule of a ggen.toml manifest as one DAG instead of running
+:func:`specify_cli.runtime.ggen.run_transform` once per rule.
+
+The graph built by :func:`specify_cli.ops.ggen_rule_graph.build_rule_graph`
+shares normalize (μ₁) and extract (μ₂) nodes between rules with the same
+ontology set and SPARQL query. This module runs that graph:
+
+* **Shared μ₁/μ₂**: Each ontology set is loaded once and each SPARQL query is
+  executed once; its result feeds every rule that uses it
+* **Parallel emit**: μ₃ EMIT through μ₅ RECEIPT for independent rules runs on
+  a thread or process pool as soon as the rule's extract node finishes
+* **Per-node timings**: Every node reports wall time, worker and status
+* **Incremental runs**: With an
+  :class:`~specify_cli.ops.ggen_incremental.IncrementalTracker`, rules whose
+  fingerprint is unchanged are skipped and rules with a cached SPARQL result
+  set go straight to emit
+
+Normalize and extract always run on threads, because parsed graphs live in
+the in-process :mod:`specify_cli.runtime.graph_cache`. With a
+:class:`~specify_cli.runtime.sparql_pool.SPARQLWorkerPool`, extract threads
+hand the query to the pool's killable worker processes instead. Emit nodes
+only need the extract result, so they can also run in worker processes.
+
+Examples
+--------
+    >>> from specify_cli.runtime.ggen_scheduler import run_manifest
+    >>> result = run_manifest("ggen.toml", max_workers=8)
+    >>> result.success
+    True
+    >>> result.summary["extract_saved"]
+    9
+    >>> result.slowest(3)
+
+See Also
+--------
+- :mod:`specify_cli.ops.ggen_rule_graph` : DAG construction
+- :mod:`specify_cli.runtime.ggen` : μ pipeline stages
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from specify_cli.core.instrumentation import add_span_event
+from specify_cli.core.telemetry import metric_counter, metric_histogram, span
+from specify_cli.ops.ggen_manifest import load_manifest, manifest_transform_configs
+from specify_cli.ops.ggen_rule_graph import RuleGraph, RuleNode, build_rule_graph
+from specify_cli.ops.transform import StageResult, TransformResult, compose_transform
+from specify_cli.runtime.ggen import (
+    _cached_extract_stages,
+    _run_emit_through_receipt,
+    _run_extract,
+    _run_normalize,
+    _skipped_transform,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from specify_cli.ops.ggen_incremental import IncrementalTracker, RuleFingerprint
+    from specify_cli.ops.transform import TransformConfig
+    from specify_cli.runtime.sparql_pool import SPARQLWorkerPool
+
+__all__ = [
+    "NodeTiming",
+    "ScheduleResult",
+    "run_manifest",
+    "run_rules",
+]
+
+EXECUTOR_KINDS = ("thread", "process")
+
+
+@dataclass
+class NodeTiming:
+    """Execution record for one graph node.
+
+    Attributes
+    ----------
+    node_id : str
+        Node identifier.
+    kind : str
+        "normalize", "extract" or "emit".
+    label : str
+        Human-readable node description.
+    rules : list[str]
+        Rules served by the node.
+    duration_ms : float
+        Wall time spent executing the node.
+    success : bool
+        Whether the node succeeded.
+    worker : str
+        Thread name or process id that ran the node.
+    """
+
+    node_id: str
+    kind: str
+    label: str
+    rules: list[str]
+    duration_ms: float
+    success: bool
+    worker: str = ""
+
+
+@dataclass
+class ScheduleResult:
+    """Result of running a rule graph.
+
+    Attributes
+    ----------
+    results : dict[str, TransformResult]
+        Transform result per rule name, in manifest order.
+    timings : list[NodeTiming]
+        Per-node timings in completion order.
+    summary : dict[str, Any]
+        Node counts and deduplication savings (see ``RuleGraph.summary``).
+    wall_ms : float
+        Total wall time.
+    """
+
+    results: dict[str, TransformResult] = field(default_factory=dict)
+    timings: list[NodeTiming] = field(default_factory=list)
+    summary: dict[str, Any] = field(default_factory=dict)
+    wall_ms: float = 0.0
+
+    @property
+    def success(self) -> bool:
+        """Whether every rule succeeded."""
+        return all(r.success for r in self.results.values())
+
+    @property
+    def failed_rules(self) -> list[str]:
+        """Names of rules that failed."""
+        return [name for name, r in self.results.items() if not r.success]
+
+    def slowest(self, n: int = 5) -> list[NodeTiming]:
+        """Get the ``n`` slowest nodes."""
+        return sorted(self.timings, key=lambda t: t.duration_ms, reverse=True)[:n]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        return {
+            "success": self.success,
+            "wall_ms": self.wall_ms,
+            "summary": self.summary,
+            "failed_rules": self.failed_rules,
+            "timings": [
+                {
+                    "node_id": t.node_id,
+                    "kind": t.kind,
+                    "label": t.label,
+                    "rules": t.rules,
+                    "duration_ms": t.duration_ms,
+                    "success": t.success,
+                    "worker": t.worker,
+                }
+                for t in self.timings
+            ],
+        }
+
+
+def run_rules(
+    configs: list[TransformConfig],
+    max_workers: int | None = None,
+    executor: str = "thread",
+    sparql_pool: SPARQLWorkerPool | None = None,
+    tracker: IncrementalTracker | None = None,
+) -> ScheduleResult:
+    """Run rules as a deduplicated DAG with parallel emit.
+
+    With an incremental ``tracker``, rules are treated as in
+    :func:`specify_cli.runtime.ggen.run_transform`: unchanged rules are
+    skipped, rules whose ontology, shapes and query are unchanged reuse the
+    cached SPARQL result set, and only the remaining rules are normalized
+    and extracted. The tracker is saved once after the run.
+
+    Parameters
+    ----------
+    configs : list[TransformConfig]
+        Rule configurations.
+    max_workers : int | None, optional
+        Worker count for each pool. Default is ``os.cpu_count()``.
+    executor : str, optional
+        Pool for emit nodes: "thread" (default) or "process".
+    sparql_pool : SPARQLWorkerPool | None, optional
+        Killable worker processes for extract nodes. Default runs queries
+        in-process.
+    tracker : IncrementalTracker | None, optional
+        Incremental state for fingerprint skipping and SPARQL result caching.
+
+    Returns
+    -------
+    ScheduleResult
+        Per-rule transform results and per-node timings.
+
+    Raises
+    ------
+    ValueError
+        If ``executor`` is unknown or the rules have duplicate names/outputs.
+    """
+    if executor not in EXECUTOR_KINDS:
+        raise ValueError(f"Unknown executor: {executor} (expected one of {EXECUTOR_KINDS})")
+
+    graph = build_rule_graph(configs)
+    workers = max(1, max_workers or os.cpu_count() or 1)
+
+    with span(
+        "ggen.schedule",
+        rules=len(graph.configs),
+        nodes=len(graph.nodes),
+        executor=executor,
+    ):
+        start = time.time()
+        result = ScheduleResult(summary=graph.summary())
+        run = _GraphRun(graph, result, sparql_pool, tracker)
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ggen-rule") as stage_pool:
+            emit_pool: Executor = stage_pool
+            if executor == "process":
+                emit_pool = ProcessPoolExecutor(max_workers=workers)
+            try:
+                run.run(stage_pool, emit_pool)
+            finally:
+                if emit_pool is not stage_pool:
+                    emit_pool.shutdown(wait=True)
+        if tracker is not None:
+            tracker.save()
+
+        # Report in manifest order, not completion order
+        result.results = {
+            name: result.results[name] for name in graph.configs if name in result.results
+        }
+        result.wall_ms = (time.time() - start) * 1000
+
+        metric_histogram("ggen.schedule.duration")(result.wall_ms / 1000)
+        metric_counter("ggen.schedule.extract_saved")(result.summary["extract_saved"])
+        add_span_event(
+            "ggen.schedule.completed",
+            {
+                "success": result.success,
+                "wall_ms": result.wall_ms,
+                "failed_rules": len(result.failed_rules),
+            },
+        )
+        return result
+
+
+def run_manifest(
+    manifest_path: str | Path = "ggen.toml",
+    max_workers: int | None = None,
+    executor: str = "thread",
+    sparql_pool: SPARQLWorkerPool | None = None,
+    tracker: IncrementalTracker | None = None,
+) -> ScheduleResult:
+    """Load a manifest and run all of its rules through the scheduler.
+
+    Relative paths in the manifest are resolved against its directory.
+
+    Parameters
+    ----------
+    manifest_path : str | Path, optional
+        Path to ggen.toml. Default is "ggen.toml".
+    max_workers : int | None, optional
+        Worker count for each pool.
+    executor : str, optional
+        Pool for emit nodes: "thread" or "process".
+    sparql_pool : SPARQLWorkerPool | None, optional
+        Killable worker processes for extract nodes.
+    tracker : IncrementalTracker | None, optional
+        Incremental state (see :func:`run_rules`).
+
+    Returns
+    -------
+    ScheduleResult
+        Per-rule transform results and per-node timings.
+    """
+    path = Path(manifest_path)
+    manifest = load_manifest(path)
+    configs = manifest_transform_configs(manifest, base_dir=path.parent)
+    return run_rules(
+        configs,
+        max_workers=max_workers,
+        executor=executor,
+        sparql_pool=sparql_pool,
+        tracker=tracker,
+    )
+
+
+# -----------------------------------------------------------------------------
+# Execution
+# -----------------------------------------------------------------------------
+
+
+class _GraphRun:
+    """Single execution of a rule graph (state for one ``run_rules`` call)."""
+
+    def __init__(
+        self,
+        graph: RuleGraph,
+        result: ScheduleResult,
+        sparql_pool: SPARQLWorkerPool | None = None,
+        tracker: IncrementalTracker | None = None,
+    ) -> None:
+        self.graph = graph
+        self.result = result
+        self.sparql_pool = sparql_pool
+        self.tracker = tracker
+        # rule name -> fingerprint (incremental runs only)
+        self.fingerprints: dict[str, RuleFingerprint] = {}
+        # node id -> stage results produced so far on the path to that node
+        self.outputs: dict[str, dict[str, StageResult]] = {}
+        # normalize node id -> ParsedGraph
+        self.parsed: dict[str, Any] = {}
+        self.pending: dict[Future[Any], RuleNode] = {}
+
+    def run(self, stage_pool: Executor, emit_pool: Executor) -> None:
+        """Submit root nodes (or cached emits) and drain the graph."""
+        self.stage_pool = stage_pool
+        self.emit_pool = emit_pool
+        for node in self._plan():
+            self._submit(node)
+
+        while self.pending:
+            done, _ = wait(list(self.pending), return_when=FIRST_COMPLETED)
+            for future in done:
+                node = self.pending.pop(future)
+                self._complete(node, future)
+
+    def _plan(self) -> list[RuleNode]:
+        """Nodes to start with: graph roots, minus work the tracker makes unnecessary.
+
+        Skipped rules get their result right away; rules with a cached result
+        set start at their emit node, with the cached stages as its input.
+        """
+        if self.tracker is None:
+            return self.graph.roots()
+
+        emits = {node.rules[0]: node for node in self.graph.of_kind("emit")}
+        stale = []
+        seeded = []
+        skipped = 0
+        for name, config in self.graph.configs.items():
+            fingerprint = self.fingerprints[name] = self.tracker.fingerprint(config)
+            if self.tracker.is_fresh(config, fingerprint):
+                self.result.results[name] = _skipped_transform(config, self.tracker)
+                skipped += 1
+                continue
+            cached = self.tracker.load_sparql_results(fingerprint.extract_key)
+            stages = _cached_extract_stages(config, cached) if cached is not None else None
+            if stages is None:
+                stale.append(config)
+                continue
+            metric_counter("ggen.incremental.sparql_cache.hit")(1)
+            emit = emits[name]
+            self.outputs[emit.depends_on[0]] = stages
+            seeded.append(emit)
+
+        # Normalize and extract only what the stale rules need
+        self.graph = build_rule_graph(stale)
+        self.result.summary["skipped"] = skipped
+        self.result.summary["sparql_cached"] = len(seeded)
+        return [*seeded, *self.graph.roots()]
+
+    def _submit(self, node: RuleNode) -> None:
+        parent = self.outputs.get(node.depends_on[0], {}) if node.depends_on else {}
+        future: Future[Any]
+        if node.kind == "normalize":
+            future = self.stage_pool.submit(_timed_call, _run_normalize, node.config)
+        elif node.kind == "extract":
+            parsed = self.parsed[node.depends_on[0]]
+            future = self.stage_pool.submit(
+                _timed_call, _run_extract, node.config, parsed, self.sparql_pool
+            )
+        else:
+            future = self.emit_pool.submit(
+                _timed_call, _run_emit_through_receipt, node.config, parent
+            )
+        self.pending[future] = node
+
+    def _complete(self, node: RuleNode, future: Future[Any]) -> None:
+        parent = self.outputs.get(node.depends_on[0], {}) if node.depends_on else {}
+        try:
+            value, duration_ms, worker = future.result()
+            error = None
+        except Exception as e:
+            value, duration_ms, worker = None, 0.0, ""
+            error = f"{node.kind} node failed: {e}"
+
+        if node.kind == "emit":
+            transform = value if error is None else self._failed(node, parent, error)
+            self._record(node, duration_ms, worker, transform.success)
+            self.result.results[node.config.name] = transform
+            if self.tracker is not None and transform.success:
+                self.tracker.record_fingerprint(
+                    node.config,
+                    self.fingerprints[node.config.name],
+                    transform.input_hash,
+                    transform.output_hash,
+                )
+            return
+
+        if node.kind == "normalize" and error is None:
+            stage_result, parsed = value
+            if stage_result.success and parsed is None:
+                stage_result = _failure(node.kind, "Normalize stage produced no output")
+            self.parsed[node.node_id] = parsed
+        else:
+            stage_result = value if error is None else _failure(node.kind, error)
+
+        self._record(node, duration_ms, worker, stage_result.success)
+        if (
+            self.tracker is not None
+            and node.kind == "extract"
+            and stage_result.success
+            and stage_result.output is not None
+        ):
+            # Every rule below this node has the same extract key
+            extract_key = self.fingerprints[node.rules[0]].extract_key
+            self.tracker.store_sparql_results(extract_key, stage_result.output)
+        stages = {**parent, node.kind: stage_result}
+        self.outputs[node.node_id] = stages
+
+        if not stage_result.success:
+            # Every rule below this node fails with the partial stage results
+            for name in node.rules:
+                config = self.graph.configs[name]
+                self.result.results[name] = compose_transform(config, stages)
+            return
+
+        for child in self.graph.children(node.node_id):
+            self._submit(child)
+
+    def _failed(
+        self, node: RuleNode, parent: dict[str, StageResult], error: str
+    ) -> TransformResult:
+        return compose_transform(node.config, {**parent, "emit": _failure("emit", error)})
+
+    def _record(self, node: RuleNode, duration_ms: float, worker: str, success: bool) -> None:
+        self.result.timings.append(
+            NodeTiming(
+                node_id=node.node_id,
+                kind=node.kind,
+                label=node.label,
+                rules=list(node.rules),
+                duration_ms=duration_ms,
+                success=success,
+                worker=worker,
+            )
+        )
+        metric_histogram(f"ggen.schedule.{node.kind}.duration")(duration_ms / 1000)
+
+
+def _timed_call(func: Callable[..., Any], *args: Any) -> tuple[Any, float, str]:
+    """Run ``func`` and return ``(result, duration_ms, worker)`` (picklable)."""
+    start = time.time()
+    value = func(*args)
+    worker = f"{os.getpid()}:{threading.current_thread().name}"
+    return value, (time.time() - start) * 1000, worker
+
+
+def _failure(stage: str, error: str) -> StageResult:
+    return StageResult(
+        stage=stage,
+        success=False,
+        input_hash="",
+        output_hash="",
+        output=None,
+        errors=[error],
+    )
@@ -0,0 +1,656 @@
+"""
+specify_cli.runtime.ggen_watch - Native Watch Mode for ggen sync
+================================================================
+
+In-process watch loop that regenerates only the ggen.toml rules affected by
+an edit.
+
+``ggen sync --watch`` re-runs the external binary, and
+:class:`specify_cli.async_core.file.AsyncDirectoryWatcher` polls once a
+second. This module watches ``ontology/``, ``sparql/`` and ``templates/``
+(plus any other directory a rule reads from and ``ggen.toml`` itself):
+
+Key Features
+-----------
+* **inotify backend**: Kernel change notifications on Linux via ``ctypes``
+  (no extra dependency), falling back to stat polling elsewhere
+* **Debouncing**: A burst of edits (editor save, ``git checkout``) becomes
+  one rebuild
+* **Targeted rebuilds**: Each changed file maps to the rules that declare it
+  as ontology, shapes, query, template or template include
+* **Warm caches**: Rules re-run in-process through
+  :func:`specify_cli.runtime.ggen_scheduler.run_rules`, so unchanged
+  ontologies stay parsed and templates stay compiled
+
+Examples
+--------
+    >>> from specify_cli.runtime.ggen_watch import watch_project
+    >>> watch_project(Path("."), on_rebuild=lambda event: print(event.rules))
+
+See Also
+--------
+- :mod:`specify_cli.runtime.ggen_scheduler` : Rule-graph execution
+- :mod:`specify_cli.runtime.graph_cache` : Parsed graph reuse
+- :mod:`specify_cli.runtime.tera` : Compiled template reuse
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from specify_cli.core.instrumentation import add_span_event
+from specify_cli.core.telemetry import metric_counter, metric_histogram, span
+from specify_cli.ops.ggen_incremental import template_dependencies
+from specify_cli.ops.ggen_manifest import load_manifest, manifest_transform_configs
+from specify_cli.runtime.ggen_scheduler import ScheduleResult, run_rules
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from specify_cli.ops.ggen_incremental import IncrementalTracker
+    from specify_cli.ops.transform import TransformConfig
+    from specify_cli.runtime.sparql_pool import SPARQLWorkerPool
+
+__all__ = [
+    "InotifyBackend",
+    "PollingBackend",
+    "RuleWatcher",
+    "WatchBackend",
+    "WatchEvent",
+    "create_watch_backend",
+    "watch_project",
+]
+
+# Directories watched by default, relative to the project root
+DEFAULT_WATCH_DIRS = ("ontology", "sparql", "templates")
+
+# Quiet period that ends a burst of edits
+DEFAULT_DEBOUNCE_S = 0.05
+
+# Longest a continuous burst may delay a rebuild
+DEFAULT_MAX_BATCH_S = 0.5
+
+# Stat polling interval for the fallback backend
+DEFAULT_POLL_INTERVAL_S = 0.1
+
+MANIFEST_NAME = "ggen.toml"
+
+# inotify event masks (linux/inotify.h)
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ISDIR = 0x40000000
+_WATCH_MASK = (
+    _IN_MODIFY
+    | _IN_CLOSE_WRITE
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+    | _IN_DELETE_SELF
+)
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+class WatchBackend:
+    """Source of file change notifications.
+
+    Parameters
+    ----------
+    roots : list[Path]
+        Directories watched recursively.
+    files : list[Path], optional
+        Individual files watched (e.g. ggen.toml).
+    """
+
+    name = ""
+
+    def __init__(self, roots: list[Path], files: list[Path] | None = None) -> None:
+        """Initialize backend."""
+        self.roots = [Path(r).resolve() for r in roots]
+        self.files = {Path(f).resolve() for f in (files or [])}
+
+    def poll(self, timeout: float) -> set[Path]:
+        """Wait up to ``timeout`` seconds for changes.
+
+        Returns
+        -------
+        set[Path]
+            Changed (created, modified, moved or deleted) paths. A watched
+            root is returned when changes may have been missed.
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release backend resources."""
+
+
+class PollingBackend(WatchBackend):
+    """Stat-polling backend (portable fallback).
+
+    Parameters
+    ----------
+    roots : list[Path]
+        Directories watched recursively.
+    files : list[Path], optional
+        Individual files watched.
+    interval : float, optional
+        Seconds between scans. Default is 0.1.
+    """
+
+    name = "polling"
+
+    def __init__(
+        self,
+        roots: list[Path],
+        files: list[Path] | None = None,
+        interval: float = DEFAULT_POLL_INTERVAL_S,
+    ) -> None:
+        """Initialize backend and take the first snapshot."""
+        super().__init__(roots, files)
+        self.interval = interval
+        self._snapshot = self._scan()
+
+    def poll(self, timeout: float) -> set[Path]:
+        """Rescan until something changed or ``timeout`` elapsed."""
+        deadline = time.monotonic() + timeout
+        while True:
+            current = self._scan()
+            changed = {
+                path
+                for path in current.keys() | self._snapshot.keys()
+                if current.get(path) != self._snapshot.get(path)
+            }
+            self._snapshot = current
+            remaining = deadline - time.monotonic()
+            if changed or remaining <= 0:
+                return changed
+            time.sleep(min(self.interval, remaining))
+
+    def _scan(self) -> dict[Path, tuple[int, int]]:
+        snapshot: dict[Path, tuple[int, int]] = {}
+        candidates: list[Path] = list(self.files)
+        for root in self.roots:
+            for dirpath, dirnames, filenames in os.walk(root):
+                dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+                candidates.extend(Path(dirpath) / name for name in filenames)
+        for path in candidates:
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            snapshot[path] = (st.st_mtime_ns, st.st_size)
+        return snapshot
+
+
+class InotifyBackend(WatchBackend):
+    """Linux inotify backend (via ``ctypes``).
+
+    New sub-directories are watched as they appear. On queue overflow every
+    root is reported as changed.
+
+    Raises
+    ------
+    OSError
+        If inotify is unavailable.
+    """
+
+    name = "inotify"
+
+    def __init__(self, roots: list[Path], files: list[Path] | None = None) -> None:
+        """Initialize inotify and add watches."""
+        super().__init__(roots, files)
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify is only available on Linux")
+
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, f"inotify_init1 failed: {os.strerror(errno)}")
+
+        # watch descriptor -> (directory, recursive)
+        self._watches: dict[int, tuple[Path, bool]] = {}
+        for root in self.roots:
+            self._add_tree(root)
+        for parent in {f.parent for f in self.files}:
+            self._add_watch(parent, recursive=False)
+
+    def poll(self, timeout: float) -> set[Path]:
+        """Wait for inotify events and return the paths they name."""
+        ready, _, _ = select.select([self._fd], [], [], max(timeout, 0))
+        if not ready:
+            return set()
+
+        changed: set[Path] = set()
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            changed |= self._parse(data)
+        return changed
+
+    def close(self) -> None:
+        """Close the inotify descriptor."""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+    def _parse(self, data: bytes) -> set[Path]:
+        changed: set[Path] = set()
+        offset = 0
+        while offset < len(data):
+            wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = data[offset : offset + length].rstrip(b"\0").decode(errors="replace")
+            offset += length
+
+            if mask & _IN_Q_OVERFLOW:
+                metric_counter("ggen.watch.overflow")(1)
+                changed.update(self.roots)
+                continue
+
+            watched = self._watches.get(wd)
+            if watched is None:
+                continue
+            directory, recursive = watched
+            if mask & _IN_IGNORED:
+                del self._watches[wd]
+                continue
+
+            path = directory / name if name else directory
+            if not recursive:
+                if path in self.files:
+                    changed.add(path)
+                continue
+
+            if mask & _IN_ISDIR and mask & (_IN_CREATE | _IN_MOVED_TO):
+                # New directory: watch it and report what is already inside
+                self._add_tree(path)
+                changed.update(p for p in path.rglob("*") if p.is_file())
+            changed.add(path)
+        return changed
+
+    def _add_tree(self, root: Path) -> None:
+        if not root.is_dir():
+            return
+        self._add_watch(root, recursive=True)
+        for dirpath, dirnames, _ in os.walk(root):
+            dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+            for dirname in dirnames:
+                self._add_watch(Path(dirpath) / dirname, recursive=True)
+
+    def _add_watch(self, directory: Path, recursive: bool) -> None:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), _WATCH_MASK)
+        if wd < 0:
+            return
+        # A directory watched both ways keeps its recursive watch
+        existing = self._watches.get(wd)
+        if existing is None or not existing[1]:
+            self._watches[wd] = (directory, recursive)
+
+
+def create_watch_backend(
+    roots: list[Path],
+    files: list[Path] | None = None,
+    prefer_native: bool = True,
+) -> WatchBackend:
+    """Create the best available watch backend.
+
+    Parameters
+    ----------
+    roots : list[Path]
+        Directories watched recursively.
+    files : list[Path], optional
+        Individual files watched.
+    prefer_native : bool, optional
+        Try inotify before polling. Default is True.
+
+    Returns
+    -------
+    WatchBackend
+        inotify backend on Linux, otherwise the polling backend.
+    """
+    if prefer_native:
+        try:
+            return InotifyBackend(roots, files)
+        except (OSError, AttributeError):
+            metric_counter("ggen.watch.native_unavailable")(1)
+    return PollingBackend(roots, files)
+
+
+@dataclass
+class WatchEvent:
+    """One debounced rebuild.
+
+    Attributes
+    ----------
+    changed_files : list[str]
+        Files that changed in the burst.
+    rules : list[str]
+        Rules that were re-run.
+    result : ScheduleResult | None
+        Scheduler result (None when no rule was affected).
+    latency_ms : float
+        Time from the first notification to the end of the rebuild.
+    manifest_reloaded : bool
+        Whether ggen.toml changed and was reloaded.
+    error : str | None
+        Why the rebuild stopped early (e.g. an invalid ggen.toml).
+    """
+
+    changed_files: list[str] = field(default_factory=list)
+    rules: list[str] = field(default_factory=list)
+    result: ScheduleResult | None = None
+    latency_ms: float = 0.0
+    manifest_reloaded: bool = False
+    error: str | None = None
+
+    @property
+    def success(self) -> bool:
+        """Whether the rebuild completed and every re-run rule succeeded."""
+        return self.error is None and (self.result is None or self.result.success)
+
+
+class RuleWatcher:
+    """Map file changes to rules and re-run them.
+
+    Parameters
+    ----------
+    configs : list[TransformConfig]
+        Rules to keep up to date (paths absolute or relative to the cwd).
+    backend : WatchBackend
+        Change notification source.
+    manifest_path : Path | None, optional
+        ggen.toml to reload when it changes.
+    debounce : float, optional
+        Quiet period in seconds that ends a burst. Default is 0.05.
+    max_batch : float, optional
+        Maximum seconds a burst may delay a rebuild. Default is 0.5.
+    max_workers : int | None, optional
+        Scheduler worker count.
+    sparql_pool : SPARQLWorkerPool | None, optional
+        Killable worker processes that keep ontologies parsed between
+        rebuilds and run the rules' queries.
+    tracker : IncrementalTracker | None, optional
+        Incremental state; rebuilt rules whose inputs did not change are
+        skipped and unchanged queries reuse their cached results.
+    """
+
+    def __init__(
+        self,
+        configs: list[TransformConfig],
+        backend: WatchBackend,
+        *,
+        manifest_path: Path | None = None,
+        debounce: float = DEFAULT_DEBOUNCE_S,
+        max_batch: float = DEFAULT_MAX_BATCH_S,
+        max_workers: int | None = None,
+        sparql_pool: SPARQLWorkerPool | None = None,
+        tracker: IncrementalTracker | None = None,
+    ) -> None:
+        """Initialize watcher and build the dependency index."""
+        self.configs = list(configs)
+        self.backend = backend
+        self.manifest_path = manifest_path.resolve() if manifest_path else None
+        self.debounce = debounce
+        self.max_batch = max_batch
+        self.max_workers = max_workers
+        self.sparql_pool = sparql_pool
+        self.tracker = tracker
+        # time.monotonic() when the last burst's first notification arrived
+        self.burst_started: float | None = None
+        self._index: dict[Path, set[str]] = {}
+        self.rebuild_index()
+
+    def rebuild_index(self) -> None:
+        """Recompute which files each rule depends on."""
+        index: dict[Path, set[str]] = {}
+        for config in self.configs:
+            deps = [
+                *config.input_files,
+                *config.schema_files,
+                config.sparql_query,
+                config.template,
+                *template_dependencies(config.template),
+            ]
+            for dep in deps:
+                index.setdefault(Path(dep).resolve(), set()).add(config.name)
+        self._index = index
+
+    def affected_rules(self, changed: set[Path]) -> list[str]:
+        """Get rules depending on any changed file (or a file under a changed directory).
+
+        Parameters
+        ----------
+        changed : set[Path]
+            Changed paths.
+
+        Returns
+        -------
+        list[str]
+            Affected rule names in manifest order.
+        """
+        names: set[str] = set()
+        for path in (p.resolve() for p in changed):
+            names |= self._index.get(path, set())
+            if path.is_dir() or not path.suffix:
+                for dep, rules in self._index.items():
+                    if dep.is_relative_to(path):
+                        names |= rules
+        return [c.name for c in self.configs if c.name in names]
+
+    def wait_for_changes(self, timeout: float) -> set[Path]:
+        """Wait for a burst of changes and return it once quiet.
+
+        Parameters
+        ----------
+        timeout : float
+            Seconds to wait for the first change.
+
+        Returns
+        -------
+        set[Path]
+            Changed paths (empty on timeout).
+        """
+        changed = self.backend.poll(timeout)
+        if not changed:
+            return changed
+        self.burst_started = time.monotonic()
+        deadline = self.burst_started + self.max_batch
+        while time.monotonic() < deadline:
+            more = self.backend.poll(min(self.debounce, deadline - time.monotonic()))
+            if not more:
+                break
+            changed |= more
+        return changed
+
+    def rebuild(self, changed: set[Path], started: float | None = None) -> WatchEvent:
+        """Re-run the rules affected by ``changed``.
+
+        Parameters
+        ----------
+        changed : set[Path]
+            Changed paths.
+        started : float | None, optional
+            ``time.monotonic()`` of the first notification (for latency).
+
+        Returns
+        -------
+        WatchEvent
+            Rebuild report. A manifest that fails to load or rules that
+            cannot be scheduled are reported in ``error``; the previous
+            rules stay in effect.
+        """
+        started = time.monotonic() if started is None else started
+        event = WatchEvent(changed_files=sorted(str(p) for p in changed))
+
+        with span("ggen.watch.rebuild", changed=len(changed)):
+            try:
+                self._rebuild(changed, event)
+            except Exception as e:  # Reported on the event; watching continues
+                event.error = f"{type(e).__name__}: {e}"
+                metric_counter("ggen.watch.errors")(1)
+                add_span_event("ggen.watch.rebuild_failed", {"error": event.error})
+
+            event.latency_ms = (time.monotonic() - started) * 1000
+            metric_histogram("ggen.watch.latency")(event.latency_ms / 1000)
+            metric_counter("ggen.watch.rebuilds")(1)
+            add_span_event(
+                "ggen.watch.rebuilt",
+                {
+                    "rules": len(event.rules),
+                    "latency_ms": event.latency_ms,
+                    "success": event.success,
+                },
+            )
+        return event
+
+    def _rebuild(self, changed: set[Path], event: WatchEvent) -> None:
+        if self.manifest_path is not None and self.manifest_path in changed:
+            self.configs = manifest_transform_configs(
+                load_manifest(self.manifest_path), base_dir=self.manifest_path.parent
+            )
+            event.manifest_reloaded = True
+            event.rules = [c.name for c in self.configs]
+        else:
+            event.rules = self.affected_rules(changed)
+
+        # Includes may have been added or removed
+        self.rebuild_index()
+
+        if event.rules:
+            selected = [c for c in self.configs if c.name in event.rules]
+            event.result = run_rules(
+                selected,
+                max_workers=self.max_workers,
+                sparql_pool=self.sparql_pool,
+                tracker=self.tracker,
+            )
+
+    def run(
+        self,
+        on_rebuild: Callable[[WatchEvent], None] | None = None,
+        stop_event: threading.Event | None = None,
+        poll_timeout: float = 0.5,
+    ) -> None:
+        """Watch until ``stop_event`` is set (or forever).
+
+        Parameters
+        ----------
+        on_rebuild : Callable[[WatchEvent], None] | None, optional
+            Called after every rebuild.
+        stop_event : threading.Event | None, optional
+            Set to stop the loop.
+        poll_timeout : float, optional
+            Seconds between stop checks. Default is 0.5.
+        """
+        stop_event = stop_event or threading.Event()
+        try:
+            while not stop_event.is_set():
+                changed = self.wait_for_changes(poll_timeout)
+                if not changed:
+                    continue
+                event = self.rebuild(changed, started=self.burst_started)
+                if on_rebuild is not None:
+                    on_rebuild(event)
+        finally:
+            self.backend.close()
+
+
+def watch_project(
+    project_path: Path,
+    *,
+    on_rebuild: Callable[[WatchEvent], None] | None = None,
+    stop_event: threading.Event | None = None,
+    initial_sync: bool = True,
+    prefer_native: bool = True,
+    max_workers: int | None = None,
+    sparql_pool: SPARQLWorkerPool | None = None,
+    tracker: IncrementalTracker | None = None,
+) -> None:
+    """Watch a ggen project and regenerate affected rules on every edit.
+
+    Parameters
+    ----------
+    project_path : Path
+        Project root containing ggen.toml.
+    on_rebuild : Callable[[WatchEvent], None] | None, optional
+        Called after the initial sync and after every rebuild.
+    stop_event : threading.Event | None, optional
+        Set to stop watching.
+    initial_sync : bool, optional
+        Run every rule once before watching (warms the caches). Default True.
+    prefer_native : bool, optional
+        Use inotify when available. Default is True.
+    max_workers : int | None, optional
+        Scheduler worker count.
+    sparql_pool : SPARQLWorkerPool | None, optional
+        Killable worker processes for the rules' queries.
+    tracker : IncrementalTracker | None, optional
+        Incremental state for the initial sync and every rebuild.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the project has no ggen.toml.
+    """
+    project_path = Path(project_path).resolve()
+    manifest_path = project_path / MANIFEST_NAME
+    configs = manifest_transform_configs(load_manifest(manifest_path), base_dir=project_path)
+
+    # Default directories plus any other directory a rule reads from
+    roots = {project_path / d for d in DEFAULT_WATCH_DIRS if (project_path / d).is_dir()}
+    for config in configs:
+        for dep in (
+            *config.input_files,
+            *config.schema_files,
+            config.sparql_query,
+            config.template,
+        ):
+            parent = Path(dep).resolve().parent
+            if parent != project_path and not any(parent.is_relative_to(r) for r in roots):
+                roots.add(parent)
+
+    backend = create_watch_backend(sorted(roots), [manifest_path], prefer_native=prefer_native)
+    watcher = RuleWatcher(
+        configs,
+        backend,
+        manifest_path=manifest_path,
+        max_workers=max_workers,
+        sparql_pool=sparql_pool,
+        tracker=tracker,
+    )
+    add_span_event(
+        "ggen.watch.started",
+        {"backend": backend.name, "roots": len(roots), "rules": len(configs)},
+    )
+
+    if initial_sync:
+        event = WatchEvent(rules=[c.name for c in configs])
+        started = time.monotonic()
+        event.result = run_rules(
+            configs, max_workers=max_workers, sparql_pool=sparql_pool, tracker=tracker
+        )
+        event.latency_ms = (time.monotonic() - started) * 1000
+        if on_rebuild is not None:
+            on_rebuild(event)
+
+    watcher.run(on_rebuild=on_rebuild, stop_event=stop_event)
@@ -0,0 +1,334 @@
+"""
+specify_cli.runtime.graph_cache - Parse-Once RDF Graph Reuse
+============================================================
+
+Process-wide cache of parsed RDF graphs for the ggen μ pipeline.
+
+Before this module every stage paid the full Turtle parsing cost: μ₁
+NORMALIZE concatenated the input files into a string, SHACL validation parsed
+that string, and μ₂ EXTRACT parsed it again for every rule. Rules sharing the
+same ontology files (e.g. ``agi-command-ops`` and ``agi-reasoner-ops``) parsed
+identical inputs once per rule.
+
+:class:`ParsedGraph` is a handle that flows through the stages. It carries the
+parsed ``rdflib.Graph`` together with the source text and hashes the receipt
+needs. :class:`GraphCache` hands out one handle per *set of input file
+hashes*, so every rule and stage that reads the same ontology reuses one
+parsed graph.
+
+Key Features
+-----------
+* **Content-addressed**: Keyed by the sorted SHA256 hashes of the input files,
+  so renamed or re-ordered inputs still hit and edited inputs always miss
+* **Stat memo**: Files whose (mtime, size) are unchanged are not re-read or
+  re-hashed on later lookups
+* **Per-file parsing**: Each file is parsed on its own into the shared graph,
+  so ``@prefix``/``@base`` declarations never leak between files
+* **LRU bound**: At most ``max_entries`` graphs are kept in memory
+* **Thread Safety**: Lock-protected; concurrent misses for the same key parse
+  only once
+
+Examples
+--------
+    >>> from specify_cli.runtime.graph_cache import get_graph_cache
+    >>> parsed = get_graph_cache().load(["ontology/cli-commands-agi.ttl"])
+    >>> parsed.graph.query("SELECT ?s WHERE { ?s ?p ?o } LIMIT 1")
+    >>> parsed.content_hash  # hash of the concatenated Turtle text
+
+Notes
+-----
+Cached graphs are shared: callers must treat ``ParsedGraph.graph`` as
+read-only (SPARQL SELECT/CONSTRUCT and pyshacl validation do not mutate it).
+
+See Also
+--------
+- :mod:`specify_cli.runtime.ggen` : μ pipeline runtime
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from specify_cli.core.instrumentation import add_span_event
+from specify_cli.core.telemetry import metric_counter, metric_histogram, span
+from specify_cli.ops.ggen_incremental import RACY_WINDOW_NS
+
+__all__ = [
+    "GraphCache",
+    "ParsedGraph",
+    "clear_graph_cache",
+    "get_graph_cache",
+]
+
+# Default number of parsed graphs kept in memory
+DEFAULT_MAX_GRAPHS = 32
+
+
+@dataclass
+class ParsedGraph:
+    """Parsed RDF graph handle shared across μ stages and rules.
+
+    Attributes
+    ----------
+    graph : Any
+        Parsed ``rdflib.Graph`` (treat as read-only).
+    input_files : list[str]
+        Input file paths in the order requested.
+    file_hashes : dict[str, str]
+        Map of input file path to SHA256 of its content.
+    content : str
+        Input files concatenated in order (the μ₁ NORMALIZE output).
+    content_hash : str
+        SHA256 of ``content``.
+    triple_count : int
+        Number of triples in the graph.
+    parse_ms : float
+        Time spent parsing when the graph was first built.
+    """
+
+    graph: Any
+    input_files: list[str]
+    file_hashes: dict[str, str]
+    content: str
+    content_hash: str
+    triple_count: int = 0
+    parse_ms: float = 0.0
+
+    @property
+    def cache_key(self) -> tuple[str, ...]:
+        """Order-independent key: sorted input file hashes."""
+        return tuple(sorted(set(self.file_hashes.values())))
+
+
+@dataclass
+class _CachedGraph:
+    """Cache entry: one parsed graph plus the per-file texts it was built from."""
+
+    graph: Any
+    texts: dict[str, str]  # file hash -> file text
+    triple_count: int
+    parse_ms: float
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+@dataclass
+class GraphCacheStats:
+    """Graph cache statistics.
+
+    Attributes
+    ----------
+    hits : int
+        Lookups served by an already parsed graph.
+    misses : int
+        Lookups that required parsing.
+    evictions : int
+        Graphs evicted by the LRU bound.
+    parse_ms_total : float
+        Total time spent parsing.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    parse_ms_total: float = 0.0
+
+
+class GraphCache:
+    """Process-wide cache of parsed RDF graphs keyed by input file hashes.
+
+    Parameters
+    ----------
+    max_entries : int, optional
+        Maximum number of parsed graphs kept. Default is 32.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_GRAPHS) -> None:
+        """Initialize graph cache."""
+        self.max_entries = max_entries
+        self._graphs: OrderedDict[tuple[str, ...], _CachedGraph] = OrderedDict()
+        self._lock = threading.Lock()
+        # Resolved path -> (mtime_ns, size, hashed_at_ns, sha256, text) of its
+        # last read; replaced when the file changes, so old versions are not kept
+        self._file_memo: dict[str, tuple[int, int, int, str, str]] = {}
+        self.stats = GraphCacheStats()
+
+    def load(self, input_files: list[str], rdf_format: str = "turtle") -> ParsedGraph:
+        """Get a parsed graph for the input files, parsing only on a miss.
+
+        Parameters
+        ----------
+        input_files : list[str]
+            RDF files to load into one graph.
+        rdf_format : str, optional
+            rdflib parser format. Default is "turtle".
+
+        Returns
+        -------
+        ParsedGraph
+            Shared parsed graph handle.
+
+        Raises
+        ------
+        FileNotFoundError
+            If an input file does not exist.
+        Exception
+            If rdflib cannot parse an input file.
+        """
+        with span("ggen.graph_cache.load", files=len(input_files)):
+            file_hashes: dict[str, str] = {}
+            texts: dict[str, str] = {}
+            for input_file in input_files:
+                digest, text = self._read_file(Path(input_file))
+                file_hashes[input_file] = digest
+                texts[digest] = text
+
+            key = tuple(sorted(set(file_hashes.values())))
+            entry, hit = self._get_entry(key, texts)
+
+            if not hit:
+                with entry.lock:
+                    if entry.graph is None:
+                        self._parse_into(entry, key, rdf_format)
+
+            content = "".join(entry.texts[file_hashes[f]] + "\n" for f in input_files)
+            return ParsedGraph(
+                graph=entry.graph,
+                input_files=list(input_files),
+                file_hashes=file_hashes,
+                content=content,
+                content_hash=hashlib.sha256(content.encode()).hexdigest(),
+                triple_count=entry.triple_count,
+                parse_ms=entry.parse_ms,
+            )
+
+    def clear(self) -> None:
+        """Drop every cached graph and file memo."""
+        with self._lock:
+            self._graphs.clear()
+            self._file_memo.clear()
+            self.stats = GraphCacheStats()
+
+    def __len__(self) -> int:
+        """Number of cached graphs."""
+        return len(self._graphs)
+
+    @property
+    def memoized_files(self) -> int:
+        """Number of files whose last read is kept (one entry per path)."""
+        return len(self._file_memo)
+
+    # -------------------------------------------------------------------------
+    # Internals
+    # -------------------------------------------------------------------------
+
+    def _read_file(self, path: Path) -> tuple[str, str]:
+        """Return ``(sha256, text)`` for a file, skipping unchanged files.
+
+        A file read within ``RACY_WINDOW_NS`` of its mtime is read again: a
+        same-size edit within the filesystem's mtime granularity would leave
+        its stat unchanged.
+        """
+        hashed_at_ns = time.time_ns()
+        st = path.stat()
+        memo_key = str(path.resolve())
+        with self._lock:
+            cached = self._file_memo.get(memo_key)
+        if (
+            cached is not None
+            and cached[:2] == (st.st_mtime_ns, st.st_size)
+            and cached[2] - st.st_mtime_ns > RACY_WINDOW_NS
+        ):
+            return cached[3], cached[4]
+
+        text = path.read_text()
+        digest = hashlib.sha256(text.encode()).hexdigest()
+        with self._lock:
+            self._file_memo[memo_key] = (st.st_mtime_ns, st.st_size, hashed_at_ns, digest, text)
+        return digest, text
+
+    def _get_entry(self, key: tuple[str, ...], texts: dict[str, str]) -> tuple[_CachedGraph, bool]:
+        """Get or reserve the cache entry for a key (hit flag second)."""
+        with self._lock:
+            entry = self._graphs.get(key)
+            if entry is not None and entry.graph is not None:
+                self._graphs.move_to_end(key)
+                self.stats.hits += 1
+                metric_counter("ggen.graph_cache.hit")(1)
+                return entry, True
+
+            if entry is None:
+                entry = _CachedGraph(graph=None, texts=texts, triple_count=0, parse_ms=0.0)
+                self._graphs[key] = entry
+                while len(self._graphs) > self.max_entries:
+                    self._graphs.popitem(last=False)
+                    self.stats.evictions += 1
+
+            self.stats.misses += 1
+            metric_counter("ggen.graph_cache.miss")(1)
+            return entry, False
+
+    def _parse_into(self, entry: _CachedGraph, key: tuple[str, ...], rdf_format: str) -> None:
+        """Parse every distinct input text into one graph (entry lock held)."""
+        from rdflib import Graph  # noqa: PLC0415
+
+        start = time.time()
+        graph = Graph()
+        try:
+            for digest in key:
+                graph.parse(data=entry.texts[digest], format=rdf_format)
+        except Exception:
+            # Do not keep a half-parsed graph around
+            with self._lock:
+                self._graphs.pop(key, None)
+            raise
+
+        parse_ms = (time.time() - start) * 1000
+        entry.triple_count = len(graph)
+        entry.parse_ms = parse_ms
+        entry.graph = graph
+
+        with self._lock:
+            self.stats.parse_ms_total += parse_ms
+        metric_histogram("ggen.graph_cache.parse_time")(parse_ms / 1000)
+        add_span_event(
+            "ggen.graph_parsed",
+            {"triples_count": entry.triple_count, "parse_ms": parse_ms},
+        )
+
+
+# -----------------------------------------------------------------------------
+# Process-wide instance
+# -----------------------------------------------------------------------------
+
+_GRAPH_CACHE: GraphCache | None = None
+_GRAPH_CACHE_LOCK = threading.Lock()
+
+
+def get_graph_cache() -> GraphCache:
+    """Get or create the process-wide graph cache.
+
+    Returns
+    -------
+    GraphCache
+        Shared graph cache instance.
+    """
+    global _GRAPH_CACHE  # noqa: PLW0603
+
+    if _GRAPH_CACHE is None:
+        with _GRAPH_CACHE_LOCK:
+            if _GRAPH_CACHE is None:
+                _GRAPH_CACHE = GraphCache()
+
+    return _GRAPH_CACHE
+
+
+def clear_graph_cache() -> None:
+    """Clear the process-wide graph cache."""
+    if _GRAPH_CACHE is not None:
+        _GRAPH_CACHE.clear()
@@ -7,6 +7,7 @@ from typing import Any, Callable, TypeVar
 
 from specify_cli.core.shell import timed
 from specify_cli.core.telemetry import metric_histogram, span
+from specify_cli.runtime.parallel import ParallelExecutor
 
 T = TypeVar("T")
 
@@ -95,24 +96,38 @@ def cached(ttl: float = 300.0) -> Callable:
 
 
 class BatchProcessor:
-    def __init__(self, batch_size: int = 100):
+    """Runs a batch handler over queued items, batches in parallel.
+
+    ``mode``, ``max_workers`` and ``timeout`` (per batch) are passed to
+    :class:`specify_cli.runtime.parallel.ParallelExecutor`.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = 100,
+        mode: str = "thread",
+        max_workers: int | None = None,
+        timeout: float | None = None,
+    ):
         self.batch_size = batch_size
         self.queue = []
+        self.executor = ParallelExecutor(mode, max_workers, chunk_size=1, timeout=timeout)
 
     def add_item(self, item: Any) -> None:
         self.queue.append(item)
 
     @timed
-    def process(self, handler: Callable) -> list[Any]:
+    def process(self, handler: Callable, ordered: bool = True) -> list[Any]:
         with span("batch.process", size=len(self.queue)):
+            batches = [
+                self.queue[i : i + self.batch_size]
+                for i in range(0, len(self.queue), self.batch_size)
+            ]
             results = []
-
-            for i in range(0, len(self.queue), self.batch_size):
-                batch = self.queue[i:i + self.batch_size]
-                batch_results = handler(batch)
+            for batch_results in self.executor.map(handler, batches, ordered=ordered):
                 results.extend(batch_results)
 
-            metric_histogram("batch.items_processed", len(self.queue))
+            metric_histogram("batch.items_processed", unit="1")(len(self.queue))
             return results
 
 
@@ -142,16 +157,22 @@ def parallelize_computation(
     items: list[Any],
     handler: Callable[[Any], Any],
     max_workers: int = 4,
+    *,
+    mode: str = "thread",
+    ordered: bool = True,
+    timeout: float | None = None,
+    chunk_size: int | None = None,
 ) -> list[Any]:
-    with span("compute.parallelize", count=len(items)):
-        results = []
+    """Apply ``handler`` to ``items`` on ``max_workers`` workers.
 
-        for i in range(0, len(items), max_workers):
-            batch = items[i:i + max_workers]
-            batch_results = [handler(item) for item in batch]
-            results.extend(batch_results)
+    Use ``mode="process"`` for CPU-bound handlers (picklable handler and
+    items). Raises the first handler error.
+    """
+    with span("compute.parallelize", count=len(items), mode=mode):
+        executor = ParallelExecutor(mode, max_workers, chunk_size=chunk_size, timeout=timeout)
+        results = executor.map(handler, items, ordered=ordered)
 
-        metric_histogram("compute.items_processed", len(items))
+        metric_histogram("compute.items_processed", unit="1")(len(items))
         return results
 
 
@@ -0,0 +1,475 @@
+"""Shared parallel executor for batch computations.
+
+``ParallelExecutor`` runs a handler over many items in one of three modes:
+
+- ``thread``: a ``ThreadPool`` of its own per call (I/O-bound handlers)
+- ``process``: a shared process pool, or one of its own per call when a
+  timeout is set (CPU-bound handlers; the handler and items must be picklable)
+- ``asyncio``: a shared event loop thread; coroutine handlers are awaited,
+  plain functions run via ``asyncio.to_thread``
+
+Thread pools belong to one call, so a handler may itself run parallel work
+without waiting on threads its caller holds. Process pools are created once
+per size and reused across calls without a timeout. Results stream back as
+``TaskResult`` objects, in input order or as they complete. In process mode
+items are sent in chunks whose size is tuned from measured per-item run
+times, so that each chunk takes about ``TARGET_CHUNK_S``.
+
+Per-task timeouts report ``TimeoutError`` for the item. Asyncio tasks are
+cancelled. Threads cannot be interrupted: timed-out thread work keeps
+running in the background and its result is discarded. Process calls with a
+timeout run on their own pool, whose workers still running timed-out work are
+terminated when the call ends.
+``cancel()`` stops submitting, cancels queued work and reports the remaining
+items as cancelled.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import inspect
+import os
+import queue
+import threading
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    CancelledError,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass
+from multiprocessing import resource_tracker
+from typing import TYPE_CHECKING, Any
+
+from specify_cli.core.telemetry import metric_counter, metric_histogram, span
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+EXECUTOR_MODES = ("thread", "process", "asyncio")
+
+# Auto-tuned process chunks aim for this much work each
+TARGET_CHUNK_S = 0.05
+# Auto-tuned chunks never exceed 1/(workers * CHUNK_SPREAD) of what is left,
+# so the tail of a batch still spreads over all workers
+CHUNK_SPREAD = 4
+
+
+@dataclass
+class TaskResult:
+    """Outcome of one item."""
+
+    index: int
+    value: Any = None
+    error: BaseException | None = None
+    duration: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+# --------------------------------------------------------------------------- #
+# Shared pools                                                                #
+# --------------------------------------------------------------------------- #
+
+
+class ThreadPool(Executor):
+    """Executor whose threads start on demand and are reused while idle.
+
+    A thread is started whenever a task is submitted and none is idle, up to
+    ``max_workers`` (unbounded if None, leaving the bound to the caller's
+    number of tasks in flight). The threads are daemons: unlike
+    ``ThreadPoolExecutor``, they are not joined at interpreter exit, so
+    abandoned work cannot hang shutdown.
+    """
+
+    def __init__(self, max_workers: int | None = None, name: str = "parallel"):
+        self.max_workers = max_workers
+        self.name = name
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._idle = threading.Semaphore(0)
+        self._threads: list[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._shutdown = False
+
+    def submit(self, fn: Callable, /, *args: Any, **kwargs: Any) -> Future:
+        future: Future = Future()
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+            self._queue.put((future, fn, args, kwargs))
+            if self._idle.acquire(blocking=False):
+                return future
+            if self.max_workers is None or len(self._threads) < self.max_workers:
+                thread = threading.Thread(
+                    target=self._work, name=f"{self.name}-{len(self._threads)}", daemon=True
+                )
+                thread.start()
+                self._threads.append(thread)
+        return future
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        """Stop the threads once they finish their current task."""
+        with self._lock:
+            self._shutdown = True
+            if cancel_futures:
+                while True:
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is not None:
+                        item[0].cancel()
+            threads = list(self._threads)
+            for _ in threads:
+                self._queue.put(None)
+        if wait:
+            for thread in threads:
+                thread.join()
+
+    def _work(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            future, fn, args, kwargs = item
+            del item
+            if future.set_running_or_notify_cancel():
+                try:
+                    result = fn(*args, **kwargs)
+                except BaseException as e:  # Delivered through the future
+                    future.set_exception(e)
+                else:
+                    future.set_result(result)
+            del future, fn, args, kwargs
+            self._idle.release()
+
+
+def new_pool(mode: str, workers: int, name: str = "parallel") -> Executor:
+    """A pool of its own for one caller: a ``ThreadPool`` or a process pool."""
+    if mode == "process":
+        # Forked workers then share our tracker, so shared memory blocks
+        # they create can be released here without warnings
+        resource_tracker.ensure_running()
+        return ProcessPoolExecutor(workers)
+    return ThreadPool(name=name)
+
+
+def close_pool(pool: Executor, abandoned: bool = False) -> None:
+    """Shut ``pool`` down without waiting for its work.
+
+    With ``abandoned``, process workers still running timed-out tasks are
+    terminated; threads cannot be, and finish their task in the background.
+    """
+    processes = []
+    if abandoned and isinstance(pool, ProcessPoolExecutor):
+        processes = list((pool._processes or {}).values())  # noqa: SLF001
+    pool.shutdown(wait=False, cancel_futures=True)
+    for process in processes:
+        process.terminate()
+
+
+_process_pools: dict[int, ProcessPoolExecutor] = {}
+_pools_lock = threading.Lock()
+_loop: asyncio.AbstractEventLoop | None = None
+
+
+def shared_process_pool(workers: int) -> Executor:
+    """Process pool of ``workers`` processes, created on first use.
+
+    Only work that always runs to completion may use it: a caller that
+    gives up on a task cannot stop it without breaking the pool for every
+    other caller (see ``ParallelExecutor._pool``).
+    """
+    with _pools_lock:
+        pool = _process_pools.get(workers)
+        if pool is None or pool._broken:  # noqa: SLF001 - a worker died; start afresh
+            pool = _process_pools[workers] = new_pool("process", workers)
+        return pool
+
+
+def _shared_loop() -> asyncio.AbstractEventLoop:
+    global _loop  # noqa: PLW0603
+    with _pools_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="parallel-asyncio", daemon=True).start()
+        return _loop
+
+
+def _forget_pools() -> None:
+    """In a forked child: the parent's pools and loop thread are not ours."""
+    global _loop, _pools_lock  # noqa: PLW0603
+    _process_pools.clear()
+    _loop = None
+    _pools_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_forget_pools)
+
+
+@atexit.register
+def shutdown_pools() -> None:
+    """Shut down the shared process pools and the event loop."""
+    global _loop
+    with _pools_lock:
+        pools = list(_process_pools.values())
+        _process_pools.clear()
+        loop, _loop = _loop, None
+    for pool in pools:
+        close_pool(pool)
+    if loop is not None:
+        loop.call_soon_threadsafe(loop.stop)
+
+
+# --------------------------------------------------------------------------- #
+# Chunk runners                                                               #
+# --------------------------------------------------------------------------- #
+
+
+def _run_chunk(fn: Callable, items: list[Any]) -> list[tuple[Any, BaseException | None, float]]:
+    """Run ``fn`` over a chunk; one failing item does not fail the others."""
+    outcomes = []
+    for item in items:
+        start = time.perf_counter()
+        try:
+            outcomes.append((fn(item), None, time.perf_counter() - start))
+        except Exception as e:  # Reported per item
+            outcomes.append((None, e, time.perf_counter() - start))
+    return outcomes
+
+
+async def _run_chunk_async(
+    fn: Callable, items: list[Any], timeout: float | None
+) -> list[tuple[Any, BaseException | None, float]]:
+    outcomes = []
+    for item in items:
+        start = time.perf_counter()
+        call = fn(item) if inspect.iscoroutinefunction(fn) else asyncio.to_thread(fn, item)
+        try:
+            value = await asyncio.wait_for(call, timeout)
+        except TimeoutError:
+            outcomes.append((None, TimeoutError(f"Task timed out after {timeout}s"), timeout))
+        except Exception as e:  # Reported per item
+            outcomes.append((None, e, time.perf_counter() - start))
+        else:
+            outcomes.append((value, None, time.perf_counter() - start))
+    return outcomes
+
+
+# --------------------------------------------------------------------------- #
+# Executor                                                                    #
+# --------------------------------------------------------------------------- #
+
+
+class ParallelExecutor:
+    """Runs a handler over items on a thread pool, process pool or event loop.
+
+    Parameters
+    ----------
+    mode : str
+        "thread", "process" or "asyncio".
+    max_workers : int | None
+        Concurrent workers. Default is ``os.cpu_count()`` (32 for asyncio).
+    chunk_size : int | None
+        Items per submitted chunk. None auto-tunes in process mode and
+        uses 1 otherwise.
+    timeout : float | None
+        Per-item timeout in seconds.
+    """
+
+    def __init__(
+        self,
+        mode: str = "thread",
+        max_workers: int | None = None,
+        chunk_size: int | None = None,
+        timeout: float | None = None,
+    ):
+        if mode not in EXECUTOR_MODES:
+            raise ValueError(f"Unknown executor mode: {mode} (expected one of {EXECUTOR_MODES})")
+        default_workers = 32 if mode == "asyncio" else os.cpu_count() or 1
+        self.mode = mode
+        self.max_workers = max(1, max_workers or default_workers)
+        self.chunk_size = chunk_size
+        self.timeout = timeout
+        self._cancelled = threading.Event()
+
+    def cancel(self) -> None:
+        """Stop a running ``imap``/``map``; queued items are cancelled."""
+        self._cancelled.set()
+
+    def map(self, fn: Callable, items: Iterable[Any], ordered: bool = True) -> list[Any]:
+        """Results of ``fn`` over ``items``; raises the first item error."""
+        values = []
+        for result in self.imap(fn, items, ordered=ordered):
+            if result.error is not None:
+                raise result.error
+            values.append(result.value)
+        return values
+
+    def imap(
+        self, fn: Callable, items: Iterable[Any], ordered: bool = True
+    ) -> Iterator[TaskResult]:
+        """Stream results, in input order or (``ordered=False``) as completed.
+
+        Closing the iterator early cancels the work still queued.
+        """
+        items = list(items)
+        self._cancelled.clear()
+        with span("parallel.imap", mode=self.mode, items=len(items), workers=self.max_workers):
+            start = time.perf_counter()
+            stream = _Stream(self, fn, items, ordered)
+            try:
+                yield from stream.run()
+            finally:
+                stream.close()
+            metric_histogram("parallel.imap.duration")(time.perf_counter() - start)
+            metric_counter("parallel.items")(len(items))
+
+    def _pool(self) -> tuple[Executor | None, bool]:
+        """Pool for one ``imap`` call (None in asyncio mode), and whether it is the call's own.
+
+        Process work that may time out gets a pool of its own, so its
+        workers can be terminated without failing other callers' work.
+        """
+        if self.mode == "thread":
+            return ThreadPool(name="parallel"), True
+        if self.mode == "process" and self.timeout is not None:
+            return new_pool("process", self.max_workers), True
+        if self.mode == "process":
+            return shared_process_pool(self.max_workers), False
+        return None, False
+
+    def _submit(self, fn: Callable, chunk: list[Any], pool: Executor | None) -> Future:
+        if pool is None:
+            return asyncio.run_coroutine_threadsafe(
+                _run_chunk_async(fn, chunk, self.timeout), _shared_loop()
+            )
+        return pool.submit(_run_chunk, fn, chunk)
+
+
+class _Stream:
+    """State of one ``imap`` call: a window of in-flight chunks."""
+
+    def __init__(self, executor: ParallelExecutor, fn: Callable, items: list[Any], ordered: bool):
+        self.executor = executor
+        self.fn = fn
+        self.items = items
+        self.ordered = ordered
+        self.next_index = 0
+        # future -> (first item index, chunk length, deadline)
+        self.pending: dict[Future, tuple[int, int, float | None]] = {}
+        self.buffer: dict[int, TaskResult] = {}
+        self.next_to_yield = 0
+        self.item_time: float | None = None
+        self.pool, self.owns_pool = executor._pool()  # noqa: SLF001
+        # Timed-out work may still be running on the pool
+        self.abandoned = False
+
+    def run(self) -> Iterator[TaskResult]:
+        workers = self.executor.max_workers
+        while self.pending or self.next_index < len(self.items):
+            if self.executor._cancelled.is_set():  # noqa: SLF001
+                yield from self._emit(self._cancel_all())
+                return
+            while len(self.pending) < workers and self.next_index < len(self.items):
+                self._submit_next()
+
+            done, _ = wait(self.pending, timeout=self._wait_timeout(), return_when=FIRST_COMPLETED)
+            results = []
+            for future in done:
+                results.extend(self._collect(future))
+            results.extend(self._expire())
+            yield from self._emit(results)
+
+    def _submit_next(self) -> None:
+        size = min(self._chunk_size(), len(self.items) - self.next_index)
+        chunk = self.items[self.next_index : self.next_index + size]
+        timeout = self.executor.timeout
+        deadline = time.monotonic() + timeout * size if timeout is not None else None
+        future = self.executor._submit(self.fn, chunk, self.pool)  # noqa: SLF001
+        self.pending[future] = (self.next_index, size, deadline)
+        self.next_index += size
+
+    def _chunk_size(self) -> int:
+        if self.executor.chunk_size is not None:
+            return max(1, self.executor.chunk_size)
+        if self.executor.mode != "process" or self.item_time is None:
+            # Probe with single items until a run time has been measured
+            return 1
+        remaining = len(self.items) - self.next_index
+        cap = max(1, remaining // (self.executor.max_workers * CHUNK_SPREAD))
+        return max(1, min(int(TARGET_CHUNK_S / max(self.item_time, 1e-6)), cap))
+
+    def _wait_timeout(self) -> float | None:
+        deadlines = [d for _, _, d in self.pending.values() if d is not None]
+        return max(0.0, min(deadlines) - time.monotonic()) if deadlines else None
+
+    def _collect(self, future: Future) -> list[TaskResult]:
+        first, size, _ = self.pending.pop(future)
+        try:
+            outcomes = future.result()
+        except (CancelledError, Exception) as e:  # e.g. unpicklable result, broken pool
+            return [TaskResult(first + i, error=e) for i in range(size)]
+
+        durations = [duration for _, error, duration in outcomes if error is None]
+        if durations:
+            mean = sum(durations) / len(durations)
+            self.item_time = mean if self.item_time is None else 0.5 * (self.item_time + mean)
+        return [
+            TaskResult(first + i, value, error, duration)
+            for i, (value, error, duration) in enumerate(outcomes)
+        ]
+
+    def _expire(self) -> list[TaskResult]:
+        now = time.monotonic()
+        results = []
+        for future, (first, size, deadline) in list(self.pending.items()):
+            if deadline is not None and now >= deadline and not future.done():
+                if not future.cancel():
+                    self.abandoned = True
+                del self.pending[future]
+                error = TimeoutError(f"Task timed out after {self.executor.timeout}s")
+                results.extend(TaskResult(first + i, error=error) for i in range(size))
+                metric_counter("parallel.timeouts")(size)
+        return results
+
+    def _cancel_all(self) -> list[TaskResult]:
+        results = []
+        for first, size, _ in self.pending.values():
+            results.extend(TaskResult(first + i, error=CancelledError()) for i in range(size))
+        self.cancel_pending()
+        results.extend(
+            TaskResult(i, error=CancelledError()) for i in range(self.next_index, len(self.items))
+        )
+        self.next_index = len(self.items)
+        metric_counter("parallel.cancelled")(len(results))
+        return results
+
+    def cancel_pending(self) -> None:
+        for future in self.pending:
+            future.cancel()
+        self.pending.clear()
+
+    def close(self) -> None:
+        """Cancel queued work and release the pool if it is this call's own."""
+        self.cancel_pending()
+        if self.owns_pool and self.pool is not None:
+            close_pool(self.pool, abandoned=self.abandoned)
+            if self.abandoned:
+                metric_counter("parallel.pools_retired")(1)
+
+    def _emit(self, results: list[TaskResult]) -> Iterator[TaskResult]:
+        if not self.ordered:
+            yield from results
+            return
+        for result in results:
+            self.buffer[result.index] = result
+        while self.next_to_yield in self.buffer:
+            yield self.buffer.pop(self.next_to_yield)
+            self.next_to_yield += 1
@@ -0,0 +1,439 @@
+"""Durable Raft log stored in segment files.
+
+Entries are appended to the active segment as length-prefixed, CRC-checked
+JSON records. ``append`` only writes to the file buffer; ``sync`` flushes
+and fsyncs everything appended so far, and concurrent ``wait_durable``
+callers share a single fsync (group commit). Segments roll over at
+``segment_bytes``.
+
+``compact`` writes a snapshot of the state machine and deletes the segments
+it covers. On open, the snapshot is loaded and the segments replayed; a torn
+record at the tail is truncated away. The current term and vote are kept in
+a separate metadata file.
+
+Indexes are absolute and start at 1: ``log[i]`` is the entry with index
+``i``, ``log[log.snapshot_index]`` is a placeholder carrying the snapshot's
+term (index 0 before any snapshot), and ``len(log)`` is the next index to
+append. Without a directory the log is kept in memory only.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import struct
+import threading
+import time
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Any
+
+from specify_cli.core.telemetry import metric_counter, metric_histogram
+
+# Record header: payload length, CRC32 of the payload
+_RECORD = struct.Struct(">II")
+
+SEGMENT_BYTES = 64 * 1024 * 1024
+SNAPSHOT_FILE = "snapshot.json"
+META_FILE = "meta.json"
+
+
+@dataclass
+class LogEntry:
+    """Entry in distributed log."""
+
+    index: int
+    term: int
+    command: str
+    data: dict[str, Any] = field(default_factory=dict)
+    timestamp: float = field(default_factory=time.time)
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary."""
+        return {
+            "index": self.index,
+            "term": self.term,
+            "command": self.command,
+            "data": self.data,
+            "timestamp": self.timestamp,
+        }
+
+
+@dataclass
+class _Segment:
+    first_index: int
+    path: Path
+    # File offset of each entry's record
+    offsets: list[int] = field(default_factory=list)
+    size: int = 0
+
+
+def _segment_path(directory: Path, first_index: int) -> Path:
+    return directory / f"segment-{first_index:020d}.log"
+
+
+def _encode(entry: LogEntry) -> bytes:
+    payload = json.dumps(entry.to_dict(), separators=(",", ":")).encode()
+    return _RECORD.pack(len(payload), zlib.crc32(payload)) + payload
+
+
+def _write_atomic(path: Path, data: dict[str, Any]) -> None:
+    """Replace ``path`` with ``data`` so that a crash leaves old or new content."""
+    tmp = path.with_suffix(".tmp")
+    with tmp.open("w", encoding="utf-8") as f:
+        json.dump(data, f)
+        f.flush()
+        os.fsync(f.fileno())
+    tmp.replace(path)
+    _fsync_dir(path.parent)
+
+
+def _fsync_dir(directory: Path) -> None:
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class RaftLog:
+    """Raft log indexed by absolute entry index, optionally backed by disk."""
+
+    def __init__(self, directory: str | Path | None = None, segment_bytes: int = SEGMENT_BYTES):
+        self.directory = Path(directory) if directory is not None else None
+        self.segment_bytes = segment_bytes
+        self.snapshot_index = 0
+        self.snapshot_term = 0
+        self.snapshot_state: dict[str, Any] | None = None
+        self.term = 0
+        self.voted_for: str | None = None
+
+        # Entries after snapshot_index
+        self._entries: list[LogEntry] = []
+        self._segments: list[_Segment] = []
+        self._file: IO[bytes] | None = None
+        # Files no longer written to, awaiting a final fsync
+        self._retired: list[IO[bytes]] = []
+        self._cond = threading.Condition()
+        # Bumped when entries are removed, so an fsync in flight does not
+        # mark re-appended entries durable
+        self._generation = 0
+        self._syncing = False
+        self._synced_index = 0
+
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._load()
+        self._synced_index = self.last_index
+
+    # ------------------------------------------------------------------ #
+    # Sequence protocol                                                  #
+    # ------------------------------------------------------------------ #
+
+    def __len__(self) -> int:
+        return self.last_index + 1
+
+    def __getitem__(self, index: int) -> LogEntry:
+        if index < 0:
+            index += len(self)
+        if index == self.snapshot_index:
+            return LogEntry(index=index, term=self.snapshot_term, command="", timestamp=0.0)
+        if index < self.snapshot_index:
+            raise IndexError(f"Entry {index} was compacted into the snapshot")
+        try:
+            return self._entries[index - self.snapshot_index - 1]
+        except IndexError:
+            raise IndexError(f"No entry {index} (last is {self.last_index})") from None
+
+    def __iter__(self):
+        return iter(list(self._entries))
+
+    @property
+    def last_index(self) -> int:
+        return self.snapshot_index + len(self._entries)
+
+    @property
+    def last_term(self) -> int:
+        return self._entries[-1].term if self._entries else self.snapshot_term
+
+    @property
+    def durable_index(self) -> int:
+        """Last index known to be on disk."""
+        return self._synced_index
+
+    def term_at(self, index: int) -> int:
+        return self[index].term
+
+    def entries_from(self, start: int, max_count: int) -> list[LogEntry]:
+        """Up to ``max_count`` entries starting at index ``start``."""
+        offset = start - self.snapshot_index - 1
+        if offset < 0:
+            raise IndexError(f"Entry {start} was compacted into the snapshot")
+        return self._entries[offset : offset + max_count]
+
+    # ------------------------------------------------------------------ #
+    # Writes                                                             #
+    # ------------------------------------------------------------------ #
+
+    def append(self, entry: LogEntry) -> None:
+        self.extend([entry])
+
+    def extend(self, entries: list[LogEntry]) -> None:
+        """Append entries; they reach disk on the next ``sync``."""
+        with self._cond:
+            for entry in entries:
+                if entry.index != self.last_index + 1:
+                    raise ValueError(f"Expected index {self.last_index + 1}, got {entry.index}")
+                if self.directory is not None:
+                    self._write(entry)
+                self._entries.append(entry)
+            if self.directory is None:
+                self._synced_index = self.last_index
+
+    def _write(self, entry: LogEntry) -> None:
+        record = _encode(entry)
+        segment = self._segments[-1] if self._segments else None
+        if segment is None or (segment.offsets and segment.size + len(record) > self.segment_bytes):
+            segment = self._roll(entry.index)
+        assert self._file is not None
+        self._file.write(record)
+        segment.offsets.append(segment.size)
+        segment.size += len(record)
+
+    def _roll(self, first_index: int) -> _Segment:
+        assert self.directory is not None
+        self._retire_file()
+        segment = _Segment(first_index, _segment_path(self.directory, first_index))
+        self._file = segment.path.open("ab")
+        self._segments.append(segment)
+        _fsync_dir(self.directory)
+        metric_counter("raft_log.segments_rolled")(1)
+        return segment
+
+    def _retire_file(self) -> None:
+        """Stop writing to the active file; the next ``sync`` fsyncs and closes it."""
+        if self._file is not None:
+            self._retired.append(self._file)
+            self._file = None
+
+    def sync(self) -> int:
+        """Flush and fsync everything appended so far; returns the durable index."""
+        with self._cond:
+            while self._syncing:
+                self._cond.wait()
+            target = self.last_index
+            retired, self._retired = self._retired, []
+            files = retired + ([self._file] if self._file is not None else [])
+            if not files or (self._synced_index >= target and not retired):
+                self._synced_index = max(self._synced_index, target)
+                return self._synced_index
+            self._syncing = True
+            generation = self._generation
+            for f in files:
+                f.flush()
+
+        start = time.perf_counter()
+        try:
+            # Outside the lock, so appends continue during the fsync
+            for f in files:
+                os.fsync(f.fileno())
+        finally:
+            for f in retired:
+                f.close()
+            with self._cond:
+                self._syncing = False
+                if generation == self._generation:
+                    self._synced_index = max(self._synced_index, target)
+                self._cond.notify_all()
+        metric_histogram("raft_log.fsync")(time.perf_counter() - start)
+        return target
+
+    def wait_durable(self, index: int) -> None:
+        """Block until entry ``index`` is on disk, sharing fsyncs with other callers."""
+        while True:
+            with self._cond:
+                if self._synced_index >= index or index > self.last_index:
+                    return
+                if self._syncing:
+                    self._cond.wait()
+                    continue
+            self.sync()
+
+    def truncate_from(self, index: int) -> None:
+        """Drop entry ``index`` and everything after it."""
+        with self._cond:
+            if index <= self.snapshot_index:
+                raise ValueError(f"Cannot truncate snapshot entries ({index})")
+            if index > self.last_index:
+                return
+            # A sync in flight closes the retired files when it finishes
+            while self._syncing:
+                self._cond.wait()
+            del self._entries[index - self.snapshot_index - 1 :]
+            self._synced_index = min(self._synced_index, self.last_index)
+            self._generation += 1
+            if self.directory is None:
+                return
+
+            # Push buffered records to the files first, so nothing written
+            # later lands past the truncation point
+            for f in [*self._retired, *([self._file] if self._file is not None else [])]:
+                f.flush()
+            active = self._segments[-1] if self._file is not None else None
+            while self._segments and self._segments[-1].first_index >= index:
+                self._segments.pop().path.unlink(missing_ok=True)
+            if self._segments:
+                segment = self._segments[-1]
+                keep = index - segment.first_index
+                if keep < len(segment.offsets):
+                    segment.size = segment.offsets[keep]
+                    del segment.offsets[keep:]
+                if segment is not active:
+                    self._retire_file()
+                    self._file = segment.path.open("ab")
+                self._file.truncate(segment.size)
+            else:
+                self._retire_file()
+            metric_counter("raft_log.truncations")(1)
+
+    # ------------------------------------------------------------------ #
+    # Snapshots and metadata                                             #
+    # ------------------------------------------------------------------ #
+
+    def compact(self, index: int, term: int, state: dict[str, Any]) -> None:
+        """Store a snapshot covering entries up to ``index`` and drop them."""
+        with self._cond:
+            if index <= self.snapshot_index:
+                return
+            if index > self.last_index:
+                raise ValueError(f"Cannot snapshot past the last entry ({index})")
+            dropped = index - self.snapshot_index
+            self._set_snapshot(index, term, state)
+            del self._entries[:dropped]
+            if self.directory is not None:
+                self._delete_segments(up_to=index)
+
+    def install_snapshot(self, index: int, term: int, state: dict[str, Any]) -> None:
+        """Adopt a leader's snapshot, keeping any entries that follow it."""
+        with self._cond:
+            if index <= self.snapshot_index:
+                return
+            keep: list[LogEntry] = []
+            if index < self.last_index and self.term_at(index) == term:
+                keep = self._entries[index - self.snapshot_index :]
+            self._set_snapshot(index, term, state)
+            self._entries = []
+            self._synced_index = index
+            self._generation += 1
+            if self.directory is not None:
+                self._delete_segments()
+            self.extend(keep)
+        self.sync()
+
+    def _set_snapshot(self, index: int, term: int, state: dict[str, Any]) -> None:
+        if self.directory is not None:
+            _write_atomic(
+                self.directory / SNAPSHOT_FILE,
+                {"last_index": index, "last_term": term, "state": state},
+            )
+        self.snapshot_index = index
+        self.snapshot_term = term
+        self.snapshot_state = state
+        metric_counter("raft_log.snapshots")(1)
+
+    def _delete_segments(self, up_to: int | None = None) -> None:
+        """Delete segments whose entries all have index <= ``up_to`` (all if None)."""
+        keep = []
+        for i, segment in enumerate(self._segments):
+            following = self._segments[i + 1] if i + 1 < len(self._segments) else None
+            if up_to is None or (following is not None and following.first_index <= up_to + 1):
+                if following is None:
+                    self._retire_file()
+                segment.path.unlink(missing_ok=True)
+            else:
+                keep.append(segment)
+        self._segments = keep
+
+    def save_meta(self, term: int, voted_for: str | None) -> None:
+        """Persist the current term and vote."""
+        if (term, voted_for) == (self.term, self.voted_for):
+            return
+        self.term, self.voted_for = term, voted_for
+        if self.directory is not None:
+            _write_atomic(self.directory / META_FILE, {"term": term, "voted_for": voted_for})
+
+    def close(self) -> None:
+        self.sync()
+        with self._cond:
+            self._retire_file()
+            for f in self._retired:
+                f.close()
+            self._retired = []
+
+    # ------------------------------------------------------------------ #
+    # Recovery                                                           #
+    # ------------------------------------------------------------------ #
+
+    def _load(self) -> None:
+        assert self.directory is not None
+        snapshot = self.directory / SNAPSHOT_FILE
+        if snapshot.exists():
+            data = json.loads(snapshot.read_text(encoding="utf-8"))
+            self.snapshot_index = data["last_index"]
+            self.snapshot_term = data["last_term"]
+            self.snapshot_state = data["state"]
+        meta = self.directory / META_FILE
+        if meta.exists():
+            data = json.loads(meta.read_text(encoding="utf-8"))
+            self.term, self.voted_for = data["term"], data["voted_for"]
+
+        paths = sorted(self.directory.glob("segment-*.log"))
+        for position, path in enumerate(paths):
+            segment = _Segment(int(path.stem.split("-")[1]), path)
+            intact = self._replay(segment)
+            self._segments.append(segment)
+            if not intact:
+                # Everything after a damaged record is unreliable
+                for stale in paths[position + 1 :]:
+                    stale.unlink()
+                break
+        if self._segments:
+            self._file = self._segments[-1].path.open("ab")
+
+    def _replay(self, segment: _Segment) -> bool:
+        """Read a segment's records; truncate at the first bad one."""
+        data = segment.path.read_bytes()
+        offset = 0
+        intact = True
+        while offset < len(data):
+            header = data[offset : offset + _RECORD.size]
+            if len(header) < _RECORD.size:
+                intact = False
+                break
+            length, crc = _RECORD.unpack(header)
+            payload = data[offset + _RECORD.size : offset + _RECORD.size + length]
+            # A zero-filled gap passes the CRC check with length 0
+            if length == 0 or len(payload) < length or zlib.crc32(payload) != crc:
+                intact = False
+                break
+            try:
+                entry = LogEntry(**json.loads(payload))
+            except (ValueError, TypeError):
+                intact = False
+                break
+            if entry.index > self.last_index + 1:
+                intact = False
+                break
+            segment.offsets.append(offset)
+            if entry.index == self.last_index + 1:
+                self._entries.append(entry)
+            offset += _RECORD.size + length
+
+        segment.size = offset
+        if not intact:
+            with segment.path.open("r+b") as f:
+                f.truncate(offset)
+                os.fsync(f.fileno())
+            metric_counter("raft_log.torn_records")(1)
+        return intact
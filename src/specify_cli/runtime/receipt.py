@@ -80,6 +80,8 @@ class Receipt:
 def sha256_file(path: Path) -> str:
     """Compute SHA256 hash of file contents.
 
+    The file is hashed in blocks rather than read into memory at once.
+
     Parameters
     ----------
     path : Path
@@ -90,7 +92,8 @@ def sha256_file(path: Path) -> str:
     str
         Hexadecimal SHA256 hash
     """
-    return hashlib.sha256(path.read_bytes()).hexdigest()
+    with path.open("rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
 
 
 def sha256_string(content: str) -> str:
@@ -113,6 +116,8 @@ def generate_receipt(
     input_file: Path,
     output_file: Path,
     stage_outputs: dict[str, str],
+    stage_hashes: dict[str, str] | None = None,
+    output_hash: str | None = None,
 ) -> Receipt:
     """Generate receipt proving output = μ(input).
 
@@ -124,33 +129,45 @@ def generate_receipt(
         Generated output file (Markdown or Python)
     stage_outputs : dict[str, str]
         Intermediate outputs from each μ stage
+    stage_hashes : dict[str, str] | None, optional
+        Output hashes of stages already hashed while streaming (used for
+        stages missing from ``stage_outputs``)
+    output_hash : str | None, optional
+        SHA256 of the output file if computed while writing it; the file is
+        hashed otherwise
 
     Returns
     -------
     Receipt
         Cryptographic proof of transformation
     """
+    stage_hashes = stage_hashes or {}
+    input_hash = sha256_file(input_file)
     stages = []
-    prev_hash = sha256_file(input_file)
+    prev_hash = input_hash
 
     for stage_name in ["normalize", "extract", "emit", "canonicalize"]:
         if stage_name in stage_outputs:
-            output_hash = sha256_string(stage_outputs[stage_name])
-            stages.append(
-                StageHash(
-                    stage=stage_name,
-                    input_hash=prev_hash,
-                    output_hash=output_hash,
-                )
+            stage_output_hash = sha256_string(stage_outputs[stage_name])
+        elif stage_name in stage_hashes:
+            stage_output_hash = stage_hashes[stage_name]
+        else:
+            continue
+        stages.append(
+            StageHash(
+                stage=stage_name,
+                input_hash=prev_hash,
+                output_hash=stage_output_hash,
             )
-            prev_hash = output_hash
+        )
+        prev_hash = stage_output_hash
 
     return Receipt(
         timestamp=datetime.now(UTC).isoformat(),
         input_file=str(input_file),
         output_file=str(output_file),
-        input_hash=sha256_file(input_file),
-        output_hash=sha256_file(output_file),
+        input_hash=input_hash,
+        output_hash=output_hash or sha256_file(output_file),
         stages=stages,
         idempotent=False,  # Set after verification
     )
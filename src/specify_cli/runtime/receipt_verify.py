@@ -0,0 +1,424 @@
+"""
+specify_cli.runtime.receipt_verify - Batch Receipt Verification
+===============================================================
+
+Verifies many μ₅ receipts at once, e.g. every ``*.receipt.json`` in a
+monorepo, instead of calling :func:`specify_cli.runtime.receipt.verify_receipt`
+(two full SHA256 passes) per receipt.
+
+Key Features
+------------
+* **Hash database**: A persistent SQLite table maps
+  ``(path, size, mtime, inode)`` to the file's SHA256, so unchanged files
+  are not read again on the next run
+* **Shared hashing**: Each input/output file is hashed once, however many
+  receipts name it
+* **Parallel mmap hashing**: Cache misses are hashed on a thread pool from
+  memory-mapped files (hashlib releases the GIL while hashing)
+* **Report**: Per-receipt status (``ok``, ``drift``, ``missing``,
+  ``invalid``), counts and cache statistics; ``success`` is False on any
+  drift, for CI exit codes
+
+Examples
+--------
+    >>> from specify_cli.runtime.receipt_verify import verify_tree
+    >>> report = verify_tree(".", db_path=".ggen/hashes.db")
+    >>> report.success
+    True
+    >>> report.summary()
+    {'receipts': 1204, 'ok': 1204, 'drift': 0, ..., 'cache_hits': 2408}
+
+Notes
+-----
+Relative paths in a receipt are resolved against the project that wrote it:
+the nearest directory above the receipt holding a ``ggen.toml``. Receipts
+outside any project resolve against the verification root.
+
+Files modified within the last ``RACY_WINDOW_S`` seconds are hashed but not
+stored, so a write that lands within the timestamp granularity of the
+recorded mtime cannot be mistaken for an unchanged file.
+
+See Also
+--------
+- :mod:`specify_cli.runtime.receipt` : Receipt generation
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import os
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from specify_cli.core.instrumentation import add_span_event
+from specify_cli.core.telemetry import metric_counter, metric_histogram, span
+from specify_cli.ops.ggen_manifest import DEFAULT_EXCLUDE_DIRS
+
+__all__ = [
+    "HashDatabase",
+    "ReceiptCheck",
+    "VerificationReport",
+    "find_receipts",
+    "hash_file_mmap",
+    "verify_receipts",
+    "verify_tree",
+]
+
+RECEIPT_SUFFIX = ".receipt.json"
+MANIFEST_NAME = "ggen.toml"
+DEFAULT_DB_PATH = Path(".ggen") / "hashes.db"
+RACY_WINDOW_S = 2.0
+
+# Statuses in report order
+STATUSES = ("ok", "drift", "missing", "invalid")
+
+
+def hash_file_mmap(path: Path) -> str:
+    """SHA256 of a file, read through a memory mapping.
+
+    Parameters
+    ----------
+    path : Path
+        File to hash.
+
+    Returns
+    -------
+    str
+        Hexadecimal SHA256 hash.
+    """
+    with path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # Empty files cannot be mapped
+            return hashlib.sha256(b"").hexdigest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return hashlib.sha256(mapped).hexdigest()
+
+
+class HashDatabase:
+    """Persistent ``(path, size, mtime, inode) -> sha256`` table.
+
+    Parameters
+    ----------
+    db_path : str | Path
+        SQLite database file (created with its directory if missing).
+    """
+
+    def __init__(self, db_path: str | Path = DEFAULT_DB_PATH) -> None:
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._init_db()
+
+    def _init_db(self) -> None:
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS file_hashes (
+                    path TEXT PRIMARY KEY,
+                    size INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    inode INTEGER NOT NULL,
+                    sha256 TEXT NOT NULL
+                )
+            """)
+            conn.commit()
+
+    def load(self) -> dict[str, tuple[int, int, int, str]]:
+        """Load every entry as ``path -> (size, mtime_ns, inode, sha256)``."""
+        with sqlite3.connect(self.db_path) as conn:
+            rows = conn.execute(
+                "SELECT path, size, mtime_ns, inode, sha256 FROM file_hashes"
+            ).fetchall()
+        return {row[0]: (row[1], row[2], row[3], row[4]) for row in rows}
+
+    def store(self, entries: list[tuple[str, int, int, int, str]]) -> None:
+        """Insert or replace ``(path, size, mtime_ns, inode, sha256)`` rows."""
+        if not entries:
+            return
+        with sqlite3.connect(self.db_path) as conn:
+            conn.executemany(
+                """
+                INSERT OR REPLACE INTO file_hashes (path, size, mtime_ns, inode, sha256)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                entries,
+            )
+            conn.commit()
+
+
+@dataclass
+class ReceiptCheck:
+    """Verification outcome of one receipt.
+
+    Attributes
+    ----------
+    receipt_path : str
+        Path to the receipt file.
+    status : str
+        "ok", "drift" (a hash changed), "missing" (input or output gone)
+        or "invalid" (receipt unreadable).
+    changed : list[str]
+        Which of "input"/"output" changed or are missing.
+    error : str | None
+        Error message for invalid receipts.
+    """
+
+    receipt_path: str
+    status: str
+    changed: list[str] = field(default_factory=list)
+    error: str | None = None
+
+
+@dataclass
+class VerificationReport:
+    """Result of a batch verification.
+
+    Attributes
+    ----------
+    checks : list[ReceiptCheck]
+        One entry per receipt, in input order.
+    files_hashed : int
+        Files read and hashed in this run.
+    cache_hits : int
+        Files whose hash came from the database.
+    duration_ms : float
+        Wall time.
+    """
+
+    checks: list[ReceiptCheck] = field(default_factory=list)
+    files_hashed: int = 0
+    cache_hits: int = 0
+    duration_ms: float = 0.0
+
+    @property
+    def success(self) -> bool:
+        """Whether every receipt verified."""
+        return all(c.status == "ok" for c in self.checks)
+
+    @property
+    def failures(self) -> list[ReceiptCheck]:
+        """Receipts that did not verify."""
+        return [c for c in self.checks if c.status != "ok"]
+
+    def summary(self) -> dict[str, Any]:
+        """Counts per status plus hashing statistics."""
+        counts = dict.fromkeys(STATUSES, 0)
+        for check in self.checks:
+            counts[check.status] += 1
+        return {
+            "receipts": len(self.checks),
+            **counts,
+            "files_hashed": self.files_hashed,
+            "cache_hits": self.cache_hits,
+            "duration_ms": self.duration_ms,
+        }
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        return {
+            "success": self.success,
+            "summary": self.summary(),
+            "failures": [
+                {
+                    "receipt": c.receipt_path,
+                    "status": c.status,
+                    "changed": c.changed,
+                    "error": c.error,
+                }
+                for c in self.failures
+            ],
+        }
+
+
+def find_receipts(root: str | Path) -> list[Path]:
+    """Find every ``*.receipt.json`` below ``root`` (sorted).
+
+    Directories in :data:`specify_cli.ops.ggen_manifest.DEFAULT_EXCLUDE_DIRS`
+    are skipped.
+    """
+    found = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in DEFAULT_EXCLUDE_DIRS]
+        found.extend(Path(dirpath) / name for name in filenames if name.endswith(RECEIPT_SUFFIX))
+    return sorted(found)
+
+
+def verify_receipts(
+    receipt_paths: list[Path],
+    db: HashDatabase | None = None,
+    max_workers: int | None = None,
+    base_dir: str | Path | None = None,
+) -> VerificationReport:
+    """Verify receipts against the current input and output files.
+
+    Parameters
+    ----------
+    receipt_paths : list[Path]
+        Receipt files to check.
+    db : HashDatabase | None, optional
+        Hash database. Without one every file is hashed.
+    max_workers : int | None, optional
+        Hashing threads. Default is ``os.cpu_count()``.
+    base_dir : str | Path | None, optional
+        Directory that relative paths in receipts outside any project (no
+        ``ggen.toml`` above them) are resolved against. Default is the
+        current directory.
+
+    Returns
+    -------
+    VerificationReport
+        Per-receipt results and statistics.
+    """
+    base = Path(base_dir) if base_dir is not None else Path.cwd()
+    workers = max(1, max_workers or os.cpu_count() or 1)
+
+    with span("receipt.verify_batch", receipts=len(receipt_paths), workers=workers):
+        start = time.time()
+        report = VerificationReport()
+
+        # Load receipts and collect every file they name
+        loaded: list[tuple[Path, dict[str, Any] | None, str | None]] = []
+        files: set[str] = set()
+        project_dirs: dict[Path, Path | None] = {}
+        for receipt_path in receipt_paths:
+            receipt_base = _project_dir(Path(receipt_path), project_dirs) or base
+            try:
+                data = json.loads(Path(receipt_path).read_text())
+                paths = {
+                    role: os.path.normpath(receipt_base / data[f"{role}_file"])
+                    for role in ("input", "output")
+                }
+                expected = {role: data[f"{role}_hash"] for role in ("input", "output")}
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                loaded.append((receipt_path, None, f"Invalid receipt: {e}"))
+                continue
+            files.update(paths.values())
+            loaded.append((receipt_path, {"paths": paths, "expected": expected}, None))
+
+        hashes = _hash_files(sorted(files), db, workers, report)
+
+        for receipt_path, entry, error in loaded:
+            if entry is None:
+                report.checks.append(ReceiptCheck(str(receipt_path), "invalid", error=error))
+                continue
+            missing = [role for role, path in entry["paths"].items() if hashes.get(path) is None]
+            changed = [
+                role
+                for role, path in entry["paths"].items()
+                if role not in missing and hashes[path] != entry["expected"][role]
+            ]
+            status = "missing" if missing else "drift" if changed else "ok"
+            report.checks.append(ReceiptCheck(str(receipt_path), status, missing + changed))
+
+        report.duration_ms = (time.time() - start) * 1000
+
+        summary = report.summary()
+        metric_histogram("receipt.verify_batch.duration")(report.duration_ms / 1000)
+        metric_counter("receipt.verify_batch.cache_hits")(report.cache_hits)
+        metric_counter("receipt.verify_batch.failed")(len(report.failures))
+        add_span_event("receipt.verify_batch.completed", summary)
+        return report
+
+
+def verify_tree(
+    root: str | Path = ".",
+    db_path: str | Path | None = DEFAULT_DB_PATH,
+    max_workers: int | None = None,
+) -> VerificationReport:
+    """Verify every receipt below ``root``.
+
+    Parameters
+    ----------
+    root : str | Path, optional
+        Directory to search. Relative paths in receipts resolve against the
+        receipt's project directory, or against ``root`` outside a project.
+    db_path : str | Path | None, optional
+        Hash database path, relative to ``root`` unless absolute. None
+        disables the database.
+    max_workers : int | None, optional
+        Hashing threads.
+
+    Returns
+    -------
+    VerificationReport
+        Per-receipt results and statistics.
+    """
+    root_path = Path(root)
+    db = HashDatabase(root_path / db_path) if db_path is not None else None
+    return verify_receipts(
+        find_receipts(root_path), db=db, max_workers=max_workers, base_dir=root_path
+    )
+
+
+def _project_dir(receipt_path: Path, known: dict[Path, Path | None]) -> Path | None:
+    """Nearest directory above ``receipt_path`` holding a manifest, memoized in ``known``."""
+    start = receipt_path.absolute().parent
+    visited = []
+    found = None
+    for directory in (start, *start.parents):
+        if directory in known:
+            found = known[directory]
+            break
+        visited.append(directory)
+        if (directory / MANIFEST_NAME).is_file():
+            found = directory
+            break
+    for directory in visited:
+        known[directory] = found
+    return found
+
+
+def _hash_files(
+    paths: list[str],
+    db: HashDatabase | None,
+    workers: int,
+    report: VerificationReport,
+) -> dict[str, str | None]:
+    """Hash ``paths`` (None for missing files), using and updating ``db``."""
+    known = db.load() if db is not None else {}
+    hashes: dict[str, str | None] = {}
+    stats: dict[str, os.stat_result] = {}
+    to_hash: list[str] = []
+
+    for path in paths:
+        try:
+            st = Path(path).stat()
+        except OSError:
+            hashes[path] = None
+            continue
+        stats[path] = st
+        cached = known.get(path)
+        if cached is not None and cached[:3] == (st.st_size, st.st_mtime_ns, st.st_ino):
+            hashes[path] = cached[3]
+            report.cache_hits += 1
+        else:
+            to_hash.append(path)
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="receipt-hash") as pool:
+        for path, digest in zip(to_hash, pool.map(_hash_or_none, to_hash), strict=True):
+            hashes[path] = digest
+    report.files_hashed = len(to_hash)
+
+    if db is not None:
+        racy_after = time.time_ns() - int(RACY_WINDOW_S * 1e9)
+        db.store(
+            [
+                (path, st.st_size, st.st_mtime_ns, st.st_ino, digest)
+                for path in to_hash
+                if (digest := hashes[path]) is not None
+                and (st := stats[path]).st_mtime_ns < racy_after
+            ]
+        )
+    return hashes
+
+
+def _hash_or_none(path: str) -> str | None:
+    """Hash a file, or None if it disappeared."""
+    try:
+        return hash_file_mmap(Path(path))
+    except OSError:
+        return None
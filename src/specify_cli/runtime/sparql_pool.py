@@ -0,0 +1,518 @@
+"""
+specify_cli.runtime.sparql_pool - Process-Isolated SPARQL Execution
+===================================================================
+
+Pool of SPARQL worker processes with real cancellation.
+
+:func:`specify_cli.ops.ggen_timeout.execute_with_timeout` runs the query in
+a daemon thread and raises on timeout, but a runaway query keeps burning a
+core in the background because threads cannot be killed. Queries here run in
+worker processes instead:
+
+Key Features
+-----------
+* **Real cancellation**: On timeout the worker is terminated (then killed)
+  and a fresh worker is spawned in its place
+* **Warm graphs**: Each worker keeps its own graph cache, so repeated queries
+  over the same ontology files parse them once per worker
+* **Streaming**: SELECT rows are sent back in chunks as they are produced
+  rather than as one large result dict
+* **Memory limits**: Each query runs under a ``resource.setrlimit``
+  address-space limit (headroom on top of the worker's current size);
+  exceeding it fails the query and replaces the worker, not the pipeline
+* **Thread Safety**: Any number of threads can share one pool; each query
+  checks out one idle worker
+
+Examples
+--------
+    >>> from specify_cli.runtime.sparql_pool import SPARQLWorkerPool
+    >>> with SPARQLWorkerPool(size=2, memory_limit_mb=512) as pool:
+    ...     result = pool.execute(["ontology/spec.ttl"], query, timeout=10)
+    ...     for chunk in pool.stream(["ontology/spec.ttl"], query, chunk_size=1000):
+    ...         process(chunk)
+    ...     run_manifest("ggen.toml", sparql_pool=pool)  # μ₂ EXTRACT in workers
+
+See Also
+--------
+- :mod:`specify_cli.runtime.ggen_scheduler` : ``run_rules(..., sparql_pool=pool)``
+- :mod:`specify_cli.ops.ggen_timeout` : Timeout errors
+- :mod:`specify_cli.runtime.graph_cache` : Parsed graph reuse
+"""
+
+from __future__ import annotations
+
+import contextlib
+import multiprocessing
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from specify_cli.core.instrumentation import add_span_event
+from specify_cli.core.telemetry import metric_counter, metric_histogram, span
+from specify_cli.ops.ggen_timeout import SPARQLTimeoutError
+
+try:
+    import resource
+
+    RESOURCE_AVAILABLE = True
+except ImportError:  # pragma: no cover - Windows
+    RESOURCE_AVAILABLE = False
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from multiprocessing.connection import Connection
+    from multiprocessing.process import BaseProcess
+
+__all__ = [
+    "SPARQLPoolStats",
+    "SPARQLStream",
+    "SPARQLWorkerError",
+    "SPARQLWorkerPool",
+]
+
+# Rows per chunk sent from a worker
+DEFAULT_CHUNK_SIZE = 500
+
+# Seconds a terminated worker gets before it is killed
+TERMINATE_GRACE_S = 1.0
+
+# Worker errors after which the worker is replaced
+_FATAL_WORKER_ERRORS = frozenset({"MemoryError", "SystemError"})
+
+
+class SPARQLWorkerError(Exception):
+    """A query failed inside a worker (or the worker died)."""
+
+    def __init__(self, message: str, error_type: str = "") -> None:
+        """Initialize worker error.
+
+        Parameters
+        ----------
+        message : str
+            Error message.
+        error_type : str, optional
+            Exception class name raised in the worker (e.g. "MemoryError").
+        """
+        super().__init__(message)
+        self.error_type = error_type
+
+
+# -----------------------------------------------------------------------------
+# Worker process
+# -----------------------------------------------------------------------------
+
+
+def _address_space_bytes() -> int:
+    """Current virtual memory size of this process (0 if unknown)."""
+    try:
+        with open("/proc/self/statm") as f:  # noqa: PTH123
+            pages = int(f.read().split()[0])
+    except (OSError, ValueError, IndexError):
+        return 0
+    return pages * resource.getpagesize()
+
+
+def _set_memory_limit(headroom_bytes: int | None) -> None:
+    """Limit further address-space growth of this process (None lifts it)."""
+    if not RESOURCE_AVAILABLE:
+        return
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    soft = (
+        resource.RLIM_INFINITY
+        if headroom_bytes is None
+        else _address_space_bytes() + headroom_bytes
+    )
+    if hard != resource.RLIM_INFINITY and (soft == resource.RLIM_INFINITY or soft > hard):
+        soft = hard
+    resource.setrlimit(resource.RLIMIT_AS, (soft, hard))
+
+
+def _worker_main(conn: Connection) -> None:
+    """Serve query requests until the parent closes the connection."""
+    from specify_cli.runtime.ggen import _iter_sparql_rows  # noqa: PLC0415
+    from specify_cli.runtime.graph_cache import get_graph_cache  # noqa: PLC0415
+
+    while True:
+        try:
+            request = conn.recv()
+        except (EOFError, OSError):
+            return
+        if request is None:
+            return
+
+        input_files, query, chunk_size, memory_limit = request
+        try:
+            parsed = get_graph_cache().load(input_files)
+            _set_memory_limit(memory_limit)
+            try:
+                variables: list[str] = []
+                rows = _iter_sparql_rows(parsed.graph, query, variables)
+                chunk: list[dict[str, Any]] = []
+                sent_vars = False
+                for row in rows:
+                    if not sent_vars:
+                        conn.send(("vars", variables))
+                        sent_vars = True
+                    chunk.append(row)
+                    if len(chunk) >= chunk_size:
+                        conn.send(("rows", chunk))
+                        chunk = []
+                if not sent_vars:
+                    conn.send(("vars", variables))
+                if chunk:
+                    conn.send(("rows", chunk))
+            finally:
+                _set_memory_limit(None)
+            conn.send(("done", None))
+        except BaseException as e:
+            # Report everything (including MemoryError) to the parent
+            try:
+                conn.send(("error", (type(e).__name__, str(e))))
+            except (OSError, ValueError):
+                return
+
+
+# -----------------------------------------------------------------------------
+# Pool
+# -----------------------------------------------------------------------------
+
+
+@dataclass
+class _Worker:
+    """Handle to one worker process."""
+
+    process: BaseProcess
+    conn: Connection
+    queries: int = 0
+
+
+@dataclass
+class SPARQLPoolStats:
+    """Pool statistics.
+
+    Attributes
+    ----------
+    queries : int
+        Queries completed.
+    timeouts : int
+        Queries cancelled by timeout.
+    errors : int
+        Queries that failed in the worker.
+    respawns : int
+        Workers terminated and replaced.
+    """
+
+    queries: int = 0
+    timeouts: int = 0
+    errors: int = 0
+    respawns: int = 0
+
+
+@dataclass
+class SPARQLStream:
+    """Chunked result stream of one query.
+
+    Iterate to receive lists of rows. ``vars`` is set once the first
+    message arrives. Closing the stream early cancels the query.
+
+    Attributes
+    ----------
+    vars : list[str]
+        Projected variable names.
+    count : int
+        Rows received so far.
+    """
+
+    _chunks: Iterator[list[dict[str, Any]]]
+    vars: list[str] = field(default_factory=list)
+    count: int = 0
+
+    def __iter__(self) -> Iterator[list[dict[str, Any]]]:
+        """Iterate over row chunks."""
+        return self._chunks
+
+    def close(self) -> None:
+        """Stop receiving (cancels the query if it is still running)."""
+        close = getattr(self._chunks, "close", None)
+        if close is not None:
+            close()
+
+
+class SPARQLWorkerPool:
+    """Pool of killable SPARQL worker processes.
+
+    Parameters
+    ----------
+    size : int, optional
+        Number of worker processes. Default is 2.
+    timeout : float, optional
+        Default per-query timeout in seconds (0 = none). Default is 30.
+    memory_limit_mb : int | None, optional
+        Default per-query memory limit: address space the query may add to
+        the worker (``RLIMIT_AS``). Default is no limit.
+    chunk_size : int, optional
+        Default rows per streamed chunk. Default is 500.
+    start_method : str, optional
+        multiprocessing start method. Default is "spawn" (safe with threads).
+    """
+
+    def __init__(
+        self,
+        size: int = 2,
+        timeout: float = 30,
+        memory_limit_mb: int | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        start_method: str = "spawn",
+    ) -> None:
+        """Initialize pool and start workers."""
+        if size < 1:
+            raise ValueError("Pool size must be at least 1")
+        self.size = size
+        self.timeout = timeout
+        self.memory_limit_mb = memory_limit_mb
+        self.chunk_size = chunk_size
+        self.stats = SPARQLPoolStats()
+        self._ctx = multiprocessing.get_context(start_method)
+        self._idle: list[_Worker] = []
+        self._all: list[_Worker] = []
+        self._cond = threading.Condition()
+        self._closed = False
+        for _ in range(size):
+            worker = self._spawn()
+            self._idle.append(worker)
+
+    # -------------------------------------------------------------------------
+    # Public API
+    # -------------------------------------------------------------------------
+
+    def stream(
+        self,
+        input_files: list[str],
+        query: str,
+        timeout: float | None = None,
+        memory_limit_mb: int | None = None,
+        chunk_size: int | None = None,
+    ) -> SPARQLStream:
+        """Run a query and stream its rows in chunks.
+
+        The timeout covers the whole query, including time the caller spends
+        between chunks.
+
+        Parameters
+        ----------
+        input_files : list[str]
+            RDF files forming the queried graph (parsed once per worker).
+        query : str
+            SPARQL SELECT query.
+        timeout : float | None, optional
+            Seconds before the worker is killed. Default is the pool timeout.
+        memory_limit_mb : int | None, optional
+            Memory headroom for the query in MB. Default is the pool limit.
+        chunk_size : int | None, optional
+            Rows per chunk. Default is the pool chunk size.
+
+        Returns
+        -------
+        SPARQLStream
+            Iterable of row chunks.
+        """
+        stream = SPARQLStream(_chunks=iter(()))
+        stream._chunks = self._run(  # noqa: SLF001
+            stream,
+            list(input_files),
+            query,
+            self.timeout if timeout is None else timeout,
+            self.memory_limit_mb if memory_limit_mb is None else memory_limit_mb,
+            chunk_size or self.chunk_size,
+        )
+        return stream
+
+    def execute(
+        self,
+        input_files: list[str],
+        query: str,
+        timeout: float | None = None,
+        memory_limit_mb: int | None = None,
+    ) -> dict[str, Any]:
+        """Run a query and collect all rows.
+
+        Parameters
+        ----------
+        input_files : list[str]
+            RDF files forming the queried graph.
+        query : str
+            SPARQL SELECT query.
+        timeout : float | None, optional
+            Seconds before the worker is killed.
+        memory_limit_mb : int | None, optional
+            Memory headroom for the query in MB.
+
+        Returns
+        -------
+        dict[str, Any]
+            ``{"results": [...], "count": n}`` like μ₂ EXTRACT.
+
+        Raises
+        ------
+        SPARQLTimeoutError
+            If the query exceeded the timeout (the worker was replaced).
+        SPARQLWorkerError
+            If the query failed or the worker died.
+        """
+        results: list[dict[str, Any]] = []
+        for chunk in self.stream(input_files, query, timeout, memory_limit_mb):
+            results.extend(chunk)
+        return {"results": results, "count": len(results)}
+
+    def close(self) -> None:
+        """Stop all workers."""
+        with self._cond:
+            self._closed = True
+            workers = list(self._all)
+            self._all.clear()
+            self._idle.clear()
+            self._cond.notify_all()
+        for worker in workers:
+            with contextlib.suppress(OSError, ValueError):
+                worker.conn.send(None)
+            worker.process.join(timeout=TERMINATE_GRACE_S)
+            if worker.process.is_alive():
+                self._terminate(worker)
+            worker.conn.close()
+
+    def __enter__(self) -> SPARQLWorkerPool:
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Context manager exit: stop workers."""
+        self.close()
+
+    # -------------------------------------------------------------------------
+    # Internals
+    # -------------------------------------------------------------------------
+
+    def _run(  # noqa: PLR0917
+        self,
+        stream: SPARQLStream,
+        input_files: list[str],
+        query: str,
+        timeout: float,
+        memory_limit_mb: int | None,
+        chunk_size: int,
+    ) -> Iterator[list[dict[str, Any]]]:
+        start = time.time()
+        deadline = start + timeout if timeout > 0 else None
+        memory_limit = memory_limit_mb * 1024 * 1024 if memory_limit_mb else None
+
+        with span("ggen.sparql_pool.query", query_length=len(query), timeout=timeout):
+            worker = self._checkout()
+            healthy = False
+            try:
+                worker.conn.send((input_files, query, chunk_size, memory_limit))
+                while True:
+                    kind, payload = self._receive(worker, deadline, timeout, query)
+                    if kind == "vars":
+                        stream.vars = payload
+                    elif kind == "rows":
+                        stream.count += len(payload)
+                        yield payload
+                    elif kind == "done":
+                        healthy = True
+                        break
+                    else:
+                        error_type, message = payload
+                        # After hitting the memory limit the interpreter may be
+                        # left inconsistent; other errors leave the worker fine
+                        healthy = error_type not in _FATAL_WORKER_ERRORS
+                        self.stats.errors += 1
+                        metric_counter("ggen.sparql_pool.error")(1)
+                        raise SPARQLWorkerError(f"{error_type}: {message}", error_type)
+            finally:
+                # Not finished cleanly: timeout, dead worker, or abandoned stream
+                if not healthy:
+                    worker = self._replace(worker)
+                self._checkin(worker)
+
+            self.stats.queries += 1
+            duration = time.time() - start
+            metric_histogram("ggen.sparql_pool.duration")(duration)
+            add_span_event(
+                "ggen.sparql_pool.completed",
+                {"rows": stream.count, "duration_ms": duration * 1000},
+            )
+
+    def _receive(
+        self,
+        worker: _Worker,
+        deadline: float | None,
+        timeout: float,
+        query: str,
+    ) -> tuple[str, Any]:
+        remaining = None if deadline is None else max(0.0, deadline - time.time())
+        if not worker.conn.poll(remaining):
+            self.stats.timeouts += 1
+            metric_counter("ggen.sparql_pool.timeout")(1)
+            raise SPARQLTimeoutError(timeout, query=query)
+        try:
+            message: tuple[str, Any] = worker.conn.recv()
+        except (EOFError, OSError) as e:
+            exitcode = worker.process.exitcode
+            raise SPARQLWorkerError(
+                f"SPARQL worker died (exit code {exitcode})", "WorkerDied"
+            ) from e
+        return message
+
+    def _spawn(self) -> _Worker:
+        parent_conn, child_conn = self._ctx.Pipe()
+        process = self._ctx.Process(
+            target=_worker_main,
+            args=(child_conn,),
+            name="sparql-worker",
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        worker = _Worker(process=process, conn=parent_conn)
+        with self._cond:
+            self._all.append(worker)
+        return worker
+
+    def _replace(self, worker: _Worker) -> _Worker:
+        self._terminate(worker)
+        worker.conn.close()
+        with self._cond:
+            if worker in self._all:
+                self._all.remove(worker)
+        self.stats.respawns += 1
+        metric_counter("ggen.sparql_pool.respawn")(1)
+        return self._spawn()
+
+    @staticmethod
+    def _terminate(worker: _Worker) -> None:
+        worker.process.terminate()
+        worker.process.join(timeout=TERMINATE_GRACE_S)
+        if worker.process.is_alive():
+            worker.process.kill()
+            worker.process.join()
+
+    def _checkout(self) -> _Worker:
+        with self._cond:
+            while not self._idle:
+                if self._closed:
+                    raise RuntimeError("SPARQL worker pool is closed")
+                self._cond.wait()
+            if self._closed:
+                raise RuntimeError("SPARQL worker pool is closed")
+            worker = self._idle.pop()
+            worker.queries += 1
+            return worker
+
+    def _checkin(self, worker: _Worker) -> None:
+        with self._cond:
+            if self._closed:
+                self._terminate(worker)
+                return
+            self._idle.append(worker)
+            self._cond.notify()
@@ -0,0 +1,203 @@
+"""
+specify_cli.runtime.sqlite_pool - Pooled SQLite Connections
+===========================================================
+
+Persistent SQLite connections and batched writes for the runtime stores
+(:mod:`specify_cli.runtime.state`, :mod:`specify_cli.runtime.database`).
+
+Key Features
+-----------
+* **Per-thread connections**: Each thread reuses one connection for the
+  lifetime of the pool instead of connecting per call; a forked child opens
+  its own
+* **WAL journal**: Readers do not block the writer, and with
+  ``synchronous=NORMAL`` a commit needs no fsync (the WAL is synced at
+  checkpoints), which is still safe against application crashes
+* **Prepared statements**: Statements are constant strings, so each
+  connection's statement cache compiles them once
+* **Write-behind**: :class:`WriteBehindQueue` hands rows to a writer thread
+  that inserts everything queued so far in one transaction (group commit);
+  ``flush`` waits until the rows queued before it are committed
+
+Examples
+--------
+    >>> pool = SQLitePool("executions.db")
+    >>> writer = WriteBehindQueue(pool, "INSERT INTO t (a, b) VALUES (?, ?)")
+    >>> writer.put((1, "x"))
+    >>> writer.flush()
+    >>> pool.connection().execute("SELECT count(*) FROM t").fetchone()
+    (1,)
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import sqlite3
+import threading
+from typing import TYPE_CHECKING, Any
+
+from specify_cli.core.telemetry import metric_counter, metric_histogram
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+    from pathlib import Path
+
+# Applied to every new connection
+PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=5000",
+)
+
+# Compiled statements kept per connection
+STATEMENT_CACHE_SIZE = 256
+
+# Rows inserted per write-behind transaction
+DEFAULT_BATCH_SIZE = 1000
+
+
+class SQLitePool:
+    """One persistent connection per thread to a SQLite database."""
+
+    def __init__(self, db_path: str | Path):
+        self.db_path = str(db_path)
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+    def connection(self) -> sqlite3.Connection:
+        """The calling thread's connection, opened on first use."""
+        if self._pid != os.getpid():
+            # Connections must not cross a fork; the child starts afresh
+            self._local = threading.local()
+            self._connections = []
+            self._pid = os.getpid()
+
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.db_path,
+                check_same_thread=False,
+                cached_statements=STATEMENT_CACHE_SIZE,
+            )
+            for pragma in PRAGMAS:
+                conn.execute(pragma)
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+            metric_counter("sqlite_pool.connections_opened")(1)
+        return conn
+
+    @contextlib.contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Commit on success, roll back on error."""
+        conn = self.connection()
+        with conn:
+            yield conn
+
+    def close(self) -> None:
+        """Close every thread's connection."""
+        with self._lock:
+            connections, self._connections = self._connections, []
+        self._local = threading.local()
+        for conn in connections:
+            conn.close()
+
+
+class WriteBehindQueue:
+    """Inserts rows from a background thread, many per transaction.
+
+    Rows are parameter tuples for ``statement``. A row that fails is dropped
+    and its error raised by the next ``flush``.
+    """
+
+    def __init__(self, pool: SQLitePool, statement: str, batch_size: int = DEFAULT_BATCH_SIZE):
+        self.pool = pool
+        self.statement = statement
+        self.batch_size = batch_size
+        self._rows: list[Sequence[Any]] = []
+        self._cond = threading.Condition()
+        self._queued = 0
+        self._committed = 0
+        self._error: Exception | None = None
+        self._closed = False
+        self._thread: threading.Thread | None = None
+
+    @property
+    def pending(self) -> int:
+        """Rows queued but not yet committed."""
+        return self._queued - self._committed
+
+    def put(self, row: Sequence[Any]) -> None:
+        """Queue a row for insertion."""
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Write-behind queue is closed")
+            self._rows.append(row)
+            self._queued += 1
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="sqlite-write-behind", daemon=True
+                )
+                self._thread.start()
+            self._cond.notify_all()
+
+    def flush(self) -> None:
+        """Wait until every row queued so far is committed."""
+        with self._cond:
+            target = self._queued
+            while self._committed < target:
+                self._cond.wait()
+            error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def close(self) -> None:
+        """Commit the remaining rows and stop the writer thread."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._rows and not self._closed:
+                    self._cond.wait()
+                if not self._rows:
+                    return
+                batch = self._rows[: self.batch_size]
+                del self._rows[: self.batch_size]
+
+            error = self._write(batch)
+            with self._cond:
+                self._committed += len(batch)
+                if error is not None and self._error is None:
+                    self._error = error
+                self._cond.notify_all()
+
+    def _write(self, batch: list[Sequence[Any]]) -> Exception | None:
+        """Insert the batch in one transaction, or row by row if that fails."""
+        try:
+            with self.pool.transaction() as conn:
+                conn.executemany(self.statement, batch)
+        except sqlite3.Error:
+            pass
+        else:
+            metric_histogram("sqlite_pool.batch_size", unit="1")(len(batch))
+            return None
+
+        # Isolate the failing rows so the rest of the batch is kept
+        first_error = None
+        for row in batch:
+            try:
+                with self.pool.transaction() as conn:
+                    conn.execute(self.statement, row)
+            except sqlite3.Error as e:
+                metric_counter("sqlite_pool.rows_failed")(1)
+                first_error = first_error or e
+        return first_error
@@ -1,14 +1,18 @@
 from __future__ import annotations
 
 import json
-import sqlite3
+import weakref
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from specify_cli.core.shell import timed
 from specify_cli.core.telemetry import metric_counter, span
+from specify_cli.runtime.sqlite_pool import SQLitePool, WriteBehindQueue
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
 
 
 @dataclass
@@ -25,14 +29,94 @@ class ExecutionState:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
+_COLUMNS = """execution_id, phase, status, start_time, end_time,
+               duration, input_data, output_data, errors, metadata"""
+
+_SAVE_SQL = """
+    INSERT OR REPLACE INTO executions
+    (execution_id, phase, status, start_time, end_time, duration,
+     input_data, output_data, errors, metadata)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# rowid breaks ties between rows created in the same second
+_NEWEST_FIRST = "ORDER BY created_at DESC, rowid DESC"
+
+# Duration percentiles reported by summarize_phases
+PERCENTILES = (50, 95, 99)
+
+# Rows fetched per round trip when streaming
+STREAM_BATCH_SIZE = 500
+
+
+def _summary_sql(where: str) -> str:
+    """Per-phase counts, durations and nearest-rank percentiles in one pass."""
+    # ceil(n * p / 100) in integer arithmetic
+    percentiles = ",\n".join(
+        f"MAX(CASE WHEN rn = (n * {p} + 99) / 100 THEN duration END)" for p in PERCENTILES
+    )
+    return f"""
+        WITH ranked AS (
+            SELECT phase, status, COALESCE(duration, 0.0) AS duration,
+                   ROW_NUMBER() OVER (PARTITION BY phase ORDER BY duration) AS rn,
+                   COUNT(*) OVER (PARTITION BY phase) AS n
+            FROM executions {where}
+        )
+        SELECT phase, COUNT(*), SUM(status = 'completed'), SUM(status = 'failed'),
+               TOTAL(duration), MAX(duration),
+               {percentiles}
+        FROM ranked GROUP BY phase ORDER BY phase
+    """
+
+
+_SUMMARY_SQL = _summary_sql("")
+_PHASE_SUMMARY_SQL = _summary_sql("WHERE phase = ?")
+
+_RECENT_SQL = f"""
+    SELECT execution_id, status, duration, COALESCE(json_array_length(errors), 0)
+    FROM executions WHERE phase = ? {_NEWEST_FIRST} LIMIT ?
+"""
+
+
+def _row_to_state(row: tuple) -> ExecutionState:
+    return ExecutionState(
+        execution_id=row[0],
+        phase=row[1],
+        status=row[2],
+        start_time=row[3],
+        end_time=row[4],
+        duration=row[5],
+        input_data=json.loads(row[6]) if row[6] else {},
+        output_data=json.loads(row[7]) if row[7] else {},
+        errors=json.loads(row[8]) if row[8] else [],
+        metadata=json.loads(row[9]) if row[9] else {},
+    )
+
+
 class StateStore:
-    def __init__(self, db_path: str | Path = ".spec-kit/executions.db"):
+    """Execution records in SQLite.
+
+    Connections are pooled per thread. By default ``save_execution`` commits
+    the record before returning. With ``write_behind``, it queues the record
+    and a writer thread commits queued records in batches; reads and
+    ``flush`` wait for queued records first, and a failed write is raised by
+    the next ``flush`` or read.
+    """
+
+    def __init__(self, db_path: str | Path = ".spec-kit/executions.db", write_behind: bool = False):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._pool = SQLitePool(self.db_path)
         self._init_db()
+        self._writes = WriteBehindQueue(self._pool, _SAVE_SQL) if write_behind else None
+        # Bumped when executions are deleted, for revision()
+        self._clears = 0
+        if self._writes is not None:
+            # Commit queued records when the store is collected or at exit
+            weakref.finalize(self, self._writes.close)
 
     def _init_db(self) -> None:
-        with sqlite3.connect(self.db_path) as conn:
+        with self._pool.transaction() as conn:
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS executions (
                     execution_id TEXT PRIMARY KEY,
@@ -48,109 +132,75 @@ class StateStore:
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 )
             """)
-            conn.commit()
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_executions_phase
+                ON executions(phase, created_at)
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_executions_created_at
+                ON executions(created_at)
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_executions_start_time
+                ON executions(start_time)
+            """)
 
-    @timed
     def save_execution(self, state: ExecutionState) -> None:
         with span("state.save_execution", execution_id=state.execution_id):
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute("""
-                    INSERT OR REPLACE INTO executions
-                    (execution_id, phase, status, start_time, end_time, duration, 
-                     input_data, output_data, errors, metadata)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    state.execution_id,
-                    state.phase,
-                    state.status,
-                    state.start_time,
-                    state.end_time,
-                    state.duration,
-                    json.dumps(state.input_data),
-                    json.dumps(state.output_data),
-                    json.dumps(state.errors),
-                    json.dumps(state.metadata),
-                ))
-                conn.commit()
-            metric_counter("state.executions.saved", 1)
+            row = (
+                state.execution_id,
+                state.phase,
+                state.status,
+                state.start_time,
+                state.end_time,
+                state.duration,
+                json.dumps(state.input_data),
+                json.dumps(state.output_data),
+                json.dumps(state.errors),
+                json.dumps(state.metadata),
+            )
+            if self._writes is not None:
+                self._writes.put(row)
+            else:
+                with self._pool.transaction() as conn:
+                    conn.execute(_SAVE_SQL, row)
+            metric_counter("state.executions.saved")(1)
+
+    def flush(self) -> None:
+        """Wait until every saved execution is committed."""
+        if self._writes is not None:
+            self._writes.flush()
+
+    def close(self) -> None:
+        """Commit queued executions and close the connections."""
+        if self._writes is not None:
+            self._writes.close()
+        self._pool.close()
+
+    def _query(self, sql: str, params: tuple = ()) -> list[tuple]:
+        self.flush()
+        return self._pool.connection().execute(sql, params).fetchall()
 
-    @timed
     def get_execution(self, execution_id: str) -> ExecutionState | None:
         with span("state.get_execution", execution_id=execution_id):
-            with sqlite3.connect(self.db_path) as conn:
-                row = conn.execute("""
-                    SELECT execution_id, phase, status, start_time, end_time,
-                           duration, input_data, output_data, errors, metadata
-                    FROM executions WHERE execution_id = ?
-                """, (execution_id,)).fetchone()
-
-            if not row:
-                return None
-
-            return ExecutionState(
-                execution_id=row[0],
-                phase=row[1],
-                status=row[2],
-                start_time=row[3],
-                end_time=row[4],
-                duration=row[5],
-                input_data=json.loads(row[6]) if row[6] else {},
-                output_data=json.loads(row[7]) if row[7] else {},
-                errors=json.loads(row[8]) if row[8] else [],
-                metadata=json.loads(row[9]) if row[9] else {},
+            rows = self._query(
+                f"SELECT {_COLUMNS} FROM executions WHERE execution_id = ?", (execution_id,)
             )
+            return _row_to_state(rows[0]) if rows else None
 
     @timed
     def get_phase_executions(self, phase: str) -> list[ExecutionState]:
         with span("state.get_phase_executions", phase=phase):
-            with sqlite3.connect(self.db_path) as conn:
-                rows = conn.execute("""
-                    SELECT execution_id, phase, status, start_time, end_time,
-                           duration, input_data, output_data, errors, metadata
-                    FROM executions WHERE phase = ? ORDER BY created_at DESC
-                """, (phase,)).fetchall()
-
-            return [
-                ExecutionState(
-                    execution_id=row[0],
-                    phase=row[1],
-                    status=row[2],
-                    start_time=row[3],
-                    end_time=row[4],
-                    duration=row[5],
-                    input_data=json.loads(row[6]) if row[6] else {},
-                    output_data=json.loads(row[7]) if row[7] else {},
-                    errors=json.loads(row[8]) if row[8] else [],
-                    metadata=json.loads(row[9]) if row[9] else {},
-                )
-                for row in rows
-            ]
+            rows = self._query(
+                f"SELECT {_COLUMNS} FROM executions WHERE phase = ? {_NEWEST_FIRST}", (phase,)
+            )
+            return [_row_to_state(row) for row in rows]
 
     @timed
     def get_latest_execution(self) -> ExecutionState | None:
         with span("state.get_latest_execution"):
-            with sqlite3.connect(self.db_path) as conn:
-                row = conn.execute("""
-                    SELECT execution_id, phase, status, start_time, end_time,
-                           duration, input_data, output_data, errors, metadata
-                    FROM executions ORDER BY created_at DESC LIMIT 1
-                """).fetchone()
-
-            if not row:
-                return None
-
-            return ExecutionState(
-                execution_id=row[0],
-                phase=row[1],
-                status=row[2],
-                start_time=row[3],
-                end_time=row[4],
-                duration=row[5],
-                input_data=json.loads(row[6]) if row[6] else {},
-                output_data=json.loads(row[7]) if row[7] else {},
-                errors=json.loads(row[8]) if row[8] else [],
-                metadata=json.loads(row[9]) if row[9] else {},
-            )
+            rows = self._query(f"SELECT {_COLUMNS} FROM executions {_NEWEST_FIRST} LIMIT 1")
+            return _row_to_state(rows[0]) if rows else None
 
     @timed
     def get_execution_history(
@@ -159,44 +209,91 @@ class StateStore:
         offset: int = 0,
     ) -> list[ExecutionState]:
         with span("state.get_execution_history", limit=limit):
-            with sqlite3.connect(self.db_path) as conn:
-                rows = conn.execute("""
-                    SELECT execution_id, phase, status, start_time, end_time,
-                           duration, input_data, output_data, errors, metadata
-                    FROM executions
-                    ORDER BY created_at DESC
-                    LIMIT ? OFFSET ?
-                """, (limit, offset)).fetchall()
-
-            return [
-                ExecutionState(
-                    execution_id=row[0],
-                    phase=row[1],
-                    status=row[2],
-                    start_time=row[3],
-                    end_time=row[4],
-                    duration=row[5],
-                    input_data=json.loads(row[6]) if row[6] else {},
-                    output_data=json.loads(row[7]) if row[7] else {},
-                    errors=json.loads(row[8]) if row[8] else [],
-                    metadata=json.loads(row[9]) if row[9] else {},
-                )
-                for row in rows
-            ]
+            rows = self._query(
+                f"SELECT {_COLUMNS} FROM executions {_NEWEST_FIRST} LIMIT ? OFFSET ?",
+                (limit, offset),
+            )
+            return [_row_to_state(row) for row in rows]
 
     @timed
     def clear_old_executions(self, days: int = 30) -> int:
         with span("state.clear_old_executions", days=days):
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute("""
+            self.flush()
+            with self._pool.transaction() as conn:
+                cursor = conn.execute(
+                    """
                     DELETE FROM executions
                     WHERE created_at < datetime('now', '-' || ? || ' days')
-                """, (days,))
-                conn.commit()
+                    """,
+                    (days,),
+                )
                 count = cursor.rowcount
-            metric_counter("state.executions.cleared", count)
+            if count:
+                self._clears += 1
+            metric_counter("state.executions.cleared")(count)
             return count
 
+    def revision(self) -> tuple[Any, ...]:
+        """A value that changes whenever executions are saved or cleared.
+
+        Built from the newest row (replacing a record gives it a new rowid),
+        so it costs one index lookup. Deletions are only seen when made
+        through this store.
+        """
+        rows = self._query("SELECT rowid, execution_id FROM executions ORDER BY rowid DESC LIMIT 1")
+        return (self._clears, *(rows[0] if rows else ()))
+
+    def summarize_phases(self, phase: str | None = None) -> dict[str, dict[str, Any]]:
+        """Aggregate executions per phase in SQL.
+
+        Returns counts, total and maximum duration, and the nearest-rank
+        duration percentiles in PERCENTILES, keyed by phase.
+        """
+        with span("state.summarize_phases", phase=phase or "*"):
+            if phase is None:
+                rows = self._query(_SUMMARY_SQL)
+            else:
+                rows = self._query(_PHASE_SUMMARY_SQL, (phase,))
+            return {
+                row[0]: {
+                    "total": row[1],
+                    "successful": row[2],
+                    "failed": row[3],
+                    "total_duration": row[4],
+                    "max_duration": row[5],
+                    "percentiles": {
+                        f"p{p}": value for p, value in zip(PERCENTILES, row[6:], strict=True)
+                    },
+                }
+                for row in rows
+            }
+
+    def get_recent_summaries(self, phase: str, limit: int = 10) -> list[dict[str, Any]]:
+        """Newest executions of a phase with their error counts, without decoding payloads."""
+        rows = self._query(_RECENT_SQL, (phase, limit))
+        return [
+            {"id": row[0], "status": row[1], "duration": row[2], "errors": row[3]} for row in rows
+        ]
+
+    def iter_executions(
+        self, phase: str | None = None, batch_size: int = STREAM_BATCH_SIZE
+    ) -> Iterator[ExecutionState]:
+        """Stream executions, newest first, fetching ``batch_size`` rows at a time."""
+        self.flush()
+        if phase is None:
+            cursor = self._pool.connection().execute(
+                f"SELECT {_COLUMNS} FROM executions {_NEWEST_FIRST}"
+            )
+        else:
+            cursor = self._pool.connection().execute(
+                f"SELECT {_COLUMNS} FROM executions WHERE phase = ? {_NEWEST_FIRST}", (phase,)
+            )
+        try:
+            while rows := cursor.fetchmany(batch_size):
+                yield from (_row_to_state(row) for row in rows)
+        finally:
+            cursor.close()
+
 
 _global_state_store: StateStore | None = None
 
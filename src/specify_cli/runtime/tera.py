@@ -0,0 +1,488 @@
+"""
+specify_cli.runtime.tera - Shared Tera Template Renderer
+========================================================
+
+Process-wide Jinja2 (Tera-compatible) renderer for the μ₃ EMIT stage.
+
+Rendering used to build a fresh ``jinja2.Environment`` for every rule,
+re-register every Tera filter and compile the template source from scratch.
+:class:`TeraRenderer` owns one Environment instead:
+
+Key Features
+-----------
+* **Filters registered once**: Tera-compatible ``replace``, ``default``,
+  ``first``, ``unique``, ``filter``, ``sort``, ``repeat``, ``indent`` and
+  ``date`` filters are module-level functions registered at construction
+* **Compiled template cache**: Templates are loaded by path through a loader;
+  Jinja's template cache keeps compiled templates and re-checks each file's
+  mtime before reuse, so edits are picked up without recompiling the rest
+* **Loader-based includes**: ``{% include %}``, ``{% extends %}`` and
+  ``{% import %}`` resolve relative to the including template, so a shared
+  partial compiles once for every rule that uses it
+* **Bytecode cache**: Optional ``jinja2.FileSystemBytecodeCache`` persists
+  compiled bytecode across processes (``SPECIFY_TEMPLATE_CACHE_DIR``)
+* **Streaming**: :meth:`TeraRenderer.stream_file` yields rendered chunks
+  for μ₄ CANONICALIZE to consume without a full in-memory copy
+
+Examples
+--------
+    >>> from specify_cli.runtime.tera import get_renderer
+    >>> renderer = get_renderer()
+    >>> renderer.render_file("templates/command.tera", {"results": rows})
+    >>> renderer.render_string("{{ name | replace(from='-', to='_') }}", {"name": "a-b"})
+
+See Also
+--------
+- :mod:`specify_cli.runtime.ggen` : μ pipeline runtime
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from specify_cli.core.instrumentation import add_span_event
+from specify_cli.core.telemetry import metric_counter, span
+
+try:
+    import jinja2
+
+    JINJA2_AVAILABLE = True
+except ImportError:  # pragma: no cover - jinja2 is a core dependency
+    JINJA2_AVAILABLE = False
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+__all__ = [
+    "TERA_FILTERS",
+    "TeraRenderer",
+    "build_context",
+    "clear_renderer",
+    "get_renderer",
+]
+
+# Maximum compiled templates kept in memory (file and string templates each)
+DEFAULT_CACHE_SIZE = 400
+
+
+# -----------------------------------------------------------------------------
+# Tera-compatible filters
+# -----------------------------------------------------------------------------
+
+
+def tera_replace(value: str, from_str: str = "", to: str = "", **kwargs: Any) -> str:
+    """Tera replace filter: | replace(from="x", to="y")"""
+    # ``from`` is a Python keyword, so Tera's spelling arrives via kwargs
+    from_str = kwargs.get("from", from_str)
+    return str(value).replace(from_str, to)
+
+
+def tera_default(input_value: Any, value: Any = "") -> Any:
+    """Tera default filter: | default(value="x")"""
+    return input_value if input_value is not None and input_value != "" else value
+
+
+def tera_first(value: list[Any]) -> Any:
+    """Tera first filter: | first"""
+    if isinstance(value, (list, tuple)) and len(value) > 0:
+        return value[0]
+    return None
+
+
+def tera_unique(value: list[Any], attribute: str | None = None) -> list[Any]:
+    """Tera unique filter: | unique(attribute="x")"""
+    if not isinstance(value, (list, tuple)):
+        return []
+    if attribute:
+        seen = set()
+        result = []
+        for item in value:
+            key = (
+                item.get(attribute)
+                if isinstance(item, dict)
+                else getattr(item, attribute, None)
+            )
+            if key not in seen:
+                seen.add(key)
+                result.append(item)
+        return result
+    return list(dict.fromkeys(value))
+
+
+def tera_filter(items: list[Any], attribute: str | None = None, value: Any = None) -> list[Any]:
+    """Tera filter filter: | filter(attribute="x", value="y") or | filter(attribute="x")"""
+    if not isinstance(items, (list, tuple)):
+        return []
+    result = []
+    for item in items:
+        if isinstance(item, dict):
+            if attribute:
+                item_val = item.get(attribute)
+                if value is not None:
+                    if item_val == value:
+                        result.append(item)
+                elif item_val:  # Just check attribute exists and is truthy
+                    result.append(item)
+            else:
+                result.append(item)
+        else:
+            result.append(item)
+    return result
+
+
+def tera_sort(value: list[Any], attribute: str | None = None) -> list[Any]:
+    """Tera sort filter: | sort(attribute="x")"""
+    if not isinstance(value, (list, tuple)):
+        return []
+    if attribute:
+        return sorted(
+            value,
+            key=lambda x: x.get(attribute, "") if isinstance(x, dict) else getattr(x, attribute, ""),
+        )
+    return sorted(value)
+
+
+def tera_repeat(value: str, count: int = 1) -> str:
+    """Tera repeat filter: | repeat(count=N)"""
+    return str(value) * count
+
+
+def tera_indent(value: str, first: bool = False, blank: bool = False, prefix: str = "    ") -> str:
+    """Tera indent filter: | indent(first=true, blank=false)"""
+    lines = str(value).split("\n")
+    result = []
+    for i, line in enumerate(lines):
+        if (i == 0 and not first) or (not line.strip() and not blank):
+            result.append(line)
+        else:
+            result.append(prefix + line)
+    return "\n".join(result)
+
+
+def tera_date(value: datetime, format_str: str = "%Y-%m-%d", **kwargs: Any) -> str:
+    """Tera date filter: | date(format="%Y-%m-%d")"""
+    format_str = kwargs.get("format", format_str)
+    if isinstance(value, datetime):
+        return value.strftime(format_str)
+    return str(value)
+
+
+# Filters registered on the shared Environment, by Tera name
+TERA_FILTERS = {
+    "replace": tera_replace,
+    "default": tera_default,
+    "first": tera_first,
+    "unique": tera_unique,
+    "filter": tera_filter,
+    "sort": tera_sort,
+    "repeat": tera_repeat,
+    "indent": tera_indent,
+    "date": tera_date,
+}
+
+
+def build_context(data: Any) -> dict[str, Any]:
+    """Build the template context from μ₂ output.
+
+    Parameters
+    ----------
+    data : Any
+        Data to render (typically dict with 'results' or 'sparql_results' key).
+
+    Returns
+    -------
+    dict[str, Any]
+        Context with ``results``/``sparql_results`` aliases filled in.
+    """
+    context: dict[str, Any] = {}
+    if isinstance(data, dict):
+        context = data.copy()
+        # Tera templates often use 'results' or 'sparql_results'
+        if "results" not in context and "sparql_results" not in context:
+            context["results"] = data
+    elif isinstance(data, (list, tuple)):
+        context["results"] = data
+        context["sparql_results"] = data
+    else:
+        context["data"] = data
+    return context
+
+
+# -----------------------------------------------------------------------------
+# Loader and Environment
+# -----------------------------------------------------------------------------
+
+if JINJA2_AVAILABLE:
+
+    class _PathLoader(jinja2.BaseLoader):
+        """Load templates by file path (names are absolute paths).
+
+        Relative names are tried against ``search_paths`` in order.
+        """
+
+        def __init__(self, search_paths: list[Path]) -> None:
+            self.search_paths = search_paths
+
+        def get_source(
+            self,
+            environment: jinja2.Environment,  # noqa: ARG002
+            template: str,
+        ) -> tuple[str, str, Any]:
+            path = Path(template)
+            if not path.is_absolute():
+                for base in self.search_paths:
+                    if (base / template).is_file():
+                        path = base / template
+                        break
+            try:
+                mtime = path.stat().st_mtime_ns
+                source = path.read_text()
+            except OSError as e:
+                raise jinja2.TemplateNotFound(template) from e
+
+            def uptodate() -> bool:
+                try:
+                    return path.stat().st_mtime_ns == mtime
+                except OSError:
+                    return False
+
+            return source, str(path), uptodate
+
+    class _TeraEnvironment(jinja2.Environment):
+        """Environment resolving includes relative to the including template."""
+
+        def join_path(self, template: str, parent: str) -> str:
+            if Path(template).is_absolute():
+                return template
+            candidate = Path(parent).parent / template
+            if Path(parent).is_absolute() and candidate.is_file():
+                return str(candidate)
+            return template
+
+
+class TeraRenderer:
+    """Shared Tera-compatible renderer with compiled template caching.
+
+    Parameters
+    ----------
+    search_paths : list[str | Path] | None, optional
+        Directories searched for templates referenced by relative name.
+        Default is the current directory.
+    bytecode_cache_dir : str | Path | None, optional
+        Directory for ``jinja2.FileSystemBytecodeCache``. Default disables
+        the on-disk cache.
+    cache_size : int, optional
+        Compiled templates kept in memory. Default is 400.
+
+    Raises
+    ------
+    ValueError
+        If Jinja2 is not installed.
+    """
+
+    def __init__(
+        self,
+        search_paths: list[str | Path] | None = None,
+        bytecode_cache_dir: str | Path | None = None,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ) -> None:
+        """Initialize renderer and register filters once."""
+        if not JINJA2_AVAILABLE:
+            raise ValueError("Jinja2 not installed for Tera rendering")
+
+        bytecode_cache = None
+        if bytecode_cache_dir is not None:
+            Path(bytecode_cache_dir).mkdir(parents=True, exist_ok=True)
+            bytecode_cache = jinja2.FileSystemBytecodeCache(str(bytecode_cache_dir))
+
+        self.env = _TeraEnvironment(
+            loader=_PathLoader([Path(p) for p in (search_paths or ["."])]),
+            bytecode_cache=bytecode_cache,
+            cache_size=cache_size,
+            auto_reload=True,
+            autoescape=jinja2.select_autoescape(default=False),
+            undefined=jinja2.StrictUndefined,
+            trim_blocks=True,
+            lstrip_blocks=True,
+        )
+        self.env.filters.update(TERA_FILTERS)
+        self.env.globals["now"] = datetime.now
+
+        self.cache_size = cache_size
+        self._string_templates: OrderedDict[str, jinja2.Template] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def render_file(self, template_path: str | Path, data: Any) -> str:
+        """Render a template file.
+
+        Parameters
+        ----------
+        template_path : str | Path
+            Template file; compiled once and reused until its mtime changes.
+        data : Any
+            Data to render (see :func:`build_context`).
+
+        Returns
+        -------
+        str
+            Rendered output.
+
+        Raises
+        ------
+        ValueError
+            If loading or rendering fails.
+        """
+        path = Path(template_path).resolve()
+        with span("ggen.render_tera", template=str(template_path)):
+            try:
+                template = self.env.get_template(str(path))
+                rendered = template.render(**build_context(data))
+            except Exception as e:
+                metric_counter("ggen.tera_render.error")(1)
+                add_span_event("tera.render_error", {"error": str(e)})
+                raise ValueError(f"Tera template rendering failed: {e}") from e
+
+            metric_counter("ggen.tera_render.success")(1)
+            add_span_event(
+                "tera.rendered",
+                {"template": str(template_path), "output_length": len(rendered)},
+            )
+            return rendered
+
+    def stream_file(self, template_path: str | Path, data: Any) -> Iterator[str]:
+        """Render a template file chunk by chunk.
+
+        Same output as :meth:`render_file` when joined, without building the
+        whole text in memory.
+
+        Parameters
+        ----------
+        template_path : str | Path
+            Template file; compiled once and reused until its mtime changes.
+        data : Any
+            Data to render (see :func:`build_context`).
+
+        Yields
+        ------
+        str
+            Rendered chunks.
+
+        Raises
+        ------
+        ValueError
+            If loading or rendering fails (possibly after some chunks).
+        """
+        path = Path(template_path).resolve()
+        with span("ggen.render_tera", template=str(template_path), streaming=True):
+            try:
+                template = self.env.get_template(str(path))
+                yield from template.generate(**build_context(data))
+            except Exception as e:
+                metric_counter("ggen.tera_render.error")(1)
+                add_span_event("tera.render_error", {"error": str(e)})
+                raise ValueError(f"Tera template rendering failed: {e}") from e
+
+            metric_counter("ggen.tera_render.success")(1)
+
+    def render_string(self, source: str, data: Any) -> str:
+        """Render template source, compiling each distinct source once.
+
+        Parameters
+        ----------
+        source : str
+            Tera template content.
+        data : Any
+            Data to render (see :func:`build_context`).
+
+        Returns
+        -------
+        str
+            Rendered output.
+
+        Raises
+        ------
+        ValueError
+            If compiling or rendering fails.
+        """
+        with span("ggen.render_tera"):
+            try:
+                rendered = self._compile_string(source).render(**build_context(data))
+            except Exception as e:
+                metric_counter("ggen.tera_render.error")(1)
+                add_span_event("tera.render_error", {"error": str(e)})
+                raise ValueError(f"Tera template rendering failed: {e}") from e
+
+            metric_counter("ggen.tera_render.success")(1)
+            add_span_event(
+                "tera.rendered",
+                {"template_length": len(source), "output_length": len(rendered)},
+            )
+            return rendered
+
+    def clear(self) -> None:
+        """Drop all compiled templates held in memory."""
+        if self.env.cache is not None:
+            self.env.cache.clear()
+        with self._lock:
+            self._string_templates.clear()
+
+    def _compile_string(self, source: str) -> jinja2.Template:
+        key = hashlib.sha256(source.encode()).hexdigest()
+        with self._lock:
+            template = self._string_templates.get(key)
+            if template is not None:
+                self._string_templates.move_to_end(key)
+                metric_counter("ggen.tera_render.compile_cache_hit")(1)
+                return template
+
+        template = self.env.from_string(source)
+        with self._lock:
+            self._string_templates[key] = template
+            while len(self._string_templates) > self.cache_size:
+                self._string_templates.popitem(last=False)
+        return template
+
+
+# -----------------------------------------------------------------------------
+# Process-wide instance
+# -----------------------------------------------------------------------------
+
+_RENDERER: TeraRenderer | None = None
+_RENDERER_LOCK = threading.Lock()
+
+
+def get_renderer() -> TeraRenderer:
+    """Get or create the process-wide renderer.
+
+    The on-disk bytecode cache is enabled when ``SPECIFY_TEMPLATE_CACHE_DIR``
+    is set.
+
+    Returns
+    -------
+    TeraRenderer
+        Shared renderer instance.
+    """
+    global _RENDERER  # noqa: PLW0603
+
+    if _RENDERER is None:
+        with _RENDERER_LOCK:
+            if _RENDERER is None:
+                _RENDERER = TeraRenderer(
+                    bytecode_cache_dir=os.getenv("SPECIFY_TEMPLATE_CACHE_DIR") or None,
+                )
+
+    return _RENDERER
+
+
+def clear_renderer() -> None:
+    """Discard the process-wide renderer (e.g. after changing settings)."""
+    global _RENDERER  # noqa: PLW0603
+
+    with _RENDERER_LOCK:
+        _RENDERER = None
@@ -1,13 +1,40 @@
+"""Worker pool executing submitted callables on OS threads or processes.
+
+Each worker owns a heap-ordered priority deque. Idle workers refill from the
+bounded global queue in small batches and steal from the busiest peer when
+the global queue is empty. ``submit_work`` returns a future and blocks while
+the global queue is full.
+"""
+
 from __future__ import annotations
 
+import heapq
+import itertools
+import threading
+import time
 import uuid
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Callable
+from queue import Full
+from typing import TYPE_CHECKING, Any
 
 from specify_cli.core.shell import timed
 from specify_cli.core.telemetry import metric_counter, metric_histogram, span
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+WORKER_MODES = ("thread", "process")
+
+# Items a worker moves from the global queue per refill
+MAX_REFILL_BATCH = 64
+# Completed items kept for latency percentiles
+LATENCY_WINDOW = 1024
+# Idle workers re-check peers for stealable work at this interval
+IDLE_POLL_S = 0.05
+
 
 class WorkerStatus(Enum):
     IDLE = "idle"
@@ -16,6 +43,14 @@ class WorkerStatus(Enum):
     SHUTDOWN = "shutdown"
 
 
+class WorkFuture(Future):
+    """Future for a submitted work item, carrying its ``item_id``."""
+
+    def __init__(self, item_id: str) -> None:
+        super().__init__()
+        self.item_id = item_id
+
+
 @dataclass
 class WorkItem:
     item_id: str
@@ -26,6 +61,8 @@ class WorkItem:
     result: Any = None
     error: str | None = None
     status: str = "pending"
+    future: WorkFuture | None = None
+    submitted_at: float = field(default_factory=time.perf_counter)
 
 
 @dataclass
@@ -33,54 +70,98 @@ class WorkerMetrics:
     worker_id: str
     items_processed: int = 0
     items_failed: int = 0
+    items_stolen: int = 0
     total_processing_time: float = 0.0
     current_status: WorkerStatus = WorkerStatus.IDLE
 
 
+_sequence = itertools.count()
+
+
+def _heap_entry(item: WorkItem) -> tuple[int, int, WorkItem]:
+    """Heap key: highest priority first, FIFO among equal priorities."""
+    return (-item.priority, next(_sequence), item)
+
+
 class Worker:
-    def __init__(self, worker_id: str):
+    """Executes items from its own priority deque."""
+
+    def __init__(self, worker_id: str, executor: ProcessPoolExecutor | None = None):
         self.worker_id = worker_id
         self.status = WorkerStatus.IDLE
         self.current_item: WorkItem | None = None
         self.metrics = WorkerMetrics(worker_id=worker_id)
-        self.work_queue: list[WorkItem] = []
+        self.work_queue: list[tuple[int, int, WorkItem]] = []
+        self._lock = threading.Lock()
+        self._executor = executor
+
+    def __len__(self) -> int:
+        return len(self.work_queue)
 
     def enqueue_work(self, item: WorkItem) -> None:
-        self.work_queue.append(item)
-        self.work_queue.sort(key=lambda x: x.priority, reverse=True)
+        with self._lock:
+            heapq.heappush(self.work_queue, _heap_entry(item))
+
+    def _pop(self) -> WorkItem | None:
+        with self._lock:
+            return heapq.heappop(self.work_queue)[2] if self.work_queue else None
+
+    def steal(self) -> list[WorkItem]:
+        """Hand over the top half of this worker's deque."""
+        with self._lock:
+            count = len(self.work_queue) // 2
+            return [heapq.heappop(self.work_queue)[2] for _ in range(count)]
+
+    def drain(self) -> list[WorkItem]:
+        """Remove and return every queued item."""
+        with self._lock:
+            items = [entry[2] for entry in self.work_queue]
+            self.work_queue.clear()
+            return items
 
-    @timed
     def process_work(self) -> WorkItem | None:
-        with span(f"worker.process", worker=self.worker_id):
-            if not self.work_queue:
-                self.status = WorkerStatus.IDLE
-                return None
+        item = self._pop()
+        if item is None:
+            self.status = WorkerStatus.IDLE
+            return None
 
-            item = self.work_queue.pop(0)
+        with span("worker.process", worker=self.worker_id, item=item.item_id):
             self.current_item = item
             self.status = WorkerStatus.BUSY
+            future = item.future
+            if future is not None and not future.set_running_or_notify_cancel():
+                item.status = "cancelled"
+                self.current_item = None
+                self.status = WorkerStatus.IDLE
+                return item
 
+            start = time.perf_counter()
             try:
-                result = item.task_handler(*item.args, **item.kwargs)
-                item.result = result
-                item.status = "completed"
-                self.metrics.items_processed += 1
-
-                metric_counter("worker.items_processed", 1, {
-                    "worker": self.worker_id,
-                })
-
+                if self._executor is not None:
+                    result = self._executor.submit(
+                        item.task_handler, *item.args, **item.kwargs
+                    ).result()
+                else:
+                    result = item.task_handler(*item.args, **item.kwargs)
             except Exception as e:
                 item.error = str(e)
                 item.status = "failed"
                 self.metrics.items_failed += 1
                 self.status = WorkerStatus.ERROR
-
-                metric_counter("worker.items_failed", 1, {
-                    "worker": self.worker_id,
-                })
-
-            self.current_item = None
+                metric_counter("worker.items_failed")(1)
+                if future is not None:
+                    future.set_exception(e)
+            else:
+                item.result = result
+                item.status = "completed"
+                self.metrics.items_processed += 1
+                self.status = WorkerStatus.IDLE
+                metric_counter("worker.items_processed")(1)
+                if future is not None:
+                    future.set_result(result)
+            finally:
+                self.metrics.total_processing_time += time.perf_counter() - start
+                self.current_item = None
             return item
 
     def get_metrics(self) -> WorkerMetrics:
@@ -92,84 +173,261 @@ class Worker:
 
 
 class WorkerPool:
-    def __init__(self, pool_size: int = 4):
+    """Priority work pool with per-worker deques and work stealing.
+
+    ``mode="thread"`` runs handlers on the worker threads; ``mode="process"``
+    sends them to a process pool of the same size (handlers and arguments
+    must be picklable). ``max_queue_size`` bounds the global queue
+    (0 = unbounded); ``submit_work`` blocks while it is full. Workers start
+    on the first submission.
+    """
+
+    def __init__(self, pool_size: int = 4, mode: str = "thread", max_queue_size: int = 0):
+        if mode not in WORKER_MODES:
+            raise ValueError(f"Unknown worker mode: {mode} (expected one of {WORKER_MODES})")
+        if pool_size < 1:
+            raise ValueError("pool_size must be at least 1")
+
         self.pool_size = pool_size
-        self.workers: dict[str, Worker] = {}
-        self.global_queue: list[WorkItem] = []
+        self.mode = mode
+        self.max_queue_size = max_queue_size
+        self.global_queue: list[tuple[int, int, WorkItem]] = []
         self.completed_items: dict[str, WorkItem] = {}
 
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._drained = threading.Condition(self._lock)
+        self._pending = 0
+        self._completed_count = 0
+        self._shutdown = False
+        self._threads: list[threading.Thread] = []
+        self._started_at: float | None = None
+        self._latencies: deque[float] = deque(maxlen=LATENCY_WINDOW)
+
+        self._process_pool = ProcessPoolExecutor(pool_size) if mode == "process" else None
+        self.workers: dict[str, Worker] = {}
         for i in range(pool_size):
             worker_id = f"worker-{i}"
-            self.workers[worker_id] = Worker(worker_id)
-
-    @timed
-    def submit_work(self, task_handler: Callable, *args: Any, **kwargs: Any) -> str:
-        with span("pool.submit_work"):
-            item = WorkItem(
-                item_id=str(uuid.uuid4())[:8],
-                task_handler=task_handler,
-                args=args,
-                kwargs=kwargs,
-                priority=kwargs.pop("priority", 0),
+            self.workers[worker_id] = Worker(worker_id, self._process_pool)
+
+    def submit_work(
+        self,
+        task_handler: Callable,
+        *args: Any,
+        priority: int = 0,
+        queue_timeout: float | None = None,
+        **kwargs: Any,
+    ) -> WorkFuture:
+        """Queue ``task_handler(*args, **kwargs)``; higher ``priority`` runs first.
+
+        Blocks while the global queue is full. Raises ``queue.Full`` if no
+        slot frees up within ``queue_timeout`` seconds; any ``timeout``
+        keyword is passed through to the task.
+        """
+        item_id = str(uuid.uuid4())[:8]
+        item = WorkItem(
+            item_id=item_id,
+            task_handler=task_handler,
+            args=args,
+            kwargs=kwargs,
+            priority=priority,
+            future=WorkFuture(item_id),
+        )
+
+        with self._not_full:
+            if self._shutdown:
+                raise RuntimeError("Cannot submit work after shutdown_pool()")
+            if self.max_queue_size > 0 and not self._not_full.wait_for(
+                lambda: len(self.global_queue) < self.max_queue_size or self._shutdown,
+                queue_timeout,
+            ):
+                metric_counter("pool.work_rejected")(1)
+                raise Full(f"Work queue full ({self.max_queue_size} items)")
+            if self._shutdown:
+                raise RuntimeError("Cannot submit work after shutdown_pool()")
+            heapq.heappush(self.global_queue, _heap_entry(item))
+            self._pending += 1
+            self._start_workers()
+            self._not_empty.notify()
+
+        metric_counter("pool.work_submitted")(1)
+        return item.future
+
+    def _start_workers(self) -> None:
+        """Start worker threads (called with the pool lock held)."""
+        if self._threads:
+            return
+        self._started_at = time.perf_counter()
+        for worker in self.workers.values():
+            thread = threading.Thread(
+                target=self._run_worker,
+                args=(worker,),
+                name=f"pool-{worker.worker_id}",
+                daemon=True,
             )
-
-            self.global_queue.append(item)
-            metric_counter("pool.work_submitted", 1)
-            return item.item_id
-
-    def _distribute_work(self) -> None:
-        self.global_queue.sort(key=lambda x: x.priority, reverse=True)
-
-        for item in self.global_queue[:]:
-            for worker in self.workers.values():
-                if worker.status == WorkerStatus.IDLE:
+            self._threads.append(thread)
+            thread.start()
+
+    def _run_worker(self, worker: Worker) -> None:
+        while True:
+            if not len(worker) and not self._refill(worker) and not self._steal(worker):
+                worker.status = WorkerStatus.IDLE
+                with self._not_empty:
+                    if self._shutdown and not self.global_queue:
+                        worker.shutdown()
+                        return
+                    if not self.global_queue:
+                        self._not_empty.wait(IDLE_POLL_S)
+                continue
+
+            item = worker.process_work()
+            if item is not None:
+                self._finish(item)
+
+    def _refill(self, worker: Worker) -> bool:
+        """Move a batch of the highest-priority global items to ``worker``."""
+        with self._lock:
+            if not self.global_queue:
+                return False
+            batch = max(1, min(len(self.global_queue) // (2 * self.pool_size), MAX_REFILL_BATCH))
+            items = [heapq.heappop(self.global_queue)[2] for _ in range(batch)]
+            self._not_full.notify(batch)
+            if batch > 1:
+                # Let idle peers steal the rest of the batch
+                self._not_empty.notify(batch - 1)
+        for item in items:
+            worker.enqueue_work(item)
+        return True
+
+    def _steal(self, worker: Worker) -> bool:
+        """Take half of the busiest peer's deque."""
+        peers = sorted((w for w in self.workers.values() if w is not worker), key=len, reverse=True)
+        for victim in peers:
+            if len(victim) < 2:
+                break
+            stolen = victim.steal()
+            if stolen:
+                for item in stolen:
                     worker.enqueue_work(item)
-                    self.global_queue.remove(item)
-                    break
+                worker.metrics.items_stolen += len(stolen)
+                metric_counter("pool.items_stolen")(len(stolen))
+                return True
+        return False
+
+    def _finish(self, item: WorkItem) -> None:
+        latency = time.perf_counter() - item.submitted_at
+        metric_histogram("pool.item_latency")(latency)
+        with self._lock:
+            self.completed_items[item.item_id] = item
+            self._completed_count += 1
+            self._latencies.append(latency)
+            self._pending -= 1
+            if self._pending == 0:
+                self._drained.notify_all()
 
     @timed
-    def execute_batch(self) -> int:
-        with span("pool.execute_batch"):
-            self._distribute_work()
+    def execute_batch(self, timeout: float | None = None) -> int:
+        """Wait until all submitted work has finished.
 
-            completed = 0
-            for worker in self.workers.values():
-                result = worker.process_work()
-                if result:
-                    self.completed_items[result.item_id] = result
-                    completed += 1
+        Returns the number of items completed while waiting.
+        """
+        with span("pool.execute_batch"):
+            with self._drained:
+                before = self._completed_count
+                self._drained.wait_for(lambda: self._pending == 0, timeout)
+                completed = self._completed_count - before
 
-            metric_histogram("pool.items_completed_per_cycle", completed)
+            metric_histogram("pool.items_completed_per_cycle", unit="1")(completed)
             return completed
 
-    def get_result(self, item_id: str) -> Any:
-        if item_id in self.completed_items:
-            return self.completed_items[item_id].result
-        return None
+    def get_result(self, item_id: str, timeout: float | None = None) -> Any:
+        """Result of a completed item (None if unknown or not finished)."""
+        item = self.completed_items.get(item_id)
+        if item is None or item.future is None:
+            return None
+        return item.future.result(timeout) if item.status != "cancelled" else None
 
     def get_pool_status(self) -> dict[str, Any]:
-        idle = sum(1 for w in self.workers.values() if w.status == WorkerStatus.IDLE)
-        busy = sum(1 for w in self.workers.values() if w.status == WorkerStatus.BUSY)
+        workers = list(self.workers.values())
+        idle = sum(1 for w in workers if w.status == WorkerStatus.IDLE)
+        busy = sum(1 for w in workers if w.status == WorkerStatus.BUSY)
+
+        with self._lock:
+            global_depth = len(self.global_queue)
+            latencies = sorted(self._latencies)
+            completed = self._completed_count
+            pending = self._pending
+
+        elapsed = time.perf_counter() - self._started_at if self._started_at else 0.0
+        busy_time = sum(w.metrics.total_processing_time for w in workers)
 
         return {
             "pool_size": self.pool_size,
+            "mode": self.mode,
             "idle_workers": idle,
             "busy_workers": busy,
-            "queued_items": len(self.global_queue),
-            "completed_items": len(self.completed_items),
-            "worker_metrics": [w.get_metrics() for w in self.workers.values()],
+            "queued_items": global_depth + sum(len(w) for w in workers),
+            "global_queue_depth": global_depth,
+            "worker_queue_depths": {w.worker_id: len(w) for w in workers},
+            "pending_items": pending,
+            "completed_items": completed,
+            "utilization": busy_time / (elapsed * self.pool_size) if elapsed else 0.0,
+            "latency_p50": _percentile(latencies, 0.50),
+            "latency_p95": _percentile(latencies, 0.95),
+            "latency_p99": _percentile(latencies, 0.99),
+            "worker_metrics": [w.get_metrics() for w in workers],
         }
 
-    def shutdown_pool(self) -> None:
+    def shutdown_pool(self, wait: bool = True, cancel_pending: bool = False) -> None:
+        """Stop the workers once the queues are empty.
+
+        With ``cancel_pending`` queued items are cancelled instead of run.
+        """
+        with self._lock:
+            self._shutdown = True
+            if cancel_pending:
+                cancelled = [entry[2] for entry in self.global_queue]
+                self.global_queue.clear()
+            else:
+                cancelled = []
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
+        if cancel_pending:
+            for worker in self.workers.values():
+                cancelled.extend(worker.drain())
+        for item in cancelled:
+            if item.future is not None:
+                item.future.cancel()
+            item.status = "cancelled"
+            self._finish(item)
+
+        if wait:
+            for thread in self._threads:
+                thread.join()
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=wait)
         for worker in self.workers.values():
             worker.shutdown()
 
+    def __enter__(self) -> WorkerPool:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.shutdown_pool()
+
+
+def _percentile(sorted_values: list[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(int(len(sorted_values) * fraction), len(sorted_values) - 1)]
+
 
 _global_worker_pool: WorkerPool | None = None
 
 
 def get_worker_pool(pool_size: int = 4) -> WorkerPool:
-    global _global_worker_pool
+    global _global_worker_pool  # noqa: PLW0603
     if _global_worker_pool is None:
         _global_worker_pool = WorkerPool(pool_size)
     return _global_worker_pool
@@ -0,0 +1,249 @@
+"""
+Raft Replication Benchmark Harness
+==================================
+
+Measures committed commands per second for ``ConsensusEngine`` with durable
+logs and followers in separate processes:
+
+* **Followers**: One spawned process per follower, each with its own log
+  directory, answering RPCs over a ``multiprocessing.Pipe`` with
+  ``serve_connection``
+* **Leader**: Runs in this process with a ``ConnectionTransport``, wins a
+  real election, then proposes commands keeping ``--window`` outstanding
+* **Modes**: ``batched`` uses the engine's default batching and pipelining;
+  ``per-entry`` sends one entry per AppendEntries with one request in flight
+  and proposes one command at a time, like the previous implementation
+
+Every run checks that all commands committed and that each follower's log
+and state machine match the leader's.
+
+Usage
+-----
+    python -m tests.benchmark.consensus_harness run
+    python -m tests.benchmark.consensus_harness run --nodes 5 --commands 20000
+    python -m tests.benchmark.consensus_harness run --modes batched --window 1024
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import sys
+import tempfile
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+DEFAULT_NODES = 3
+DEFAULT_COMMANDS = 5_000
+DEFAULT_WINDOW = 512
+MODES = ("batched", "per-entry")
+HEARTBEAT_MS = 20.0
+
+
+@dataclass
+class ReplicationResult:
+    """Benchmark result for one mode.
+
+    Attributes
+    ----------
+    mode : str
+        "batched" or "per-entry".
+    nodes : int
+        Cluster size, leader included.
+    commands : int
+        Commands proposed.
+    committed : int
+        Commands whose proposal resolved successfully.
+    duration_s : float
+        Time from the first proposal until the last commit.
+    commits_per_second : float
+        ``committed / duration_s``.
+    converged : bool
+        Every follower ended with the leader's log and state machine.
+    """
+
+    mode: str
+    nodes: int
+    commands: int
+    committed: int
+    duration_s: float
+    commits_per_second: float
+    converged: bool
+
+
+def _mode_options(mode: str) -> dict[str, int]:
+    if mode == "per-entry":
+        return {"max_batch_entries": 1, "max_inflight": 1}
+    return {}
+
+
+def _count(state_machine: dict[str, Any], data: dict[str, Any]) -> None:
+    state_machine["count"] = state_machine.get("count", 0) + data["n"]
+
+
+def _follower(conn: Any, results: Any, node: dict[str, Any]) -> None:
+    """Serve one follower until the leader hangs up, then report its state."""
+    from specify_cli.runtime.consensus import ConsensusEngine, serve_connection
+
+    engine = ConsensusEngine(
+        node["node_id"],
+        node["nodes"],
+        heartbeat_interval_ms=HEARTBEAT_MS,
+        log_dir=node["log_dir"],
+        **node["options"],
+    )
+    engine.register_command_handler("add", lambda data: _count(engine.state_machine, data))
+    serve_connection(engine, conn)
+    state = engine.get_state()
+    state["state_machine"] = engine.state_machine
+    engine.close()
+    results.put(state)
+
+
+def run_mode(mode: str, nodes: int, commands: int, window: int) -> ReplicationResult:
+    """Run one cluster in ``mode`` and measure its commit rate.
+
+    Parameters
+    ----------
+    mode : str
+        One of MODES.
+    nodes : int
+        Cluster size, leader included.
+    commands : int
+        Commands to propose.
+    window : int
+        Proposals kept outstanding (1 in per-entry mode).
+
+    Returns
+    -------
+    ReplicationResult
+        Throughput and convergence.
+
+    Raises
+    ------
+    RuntimeError
+        If the leader is not elected.
+    """
+    from specify_cli.runtime.consensus import ConnectionTransport, ConsensusEngine
+
+    options = _mode_options(mode)
+    if mode == "per-entry":
+        window = 1
+    node_ids = [f"n{i}" for i in range(nodes)]
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+
+    with tempfile.TemporaryDirectory(prefix="raft-bench-") as tmp:
+        connections = {}
+        processes = []
+        for node_id in node_ids[1:]:
+            leader_end, follower_end = context.Pipe()
+            node = {
+                "node_id": node_id,
+                "nodes": node_ids,
+                "log_dir": str(Path(tmp) / node_id),
+                "options": options,
+            }
+            process = context.Process(target=_follower, args=(follower_end, results, node))
+            process.start()
+            follower_end.close()
+            connections[node_id] = leader_end
+            processes.append(process)
+
+        transport = ConnectionTransport(connections)
+        leader = ConsensusEngine(
+            node_ids[0],
+            node_ids,
+            election_timeout_ms=30_000,
+            heartbeat_interval_ms=HEARTBEAT_MS,
+            log_dir=Path(tmp) / node_ids[0],
+            transport=transport,
+            **options,
+        )
+        leader.register_command_handler("add", lambda data: _count(leader.state_machine, data))
+        try:
+            if not leader.start_election():
+                raise RuntimeError("Leader election failed")
+
+            committed = 0
+            outstanding: deque = deque()
+            start = time.perf_counter()
+            for _ in range(commands):
+                outstanding.append(leader.propose("add", {"n": 1}))
+                if len(outstanding) >= window:
+                    committed += outstanding.popleft().result().success
+            while outstanding:
+                committed += outstanding.popleft().result().success
+            duration = time.perf_counter() - start
+
+            # Heartbeats carry the final commit index to the followers
+            time.sleep(5 * HEARTBEAT_MS / 1000)
+            expected = leader.get_state()
+            leader.close()
+        finally:
+            transport.close()
+
+        followers = [results.get(timeout=60) for _ in processes]
+        for process in processes:
+            process.join(timeout=60)
+
+    converged = all(
+        state["commit_index"] == expected["commit_index"]
+        and state["log_length"] == expected["log_length"]
+        and state["state_machine"] == leader.state_machine
+        for state in followers
+    )
+    return ReplicationResult(
+        mode=mode,
+        nodes=nodes,
+        commands=commands,
+        committed=committed,
+        duration_s=duration,
+        commits_per_second=committed / duration if duration else 0.0,
+        converged=converged,
+    )
+
+
+def run_benchmark(
+    modes: list[str],
+    nodes: int = DEFAULT_NODES,
+    commands: int = DEFAULT_COMMANDS,
+    window: int = DEFAULT_WINDOW,
+) -> dict[str, ReplicationResult]:
+    """Run every mode and print a summary line for each."""
+    results = {}
+    for mode in modes:
+        result = run_mode(mode, nodes, commands, window)
+        results[mode] = result
+        print(  # noqa: T201
+            f"{mode:>9}: {result.commits_per_second:10,.0f} commits/s  "
+            f"({result.committed}/{result.commands} in {result.duration_s:.2f} s, "
+            f"converged={result.converged})",
+            file=sys.stderr,
+        )
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command-line entry point; returns the exit status."""
+    parser = argparse.ArgumentParser(description="Benchmark Raft log replication")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = sub.add_parser("run", help="Measure commits per second")
+    run_parser.add_argument("--nodes", type=int, default=DEFAULT_NODES)
+    run_parser.add_argument("--commands", type=int, default=DEFAULT_COMMANDS)
+    run_parser.add_argument("--window", type=int, default=DEFAULT_WINDOW)
+    run_parser.add_argument("--modes", default=",".join(MODES), help="e.g. batched,per-entry")
+
+    args = parser.parse_args(argv)
+    results = run_benchmark(args.modes.split(","), args.nodes, args.commands, args.window)
+    print(json.dumps({mode: asdict(r) for mode, r in results.items()}, indent=2))  # noqa: T201
+    return 0 if all(r.converged and r.committed == r.commands for r in results.values()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
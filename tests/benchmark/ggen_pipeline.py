@@ -0,0 +1,492 @@
+"""
+ggen Pipeline Benchmark Harness
+===============================
+
+Reproducible end-to-end benchmark of ``run_transform`` (μ₁ NORMALIZE through
+μ₅ RECEIPT) over a real rule from the repository's ``ggen.toml``.
+
+The rule's ontology files are extended with a synthetic ontology of the same
+shape (commands and their option properties) at 10k, 100k or 1M triples, and
+its real SPARQL query and Tera template are used unchanged. Each size runs in
+a fresh spawned process:
+
+* **Cold run**: First transform in the process - graph, SHACL, SPARQL parse
+  and template caches are empty
+* **Warm runs**: Repeated transforms in the same process; the median per
+  stage is recorded
+* **Per-stage timing**: Taken from ``StageResult.duration_ms``
+* **Peak RSS**: ``ru_maxrss`` of the worker process after all runs
+
+Entries (commit, timestamp, per-size results) are appended to a JSON history
+file, and ``compare`` flags stage-level regressions between two entries.
+
+Usage
+-----
+    python -m tests.benchmark.ggen_pipeline run --runs 3
+    python -m tests.benchmark.ggen_pipeline run --sizes 10k,100k --runs 2
+    python -m tests.benchmark.ggen_pipeline run --sizes 1m --runs 1
+    python -m tests.benchmark.ggen_pipeline compare
+    python -m tests.benchmark.ggen_pipeline compare --base 1a2b3c --head HEAD
+
+Notes
+-----
+With rdflib, μ₂ EXTRACT grows quadratically for queries with OPTIONAL
+groups, such as the default rule's (about 30 s at 5k triples). That is why
+100k and 1M are opt-in through ``--sizes``; 1M also needs several GB of RAM.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+try:
+    import resource
+
+    RESOURCE_AVAILABLE = True
+except ImportError:  # pragma: no cover - Windows
+    RESOURCE_AVAILABLE = False
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_RULE = "agi-command-ops"
+DEFAULT_HISTORY = REPO_ROOT / ".benchmarks" / "ggen_pipeline.json"
+SIZES = {"10k": 10_000, "100k": 100_000, "1m": 1_000_000}
+STAGES = ("normalize", "extract", "emit", "canonicalize", "receipt")
+
+# A stage regresses if it is this much slower *and* slower by min_delta_ms
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_MIN_DELTA_MS = 5.0
+
+_PREFIXES = """@prefix : <http://spec-kit.io/agi/cli#> .
+@prefix cli: <http://github.com/github/spec-kit/cli#> .
+@prefix sk: <http://github.com/github/spec-kit#> .
+@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+@prefix owl: <http://www.w3.org/2002/07/owl#> .
+@prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
+
+"""
+
+_WORDS = (
+    "reason",
+    "plan",
+    "infer",
+    "graph",
+    "agent",
+    "task",
+    "schema",
+    "ontology",
+    "query",
+    "render",
+    "emit",
+    "validate",
+    "normalize",
+    "extract",
+    "receipt",
+    "hash",
+    "cache",
+    "strategy",
+    "iteration",
+    "output",
+)
+
+
+# =============================================================================
+# Synthetic ontology
+# =============================================================================
+
+
+def generate_ontology(path: Path, triples: int, seed: int = 0) -> int:
+    """Write a synthetic command ontology with at least ``triples`` triples.
+
+    Commands follow ``ontology/cli-commands-agi.ttl``: an ``owl:Class``
+    sub-classing ``cli:Command`` with label, comment, category and
+    description (6 triples), plus 2-8 option properties of 5 triples each.
+
+    Parameters
+    ----------
+    path : Path
+        Turtle file to write.
+    triples : int
+        Minimum number of triples.
+    seed : int, optional
+        Random seed (same seed, same file).
+
+    Returns
+    -------
+    int
+        Number of triples written.
+    """
+    rng = random.Random(seed)
+    written = 0
+    index = 0
+    with path.open("w", encoding="utf-8") as f:
+        f.write(_PREFIXES)
+        while written < triples:
+            name = f"bench_cmd_{index:07d}"
+            text = " ".join(rng.choices(_WORDS, k=rng.randint(4, 16)))
+            f.write(
+                f":{name} a owl:Class ;\n"
+                f"    rdfs:subClassOf cli:Command ;\n"
+                f'    rdfs:label "{name}" ;\n'
+                f'    rdfs:comment "{text}" ;\n'
+                f'    sk:category "bench{index % 17}" ;\n'
+                f'    sk:description "{text} ({index})" .\n\n'
+            )
+            written += 6
+            for option in range(rng.randint(2, 8)):
+                kind = "argument" if option == 0 else "option"
+                f.write(
+                    f":{name}_opt{option} a owl:DatatypeProperty ;\n"
+                    f"    rdfs:domain :{name} ;\n"
+                    f"    rdfs:range xsd:string ;\n"
+                    f'    rdfs:label "opt{option}" ;\n'
+                    f'    rdfs:comment "[type:{kind}] [flag:--opt{option}] '
+                    f'[default:{rng.choice(_WORDS)}] [help:{text}]" .\n\n'
+                )
+                written += 5
+            index += 1
+    return written
+
+
+# =============================================================================
+# Running
+# =============================================================================
+
+
+@dataclass
+class SizeResult:
+    """Benchmark result for one ontology size.
+
+    Attributes
+    ----------
+    label : str
+        Size label (e.g. "100k").
+    triples : int
+        Synthetic triples added to the rule's ontology.
+    cold : dict[str, float]
+        Stage durations (ms) of the first run.
+    warm : dict[str, float]
+        Median stage durations (ms) of the later runs.
+    cold_total_ms : float
+        Wall time of the first run.
+    warm_total_ms : float
+        Median wall time of the later runs.
+    peak_rss_mb : float
+        Peak resident set size of the benchmark process.
+    output_bytes : int
+        Size of the generated output.
+    """
+
+    label: str
+    triples: int
+    cold: dict[str, float]
+    warm: dict[str, float]
+    cold_total_ms: float
+    warm_total_ms: float
+    peak_rss_mb: float
+    output_bytes: int
+
+
+def bench_size(label: str, triples: int, runs: int, rule: str = DEFAULT_RULE) -> SizeResult:
+    """Benchmark one size in the current process.
+
+    Parameters
+    ----------
+    label : str
+        Size label.
+    triples : int
+        Synthetic triples to add.
+    runs : int
+        Total runs (1 cold + ``runs - 1`` warm).
+    rule : str, optional
+        Rule name in the repository's ggen.toml.
+
+    Returns
+    -------
+    SizeResult
+        Timings and memory use.
+
+    Raises
+    ------
+    RuntimeError
+        If the transform fails.
+    """
+    from specify_cli.ops.ggen_manifest import (
+        load_manifest,
+        manifest_transform_configs,
+    )
+    from specify_cli.runtime.ggen import run_transform
+
+    configs = manifest_transform_configs(load_manifest(REPO_ROOT / "ggen.toml"), REPO_ROOT)
+    config = next((c for c in configs if c.name == rule), None)
+    if config is None:
+        raise RuntimeError(f"Rule not found in ggen.toml: {rule}")
+
+    with tempfile.TemporaryDirectory(prefix="ggen-bench-") as tmp:
+        synthetic = Path(tmp) / f"synthetic-{label}.ttl"
+        generate_ontology(synthetic, triples)
+        config.input_files = [*config.input_files, str(synthetic)]
+        config.output_file = str(Path(tmp) / "out" / Path(config.output_file).name)
+
+        timings: list[dict[str, float]] = []
+        totals: list[float] = []
+        for _ in range(max(runs, 1)):
+            start = time.perf_counter()
+            result = run_transform(config)
+            totals.append((time.perf_counter() - start) * 1000)
+            if not result.success:
+                raise RuntimeError(f"Transform failed: {result.errors}")
+            timings.append(
+                {
+                    stage: result.stage_results[stage].duration_ms
+                    for stage in STAGES
+                    if stage in result.stage_results
+                }
+            )
+        output_bytes = Path(config.output_file).stat().st_size
+
+    warm = timings[1:] or timings
+    return SizeResult(
+        label=label,
+        triples=triples,
+        cold=timings[0],
+        warm={stage: statistics.median(t[stage] for t in warm) for stage in timings[0]},
+        cold_total_ms=totals[0],
+        warm_total_ms=statistics.median(totals[1:] or totals),
+        peak_rss_mb=_peak_rss_mb(),
+        output_bytes=output_bytes,
+    )
+
+
+def run_benchmark(
+    sizes: list[str],
+    runs: int = 3,
+    rule: str = DEFAULT_RULE,
+    isolate: bool = True,
+) -> dict[str, Any]:
+    """Benchmark every size and build a history entry.
+
+    Parameters
+    ----------
+    sizes : list[str]
+        Size labels from SIZES, or plain triple counts.
+    runs : int, optional
+        Runs per size (first is cold).
+    rule : str, optional
+        Rule name in ggen.toml.
+    isolate : bool, optional
+        Run each size in a fresh spawned process, so cold runs see empty
+        caches and peak RSS is per size. Default is True.
+
+    Returns
+    -------
+    dict[str, Any]
+        History entry.
+    """
+    results: dict[str, Any] = {}
+    for label in sizes:
+        triples = SIZES.get(label.lower()) or int(label)
+        if isolate:
+            context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                result = pool.submit(bench_size, label, triples, runs, rule).result()
+        else:
+            result = bench_size(label, triples, runs, rule)
+        results[label] = asdict(result)
+        print(  # noqa: T201
+            f"{label:>6}: cold {result.cold_total_ms:9.1f} ms  "
+            f"warm {result.warm_total_ms:9.1f} ms  rss {result.peak_rss_mb:8.1f} MB",
+            file=sys.stderr,
+        )
+
+    return {
+        "commit": _git_commit(),
+        "timestamp": datetime.now(UTC).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "rule": rule,
+        "runs": runs,
+        "results": results,
+    }
+
+
+# =============================================================================
+# History and comparison
+# =============================================================================
+
+
+@dataclass
+class Regression:
+    """A stage that got slower between two history entries."""
+
+    size: str
+    mode: str
+    stage: str
+    base_ms: float
+    head_ms: float
+
+    @property
+    def ratio(self) -> float:
+        """Head time relative to base time."""
+        return self.head_ms / self.base_ms if self.base_ms else float("inf")
+
+    def __str__(self) -> str:
+        """Human-readable description."""
+        return (
+            f"{self.size} {self.mode} {self.stage}: "
+            f"{self.base_ms:.1f} ms -> {self.head_ms:.1f} ms ({self.ratio:.2f}x)"
+        )
+
+
+def load_history(path: Path = DEFAULT_HISTORY) -> list[dict[str, Any]]:
+    """Load history entries (empty if the file does not exist)."""
+    if not path.exists():
+        return []
+    return list(json.loads(path.read_text()))
+
+
+def append_history(entry: dict[str, Any], path: Path = DEFAULT_HISTORY) -> None:
+    """Append an entry to the history file."""
+    history = load_history(path)
+    history.append(entry)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(history, indent=2) + "\n")
+
+
+def find_entry(history: list[dict[str, Any]], ref: str) -> dict[str, Any]:
+    """Latest entry whose commit starts with ``ref`` (a git ref is resolved first).
+
+    Raises
+    ------
+    LookupError
+        If no entry matches.
+    """
+    commit = _git_commit(ref) or ref
+    for entry in reversed(history):
+        if entry.get("commit", "").startswith(commit):
+            return entry
+    raise LookupError(f"No benchmark entry for {ref}")
+
+
+def compare(
+    base: dict[str, Any],
+    head: dict[str, Any],
+    threshold: float = DEFAULT_THRESHOLD,
+    min_delta_ms: float = DEFAULT_MIN_DELTA_MS,
+) -> list[Regression]:
+    """Find stages that regressed from ``base`` to ``head``.
+
+    Parameters
+    ----------
+    base, head : dict[str, Any]
+        History entries.
+    threshold : float, optional
+        Relative slowdown that counts as a regression (0.25 = 25%).
+    min_delta_ms : float, optional
+        Absolute slowdown below which differences are treated as noise.
+
+    Returns
+    -------
+    list[Regression]
+        Regressions for sizes present in both entries.
+    """
+    regressions = []
+    for size, head_result in head["results"].items():
+        base_result = base["results"].get(size)
+        if base_result is None:
+            continue
+        for mode in ("cold", "warm"):
+            for stage, head_ms in head_result[mode].items():
+                base_ms = base_result[mode].get(stage)
+                if base_ms is None:
+                    continue
+                if head_ms > base_ms * (1 + threshold) and head_ms - base_ms >= min_delta_ms:
+                    regressions.append(Regression(size, mode, stage, base_ms, head_ms))
+    return regressions
+
+
+# =============================================================================
+# Helpers and CLI
+# =============================================================================
+
+
+def _peak_rss_mb() -> float:
+    if not RESOURCE_AVAILABLE:
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _git_commit(ref: str = "HEAD") -> str:
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "--verify", "--quiet", f"{ref}^{{commit}}"],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+    except OSError:
+        return ""
+    return completed.stdout.strip()
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command-line entry point; returns the exit status."""
+    parser = argparse.ArgumentParser(description="Benchmark the ggen μ pipeline")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = sub.add_parser("run", help="Benchmark and append to the history")
+    run_parser.add_argument("--sizes", default="10k", help="e.g. 10k,100k,1m")
+    run_parser.add_argument("--runs", type=int, default=3, help="Runs per size (first is cold)")
+    run_parser.add_argument("--rule", default=DEFAULT_RULE)
+    run_parser.add_argument("--history", type=Path, default=DEFAULT_HISTORY)
+
+    compare_parser = sub.add_parser("compare", help="Flag stage regressions")
+    compare_parser.add_argument("--base", help="Commit/ref (default: previous entry)")
+    compare_parser.add_argument("--head", help="Commit/ref (default: latest entry)")
+    compare_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    compare_parser.add_argument("--min-delta-ms", type=float, default=DEFAULT_MIN_DELTA_MS)
+    compare_parser.add_argument("--history", type=Path, default=DEFAULT_HISTORY)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        entry = run_benchmark(args.sizes.split(","), runs=args.runs, rule=args.rule)
+        append_history(entry, args.history)
+        print(json.dumps(entry["results"], indent=2))  # noqa: T201
+        return 0
+
+    history = load_history(args.history)
+    try:
+        head = find_entry(history, args.head) if args.head else history[-1]
+        base = find_entry(history, args.base) if args.base else history[-2]
+    except (LookupError, IndexError) as e:
+        print(f"Cannot compare: {e or 'need at least two entries'}", file=sys.stderr)  # noqa: T201
+        return 2
+
+    regressions = compare(base, head, args.threshold, args.min_delta_ms)
+    print(f"base {base['commit'][:10]}  head {head['commit'][:10]}")  # noqa: T201
+    for regression in regressions:
+        print(f"REGRESSION {regression}")  # noqa: T201
+    if not regressions:
+        print("No stage regressions")  # noqa: T201
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
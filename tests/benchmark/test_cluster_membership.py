@@ -0,0 +1,123 @@
+"""
+Membership Micro-Benchmarks for the ClusterManager
+==================================================
+
+Measures heartbeat processing, failure detection and node selection in
+specify_cli.runtime.cluster with tens of thousands of simulated nodes,
+against the full scans the manager used before (``is_alive`` on every node
+per health check, filtering every node per ``get_available_nodes``).
+
+Absolute rates depend on the machine, so the checks compare against the
+scans and across cluster sizes.
+
+Run with: pytest tests/benchmark/test_cluster_membership.py -s
+"""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from specify_cli.runtime.cluster import ClusterManager, NodeHealth
+from specify_cli.runtime.distributed_execution import (
+    DistributedExecutor,
+    DistributedTask,
+    TaskSchedulingStrategy,
+)
+
+pytestmark = pytest.mark.benchmark
+
+NODES = 20_000
+OPERATIONS = 20_000
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _cluster(count: int) -> tuple[ClusterManager, FakeClock]:
+    clock = FakeClock()
+    manager = ClusterManager("bench", clock=clock)
+    for i in range(count):
+        manager.add_node("sim", i)
+    return manager, clock
+
+
+def _heartbeat_rate(count: int) -> float:
+    """Heartbeats per second; every node beats within the timeout, so entries re-arm."""
+    manager, clock = _cluster(count)
+    node_ids = list(manager.nodes)
+    start = time.perf_counter()
+    for i in range(OPERATIONS):
+        clock.now += 0.001
+        manager.heartbeat(node_ids[i % count])
+        manager.expire_nodes()
+    return OPERATIONS / (time.perf_counter() - start)
+
+
+def test_heartbeats_independent_of_cluster_size() -> None:
+    small = _heartbeat_rate(100)
+    large = _heartbeat_rate(NODES)
+
+    print(f"\nheartbeats: 100 nodes {small:,.0f}/s, {NODES} nodes {large:,.0f}/s")  # noqa: T201
+    assert large > 0.3 * small
+
+
+def test_failure_detection_beats_full_scan() -> None:
+    """Periodic health checks only visit due heap entries.
+
+    Each node's entry is re-armed at most once per timeout, so checks in
+    between cost O(1) where the scan visits every node.
+    """
+    manager, clock = _cluster(NODES)
+    timeout = manager.heartbeat_timeout_seconds
+    clock.now = 10.0
+    for node_id in list(manager.nodes)[NODES // 100 :]:
+        manager.heartbeat(node_id)
+    clock.now = 35.0
+
+    expired = manager.expire_nodes()
+    scanned = [n for n, node in manager.nodes.items() if not node.is_alive(timeout, now=clock.now)]
+    assert sorted(expired) == sorted(scanned)
+    assert len(expired) == NODES // 100
+
+    checks = 100
+    start = time.perf_counter()
+    for _ in range(checks):
+        clock.now += 0.05
+        manager.expire_nodes()
+    heap = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(checks):
+        [n for n, node in manager.nodes.items() if not node.is_alive(timeout, now=clock.now)]
+    scan = time.perf_counter() - start
+
+    print(f"\n{checks} checks: heap {heap * 1e3:.2f} ms vs scan {scan * 1e3:.2f} ms")  # noqa: T201
+    assert heap < scan / 10
+
+
+def test_node_selection_beats_filtering() -> None:
+    """Round-robin selection no longer filters every node per task."""
+    manager, _ = _cluster(NODES)
+    executor = DistributedExecutor(manager, TaskSchedulingStrategy.ROUND_ROBIN)
+    task = DistributedTask("t", "noop", lambda: None)
+
+    start = time.perf_counter()
+    for _ in range(OPERATIONS):
+        executor._select_node(task)  # noqa: SLF001
+    rate = OPERATIONS / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for _ in range(OPERATIONS // 100):
+        [n for n in manager.nodes.values() if n.health == NodeHealth.HEALTHY]
+    filtering = OPERATIONS // 100 / (time.perf_counter() - start)
+
+    executor.shutdown()
+    print(f"\nselection: {rate:,.0f}/s vs filtering {filtering:,.0f}/s")  # noqa: T201
+    assert rate > 10 * filtering
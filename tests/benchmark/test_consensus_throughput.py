@@ -0,0 +1,44 @@
+"""
+Replication Throughput Benchmarks for the Raft Consensus Engine
+===============================================================
+
+Runs the multi-process harness in tests/benchmark/consensus_harness.py:
+followers in spawned processes with durable logs, the leader proposing
+through a pipe transport.
+
+Absolute rates depend on the disk and machine, so the check compares
+batched, pipelined replication against one entry per round trip.
+
+Run with: pytest tests/benchmark/test_consensus_throughput.py -s
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from tests.benchmark.consensus_harness import run_mode
+
+pytestmark = pytest.mark.benchmark
+
+COMMANDS = 1_000
+
+
+def test_all_commands_commit_and_followers_converge() -> None:
+    result = run_mode("batched", nodes=3, commands=200, window=64)
+
+    assert result.committed == 200
+    assert result.converged
+
+
+def test_batching_beats_per_entry_replication() -> None:
+    """Batches and a window of outstanding requests amortize fsyncs and round trips."""
+    batched = run_mode("batched", nodes=3, commands=COMMANDS, window=256)
+    per_entry = run_mode("per-entry", nodes=3, commands=COMMANDS, window=1)
+
+    print(  # noqa: T201
+        f"\nbatched {batched.commits_per_second:,.0f} commits/s vs "
+        f"per-entry {per_entry.commits_per_second:,.0f} commits/s"
+    )
+    assert batched.converged
+    assert per_entry.converged
+    assert batched.commits_per_second > 3 * per_entry.commits_per_second
@@ -0,0 +1,99 @@
+"""
+Report Benchmarks for Execution Tracking
+========================================
+
+Measures ``get_phase_report`` and ``get_overall_report`` in
+specify_cli.runtime.execution over a large execution history: aggregation
+in SQL against loading every row into ``ExecutionState`` objects as the
+reports did before, and cached polling against rebuilding.
+
+Absolute times depend on the machine, so the checks are relative.
+
+Run with: pytest tests/benchmark/test_execution_reports.py -s
+"""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from specify_cli.runtime import execution
+from specify_cli.runtime.state import ExecutionState, StateStore
+
+pytestmark = pytest.mark.benchmark
+
+ROWS = 100_000
+PHASES = 10
+
+
+@pytest.fixture(scope="module")
+def store(tmp_path_factory):
+    store = StateStore(tmp_path_factory.mktemp("reports") / "executions.db")
+    for i in range(ROWS):
+        store.save_execution(
+            ExecutionState(
+                execution_id=f"e{i}",
+                phase=f"phase-{i % PHASES}",
+                status="failed" if i % 7 == 0 else "completed",
+                start_time="2026-01-01T00:00:00",
+                duration=(i % 1000) / 100,
+                input_data={"i": i},
+            )
+        )
+    store.flush()
+    yield store
+    store.close()
+
+
+@pytest.fixture
+def reports(store, monkeypatch):
+    monkeypatch.setattr(execution, "get_state_store", lambda: store)
+    monkeypatch.setattr(execution, "_report_cache", {})
+    return execution
+
+
+def _python_phase_report(store: StateStore, phase: str) -> dict:
+    """Aggregation as previously implemented: every row through Python."""
+    executions = store.get_phase_executions(phase)
+    total = len(executions)
+    successful = sum(1 for e in executions if e.status == "completed")
+    return {
+        "total_executions": total,
+        "successful": successful,
+        "average_duration": sum(e.duration for e in executions) / total,
+    }
+
+
+def _elapsed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def test_sql_aggregation_beats_python(store, reports) -> None:
+    phase = "phase-3"
+    sql = _elapsed(lambda: reports.get_phase_report(phase))
+    python = _elapsed(lambda: _python_phase_report(store, phase))
+
+    report = reports.get_phase_report(phase)
+    legacy = _python_phase_report(store, phase)
+    assert report["total_executions"] == legacy["total_executions"]
+    assert report["successful"] == legacy["successful"]
+    assert report["average_duration"] == pytest.approx(legacy["average_duration"])
+
+    print(f"\nphase report: SQL {sql * 1e3:.1f} ms vs Python {python * 1e3:.1f} ms")  # noqa: T201
+    assert sql < python
+
+
+def test_cached_polling_costs_milliseconds(reports) -> None:
+    build = _elapsed(reports.get_overall_report)
+    polls = 100
+    poll = _elapsed(lambda: [reports.get_overall_report() for _ in range(polls)]) / polls
+
+    print(  # noqa: T201
+        f"\noverall report over {ROWS} rows: build {build * 1e3:.1f} ms, "
+        f"cached poll {poll * 1e3:.2f} ms"
+    )
+    assert poll < build / 10
+    assert poll < 0.05
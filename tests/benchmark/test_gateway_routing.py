@@ -0,0 +1,113 @@
+"""
+Routing Micro-Benchmarks for the API Gateway LoadBalancer
+=========================================================
+
+Measures routing decisions per second in specify_cli.runtime.gateway with
+thousands of endpoints, against the linear scan the balancer used before
+(rebuild the available list, then ``min`` or ``random.choices``).
+
+Absolute rates depend on the machine, so the checks compare against the
+linear scan and across endpoint counts.
+
+Run with: pytest tests/benchmark/test_gateway_routing.py -s
+"""
+
+from __future__ import annotations
+
+import random
+import time
+
+import pytest
+
+from specify_cli.runtime.gateway import Endpoint, LoadBalancer, LoadBalancingStrategy
+
+pytestmark = pytest.mark.benchmark
+
+ENDPOINTS = 2_000
+DECISIONS = 20_000
+
+
+def _endpoints(count: int) -> list[Endpoint]:
+    return [
+        Endpoint(f"e{i}", "10.0.0.1", 8000 + i, capacity=10**9, weight=1.0 + i % 4)
+        for i in range(count)
+    ]
+
+
+def _balancer(strategy: LoadBalancingStrategy, count: int) -> LoadBalancer:
+    lb = LoadBalancer(strategy, seed=1)
+    for endpoint in _endpoints(count):
+        lb.register_endpoint(endpoint)
+    return lb
+
+
+def _linear_select(endpoints: list[Endpoint], strategy: LoadBalancingStrategy) -> Endpoint:
+    """Selection as previously implemented: O(n) per decision."""
+    available = [e for e in endpoints if e.is_available()]
+    if strategy == LoadBalancingStrategy.LEAST_LOADED:
+        return min(available, key=lambda e: e.current_load)
+    if strategy == LoadBalancingStrategy.WEIGHTED:
+        total_weight = sum(e.weight for e in available)
+        return random.choices(available, weights=[e.weight / total_weight for e in available])[0]
+    return random.choice(available)
+
+
+def _routing_rate(lb: LoadBalancer, decisions: int = DECISIONS) -> float:
+    """Route-and-complete cycles per second."""
+    start = time.perf_counter()
+    for _ in range(decisions):
+        lb.complete_request(lb.route_request({}))
+    return decisions / (time.perf_counter() - start)
+
+
+def _linear_rate(strategy: LoadBalancingStrategy, decisions: int) -> float:
+    endpoints = _endpoints(ENDPOINTS)
+    start = time.perf_counter()
+    for _ in range(decisions):
+        endpoint = _linear_select(endpoints, strategy)
+        endpoint.current_load += 1
+        endpoint.current_load -= 1
+    return decisions / (time.perf_counter() - start)
+
+
+@pytest.mark.parametrize(
+    "strategy",
+    [
+        LoadBalancingStrategy.LEAST_LOADED,
+        LoadBalancingStrategy.WEIGHTED,
+        LoadBalancingStrategy.POWER_OF_TWO,
+        LoadBalancingStrategy.RANDOM,
+    ],
+)
+def test_routing_beats_linear_scan(strategy: LoadBalancingStrategy) -> None:
+    """Heap, alias table and sampling outpace rebuilding the candidate list."""
+    rate = _routing_rate(_balancer(strategy, ENDPOINTS))
+    linear = _linear_rate(strategy, DECISIONS // 20)
+
+    print(  # noqa: T201
+        f"\n{strategy.value}: {rate:,.0f} decisions/s vs linear scan {linear:,.0f}/s "
+        f"over {ENDPOINTS} endpoints"
+    )
+    assert rate > 10 * linear
+
+
+@pytest.mark.parametrize("strategy", list(LoadBalancingStrategy))
+def test_routing_rate_independent_of_endpoint_count(strategy: LoadBalancingStrategy) -> None:
+    """Going from 50 to 5000 endpoints costs at most a log factor."""
+    small = _routing_rate(_balancer(strategy, 50))
+    large = _routing_rate(_balancer(strategy, 5_000))
+
+    print(f"\n{strategy.value}: 50 endpoints {small:,.0f}/s, 5000 endpoints {large:,.0f}/s")  # noqa: T201
+    assert large > 0.5 * small
+
+
+def test_select_rate() -> None:
+    """Raw least-loaded selection rate, without request bookkeeping."""
+    lb = _balancer(LoadBalancingStrategy.LEAST_LOADED, ENDPOINTS)
+    start = time.perf_counter()
+    for _ in range(DECISIONS):
+        lb._select_endpoint()  # noqa: SLF001
+    rate = DECISIONS / (time.perf_counter() - start)
+
+    print(f"\nleast_loaded selection: {rate:,.0f} decisions/s")  # noqa: T201
+    assert rate > 0
@@ -0,0 +1,100 @@
+"""
+Tests for the ggen Pipeline Benchmark Harness
+=============================================
+
+Tests verify:
+1. The synthetic ontology parses to the reported triple count
+2. A small run records cold/warm timings for all five stages
+3. compare flags slow stages and ignores noise below the absolute floor
+4. History round-trips and the compare exit codes
+"""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from rdflib import Graph
+
+from tests.benchmark.ggen_pipeline import (
+    STAGES,
+    append_history,
+    compare,
+    generate_ontology,
+    load_history,
+    main,
+    run_benchmark,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _entry(commit: str, emit_ms: float) -> dict[str, Any]:
+    """History entry with one size and flat stage timings."""
+    timings = dict.fromkeys(STAGES, 10.0) | {"emit": emit_ms}
+    return {
+        "commit": commit,
+        "results": {"10k": {"cold": dict(timings), "warm": dict(timings)}},
+    }
+
+
+def test_generate_ontology_triple_count(tmp_path: Path) -> None:
+    """The written triple count matches what rdflib parses."""
+    path = tmp_path / "synthetic.ttl"
+    written = generate_ontology(path, 500)
+
+    assert written >= 500
+    assert len(Graph().parse(path, format="turtle")) == written
+
+
+def test_generate_ontology_deterministic(tmp_path: Path) -> None:
+    """The same seed writes the same file."""
+    generate_ontology(tmp_path / "a.ttl", 300, seed=7)
+    generate_ontology(tmp_path / "b.ttl", 300, seed=7)
+
+    assert (tmp_path / "a.ttl").read_bytes() == (tmp_path / "b.ttl").read_bytes()
+
+
+@pytest.mark.slow
+def test_run_benchmark_small() -> None:
+    """A small in-process run times every stage."""
+    entry = run_benchmark(["500"], runs=2, isolate=False)
+    result = entry["results"]["500"]
+
+    assert set(result["cold"]) == set(STAGES)
+    assert set(result["warm"]) == set(STAGES)
+    assert all(ms >= 0 for ms in result["cold"].values())
+    assert result["output_bytes"] > 0
+    assert result["peak_rss_mb"] > 0
+
+
+def test_compare_flags_regression() -> None:
+    """A stage 2x slower by more than the floor is a regression."""
+    regressions = compare(_entry("a", 20.0), _entry("b", 40.0))
+
+    assert [(r.mode, r.stage) for r in regressions] == [("cold", "emit"), ("warm", "emit")]
+    assert regressions[0].ratio == pytest.approx(2.0)
+
+
+def test_compare_ignores_noise() -> None:
+    """Large relative changes below min_delta_ms are ignored."""
+    assert compare(_entry("a", 1.0), _entry("b", 3.0), min_delta_ms=5.0) == []
+    assert compare(_entry("a", 20.0), _entry("b", 22.0)) == []
+
+
+def test_history_and_compare_exit_codes(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    """compare exits 2 without two entries, 1 on regression, 0 otherwise."""
+    history = tmp_path / "history.json"
+    assert main(["compare", "--history", str(history)]) == 2
+
+    append_history(_entry("aaaa", 20.0), history)
+    append_history(_entry("bbbb", 40.0), history)
+    assert [e["commit"] for e in load_history(history)] == ["aaaa", "bbbb"]
+    assert json.loads(history.read_text())[0]["commit"] == "aaaa"
+
+    assert main(["compare", "--history", str(history)]) == 1
+    assert "REGRESSION 10k cold emit" in capsys.readouterr().out
+
+    assert main(["compare", "--history", str(history), "--base", "bbbb", "--head", "bbbb"]) == 0
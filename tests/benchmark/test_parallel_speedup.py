@@ -0,0 +1,93 @@
+"""
+Speedup Benchmarks for the Shared Parallel Executor
+===================================================
+
+Measures process-mode speedup of CPU-bound handlers in
+specify_cli.runtime.parallel against a serial loop.
+
+Speedup is bounded by the available CPUs, so the expected speedup scales
+with ``os.cpu_count()`` and the checks skip on single-CPU machines.
+
+Run with: pytest tests/benchmark/test_parallel_speedup.py -s
+"""
+
+from __future__ import annotations
+
+import os
+import time
+
+import pytest
+
+from specify_cli.runtime.optimization import parallelize_computation
+from specify_cli.runtime.parallel import ParallelExecutor
+
+pytestmark = pytest.mark.benchmark
+
+CPUS = os.cpu_count() or 1
+WORKERS = min(CPUS, 8)
+# Fraction of linear speedup required (process start-up, IPC, scheduling)
+EFFICIENCY = 0.7
+
+
+def _burn(n: int) -> int:
+    """CPU-bound handler: sum of squares."""
+    total = 0
+    for i in range(n):
+        total += i * i
+    return total
+
+
+def _serial_time(items: list[int]) -> float:
+    start = time.perf_counter()
+    for item in items:
+        _burn(item)
+    return time.perf_counter() - start
+
+
+def _parallel_time(items: list[int], **kwargs: object) -> float:
+    executor = ParallelExecutor("process", max_workers=WORKERS, **kwargs)
+    executor.map(_burn, items[:WORKERS])  # Start the worker processes
+    start = time.perf_counter()
+    executor.map(_burn, items)
+    return time.perf_counter() - start
+
+
+@pytest.mark.skipif(CPUS < 2, reason="speedup needs at least 2 CPUs")
+@pytest.mark.parametrize(
+    ("label", "items"),
+    [
+        ("coarse", [200_000] * (WORKERS * 8)),  # ~10 ms items
+        ("fine", [2_000] * 20_000),  # ~0.1 ms items, relies on chunking
+    ],
+)
+def test_process_mode_speedup(label: str, items: list[int]) -> None:
+    """Process mode reaches near-linear speedup on CPU-bound work."""
+    serial = _serial_time(items)
+    parallel = _parallel_time(items)
+    speedup = serial / parallel
+
+    print(  # noqa: T201
+        f"\n{label}: serial {serial:.2f}s, {WORKERS} workers {parallel:.2f}s, "
+        f"speedup {speedup:.2f}x"
+    )
+    assert speedup >= EFFICIENCY * WORKERS
+
+
+@pytest.mark.skipif(CPUS < 2, reason="speedup needs at least 2 CPUs")
+def test_chunking_beats_single_items() -> None:
+    """Auto-tuned chunks outperform one IPC round trip per item."""
+    items = [2_000] * 20_000
+
+    tuned = _parallel_time(items)
+    unchunked = _parallel_time(items, chunk_size=1)
+
+    assert tuned < unchunked
+
+
+def test_parallelize_computation_process_mode() -> None:
+    """Process mode returns the serial results (runs on any machine)."""
+    items = list(range(0, 5_000, 50))
+
+    assert parallelize_computation(items, _burn, max_workers=WORKERS, mode="process") == [
+        _burn(n) for n in items
+    ]
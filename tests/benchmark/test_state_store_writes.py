@@ -0,0 +1,113 @@
+"""
+Write and Query Benchmarks for the Runtime SQLite Stores
+========================================================
+
+Measures ``StateStore.save_execution`` throughput with pooled connections
+and write-behind group commits against the previous pattern (a new
+connection and a commit per record, default journal), and phase queries
+over a large table with and without the phase index.
+
+Absolute rates depend on the disk, so the checks are relative.
+
+Run with: pytest tests/benchmark/test_state_store_writes.py -s
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import time
+
+import pytest
+
+from specify_cli.runtime.state import ExecutionState, StateStore
+
+pytestmark = pytest.mark.benchmark
+
+RECORDS = 2_000
+LARGE_TABLE = 100_000
+
+
+def _state(i: int) -> ExecutionState:
+    return ExecutionState(
+        execution_id=f"e{i}",
+        phase=f"phase-{i % 50}",
+        status="completed",
+        start_time="2026-01-01T00:00:00",
+        duration=0.5,
+        input_data={"i": i},
+    )
+
+
+def _save_per_connection(db_path, state: ExecutionState) -> None:
+    """Save as previously implemented: connect, insert, commit."""
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            """
+            INSERT OR REPLACE INTO executions
+            (execution_id, phase, status, start_time, end_time, duration,
+             input_data, output_data, errors, metadata)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                state.execution_id,
+                state.phase,
+                state.status,
+                state.start_time,
+                state.end_time,
+                state.duration,
+                json.dumps(state.input_data),
+                json.dumps(state.output_data),
+                json.dumps(state.errors),
+                json.dumps(state.metadata),
+            ),
+        )
+        conn.commit()
+
+
+def test_write_behind_beats_connection_per_save(tmp_path) -> None:
+    store = StateStore(tmp_path / "new.db", write_behind=True)
+    start = time.perf_counter()
+    for i in range(RECORDS):
+        store.save_execution(_state(i))
+    store.flush()
+    pooled = RECORDS / (time.perf_counter() - start)
+    store.close()
+
+    legacy_db = tmp_path / "old.db"
+    StateStore(legacy_db).close()
+    with sqlite3.connect(legacy_db) as conn:
+        conn.execute("PRAGMA journal_mode=DELETE")
+    start = time.perf_counter()
+    for i in range(RECORDS // 10):
+        _save_per_connection(legacy_db, _state(i))
+    legacy = RECORDS // 10 / (time.perf_counter() - start)
+
+    print(f"\nsaves: write-behind {pooled:,.0f}/s vs connection per save {legacy:,.0f}/s")  # noqa: T201
+    assert pooled > 5 * legacy
+
+
+def test_phase_query_uses_index_at_scale(tmp_path) -> None:
+    store = StateStore(tmp_path / "large.db", write_behind=True)
+    for i in range(LARGE_TABLE):
+        store.save_execution(_state(i))
+    store.flush()
+    conn = store._pool.connection()  # noqa: SLF001
+    sql = "SELECT execution_id FROM executions WHERE phase = ? ORDER BY created_at DESC, rowid DESC"
+
+    def query_time() -> float:
+        start = time.perf_counter()
+        for n in range(20):
+            conn.execute(sql, (f"phase-{n}",)).fetchall()
+        return time.perf_counter() - start
+
+    indexed = query_time()
+    conn.execute("DROP INDEX idx_executions_phase")
+    scanned = query_time()
+    store.close()
+
+    print(  # noqa: T201
+        f"\n20 phase queries over {LARGE_TABLE} rows: "
+        f"indexed {indexed * 1e3:.1f} ms vs scan {scanned * 1e3:.1f} ms"
+    )
+    assert indexed < scanned
@@ -6,10 +6,12 @@ Tests the multi-level caching system with smart invalidation.
 
 from __future__ import annotations
 
+import multiprocessing
 import time
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+import numpy as np
 import pytest
 
 from specify_cli.core.advanced_cache import (
@@ -22,6 +24,14 @@ from specify_cli.core.advanced_cache import (
     get_global_cache,
     invalidate_cache,
 )
+from specify_cli.core.cache_codecs import (
+    CacheCodec,
+    CompressedPickleCodec,
+    NumpyCodec,
+    get_codec,
+    select_codec,
+)
+from specify_cli.core.shared_cache import SharedMemoryTier, is_shareable
 
 if TYPE_CHECKING:
     from _pytest.tmpdir import TempPathFactory
@@ -338,6 +348,183 @@ class TestSmartCache:
         assert call_count == 0  # Not computed
 
 
+class TestCacheCodecs:
+    """Tests for per-type L2 codecs."""
+
+    def test_select_codec_by_type(self) -> None:
+        """Arrays use npy, large generic values compressed pickle, small ones pickle."""
+        assert select_codec(np.zeros(10)).name == "npy"
+        assert select_codec("x" * 10_000).name.startswith("pickle+")
+        assert select_codec("x" * 10_000, compress=False).name == "pickle"
+        assert select_codec({"a": 1}).name == "pickle"
+        assert select_codec(np.array([object()])).name != "npy"
+
+    def test_codec_base_is_abstract(self) -> None:
+        """Codecs must implement can_encode, dump and load."""
+        with pytest.raises(TypeError, match="abstract"):
+            CacheCodec()  # type: ignore[abstract]
+
+    def test_legacy_entries_use_pickle(self) -> None:
+        """Entries without a recorded codec decode as plain pickle."""
+        assert get_codec(None).name == "pickle"
+
+    def test_zlib_fallback_roundtrip(self, tmp_path: Path) -> None:
+        """The stdlib zlib codec is always available."""
+        codec = CompressedPickleCodec("zlib")
+        path = tmp_path / f"value{codec.extension}"
+        codec.dump({"rows": list(range(1000))}, path)
+        assert codec.load(path) == {"rows": list(range(1000))}
+
+    def test_large_array_is_memory_mapped(self, tmp_path: Path) -> None:
+        """Arrays above the threshold load as read-only memmaps."""
+        codec = NumpyCodec(mmap_threshold=1024)
+        path = tmp_path / "array.npy"
+        codec.dump(np.arange(10_000, dtype=np.float64), path)
+
+        loaded = codec.load(path)
+        assert isinstance(loaded, np.memmap)
+        assert not loaded.flags.writeable
+        np.testing.assert_array_equal(loaded, np.arange(10_000, dtype=np.float64))
+
+    def test_codec_recorded_in_metadata(self, temp_cache_dir: Path) -> None:
+        """SmartCache records the codec and reads the entry back from L2."""
+        cache1 = SmartCache(cache_dir=temp_cache_dir)
+        cache1.get_or_compute("array", lambda: np.ones((64, 64)))
+        cache1.get_or_compute("text", lambda: "y" * 10_000)
+
+        assert (temp_cache_dir / "array.npy").exists()
+        cache2 = SmartCache(cache_dir=temp_cache_dir)
+        assert cache2.get_l2_entry("array").metadata["codec"] == "npy"
+        assert cache2.get_l2_entry("text").metadata["codec"].startswith("pickle+")
+        assert cache2.get_l2_entry("missing") is None
+
+        np.testing.assert_array_equal(
+            cache2.get_or_compute("array", lambda: np.zeros(1)), np.ones((64, 64))
+        )
+        assert cache2.get_or_compute("text", lambda: "") == "y" * 10_000
+        assert cache2.get_stats().l2_hits == 2
+
+    def test_clear_removes_all_codec_files(self, cache: SmartCache) -> None:
+        """Clearing removes entries regardless of their codec."""
+        cache.get_or_compute("array", lambda: np.ones(8))
+        cache.get_or_compute("text", lambda: "z" * 10_000)
+        cache.clear()
+        assert cache.get_stats().l2_disk_bytes == 0
+
+
+def _publish_from_child(cache_dir: Path, shared_dir: Path) -> None:
+    """Compute an array in a separate process so it lands in the shared tier."""
+    cache = SmartCache(cache_dir=cache_dir, enable_shared=True, shared_dir=shared_dir)
+    cache.get_or_compute("shared:array", lambda: np.arange(1000, dtype=np.float64))
+
+
+class TestSharedMemoryTier:
+    """Tests for the L1.5 shared-memory tier."""
+
+    def test_is_shareable(self) -> None:
+        """Only bytes-like values and plain numpy arrays are shareable."""
+        assert is_shareable(b"data")
+        assert is_shareable(np.zeros(4))
+        assert not is_shareable(np.array([object()]))
+        assert not is_shareable({"a": 1})
+
+    def test_tier_bytes_and_array_roundtrip(self, tmp_path: Path) -> None:
+        """Bytes and arrays round-trip with their cache key data."""
+        tier = SharedMemoryTier(namespace="test", shared_dir=tmp_path / "shm")
+        array = np.arange(12, dtype=np.int32).reshape(3, 4)
+
+        assert tier.put("blob", b"payload", {"key": "blob"})
+        assert tier.put("array", array, {"key": "array"})
+
+        value, key_data = tier.get("blob")
+        assert value == b"payload"
+        assert key_data == {"key": "blob"}
+
+        shared_array, _ = tier.get("array")
+        np.testing.assert_array_equal(shared_array, array)
+        assert not shared_array.flags.writeable
+
+        assert tier.get("missing") is None
+        stats = tier.get_stats()
+        assert stats.hits == 2
+        assert stats.misses == 1
+        assert stats.entries == 2
+
+    def test_tier_size_cap_evicts_lru(self, tmp_path: Path) -> None:
+        """Arena stays under its size cap by evicting least recently used entries."""
+        tier = SharedMemoryTier(namespace="test", max_size_mb=1, shared_dir=tmp_path / "shm")
+        chunk = b"x" * (400 * 1024)
+
+        tier.put("a", chunk, {"key": "a"})
+        time.sleep(0.01)
+        tier.put("b", chunk, {"key": "b"})
+        time.sleep(0.01)
+        tier.put("c", chunk, {"key": "c"})
+
+        stats = tier.get_stats()
+        assert stats.bytes_used <= tier.max_bytes
+        assert stats.evictions == 1
+        assert tier.get("a") is None
+        assert tier.get("c") is not None
+
+    def test_tier_rejects_oversized_and_unshareable(self, tmp_path: Path) -> None:
+        """Values over the cap or needing pickling are skipped."""
+        tier = SharedMemoryTier(namespace="test", max_size_mb=1, shared_dir=tmp_path / "shm")
+        assert not tier.put("big", b"x" * (2 * 1024 * 1024), {"key": "big"})
+        assert not tier.put("dict", {"a": 1}, {"key": "dict"})
+        assert tier.get_stats().rejected == 2
+
+    def test_smart_cache_shared_hit(self, temp_cache_dir: Path, tmp_path: Path) -> None:
+        """A second cache on the same arena hits L1.5 instead of L2."""
+        shared_dir = tmp_path / "shm"
+        cache1 = SmartCache(cache_dir=temp_cache_dir, enable_shared=True, shared_dir=shared_dir)
+        cache1.get_or_compute("bytes-key", lambda: b"abc" * 100)
+
+        cache2 = SmartCache(cache_dir=temp_cache_dir, enable_shared=True, shared_dir=shared_dir)
+        result = cache2.get_or_compute("bytes-key", lambda: b"recomputed")
+
+        assert result == b"abc" * 100
+        stats = cache2.get_stats()
+        assert stats.shared_hits == 1
+        assert stats.l2_hits == 0
+        assert stats.shared_size == 1
+        assert stats.to_dict()["shared_hit_rate"] == 1.0
+        assert stats.avg_shared_time_ms > 0
+        assert stats.avg_l1_time_ms == 0
+
+    def test_smart_cache_shared_invalidate(self, temp_cache_dir: Path, tmp_path: Path) -> None:
+        """Invalidation removes entries from the shared tier as well."""
+        cache = SmartCache(
+            cache_dir=temp_cache_dir, enable_shared=True, shared_dir=tmp_path / "shm"
+        )
+        cache.get_or_compute("prefix:a", lambda: b"a")
+        cache.get_or_compute("prefix:b", lambda: b"b")
+
+        cache.invalidate("prefix:a")
+        cache.invalidate_pattern("prefix:")
+
+        assert cache.get_stats().shared_size == 0
+
+    def test_shared_tier_across_processes(self, temp_cache_dir: Path, tmp_path: Path) -> None:
+        """An array published by a sibling process is read without recomputation."""
+        shared_dir = tmp_path / "shm"
+        ctx = multiprocessing.get_context("spawn")
+        proc = ctx.Process(target=_publish_from_child, args=(temp_cache_dir, shared_dir))
+        proc.start()
+        proc.join(timeout=60)
+        assert proc.exitcode == 0
+
+        # Drop the L2 copy so only the shared tier can serve the value
+        for pkl in temp_cache_dir.glob("*.pkl"):
+            pkl.unlink()
+
+        cache = SmartCache(cache_dir=temp_cache_dir, enable_shared=True, shared_dir=shared_dir)
+        result = cache.get_or_compute("shared:array", lambda: np.zeros(1))
+
+        np.testing.assert_array_equal(result, np.arange(1000, dtype=np.float64))
+        assert cache.get_stats().shared_hits == 1
+
+
 class TestCacheDecorator:
     """Tests for @cached decorator."""
 
@@ -0,0 +1,217 @@
+"""
+Unit Tests for the Workflow DAG Scheduler
+=========================================
+
+Tests for specify_cli.runtime.advanced_workflows.AdvancedWorkflow.
+
+Tests verify:
+1. Independent branches run concurrently; dependents wait
+2. Ready nodes start longest critical path first
+3. Results pass between nodes by reference (threads) or shared memory
+   (processes)
+4. Failures skip dependents; timeouts and cycles are reported
+5. Per-node timings and the critical path are recorded
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any
+
+import numpy as np
+import pytest
+
+from specify_cli.runtime.advanced_workflows import (
+    AdvancedWorkflow,
+    WorkflowNode,
+    WorkflowPattern,
+)
+from specify_cli.runtime.optimization import parallelize_computation
+
+
+def _sleep(seconds: float) -> Any:
+    def handler(*_: Any) -> float:
+        time.sleep(seconds)
+        return seconds
+
+    return handler
+
+
+def _make_array() -> np.ndarray:
+    return np.arange(1_000_000, dtype=np.float64)
+
+
+def _double(inputs: dict[str, np.ndarray]) -> np.ndarray:
+    return inputs["make"] * 2
+
+
+def _total(inputs: dict[str, np.ndarray]) -> float:
+    return float(inputs["double"].sum())
+
+
+def _hang() -> None:
+    time.sleep(30)
+
+
+def test_independent_branches_overlap() -> None:
+    """Two 0.2 s branches joined by a third node take ~0.2 s, not 0.4 s."""
+    workflow = AdvancedWorkflow("wf", max_workers=4)
+    workflow.add_node(WorkflowNode("a", _sleep(0.2)))
+    workflow.add_node(WorkflowNode("b", _sleep(0.2)))
+    workflow.add_node(WorkflowNode("join", _sleep(0), dependencies=["a", "b"]))
+
+    execution = workflow.execute()
+
+    assert execution.success
+    assert execution.duration < 0.35
+    timings = execution.node_timings
+    assert timings["join"]["start"] >= max(timings["a"]["end"], timings["b"]["end"]) - 1e-3
+    assert execution.critical_path[-1] == "join"
+    assert execution.critical_path_duration >= 0.2
+
+
+def test_critical_path_first() -> None:
+    """With one worker, the head of the longest chain starts first."""
+    started: list[str] = []
+
+    def record(name: str) -> Any:
+        return lambda: started.append(name)
+
+    workflow = AdvancedWorkflow("wf", max_workers=1)
+    workflow.add_node(WorkflowNode("short", record("short")))
+    workflow.add_node(WorkflowNode("long-1", record("long-1")))
+    workflow.add_node(WorkflowNode("long-2", record("long-2"), dependencies=["long-1"]))
+    workflow.add_node(WorkflowNode("long-3", record("long-3"), dependencies=["long-2"]))
+
+    workflow.execute()
+
+    assert started[0] == "long-1"
+    assert started.index("long-3") > started.index("long-2")
+
+
+def test_results_shared_by_reference() -> None:
+    """Thread-mode nodes receive the producer's object itself."""
+    payload = {"rows": list(range(10))}
+    received: list[Any] = []
+
+    workflow = AdvancedWorkflow("wf")
+    workflow.add_node(WorkflowNode("make", lambda: payload))
+    workflow.add_node(
+        WorkflowNode(
+            "use",
+            lambda inputs: received.append(inputs["make"]),
+            dependencies=["make"],
+            pass_results=True,
+        )
+    )
+
+    workflow.execute()
+
+    assert received[0] is payload
+
+
+def test_process_mode_shared_memory() -> None:
+    """Arrays flow between worker processes through shared memory."""
+    workflow = AdvancedWorkflow("wf", max_workers=2, mode="process")
+    workflow.add_node(WorkflowNode("make", _make_array))
+    workflow.add_node(WorkflowNode("double", _double, dependencies=["make"], pass_results=True))
+    workflow.add_node(WorkflowNode("total", _total, dependencies=["double"], pass_results=True))
+
+    execution = workflow.execute()
+
+    assert execution.success, execution.errors
+    expected = float((np.arange(1_000_000, dtype=np.float64) * 2).sum())
+    assert execution.results["total"] == expected
+    assert isinstance(execution.results["double"], np.ndarray)
+    assert set(execution.shared_refs) == {"make", "double"}
+
+
+def test_failure_skips_dependents() -> None:
+    """Dependents of a failed node are skipped; other branches still run."""
+    workflow = AdvancedWorkflow("wf")
+    workflow.add_node(WorkflowNode("bad", lambda: 1 / 0))
+    workflow.add_node(WorkflowNode("child", _sleep(0), dependencies=["bad"]))
+    workflow.add_node(WorkflowNode("grandchild", _sleep(0), dependencies=["child"]))
+    workflow.add_node(WorkflowNode("other", _sleep(0)))
+
+    execution = workflow.execute()
+
+    assert not execution.success
+    assert execution.nodes_failed == ["bad"]
+    assert sorted(execution.nodes_skipped) == ["child", "grandchild"]
+    assert execution.nodes_executed == ["other"]
+    assert "division" in execution.errors["bad"]
+
+
+def test_node_timeout() -> None:
+    """A node running past its timeout is failed."""
+    release = threading.Event()
+    workflow = AdvancedWorkflow("wf")
+    workflow.add_node(WorkflowNode("slow", lambda: release.wait(5), timeout=0.1))
+
+    execution = workflow.execute()
+    release.set()
+
+    assert execution.nodes_failed == ["slow"]
+    assert "timed out" in execution.errors["slow"]
+
+
+def test_nested_parallel_work_and_timeouts() -> None:
+    """Nodes may run parallel work; their timed-out threads hold no shared workers."""
+
+    def node() -> list[float]:
+        return parallelize_computation([2.0, 2.0], time.sleep, max_workers=2)
+
+    workflow = AdvancedWorkflow("wf", max_workers=2)
+    workflow.add_node(WorkflowNode("a", node, timeout=0.1))
+    workflow.add_node(WorkflowNode("b", node, timeout=0.1))
+
+    assert sorted(workflow.execute().nodes_failed) == ["a", "b"]
+    start = time.perf_counter()
+    assert parallelize_computation([1], abs, max_workers=2, timeout=2) == [1]
+    assert time.perf_counter() - start < 1
+
+
+def test_process_node_timeout_terminates_worker() -> None:
+    """A timed-out process node does not keep execute (or a worker) waiting."""
+    workflow = AdvancedWorkflow("wf", max_workers=1, mode="process")
+    workflow.add_node(WorkflowNode("hang", _hang, timeout=0.2))
+
+    start = time.perf_counter()
+    execution = workflow.execute()
+
+    assert execution.nodes_failed == ["hang"]
+    assert time.perf_counter() - start < 5
+
+
+def test_patterns() -> None:
+    """Conditional and loop nodes keep their semantics."""
+    calls: list[int] = []
+    workflow = AdvancedWorkflow("wf")
+    workflow.add_node(
+        WorkflowNode(
+            "cond",
+            lambda: calls.append(1),
+            pattern=WorkflowPattern.CONDITIONAL,
+            condition=lambda: False,
+        )
+    )
+    workflow.add_node(
+        WorkflowNode("loop", lambda: calls.append(2), pattern=WorkflowPattern.LOOP, loop_count=3)
+    )
+
+    execution = workflow.execute()
+
+    assert execution.results == {"cond": {"skipped": True}, "loop": {"iterations": 3}}
+    assert calls == [2, 2, 2]
+
+
+def test_cycle_rejected() -> None:
+    """Dependency cycles are reported instead of deadlocking."""
+    workflow = AdvancedWorkflow("wf")
+    workflow.add_node(WorkflowNode("a", _sleep(0), dependencies=["b"]))
+    workflow.add_node(WorkflowNode("b", _sleep(0), dependencies=["a"]))
+
+    with pytest.raises(ValueError, match="Dependency cycle"):
+        workflow.execute()
@@ -0,0 +1,200 @@
+"""Tests for concurrent dispatch in MultiAgentOrchestrator."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+from specify_cli.runtime.agent_orchestration import (
+    AgentCapabilities,
+    AgentRole,
+    AgentTask,
+    AutonomousAgent,
+    MultiAgentOrchestrator,
+    create_agent_team,
+)
+from specify_cli.runtime.optimization import parallelize_computation
+
+
+class SlowAgent(AutonomousAgent):
+    """Agent whose tasks sleep, recording how many ran at once."""
+
+    def __init__(self, agent_id, role=AgentRole.EXECUTOR, capacity=2, delay=0.1):
+        super().__init__(agent_id, AgentCapabilities(role=role, max_concurrent_tasks=capacity))
+        self.delay = delay
+        self.running = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def _process_task(self, _task):
+        with self.lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        try:
+            time.sleep(self.delay)
+            return {"agent": self.agent_id}
+        finally:
+            with self.lock:
+                self.running -= 1
+
+
+class FanOutAgent(AutonomousAgent):
+    """Agent whose tasks run parallel work of their own."""
+
+    def _process_task(self, _task):
+        return parallelize_computation([1, 2, 3], abs, max_workers=2, timeout=5)
+
+
+class AsyncAgent(AutonomousAgent):
+    async def execute_task_async(self, _task):
+        await asyncio.sleep(0.1)
+        return {"success": True, "result": {"agent": self.agent_id}}
+
+
+def _tasks(count, role=AgentRole.EXECUTOR):
+    return [AgentTask(f"t{i}", "work", role) for i in range(count)]
+
+
+def _orchestrator(*agents):
+    orchestrator = MultiAgentOrchestrator()
+    for agent in agents:
+        orchestrator.register_agent(agent)
+    return orchestrator
+
+
+def test_dispatch_multiple_runs_tasks_concurrently():
+    agents = [SlowAgent("a"), SlowAgent("b")]
+    orchestrator = _orchestrator(*agents)
+
+    start = time.perf_counter()
+    result = orchestrator.dispatch_multiple_tasks(_tasks(4))
+    elapsed = time.perf_counter() - start
+
+    assert result.tasks_completed == 4
+    assert result.tasks_failed == 0
+    assert sorted(result.agents_used) == ["a", "b"]
+    assert elapsed < 0.3  # Serial dispatch takes 0.4s
+    assert len(orchestrator.task_log) == 4
+
+
+def test_agent_capacity_is_respected():
+    agent = SlowAgent("a", capacity=2, delay=0.05)
+    orchestrator = _orchestrator(agent)
+
+    result = orchestrator.dispatch_multiple_tasks(_tasks(6))
+
+    assert result.tasks_completed == 6
+    assert agent.peak == 2
+    assert agent.active_tasks == 0
+    assert agent.task_queue == []
+
+
+def test_assignment_rotates_through_idle_agents():
+    orchestrator = _orchestrator(
+        SlowAgent("a", capacity=2), SlowAgent("b", capacity=2), SlowAgent("m", AgentRole.MONITOR)
+    )
+    task = _tasks(1)[0]
+
+    picked = [orchestrator._get_agent_for_task(task).agent_id for _ in range(4)]  # noqa: SLF001
+
+    assert picked == ["a", "b", "a", "b"]
+    assert orchestrator._get_agent_for_task(task) is None  # noqa: SLF001
+
+
+def test_tasks_without_an_agent_fail():
+    orchestrator = _orchestrator(SlowAgent("a", delay=0))
+
+    result = orchestrator.dispatch_multiple_tasks(_tasks(2) + _tasks(1, role=AgentRole.ANALYZER))
+
+    assert result.tasks_completed == 2
+    assert result.tasks_failed == 1
+    response = orchestrator.dispatch_task(AgentTask("x", "work", AgentRole.MONITOR))
+    assert response["success"] is False
+
+
+def test_efficiency_reflects_wall_clock_throughput():
+    serial = _orchestrator(SlowAgent("a", capacity=1, delay=0.05))
+    parallel = _orchestrator(SlowAgent("a", capacity=4, delay=0.05))
+
+    slow = serial.dispatch_multiple_tasks(_tasks(4))
+    fast = parallel.dispatch_multiple_tasks(_tasks(4))
+
+    assert fast.throughput > 2 * slow.throughput
+    assert fast.total_duration < slow.total_duration
+    assert 0.5 < fast.coordination_efficiency <= 1.0
+
+
+def test_dispatch_multiple_async():
+    agents = [
+        AsyncAgent(f"a{i}", AgentCapabilities(AgentRole.ANALYZER, max_concurrent_tasks=5))
+        for i in range(2)
+    ]
+    orchestrator = _orchestrator(*agents)
+
+    start = time.perf_counter()
+    result = asyncio.run(orchestrator.dispatch_multiple_tasks_async(_tasks(10, AgentRole.ANALYZER)))
+    elapsed = time.perf_counter() - start
+
+    assert result.tasks_completed == 10
+    assert elapsed < 0.5  # 10 x 0.1s in one wave
+    assert all(agent.active_tasks == 0 for agent in agents)
+
+
+def test_default_team_dispatches():
+    orchestrator = create_agent_team({"size": 4})
+    tasks = [AgentTask(f"t-{role.value}", "work", role) for role in AgentRole]
+
+    result = orchestrator.dispatch_multiple_tasks(tasks)
+
+    assert result.tasks_completed == len(AgentRole)
+    assert all(task.status == "completed" for task in tasks)
+
+
+def test_dispatch_task_times_out_when_agents_are_busy():
+    agent = SlowAgent("a", capacity=1, delay=0.3)
+    orchestrator = _orchestrator(agent)
+    worker = threading.Thread(target=orchestrator.dispatch_task, args=(_tasks(1)[0],))
+    worker.start()
+    time.sleep(0.05)
+
+    response = orchestrator.dispatch_task(
+        AgentTask("late", "work", AgentRole.EXECUTOR), timeout=0.05
+    )
+    worker.join()
+
+    assert response["success"] is False
+    assert orchestrator.dispatch_task(AgentTask("next", "work", AgentRole.EXECUTOR))["success"]
+
+
+def test_dispatch_task_fails_fast_by_default():
+    agent = SlowAgent("a", capacity=1, delay=0.3)
+    orchestrator = _orchestrator(agent)
+    worker = threading.Thread(target=orchestrator.dispatch_task, args=(_tasks(1)[0],))
+    worker.start()
+    time.sleep(0.05)
+
+    start = time.perf_counter()
+    busy = orchestrator.dispatch_task(AgentTask("busy", "work", AgentRole.EXECUTOR))
+    elapsed = time.perf_counter() - start
+    waited = orchestrator.dispatch_task(AgentTask("wait", "work", AgentRole.EXECUTOR), timeout=5)
+    worker.join()
+
+    assert busy == {
+        "success": False,
+        "error": f"No agent available for role {AgentRole.EXECUTOR}",
+    }
+    assert elapsed < 0.2
+    assert waited["success"]
+
+
+def test_handlers_running_parallel_work_do_not_starve_dispatch():
+    orchestrator = MultiAgentOrchestrator(max_workers=2)
+    orchestrator.register_agent(
+        FanOutAgent("a", AgentCapabilities(role=AgentRole.EXECUTOR, max_concurrent_tasks=2))
+    )
+
+    result = orchestrator.dispatch_multiple_tasks(_tasks(4))
+
+    assert result.tasks_completed == 4
+    assert [r["result"] for _, r in orchestrator.task_log] == [[1, 2, 3]] * 4
@@ -0,0 +1,220 @@
+"""Tests for Raft replication in the consensus engine."""
+
+from __future__ import annotations
+
+import threading
+import time
+from multiprocessing import Pipe
+
+import pytest
+
+from specify_cli.runtime.consensus import (
+    ConnectionTransport,
+    ConsensusCluster,
+    ConsensusEngine,
+    LocalTransport,
+    NodeState,
+    serve_connection,
+)
+from specify_cli.runtime.raft_log import LogEntry
+
+NODES = ["n0", "n1", "n2"]
+
+
+def _add(engine):
+    def handler(data):
+        engine.state_machine["count"] = engine.state_machine.get("count", 0) + data["n"]
+
+    engine.register_command_handler("add", handler)
+
+
+def _cluster(tmp_path, **options):
+    cluster = ConsensusCluster("test", transport=LocalTransport())
+    for node_id in NODES:
+        cluster.add_node(
+            node_id, NODES, heartbeat_interval_ms=10, log_dir=tmp_path / node_id, **options
+        )
+        _add(cluster.nodes[node_id])
+    return cluster
+
+
+def _close(cluster):
+    for engine in cluster.nodes.values():
+        engine.close()
+    cluster.transport.close()
+
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            pytest.fail("condition not met in time")
+        time.sleep(0.01)
+
+
+def _propose_all(leader, count):
+    futures = [leader.propose("add", {"n": 1}) for _ in range(count)]
+    return [future.result(timeout=10) for future in futures]
+
+
+def test_leader_replicates_and_followers_apply(tmp_path):
+    cluster = _cluster(tmp_path)
+    leader = cluster.nodes["n0"]
+
+    assert leader.start_election()
+    results = _propose_all(leader, 100)
+
+    assert all(r.success and r.message == "command committed" for r in results)
+    assert [r.log_index for r in results] == list(range(1, 101))
+    assert leader.state_machine == {"count": 100}
+    _wait_for(lambda: all(e.state.commit_index == 100 for e in cluster.nodes.values()))
+    assert all(e.state_machine == {"count": 100} for e in cluster.nodes.values())
+    assert cluster.nodes["n1"].state.voted_for == "n0"
+    _close(cluster)
+
+
+def test_replication_batches_entries(tmp_path):
+    cluster = _cluster(tmp_path)
+    leader = cluster.nodes["n0"]
+    sent = []
+    send = cluster.transport.send
+
+    def counting_send(peer, method, payload):
+        if payload.get("entries"):
+            sent.append(len(payload["entries"]))
+        return send(peer, method, payload)
+
+    cluster.transport.send = counting_send
+    leader.start_election()
+    _propose_all(leader, 500)
+
+    assert sum(sent) >= 2 * 500
+    assert len(sent) < 500
+    _close(cluster)
+
+
+def test_state_recovers_from_log_directories(tmp_path):
+    cluster = _cluster(tmp_path)
+    cluster.nodes["n0"].start_election()
+    _propose_all(cluster.nodes["n0"], 20)
+    _close(cluster)
+
+    restarted = _cluster(tmp_path)
+    leader = restarted.nodes["n1"]
+
+    assert leader.state.current_term == 1
+    assert leader.state.log.last_index == 20
+    assert leader.start_election()
+    assert leader.submit_command("add", {"n": 1}, timeout=10).log_index == 21
+    assert leader.state_machine == {"count": 21}
+    _close(restarted)
+
+
+def test_lagging_follower_catches_up_from_snapshot(tmp_path):
+    cluster = _cluster(tmp_path, snapshot_threshold=25)
+    leader, lagging = cluster.nodes["n0"], cluster.nodes["n2"]
+    leader.start_election()
+    cluster.transport.disconnected.add("n2")
+
+    assert all(r.success for r in _propose_all(leader, 100))
+    assert leader.state.log.snapshot_index >= 75
+
+    cluster.transport.disconnected.clear()
+    _wait_for(lambda: lagging.state.commit_index == 100)
+
+    assert lagging.state.log.snapshot_index >= 75
+    assert lagging.state_machine == {"count": 100}
+    _close(cluster)
+
+
+def test_follower_replaces_conflicting_entries():
+    follower = ConsensusEngine("f", ["f", "l"])
+    old = [LogEntry(index=i, term=1, command="x") for i in (1, 2, 3)]
+    assert follower.append_entry(1, "l", 0, 0, old, 0).success
+
+    mismatch = follower.append_entry(3, "l", 3, 2, [], 0)
+    assert not mismatch.success
+    assert mismatch.log_index == 1  # First index of the conflicting term
+
+    new = [LogEntry(index=i, term=3, command="y") for i in (2, 3)]
+    assert follower.append_entry(3, "l", 1, 1, new, 3).success
+    assert [e.term for e in follower.state.log] == [1, 3, 3]
+    assert follower.state.commit_index == 3
+
+    stale = follower.append_entry(2, "old", 3, 3, [], 3)
+    assert (stale.success, stale.message) == (False, "stale term")
+
+
+def test_votes_are_persisted_and_single_per_term(tmp_path):
+    voter = ConsensusEngine("v", ["v", "a", "b"], log_dir=tmp_path)
+
+    assert voter.request_vote(2, "a", 0, 0).success
+    assert voter.request_vote(2, "a", 0, 0).success
+    assert not voter.request_vote(2, "b", 0, 0).success
+    voter.close()
+
+    assert ConsensusEngine("v", ["v", "a", "b"], log_dir=tmp_path).state.voted_for == "a"
+
+
+def test_propose_on_follower_fails():
+    follower = ConsensusEngine("f", NODES)
+
+    result = follower.submit_command("add", {"n": 1})
+
+    assert (result.success, result.message) == (False, "not leader")
+
+
+def test_waiting_commands_fail_when_leadership_is_lost():
+    transport = LocalTransport()
+    leader = ConsensusEngine("n0", NODES, transport=transport)
+    for node_id in NODES[1:]:
+        transport.register(ConsensusEngine(node_id, NODES, transport=transport))
+    assert leader.start_election()
+    transport.disconnected.update(NODES[1:])
+
+    future = leader.propose("add", {"n": 1})
+    leader.append_entry(leader.state.current_term + 1, "n1", 0, 0, [], 0)
+
+    result = future.result(timeout=5)
+    assert (result.success, result.message) == (False, "leadership lost")
+    assert leader.state.state == NodeState.FOLLOWER
+    leader.close()
+    transport.close()
+
+
+def test_single_node_without_transport_commits_and_applies():
+    engine = ConsensusEngine("solo", ["solo"])
+    _add(engine)
+
+    assert engine.start_election()
+    result = engine.submit_command("add", {"n": 2})
+
+    assert (result.success, result.log_index, result.message) == (True, 1, "command committed")
+    assert engine.state_machine == {"count": 2}
+    assert engine.state.last_applied == 1
+    engine.close()
+
+
+def test_connection_transport_replicates_over_pipes():
+    followers = {node_id: ConsensusEngine(node_id, NODES) for node_id in NODES[1:]}
+    connections, servers = {}, []
+    for node_id, engine in followers.items():
+        _add(engine)
+        client, server = Pipe()
+        connections[node_id] = client
+        thread = threading.Thread(target=serve_connection, args=(engine, server), daemon=True)
+        thread.start()
+        servers.append(thread)
+    transport = ConnectionTransport(connections)
+    leader = ConsensusEngine("n0", NODES, heartbeat_interval_ms=10, transport=transport)
+    _add(leader)
+
+    assert leader.start_election()
+    assert all(r.success for r in _propose_all(leader, 50))
+    _wait_for(lambda: all(e.state_machine == {"count": 50} for e in followers.values()))
+
+    leader.close()
+    transport.close()
+    for thread in servers:
+        thread.join(timeout=5)
+    assert not any(thread.is_alive() for thread in servers)
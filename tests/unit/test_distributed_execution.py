@@ -0,0 +1,150 @@
+"""
+Unit Tests for Distributed Execution
+====================================
+
+Tests for specify_cli.runtime.distributed_execution and its backends.
+
+Tests verify:
+1. Tasks run concurrently and completions update ExecutionStats
+2. The task queue is priority ordered and waits for available nodes
+3. Failures are recorded per task and per node
+4. Process pool and subprocess agent backends run picklable tasks
+"""
+
+from __future__ import annotations
+
+import operator
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+from specify_cli.runtime.cluster import ClusterManager, NodeHealth
+from specify_cli.runtime.distributed_backends import create_backend
+from specify_cli.runtime.distributed_execution import (
+    DistributedExecutor,
+    TaskSchedulingStrategy,
+    TaskState,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+@pytest.fixture
+def cluster() -> ClusterManager:
+    """Cluster with two healthy worker nodes."""
+    manager = ClusterManager("test")
+    manager.add_node("node-a", 1)
+    manager.add_node("node-b", 2)
+    return manager
+
+
+@pytest.fixture
+def executor(cluster: ClusterManager) -> Iterator[DistributedExecutor]:
+    """Thread-backed executor, two workers per node."""
+    distributed = DistributedExecutor(cluster, workers_per_node=2)
+    yield distributed
+    distributed.shutdown()
+
+
+def test_tasks_run_concurrently(executor: DistributedExecutor) -> None:
+    """Four sleeping tasks on 2x2 workers overlap."""
+    for i in range(4):
+        executor.submit_task(f"sleep-{i}", time.sleep, 0.2)
+
+    start = time.perf_counter()
+    executed = executor.execute_batch(timeout=5)
+
+    assert executed == 4
+    assert time.perf_counter() - start < 0.6
+    stats = executor.get_execution_stats()
+    assert stats["completed_tasks"] == 4
+    assert stats["pending_tasks"] == 0
+    assert 0.2 <= stats["min_execution_time"] <= stats["max_execution_time"]
+    assert executor.node_workloads == {"node-a:1": 0, "node-b:2": 0}
+
+
+def test_async_dispatch(executor: DistributedExecutor) -> None:
+    """dispatch_pending returns futures; stats fill in as tasks finish."""
+    submitted = executor.submit_task("add", operator.add, 2, 3)
+
+    futures = executor.dispatch_pending()
+    assert executor.wait_all(timeout=5)
+
+    assert futures[submitted.task_id].result()[0] == 5
+    status = executor.get_task_status(submitted.task_id)
+    assert status["state"] == "completed"
+    assert status["assigned_node"] in executor.cluster.nodes
+
+
+def test_priority_order(cluster: ClusterManager) -> None:
+    """Higher priority tasks are dispatched first."""
+    executor = DistributedExecutor(cluster, scheduling_strategy=TaskSchedulingStrategy.ROUND_ROBIN)
+    order: list[int] = []
+    for priority in (1, 9, 5):
+        executor.submit_task("append", order.append, priority, priority=priority)
+
+    executor.execute_batch(timeout=5)
+    executor.shutdown()
+
+    # One worker per node; round robin puts 9 and 1 on the same node
+    assert order.index(9) < order.index(1)
+    assert len({task.assigned_node for task in executor.tasks.values()}) == 2
+
+
+def test_failures_recorded(executor: DistributedExecutor, cluster: ClusterManager) -> None:
+    """A failing task is marked failed on the task, the stats and its node."""
+    failed = executor.submit_task("div", operator.truediv, 1, 0, affinity_node="node-b:2")
+
+    assert executor.execute_batch(timeout=5) == 0
+
+    task = executor.tasks[failed.task_id]
+    assert task.state == TaskState.FAILED
+    assert "division" in task.error
+    assert executor.stats.failed_tasks == 1
+    assert cluster.nodes["node-b:2"].failed_tasks == 1
+
+
+def test_waits_for_nodes(executor: DistributedExecutor, cluster: ClusterManager) -> None:
+    """Tasks stay queued while no node is healthy."""
+    for node in cluster.nodes.values():
+        node.health = NodeHealth.DEAD
+    executor.submit_task("add", operator.add, 1, 1)
+
+    assert executor.execute_batch(timeout=1) == 0
+    assert len(executor.task_queue) == 1
+
+    for node in cluster.nodes.values():
+        node.health = NodeHealth.HEALTHY
+    assert executor.execute_batch(timeout=5) == 1
+
+
+@pytest.mark.parametrize("backend", ["process", "agent"])
+def test_out_of_process_backends(cluster: ClusterManager, backend: str) -> None:
+    """Process and agent backends run tasks and return errors."""
+    executor = DistributedExecutor(cluster, backend=create_backend(backend, 2))
+    try:
+        ok = [executor.submit_task("pow", pow, 2, n) for n in range(6)]
+        bad = executor.submit_task("div", operator.truediv, 1, 0)
+
+        assert executor.execute_batch(timeout=60) == 6
+        assert [executor.tasks[r.task_id].result for r in ok] == [1, 2, 4, 8, 16, 32]
+        assert executor.tasks[bad.task_id].state == TaskState.FAILED
+        assert "division" in executor.tasks[bad.task_id].error
+    finally:
+        executor.shutdown()
+
+
+def test_agent_rejects_unpicklable(cluster: ClusterManager) -> None:
+    """Unpicklable handlers fail without killing the agent."""
+    executor = DistributedExecutor(cluster, backend="agent")
+    try:
+        bad = executor.submit_task("lambda", lambda: 1)
+        good = executor.submit_task("add", operator.add, 1, 2)
+
+        assert executor.execute_batch(timeout=60) == 1
+        assert executor.tasks[bad.task_id].state == TaskState.FAILED
+        assert executor.tasks[good.task_id].result == 3
+    finally:
+        executor.shutdown()
@@ -0,0 +1,130 @@
+"""
+Unit Tests for the Multi-Project ggen Orchestrator
+==================================================
+
+Tests for specify_cli.runtime.ggen_orchestrator and manifest discovery.
+
+Tests verify:
+1. Manifests are discovered recursively, skipping excluded directories
+2. Preflight resolves paths against the manifest directory and accepts [[rules]]
+3. Rules from all projects run on one schedule and share normalize nodes
+4. A failing or locked project does not stop the others
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from specify_cli.ops.ggen_filelock import FileLock
+from specify_cli.ops.ggen_manifest import discover_manifests, load_manifest
+from specify_cli.ops.ggen_preflight import run_preflight_checks
+from specify_cli.runtime.ggen_orchestrator import LOCK_FILE, sync_projects
+from specify_cli.runtime.graph_cache import clear_graph_cache
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+FEATURES_TTL = """@prefix sk: <http://spec-kit.io/ontology#> .
+@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+
+sk:Feature1 a sk:Feature ; rdfs:label "Authentication" .
+"""
+
+LABELS_QUERY = """
+PREFIX sk: <http://spec-kit.io/ontology#>
+PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
+SELECT ?label WHERE { ?f a sk:Feature ; rdfs:label ?label }
+"""
+
+MANIFEST = """
+[project]
+name = "{name}"
+
+[[rules]]
+name = "features"
+ontology = ["../shared/features.ttl"]
+sparql = "../shared/labels.rq"
+template = "features.tera"
+output = "out/features.md"
+"""
+
+
+@pytest.fixture(autouse=True)
+def _fresh_graph_cache() -> None:
+    """Isolate the process-wide graph cache between tests."""
+    clear_graph_cache()
+
+
+@pytest.fixture
+def tree(tmp_path: Path) -> Path:
+    """Two projects importing one shared ontology and query."""
+    shared = tmp_path / "shared"
+    shared.mkdir()
+    (shared / "features.ttl").write_text(FEATURES_TTL)
+    (shared / "labels.rq").write_text(LABELS_QUERY)
+    for name in ("billing", "identity"):
+        project = tmp_path / name
+        project.mkdir()
+        (project / "features.tera").write_text(f"# {name}\n")
+        (project / "ggen.toml").write_text(MANIFEST.format(name=name))
+    return tmp_path
+
+
+def test_discover_manifests(tree: Path) -> None:
+    """Manifests are found recursively; excluded directories are skipped."""
+    (tree / "node_modules" / "pkg").mkdir(parents=True)
+    (tree / "node_modules" / "pkg" / "ggen.toml").write_text(MANIFEST)
+
+    assert discover_manifests(tree) == [
+        tree / "billing" / "ggen.toml",
+        tree / "identity" / "ggen.toml",
+    ]
+
+
+def test_preflight_uses_base_dir(tree: Path) -> None:
+    """Rules-only manifests pass preflight with paths relative to base_dir."""
+    manifest = load_manifest(tree / "billing" / "ggen.toml")
+
+    assert run_preflight_checks(manifest, base_dir=tree / "billing").passed
+    assert not run_preflight_checks(manifest, base_dir=tree).passed
+
+
+def test_sync_projects_shares_normalize(tree: Path) -> None:
+    """Both projects run on one schedule and share the ontology and query."""
+    result = sync_projects(tree, max_workers=2)
+
+    assert result.success, result.to_dict()
+    assert [p.name for p in result.projects] == ["billing", "identity"]
+    assert list(result.projects[0].results) == ["features"]
+    assert (tree / "billing" / "out" / "features.md").read_text() == "# billing\n"
+    assert (tree / "identity" / "out" / "features.md").read_text() == "# identity\n"
+
+    assert result.schedule is not None
+    assert result.schedule.summary["normalize_saved"] == 1
+    assert result.schedule.summary["extract_saved"] == 1
+    assert not list(tree.glob(f"*/{LOCK_FILE}"))
+
+
+def test_failed_preflight_isolated(tree: Path) -> None:
+    """A project failing preflight does not stop the others."""
+    (tree / "identity" / "features.tera").unlink()
+
+    result = sync_projects(tree)
+
+    assert result.failed_projects == ["identity"]
+    assert "Pre-flight checks failed" in (result.projects[1].error or "")
+    assert result.projects[0].success
+    assert not (tree / "identity" / "out").exists()
+
+
+def test_locked_project_skipped(tree: Path) -> None:
+    """A project locked by another sync times out and is skipped."""
+    with FileLock(tree / "billing" / LOCK_FILE):
+        result = sync_projects(tree, lock_timeout=0.2)
+
+    assert result.failed_projects == ["billing"]
+    assert "Could not acquire lock" in (result.projects[0].error or "")
+    assert result.projects[1].success
+    assert result.to_dict()["projects"][0]["error"]
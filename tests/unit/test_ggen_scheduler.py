@@ -0,0 +1,240 @@
+"""
+Unit Tests for the ggen Rule-Graph Scheduler
+============================================
+
+Tests for specify_cli.ops.ggen_rule_graph and specify_cli.runtime.ggen_scheduler.
+
+Tests verify:
+1. ggen.toml [[rules]] convert to TransformConfig with resolved paths
+2. Rules sharing ontology/query share normalize and extract nodes
+3. Each shared SPARQL query executes once
+4. Emit runs per rule and reports per-node timings
+5. Upstream failures fail every dependent rule
+6. Output is streamed to disk atomically with receipt hashes from the stream
+7. An incremental tracker skips unchanged rules and reuses cached queries
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from specify_cli.ops.ggen_incremental import IncrementalTracker
+from specify_cli.ops.ggen_manifest import load_manifest, manifest_transform_configs
+from specify_cli.ops.ggen_rule_graph import build_rule_graph
+from specify_cli.runtime import ggen
+from specify_cli.runtime.ggen_scheduler import run_manifest, run_rules
+from specify_cli.runtime.graph_cache import clear_graph_cache
+from specify_cli.runtime.receipt import Receipt, sha256_file
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from specify_cli.ops.transform import TransformConfig
+
+FEATURES_TTL = """@prefix sk: <http://spec-kit.io/ontology#> .
+@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+
+sk:Feature1 a sk:Feature ; rdfs:label "Authentication" .
+sk:Feature2 a sk:Feature ; rdfs:label "Authorization" .
+"""
+
+LABELS_QUERY = """
+PREFIX sk: <http://spec-kit.io/ontology#>
+PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
+SELECT ?label WHERE { ?f a sk:Feature ; rdfs:label ?label } ORDER BY ?label
+"""
+
+COUNT_QUERY = """
+PREFIX sk: <http://spec-kit.io/ontology#>
+SELECT (COUNT(?f) AS ?n) WHERE { ?f a sk:Feature }
+"""
+
+MANIFEST = """
+[project]
+name = "demo"
+version = "1.0.0"
+
+[[rules]]
+name = "list-md"
+ontology = ["features.ttl"]
+sparql = "labels.rq"
+template = "list.tera"
+output = "out/list.md"
+
+[[rules]]
+name = "list-txt"
+ontology = ["features.ttl"]
+sparql = "labels.rq"
+template = "list.tera"
+output = "out/list.txt"
+
+[[rules]]
+name = "count"
+ontology = ["features.ttl"]
+sparql = "count.rq"
+template = "count.tera"
+output = "out/count.md"
+"""
+
+
+@pytest.fixture(autouse=True)
+def _fresh_graph_cache() -> None:
+    """Isolate the process-wide graph cache between tests."""
+    clear_graph_cache()
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    """Write a small project with three rules over one ontology."""
+    (tmp_path / "features.ttl").write_text(FEATURES_TTL)
+    (tmp_path / "labels.rq").write_text(LABELS_QUERY)
+    (tmp_path / "count.rq").write_text(COUNT_QUERY)
+    (tmp_path / "list.tera").write_text("# Features\n")
+    (tmp_path / "count.tera").write_text("# Count\n")
+    (tmp_path / "ggen.toml").write_text(MANIFEST)
+    return tmp_path
+
+
+@pytest.fixture
+def configs(project: Path) -> list[TransformConfig]:
+    """Configs for the project's rules."""
+    return manifest_transform_configs(load_manifest(project / "ggen.toml"), base_dir=project)
+
+
+def test_rules_convert_to_configs(configs: list[TransformConfig], project: Path) -> None:
+    """[[rules]] keys map to TransformConfig fields with resolved paths."""
+    assert [c.name for c in configs] == ["list-md", "list-txt", "count"]
+    assert configs[0].input_files == [str(project / "features.ttl")]
+    assert configs[0].sparql_query == str(project / "labels.rq")
+    assert configs[0].output_file == str(project / "out" / "list.md")
+
+
+def test_graph_dedupes_normalize_and_extract(configs: list[TransformConfig]) -> None:
+    """One ontology set and two queries give 1 normalize and 2 extract nodes."""
+    graph = build_rule_graph(configs)
+    summary = graph.summary()
+
+    assert summary["normalize"] == 1
+    assert summary["extract"] == 2
+    assert summary["emit"] == 3
+    assert summary["extract_saved"] == 1
+    assert [n.kind for n in graph.nodes.values()] == [
+        "normalize",
+        "extract",
+        "extract",
+        "emit",
+        "emit",
+        "emit",
+    ]
+
+
+def test_duplicate_outputs_rejected(configs: list[TransformConfig]) -> None:
+    """Two rules writing the same file cannot be scheduled."""
+    configs[1].output_file = configs[0].output_file
+    with pytest.raises(ValueError, match="Output file"):
+        build_rule_graph(configs)
+
+
+def test_run_executes_each_query_once(configs: list[TransformConfig], project: Path) -> None:
+    """Shared extract nodes run SPARQL once and all rules are emitted."""
+    with patch.object(ggen, "_sparql_chunks", wraps=ggen._sparql_chunks) as sparql:  # noqa: SLF001
+        result = run_rules(configs, max_workers=4)
+
+    assert result.success, result.failed_rules
+    assert sparql.call_count == 2
+    assert list(result.results) == ["list-md", "list-txt", "count"]
+    assert (project / "out" / "list.md").read_text() == "# Features\n"
+    assert (project / "out" / "count.md").exists()
+
+    kinds = [t.kind for t in result.timings]
+    assert kinds.count("normalize") == 1
+    assert kinds.count("extract") == 2
+    assert kinds.count("emit") == 3
+    assert all(t.duration_ms >= 0 and t.worker for t in result.timings)
+    assert result.to_dict()["summary"]["extract_saved"] == 1
+
+
+def test_extract_failure_fails_dependent_rules(project: Path) -> None:
+    """A broken query fails both rules that share it, not the others."""
+    (project / "labels.rq").write_text("SELECT nonsense {")
+
+    result = run_manifest(project / "ggen.toml", max_workers=2)
+
+    assert sorted(result.failed_rules) == ["list-md", "list-txt"]
+    assert result.results["count"].success
+    assert "emit" not in result.results["list-md"].stage_results
+
+
+def test_process_executor(configs: list[TransformConfig], project: Path) -> None:
+    """Emit nodes can run in worker processes."""
+    result = run_rules(configs, max_workers=2, executor="process")
+
+    assert result.success, result.failed_rules
+    emit_workers = {t.worker.split(":")[0] for t in result.timings if t.kind == "emit"}
+    stage_workers = {t.worker.split(":")[0] for t in result.timings if t.kind != "emit"}
+    assert emit_workers.isdisjoint(stage_workers)
+    assert (project / "out" / "list.txt").exists()
+
+
+def test_unknown_executor(configs: list[TransformConfig]) -> None:
+    """Executor kind is validated."""
+    with pytest.raises(ValueError, match="Unknown executor"):
+        run_rules(configs, executor="fiber")
+
+
+def test_streamed_output_and_receipt(configs: list[TransformConfig], project: Path) -> None:
+    """Receipt hashes computed while streaming match the written files."""
+    (project / "list.tera").write_text("# Features  \r\n\r\n- one\t\n- two\n\n\n")
+
+    result = run_rules(configs[:1])
+
+    assert result.success, result.failed_rules
+    output = project / "out" / "list.md"
+    assert output.read_text() == "# Features\n\n- one\n- two\n"
+    receipt = Receipt.from_file(project / "out" / "list.md.receipt.json")
+    assert receipt.output_hash == sha256_file(output)
+    assert [s.stage for s in receipt.stages] == ["normalize", "extract", "emit", "canonicalize"]
+    assert receipt.stages[-1].output_hash == receipt.output_hash
+    assert sorted(p.name for p in output.parent.iterdir()) == ["list.md", "list.md.receipt.json"]
+
+
+def test_render_error_keeps_previous_output(configs: list[TransformConfig], project: Path) -> None:
+    """A template failing mid-render leaves the previous output untouched."""
+    assert run_rules(configs[:1]).success
+    (project / "list.tera").write_text("partial\n{{ missing_variable.attr }}")
+
+    result = run_rules(configs[:1])
+
+    assert not result.success
+    output = project / "out" / "list.md"
+    assert output.read_text() == "# Features\n"
+    assert sorted(p.name for p in output.parent.iterdir()) == ["list.md", "list.md.receipt.json"]
+
+
+def test_tracker_skips_unchanged_rules(configs: list[TransformConfig], project: Path) -> None:
+    """A second tracked run skips every rule; a template edit re-renders from cache."""
+    assert run_rules(configs, tracker=IncrementalTracker(project)).success
+
+    with patch.object(ggen, "_sparql_chunks", wraps=ggen._sparql_chunks) as sparql:  # noqa: SLF001
+        unchanged = run_rules(configs, tracker=IncrementalTracker(project))
+        (project / "count.tera").write_text("# Count of features\n")
+        edited = run_rules(configs, tracker=IncrementalTracker(project))
+
+    assert sparql.call_count == 0
+    assert unchanged.success
+    assert unchanged.summary["skipped"] == 3
+    assert not unchanged.timings
+    assert all(
+        r.warnings == ["Unchanged since last sync; all stages skipped"]
+        for r in unchanged.results.values()
+    )
+    assert edited.success, edited.failed_rules
+    assert edited.summary["skipped"] == 2
+    assert edited.summary["sparql_cached"] == 1
+    assert [t.kind for t in edited.timings] == ["emit"]
+    assert (project / "out" / "count.md").read_text() == "# Count of features\n"
+    receipt = Receipt.from_file(project / "out" / "count.md.receipt.json")
+    assert [s.stage for s in receipt.stages] == ["normalize", "extract", "emit", "canonicalize"]
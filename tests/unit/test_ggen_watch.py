@@ -0,0 +1,264 @@
+"""
+Unit Tests for Native ggen Watch Mode
+=====================================
+
+Tests for specify_cli.runtime.ggen_watch.
+
+Tests verify:
+1. inotify and polling backends report changed files
+2. Bursts of edits are debounced into one batch
+3. Changed files map to the rules that declare them (including template includes)
+4. Only affected rules are re-run, well under a second after the edit
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+from specify_cli.ops.ggen_manifest import load_manifest, manifest_transform_configs
+from specify_cli.runtime.ggen_watch import (
+    InotifyBackend,
+    PollingBackend,
+    RuleWatcher,
+    create_watch_backend,
+    watch_project,
+)
+from specify_cli.runtime.graph_cache import clear_graph_cache
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from specify_cli.runtime.ggen_watch import WatchBackend, WatchEvent
+
+FEATURES_TTL = """@prefix sk: <http://spec-kit.io/ontology#> .
+@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+
+sk:Feature1 a sk:Feature ; rdfs:label "Authentication" .
+"""
+
+QUERY = """
+PREFIX sk: <http://spec-kit.io/ontology#>
+SELECT ?f WHERE { ?f a sk:Feature }
+"""
+
+MANIFEST = """
+[project]
+name = "demo"
+version = "1.0.0"
+
+[[rules]]
+name = "features"
+ontology = ["ontology/features.ttl"]
+sparql = "sparql/features.rq"
+template = "templates/features.tera"
+output = "out/features.md"
+
+[[rules]]
+name = "other"
+ontology = ["ontology/other.ttl"]
+sparql = "sparql/features.rq"
+template = "templates/other.tera"
+output = "out/other.md"
+"""
+
+BACKENDS = ["polling"]
+if sys.platform.startswith("linux"):
+    BACKENDS.append("inotify")
+
+
+@pytest.fixture(autouse=True)
+def _fresh_graph_cache() -> None:
+    """Isolate the process-wide graph cache between tests."""
+    clear_graph_cache()
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    """Project with two rules over separate ontologies."""
+    for sub in ("ontology", "sparql", "templates"):
+        (tmp_path / sub).mkdir()
+    (tmp_path / "ontology" / "features.ttl").write_text(FEATURES_TTL)
+    (tmp_path / "ontology" / "other.ttl").write_text(FEATURES_TTL)
+    (tmp_path / "sparql" / "features.rq").write_text(QUERY)
+    (tmp_path / "templates" / "features.tera").write_text("v1\n")
+    (tmp_path / "templates" / "other.tera").write_text('{% include "footer.tera" %}\n')
+    (tmp_path / "templates" / "footer.tera").write_text("footer\n")
+    (tmp_path / "ggen.toml").write_text(MANIFEST)
+    return tmp_path
+
+
+def _backend(kind: str, project: Path) -> WatchBackend:
+    roots = [project / "ontology", project / "sparql", project / "templates"]
+    if kind == "inotify":
+        return InotifyBackend(roots, [project / "ggen.toml"])
+    return PollingBackend(roots, [project / "ggen.toml"], interval=0.01)
+
+
+@pytest.mark.parametrize("kind", BACKENDS)
+def test_backend_reports_changes(kind: str, project: Path) -> None:
+    """Modified, created and manifest files are reported."""
+    backend = _backend(kind, project)
+    try:
+        assert backend.poll(0.05) == set()
+
+        (project / "templates" / "features.tera").write_text("v2 changed\n")
+        (project / "ontology" / "new.ttl").write_text("")
+        (project / "ggen.toml").write_text(MANIFEST + "\n")
+        changed: set[Path] = set()
+        deadline = time.monotonic() + 2
+        while len(changed) < 3 and time.monotonic() < deadline:
+            changed |= backend.poll(0.2)
+    finally:
+        backend.close()
+
+    resolved = {p.resolve() for p in changed}
+    assert (project / "templates" / "features.tera").resolve() in resolved
+    assert (project / "ontology" / "new.ttl").resolve() in resolved
+    assert (project / "ggen.toml").resolve() in resolved
+
+
+def test_create_backend_prefers_native(project: Path) -> None:
+    """inotify is used on Linux; polling can be forced."""
+    native = create_watch_backend([project / "ontology"])
+    polling = create_watch_backend([project / "ontology"], prefer_native=False)
+    native.close()
+
+    expected = "inotify" if sys.platform.startswith("linux") else "polling"
+    assert native.name == expected
+    assert polling.name == "polling"
+
+
+def test_affected_rules(project: Path) -> None:
+    """Files map to the rules that declare them, including template includes."""
+    configs = manifest_transform_configs(load_manifest(project / "ggen.toml"), base_dir=project)
+    watcher = RuleWatcher(configs, PollingBackend([]))
+
+    assert watcher.affected_rules({project / "ontology" / "features.ttl"}) == ["features"]
+    assert watcher.affected_rules({project / "templates" / "footer.tera"}) == ["other"]
+    assert watcher.affected_rules({project / "sparql" / "features.rq"}) == [
+        "features",
+        "other",
+    ]
+    assert watcher.affected_rules({project / "templates"}) == ["features", "other"]
+    assert watcher.affected_rules({project / "README.md"}) == []
+
+
+def test_burst_is_debounced(project: Path) -> None:
+    """Several quick edits come back as one batch."""
+    backend = PollingBackend([project / "templates"], interval=0.005)
+    configs = manifest_transform_configs(load_manifest(project / "ggen.toml"), base_dir=project)
+    watcher = RuleWatcher(configs, backend, debounce=0.1)
+
+    def _edit() -> None:
+        for i in range(3):
+            (project / "templates" / "features.tera").write_text(f"edit {i} {'x' * i}\n")
+            (project / "templates" / "other.tera").write_text(f"edit {i} {'x' * i}\n")
+            time.sleep(0.02)
+
+    threading.Thread(target=_edit).start()
+    changed = watcher.wait_for_changes(timeout=2)
+
+    assert {p.name for p in changed} == {"features.tera", "other.tera"}
+    assert watcher.wait_for_changes(timeout=0.05) == set()
+
+
+def test_watch_project_rebuilds_only_affected_rule(project: Path) -> None:
+    """A template edit regenerates its rule in-process, quickly."""
+    events: list[WatchEvent] = []
+    rebuilt = threading.Event()
+    stop = threading.Event()
+
+    def _on_rebuild(event: WatchEvent) -> None:
+        events.append(event)
+        if len(events) > 1:
+            rebuilt.set()
+
+    thread = threading.Thread(
+        target=watch_project,
+        args=(project,),
+        kwargs={"on_rebuild": _on_rebuild, "stop_event": stop},
+    )
+    thread.start()
+    try:
+        deadline = time.monotonic() + 5
+        while not events and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert events, "initial sync did not finish"
+        assert (project / "out" / "features.md").read_text() == "v1\n"
+
+        edited_at = time.monotonic()
+        (project / "templates" / "features.tera").write_text("v2\n")
+        assert rebuilt.wait(timeout=5)
+        edit_to_output = time.monotonic() - edited_at
+    finally:
+        stop.set()
+        thread.join(timeout=5)
+
+    event = events[1]
+    assert event.rules == ["features"]
+    assert event.success
+    assert (project / "out" / "features.md").read_text() == "v2\n"
+    assert edit_to_output < 1.0
+
+
+def _run_watcher(
+    watcher: RuleWatcher, count: int, edits: list[tuple[Path, str]]
+) -> list[WatchEvent]:
+    """Run ``watcher`` in a thread, apply ``edits`` one burst at a time."""
+    events: list[WatchEvent] = []
+    received = threading.Semaphore(0)
+    stop = threading.Event()
+
+    def _on_rebuild(event: WatchEvent) -> None:
+        events.append(event)
+        received.release()
+
+    thread = threading.Thread(
+        target=watcher.run,
+        kwargs={"on_rebuild": _on_rebuild, "stop_event": stop, "poll_timeout": 0.05},
+    )
+    thread.start()
+    try:
+        for path, text in edits:
+            path.write_text(text)
+            assert received.acquire(timeout=5)
+        assert len(events) == count
+    finally:
+        stop.set()
+        thread.join(timeout=5)
+    return events
+
+
+def test_latency_includes_debounce(project: Path) -> None:
+    """latency_ms counts from the first notification, not from the end of the burst."""
+    configs = manifest_transform_configs(load_manifest(project / "ggen.toml"), base_dir=project)
+    watcher = RuleWatcher(configs, _backend("polling", project), debounce=0.3)
+
+    events = _run_watcher(watcher, 1, [(project / "templates" / "features.tera", "v2\n")])
+
+    assert events[0].success
+    assert events[0].latency_ms >= 300
+
+
+def test_invalid_manifest_keeps_watching(project: Path) -> None:
+    """A broken ggen.toml is reported and later edits still rebuild."""
+    manifest = project / "ggen.toml"
+    configs = manifest_transform_configs(load_manifest(manifest), base_dir=project)
+    watcher = RuleWatcher(configs, _backend("polling", project), manifest_path=manifest)
+
+    events = _run_watcher(
+        watcher,
+        2,
+        [(manifest, "[[rules]\nname = "), (project / "templates" / "features.tera", "v2\n")],
+    )
+
+    assert not events[0].success
+    assert events[0].error
+    assert events[1].success
+    assert events[1].rules == ["features"]
+    assert (project / "out" / "features.md").read_text() == "v2\n"
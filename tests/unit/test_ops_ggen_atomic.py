@@ -0,0 +1,131 @@
+"""Unit tests for ggen atomic writes."""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from specify_cli.ops import ggen_atomic
+from specify_cli.ops.ggen_atomic import AtomicWriter
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _age(path: Path) -> int:
+    """Move a file's mtime one minute into the past and return it."""
+    mtime = path.stat().st_mtime_ns - 60_000_000_000
+    os.utime(path, ns=(mtime, mtime))
+    return mtime
+
+
+class TestAtomicWriter:
+    """Tests for AtomicWriter staging and commit."""
+
+    def test_commit_moves_staged_files(self, tmp_path: Path) -> None:
+        """Nothing reaches the output directory before commit."""
+        writer = AtomicWriter(tmp_path / "out")
+        writer.write("a.md", "A\n")
+        writer.write("nested/b.md", "B\n")
+
+        assert not (tmp_path / "out" / "a.md").exists()
+        writer.commit()
+
+        assert (tmp_path / "out" / "a.md").read_text() == "A\n"
+        assert (tmp_path / "out" / "nested" / "b.md").read_text() == "B\n"
+        assert writer.manifest.status == "committed"
+
+    def test_parallel_staging(self, tmp_path: Path) -> None:
+        """Files staged on the thread pool are all committed."""
+        writer = AtomicWriter(tmp_path / "out", parallel=True, max_workers=2)
+        for i in range(50):
+            writer.write(f"f{i}.md", f"{i}\n" * 100)
+        writer.commit()
+
+        assert sorted(p.name for p in (tmp_path / "out").glob("*.md")) == sorted(
+            f"f{i}.md" for i in range(50)
+        )
+        assert (tmp_path / "out" / "f7.md").read_text() == "7\n" * 100
+
+    def test_same_path_written_twice(self, tmp_path: Path) -> None:
+        """The last write of a path wins in parallel mode."""
+        writer = AtomicWriter(tmp_path / "out", parallel=True)
+        writer.write("a.md", "first\n")
+        writer.write("a.md", "second\n")
+        writer.commit()
+
+        assert (tmp_path / "out" / "a.md").read_text() == "second\n"
+
+    def test_staging_error_fails_commit(self, tmp_path: Path) -> None:
+        """An error in a staging thread surfaces from commit."""
+        writer = AtomicWriter(tmp_path / "out", parallel=True)
+        writer.write("a", "file\n")
+        writer.flush()
+        writer.write("a/b.md", "needs a directory named a\n")
+
+        with pytest.raises(RuntimeError, match="Commit failed"):
+            writer.commit()
+        assert writer.manifest.status == "failed"
+
+    def test_skip_identical_keeps_mtime(self, tmp_path: Path) -> None:
+        """Unchanged outputs are not rewritten; changed ones are."""
+        out = tmp_path / "out"
+        first = AtomicWriter(out)
+        first.write("same.md", "same\n")
+        first.write("changed.md", "old\n")
+        first.commit()
+        same_mtime = _age(out / "same.md")
+        changed_mtime = _age(out / "changed.md")
+
+        writer = AtomicWriter(out, skip_identical=True)
+        writer.write("same.md", "same\n")
+        writer.write("changed.md", "new\n")
+        writer.commit()
+
+        assert writer.unchanged_files == ["same.md"]
+        assert (out / "same.md").stat().st_mtime_ns == same_mtime
+        assert (out / "changed.md").stat().st_mtime_ns != changed_mtime
+        assert (out / "changed.md").read_text() == "new\n"
+
+    def test_fsync_per_file(self, tmp_path: Path) -> None:
+        """The "file" policy fsyncs every staged file and directory."""
+        writer = AtomicWriter(tmp_path / "out", durability="file")
+        writer.write("a.md", "A\n")
+        writer.write("b.md", "B\n")
+
+        with patch.object(ggen_atomic.os, "fsync", wraps=os.fsync) as fsync:
+            writer.commit()
+            calls = fsync.call_count
+
+        assert calls == 2  # One directory fsync per renamed file
+        assert (tmp_path / "out" / "b.md").read_text() == "B\n"
+
+    def test_sync_once_per_commit(self, tmp_path: Path) -> None:
+        """The "commit" policy syncs once after all renames."""
+        writer = AtomicWriter(tmp_path / "out", durability="commit")
+        for i in range(5):
+            writer.write(f"{i}.md", f"{i}\n")
+
+        with patch.object(ggen_atomic, "_sync_filesystem") as sync:
+            writer.commit()
+
+        sync.assert_called_once()
+        assert len(list((tmp_path / "out").glob("*.md"))) == 5
+
+    def test_unknown_durability(self, tmp_path: Path) -> None:
+        """Durability policies are validated."""
+        with pytest.raises(ValueError, match="Unknown durability policy"):
+            AtomicWriter(tmp_path / "out", durability="paranoid")
+
+    def test_rollback_discards_staged_files(self, tmp_path: Path) -> None:
+        """Rollback in parallel mode leaves the output directory untouched."""
+        writer = AtomicWriter(tmp_path / "out", parallel=True)
+        writer.write("a.md", "A\n")
+        writer.rollback()
+
+        assert not (tmp_path / "out" / "a.md").exists()
+        assert not writer.staging_dir.exists()
+        assert writer.manifest.status == "rolled_back"
@@ -0,0 +1,132 @@
+"""
+Unit Tests for ggen File Locking
+================================
+
+Tests for specify_cli.ops.ggen_filelock.
+
+Tests verify:
+1. Exclusive locks exclude each other and report the owner PID
+2. Shared locks coexist but exclude exclusive locks
+3. Waiters block until release instead of failing
+4. Lock files of exclusive holders are removed on release
+5. Wait times are recorded as histograms
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from specify_cli.ops import ggen_filelock
+from specify_cli.ops.ggen_filelock import FileLock, LockTimeoutError
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+pytestmark = pytest.mark.skipif(not ggen_filelock.FCNTL_AVAILABLE, reason="requires fcntl")
+
+
+@pytest.fixture
+def lock_path(tmp_path: Path) -> Path:
+    """Lock file path in a temporary directory."""
+    return tmp_path / ".ggen.lock"
+
+
+def _release_later(lock: FileLock, delay: float) -> threading.Thread:
+    """Release ``lock`` from another thread after ``delay`` seconds."""
+    thread = threading.Timer(delay, lock.release)
+    thread.start()
+    return thread
+
+
+def test_exclusive_excludes_exclusive(lock_path: Path) -> None:
+    """A second writer times out and sees the holder's PID."""
+    with FileLock(lock_path), pytest.raises(LockTimeoutError) as excinfo:
+        FileLock(lock_path, timeout=0.1).acquire()
+
+    assert excinfo.value.owner_pid == os.getpid()
+
+
+def test_shared_locks_coexist(lock_path: Path) -> None:
+    """Readers do not wait for each other."""
+    with (
+        FileLock(lock_path, mode="shared"),
+        FileLock(lock_path, timeout=1, mode="shared") as second,
+    ):
+        assert second.acquired
+        assert second.wait_time < 0.5
+
+
+@pytest.mark.parametrize(("held", "wanted"), [("shared", "exclusive"), ("exclusive", "shared")])
+def test_shared_and_exclusive_conflict(lock_path: Path, held: str, wanted: str) -> None:
+    """Readers and writers exclude each other."""
+    with FileLock(lock_path, mode=held), pytest.raises(LockTimeoutError):
+        FileLock(lock_path, timeout=0.1, mode=wanted).acquire()
+
+
+def test_waiter_blocks_until_release(lock_path: Path) -> None:
+    """A waiter acquires as soon as the holder releases."""
+    holder = FileLock(lock_path)
+    holder.acquire()
+    timer = _release_later(holder, 0.3)
+
+    with FileLock(lock_path, timeout=5) as waiter:
+        assert 0.2 < waiter.wait_time < 3
+    timer.join()
+
+
+def test_release_removes_file_and_relocks(lock_path: Path) -> None:
+    """Writers remove the lock file; the lock can be taken again."""
+    with FileLock(lock_path):
+        assert lock_path.read_text() == str(os.getpid())
+    assert not lock_path.exists()
+
+    with FileLock(lock_path, mode="shared"):
+        pass
+    with FileLock(lock_path, timeout=0.5) as again:
+        assert again.acquired
+
+
+def test_timed_out_waiter_does_not_keep_lock(lock_path: Path) -> None:
+    """An abandoned waiter drops the lock once it finally gets it."""
+    holder = FileLock(lock_path)
+    holder.acquire()
+    with pytest.raises(LockTimeoutError):
+        FileLock(lock_path, timeout=0.1).acquire()
+    holder.release()
+
+    with FileLock(lock_path, timeout=2) as later:
+        assert later.acquired
+
+
+def test_wait_time_histogram(lock_path: Path) -> None:
+    """Each acquisition records its wait in a per-mode histogram."""
+    recorded: list[str] = []
+
+    def histogram(name: str, unit: str = "s") -> object:
+        return lambda _value: recorded.append(name)
+
+    with patch.object(ggen_filelock, "metric_histogram", histogram):
+        with FileLock(lock_path, mode="shared"):
+            pass
+        with FileLock(lock_path):
+            pass
+
+    assert recorded == ["ggen.lock.shared.wait", "ggen.lock.exclusive.wait"]
+
+
+def test_unknown_mode(lock_path: Path) -> None:
+    """Lock mode is validated."""
+    with pytest.raises(ValueError, match="Unknown lock mode"):
+        FileLock(lock_path, mode="upgradable")
+
+
+def test_release_without_acquire(lock_path: Path) -> None:
+    """Releasing an unheld lock is a no-op and leaves others' files alone."""
+    with FileLock(lock_path):
+        FileLock(lock_path).release()
+        assert lock_path.exists()
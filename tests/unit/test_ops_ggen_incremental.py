@@ -2,15 +2,33 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from unittest.mock import patch
 
 import pytest
 
 from specify_cli.ops.ggen_incremental import (
     FileHashRecord,
     IncrementalTracker,
+    template_dependencies,
 )
+from specify_cli.ops.transform import TransformConfig
+from specify_cli.runtime import ggen
+from specify_cli.runtime.ggen import run_transform
+
+FEATURES_TTL = """@prefix sk: <http://spec-kit.io/ontology#> .
+@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+
+sk:Feature1 a sk:Feature ; rdfs:label "Authentication" .
+"""
+
+LABELS_QUERY = """
+PREFIX sk: <http://spec-kit.io/ontology#>
+PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
+SELECT ?label WHERE { ?f a sk:Feature ; rdfs:label ?label }
+"""
 
 
 @pytest.fixture
@@ -23,6 +41,34 @@ def temp_project() -> tuple[Path, Path]:
         yield project_dir, output_dir
 
 
+def _age(*paths: Path) -> None:
+    """Backdate mtimes so stat memo entries are not racy."""
+    old = paths[0].stat().st_mtime - 60
+    for path in paths:
+        os.utime(path, (old, old))
+
+
+@pytest.fixture
+def rule(temp_project: tuple[Path, Path]) -> TransformConfig:
+    """Single rule with ontology, query, template and an included partial."""
+    project_dir, output_dir = temp_project
+    (project_dir / "features.ttl").write_text(FEATURES_TTL)
+    (project_dir / "labels.rq").write_text(LABELS_QUERY)
+    (project_dir / "partial.tera").write_text("Footer\n")
+    (project_dir / "page.tera").write_text("# Features\n")
+    (project_dir / "layout.tera").write_text('# Features\n{% include "partial.tera" %}\n')
+    _age(*project_dir.glob("*.*"))
+    return TransformConfig(
+        name="features",
+        description="",
+        input_files=[str(project_dir / "features.ttl")],
+        schema_files=[],
+        sparql_query=str(project_dir / "labels.rq"),
+        template=str(project_dir / "page.tera"),
+        output_file=str(output_dir / "features.md"),
+    )
+
+
 class TestIncrementalTracker:
     """Tests for incremental tracking."""
 
@@ -187,3 +233,101 @@ class TestFileHashRecord:
         assert record.file_path == "test.ttl"
         assert record.hash == "abc123"
         assert record.size == 100
+
+
+class TestStatMemo:
+    """Tests for skipping hashes of files with unchanged stat."""
+
+    def test_unchanged_file_not_rehashed(self, temp_project: tuple[Path, Path]) -> None:
+        """A second lookup with the same mtime/size does not read the file."""
+        project_dir, output_dir = temp_project
+        test_file = project_dir / "test.ttl"
+        test_file.write_text("content")
+        _age(test_file)
+        tracker = IncrementalTracker(output_dir)
+        tracker.file_hash(str(test_file))
+        tracker.save()
+
+        reloaded = IncrementalTracker(output_dir)
+        with patch.object(IncrementalTracker, "_compute_hash") as compute:
+            assert reloaded.needs_update(str(test_file)) is True  # never recorded
+            reloaded.file_hash(str(test_file))
+        compute.assert_not_called()
+
+    def test_racy_file_rehashed(self, temp_project: tuple[Path, Path]) -> None:
+        """Files modified just before hashing are always re-hashed."""
+        project_dir, output_dir = temp_project
+        test_file = project_dir / "test.ttl"
+        test_file.write_text("content")
+        tracker = IncrementalTracker(output_dir)
+        tracker.file_hash(str(test_file))
+
+        with patch.object(IncrementalTracker, "_compute_hash", return_value="x") as compute:
+            tracker.file_hash(str(test_file))
+        compute.assert_called_once()
+
+
+class TestRuleFingerprint:
+    """Tests for rule fingerprints and incremental run_transform."""
+
+    def test_template_dependencies(self, rule: TransformConfig) -> None:
+        """Included templates are found relative to the including template."""
+        layout = Path(rule.template).parent / "layout.tera"
+        assert template_dependencies(layout) == [layout.parent / "partial.tera"]
+        assert template_dependencies(rule.template) == []
+
+    def test_fingerprint_tracks_includes(self, rule: TransformConfig) -> None:
+        """Editing an included template changes the digest, not the extract key."""
+        rule.template = str(Path(rule.template).parent / "layout.tera")
+        tracker = IncrementalTracker(Path(rule.output_file).parent)
+        before = tracker.fingerprint(rule, generator_version="1.0")
+
+        (Path(rule.template).parent / "partial.tera").write_text("New footer\n")
+        after = tracker.fingerprint(rule, generator_version="1.0")
+
+        assert after.digest != before.digest
+        assert after.extract_key == before.extract_key
+        assert tracker.fingerprint(rule, generator_version="2.0").extract_key != (
+            after.extract_key
+        )
+
+    def test_unchanged_rule_skips_all_stages(self, rule: TransformConfig) -> None:
+        """Second run with the same fingerprint runs no stage."""
+        tracker = IncrementalTracker(Path(rule.output_file).parent)
+        first = run_transform(rule, tracker=tracker)
+        assert first.success, first.errors
+        tracker.save()
+
+        reloaded = IncrementalTracker(Path(rule.output_file).parent)
+        with patch.object(ggen, "_run_emit") as emit:
+            second = run_transform(rule, tracker=reloaded)
+
+        emit.assert_not_called()
+        assert second.success
+        assert second.stage_results == {}
+        assert second.output_hash == first.output_hash
+
+    def test_template_edit_reuses_sparql_results(self, rule: TransformConfig) -> None:
+        """A template-only edit re-runs emit without executing SPARQL."""
+        tracker = IncrementalTracker(Path(rule.output_file).parent)
+        assert run_transform(rule, tracker=tracker).success
+
+        Path(rule.template).write_text("# All features\n")
+        with patch.object(ggen, "_sparql_chunks") as sparql:
+            result = run_transform(rule, tracker=tracker)
+
+        sparql.assert_not_called()
+        assert result.success, result.errors
+        assert Path(rule.output_file).read_text() == "# All features\n"
+        assert "receipt" in result.stage_results
+
+    def test_deleted_output_is_regenerated(self, rule: TransformConfig) -> None:
+        """A rule is not fresh when its output file was removed."""
+        tracker = IncrementalTracker(Path(rule.output_file).parent)
+        assert run_transform(rule, tracker=tracker).success
+
+        Path(rule.output_file).unlink()
+        result = run_transform(rule, tracker=tracker)
+
+        assert "emit" in result.stage_results
+        assert Path(rule.output_file).exists()
@@ -0,0 +1,192 @@
+"""
+Unit Tests for the SHACL Validation Cache
+=========================================
+
+Tests for specify_cli.ops.ggen_shacl.
+
+Tests verify:
+1. Unchanged (data, shapes) combinations are answered from the cache
+2. Shapes graphs are parsed once and results persist across processes
+3. Subject digests ignore blank node labels
+4. Incremental mode validates only changed focus nodes and their referrers
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+from rdflib import Graph, URIRef
+
+from specify_cli.ops import ggen_shacl
+from specify_cli.ops.ggen_shacl import (
+    SHACLValidationCache,
+    SHACLValidationResult,
+    changed_focus_nodes,
+    subject_digests,
+    validate_cached,
+    validate_rdf,
+)
+from specify_cli.runtime.ggen import _validate_shacl
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+SK = "http://spec-kit.io/ontology#"
+
+DATA_TTL = """@prefix sk: <http://spec-kit.io/ontology#> .
+@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+
+sk:Feature rdfs:subClassOf sk:Thing .
+sk:Feature1 a sk:Feature ; rdfs:label "Authentication" ;
+    sk:owner [ sk:name "alice" ] .
+sk:Feature2 a sk:Feature ; rdfs:label "Authorization" ; sk:dependsOn sk:Feature1 .
+sk:Feature3 a sk:Feature ; rdfs:label "Audit" .
+"""
+
+SHAPES_TTL = """@prefix sh: <http://www.w3.org/ns/shacl#> .
+@prefix sk: <http://spec-kit.io/ontology#> .
+
+sk:FeatureShape a sh:NodeShape ;
+    sh:targetClass sk:Feature ;
+    sh:property [ sh:path <http://www.w3.org/2000/01/rdf-schema#label> ; sh:minCount 1 ] .
+"""
+
+
+def _graph(text: str) -> Graph:
+    graph = Graph()
+    graph.parse(data=text, format="turtle")
+    return graph
+
+
+@pytest.fixture
+def files(tmp_path: Path) -> tuple[Path, Path]:
+    """Data and shapes files."""
+    data = tmp_path / "data.ttl"
+    shapes = tmp_path / "shapes.ttl"
+    data.write_text(DATA_TTL)
+    shapes.write_text(SHAPES_TTL)
+    return data, shapes
+
+
+def test_unchanged_inputs_hit_cache(files: tuple[Path, Path]) -> None:
+    """The second validation of unchanged files skips validation."""
+    data, shapes = files
+    cache = SHACLValidationCache()
+
+    first = validate_rdf(rdf_files=[str(data)], shapes_files=[str(shapes)], cache=cache)
+    second = validate_rdf(rdf_files=[str(data)], shapes_files=[str(shapes)], cache=cache)
+
+    assert first.valid
+    assert "cached" not in first.details
+    assert second.details["cached"] is True
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+
+def test_changed_data_misses_and_shapes_stay_warm(files: tuple[Path, Path]) -> None:
+    """Edited data is re-validated against the already parsed shapes."""
+    data, shapes = files
+    cache = SHACLValidationCache()
+    validate_rdf(rdf_files=[str(data)], shapes_files=[str(shapes)], cache=cache)
+
+    data.write_text(DATA_TTL.replace("Audit", "Auditing"))
+    result = validate_rdf(rdf_files=[str(data)], shapes_files=[str(shapes)], cache=cache)
+
+    assert "cached" not in result.details
+    assert cache.stats.misses == 2
+    assert cache.stats.shapes_parsed == 1
+
+
+def test_results_persist(files: tuple[Path, Path], tmp_path: Path) -> None:
+    """A new cache over the same directory reuses stored results."""
+    data, shapes = files
+    cache_dir = tmp_path / "shacl"
+    validate_rdf(
+        rdf_files=[str(data)], shapes_files=[str(shapes)], cache=SHACLValidationCache(cache_dir)
+    )
+
+    fresh = SHACLValidationCache(cache_dir)
+    result = validate_rdf(rdf_files=[str(data)], shapes_files=[str(shapes)], cache=fresh)
+
+    assert result.details["cached"] is True
+    assert fresh.stats.shapes_parsed == 0
+
+
+def test_subject_digests_ignore_blank_node_labels() -> None:
+    """Re-parsing unchanged data gives identical digests."""
+    first = subject_digests(_graph(DATA_TTL))
+    second = subject_digests(_graph(DATA_TTL))
+
+    assert first == second
+    assert URIRef(f"{SK}Feature1") in first
+
+
+def test_focus_nodes_changed_and_referrers() -> None:
+    """A changed subject is re-validated together with subjects pointing to it."""
+    previous = subject_digests(_graph(DATA_TTL))
+    graph = _graph(DATA_TTL.replace('"alice"', '"bob"'))
+
+    focus = changed_focus_nodes(previous, graph)
+
+    assert focus == {URIRef(f"{SK}Feature1"), URIRef(f"{SK}Feature2")}
+
+
+def test_focus_nodes_unchanged_graph() -> None:
+    """No changes give no focus nodes."""
+    previous = subject_digests(_graph(DATA_TTL))
+
+    assert changed_focus_nodes(previous, _graph(DATA_TTL)) == set()
+
+
+def test_class_change_requires_full_validation() -> None:
+    """Changing a class definition can affect any instance."""
+    previous = subject_digests(_graph(DATA_TTL))
+    graph = _graph(DATA_TTL.replace("subClassOf sk:Thing", "subClassOf sk:Other"))
+
+    assert changed_focus_nodes(previous, graph) is None
+
+
+def test_incremental_validation_uses_focus_nodes() -> None:
+    """After a conforming snapshot only changed focus nodes are validated."""
+    cache = SHACLValidationCache()
+    shapes = _graph(SHAPES_TTL)
+    conforming = SHACLValidationResult(valid=True, details={"validator": "pyshacl"})
+
+    with (
+        patch.object(ggen_shacl, "_validator_name", return_value="pyshacl"),
+        patch.object(ggen_shacl, "validate_graph", return_value=conforming) as validate,
+    ):
+        validate_cached(cache, _graph(DATA_TTL), shapes, "scope", "shapes", incremental=True)
+        unchanged = validate_cached(
+            cache, _graph(DATA_TTL), shapes, "scope", "shapes", incremental=True
+        )
+        validate_cached(
+            cache,
+            _graph(DATA_TTL.replace('"Audit"', '"Auditing"')),
+            shapes,
+            "scope",
+            "shapes",
+            incremental=True,
+        )
+
+    assert validate.call_count == 2  # Full run, then one focused run
+    assert validate.call_args_list[0].kwargs == {}
+    assert validate.call_args_list[1].kwargs["focus_nodes"] == {URIRef(f"{SK}Feature3")}
+    assert unchanged.details["focus_nodes"] == 0
+    assert cache.stats.incremental_runs == 2
+
+
+def test_runtime_validation_cached(tmp_path: Path) -> None:
+    """μ₁ NORMALIZE validation is cached by data and shapes hashes."""
+    shapes = tmp_path / "shapes.ttl"
+    shapes.write_text(SHAPES_TTL)
+    data = DATA_TTL.replace("Audit", "Runtime cache")
+
+    first = _validate_shacl(data, [str(shapes)])
+    second = _validate_shacl(data, [str(shapes)])
+
+    assert first["valid"]
+    assert second["valid"]
+    assert first["cached"] is False
+    assert second["cached"] is True
@@ -34,6 +34,7 @@ import pytest
 
 from specify_cli.ops.transform import (
     StageResult,
+    StreamingCanonicalizer,
     TransformConfig,
     TransformResult,
     canonicalize_output,
@@ -532,6 +533,43 @@ More content.
     assert "## Section 2" in result.output
 
 
+@pytest.mark.parametrize(
+    "content",
+    [
+        "",
+        "   ",
+        "\n",
+        "   \n\t\n   ",
+        "Line 1\r\nLine 2\rLine 3\n\n\n",
+        "\n\n# Title  \n\nBody\t\n\n\nEnd\r",
+    ],
+)
+def test_streaming_canonicalizer_matches_canonicalize_output(content: str) -> None:
+    """Feeding chunks of any size gives the canonicalize_output() result."""
+    expected = canonicalize_output(content)
+
+    for size in (1, 2, 3, len(content) or 1):
+        canon = StreamingCanonicalizer()
+        chunks = [content[i : i + size] for i in range(0, len(content), size)]
+        output = "".join(canon.feed(chunk) for chunk in chunks) + canon.finish()
+
+        assert output == expected.output
+        assert canon.output_hash == expected.output_hash
+        assert canon.input_hash == expected.input_hash
+
+
+def test_streaming_canonicalizer_holds_trailing_blank_lines() -> None:
+    """Blank lines are only written once a later line shows they are not trailing."""
+    canon = StreamingCanonicalizer()
+
+    assert canon.feed("a\n\n") == "a"
+    assert canon.feed("\n") == ""
+    assert canon.feed("b\n") == "\n\n\nb"
+    assert canon.feed("\n\n") == ""
+    assert canon.finish() == "\n"
+    assert canon.line_count == 7
+
+
 # ============================================================================
 # Test: μ₅ RECEIPT Stage
 # ============================================================================
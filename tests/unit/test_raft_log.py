@@ -0,0 +1,174 @@
+"""Tests for the durable segmented Raft log."""
+
+from __future__ import annotations
+
+import os
+import threading
+
+import pytest
+
+from specify_cli.runtime.raft_log import LogEntry, RaftLog
+
+
+def _entries(start, stop, term=1):
+    return [LogEntry(index=i, term=term, command="set", data={"i": i}) for i in range(start, stop)]
+
+
+def _segments(path):
+    return sorted(path.glob("segment-*.log"))
+
+
+def test_entries_survive_reopen_across_segments(tmp_path):
+    log = RaftLog(tmp_path, segment_bytes=512)
+    log.extend(_entries(1, 51))
+    log.close()
+
+    reopened = RaftLog(tmp_path, segment_bytes=512)
+
+    assert len(_segments(tmp_path)) > 1
+    assert reopened.last_index == 50
+    assert reopened.durable_index == 50
+    assert [e.data["i"] for e in reopened] == list(range(1, 51))
+    assert reopened[0].term == 0
+
+
+def test_appends_must_be_contiguous():
+    log = RaftLog()
+    log.append(LogEntry(index=1, term=1, command="a"))
+
+    with pytest.raises(ValueError, match="Expected index 2"):
+        log.append(LogEntry(index=3, term=1, command="b"))
+
+
+def test_torn_tail_is_truncated(tmp_path):
+    log = RaftLog(tmp_path)
+    log.extend(_entries(1, 11))
+    log.close()
+    segment = _segments(tmp_path)[-1]
+    segment.write_bytes(segment.read_bytes()[:-5])
+
+    reopened = RaftLog(tmp_path)
+    reopened.extend(_entries(10, 12, term=2))
+    reopened.close()
+
+    assert [(e.index, e.term) for e in RaftLog(tmp_path)][-3:] == [(9, 1), (10, 2), (11, 2)]
+
+
+def test_truncate_across_segments(tmp_path):
+    log = RaftLog(tmp_path, segment_bytes=512)
+    log.extend(_entries(1, 41))
+    log.sync()
+    before = len(_segments(tmp_path))
+
+    log.truncate_from(8)
+    log.extend(_entries(8, 10, term=2))
+    log.close()
+
+    reopened = RaftLog(tmp_path, segment_bytes=512)
+    assert len(_segments(tmp_path)) < before
+    assert reopened.last_index == 9
+    assert [e.term for e in reopened][-3:] == [1, 2, 2]
+
+
+def test_truncate_unsynced_entries(tmp_path):
+    log = RaftLog(tmp_path)
+    log.extend(_entries(1, 6))
+    log.sync()
+    log.extend(_entries(6, 11))
+
+    log.truncate_from(8)
+    log.extend(_entries(8, 10, term=2))
+    log.sync()
+    log.close()
+
+    reopened = RaftLog(tmp_path)
+    assert [(e.index, e.term) for e in reopened] == [
+        *[(i, 1) for i in range(1, 8)],
+        (8, 2),
+        (9, 2),
+    ]
+
+
+def test_zero_filled_tail_is_truncated(tmp_path):
+    log = RaftLog(tmp_path)
+    log.extend(_entries(1, 4))
+    log.close()
+    segment = _segments(tmp_path)[-1]
+    intact = segment.read_bytes()
+    segment.write_bytes(intact + bytes(64))
+
+    reopened = RaftLog(tmp_path)
+
+    assert reopened.last_index == 3
+    assert segment.read_bytes() == intact
+
+
+def test_compaction_drops_segments_and_survives_reopen(tmp_path):
+    log = RaftLog(tmp_path, segment_bytes=512)
+    log.extend(_entries(1, 41))
+    log.sync()
+    before = len(_segments(tmp_path))
+
+    log.compact(30, 1, {"count": 30})
+    log.extend(_entries(41, 43))
+    log.close()
+
+    reopened = RaftLog(tmp_path, segment_bytes=512)
+    assert len(_segments(tmp_path)) < before
+    assert (reopened.snapshot_index, reopened.snapshot_state) == (30, {"count": 30})
+    assert reopened.last_index == 42
+    assert reopened[30].term == 1
+    assert reopened[31].data == {"i": 31}
+    with pytest.raises(IndexError, match="compacted"):
+        reopened[29]
+
+
+def test_installed_snapshot_replaces_diverging_log(tmp_path):
+    log = RaftLog(tmp_path)
+    log.extend(_entries(1, 6))
+
+    log.install_snapshot(8, 3, {"count": 8})
+    log.extend(_entries(9, 10, term=3))
+    log.close()
+
+    reopened = RaftLog(tmp_path)
+    assert (reopened.snapshot_index, reopened.last_index, reopened.last_term) == (8, 9, 3)
+
+
+def test_concurrent_waiters_share_fsyncs(tmp_path, monkeypatch):
+    log = RaftLog(tmp_path)
+    calls = []
+    real_fsync = os.fsync
+
+    def counting_fsync(fd):
+        calls.append(fd)
+        real_fsync(fd)
+
+    monkeypatch.setattr(os, "fsync", counting_fsync)
+
+    def writer(offset):
+        for _ in range(50):
+            with lock:
+                entry = LogEntry(index=log.last_index + 1, term=1, command="w", data={"w": offset})
+                log.append(entry)
+            log.wait_durable(entry.index)
+
+    lock = threading.Lock()
+    threads = [threading.Thread(target=writer, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert log.durable_index == 400
+    assert len(calls) < 400
+
+
+def test_meta_is_persisted(tmp_path):
+    log = RaftLog(tmp_path)
+    log.save_meta(4, "n2")
+    log.close()
+
+    reopened = RaftLog(tmp_path)
+
+    assert (reopened.term, reopened.voted_for) == (4, "n2")
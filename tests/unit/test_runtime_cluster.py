@@ -0,0 +1,132 @@
+"""Tests for heartbeat expiry and membership tracking in ClusterManager."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from specify_cli.runtime.cluster import ClusterManager, NodeHealth
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def _cluster(count=3, clock=None):
+    manager = ClusterManager("test", clock=clock or FakeClock())
+    for i in range(count):
+        manager.add_node("host", i)
+    return manager
+
+
+def _available(manager):
+    return sorted(node.node_id for node in manager.get_available_nodes())
+
+
+def test_silent_nodes_expire_once():
+    clock = FakeClock()
+    manager = _cluster(clock=clock)
+    dead_events = []
+    manager.register_event_handler("node_dead", dead_events.append)
+
+    clock.now += 20
+    manager.heartbeat("host:1")
+    clock.now += 15
+
+    assert manager.expire_nodes() == ["host:0", "host:2"]
+    assert manager.expire_nodes() == []
+    assert _available(manager) == ["host:1"]
+    assert manager.nodes["host:0"].health == NodeHealth.DEAD
+    assert [e.node_id for e in dead_events] == ["host:0", "host:2"]
+    assert manager.next_expiry() == clock.now - 15 + 30
+
+
+def test_heartbeats_keep_one_heap_entry_per_node():
+    clock = FakeClock()
+    manager = _cluster(count=10, clock=clock)
+
+    for _ in range(100):
+        clock.now += 1
+        for node_id in manager.nodes:
+            manager.heartbeat(node_id)
+        manager.expire_nodes()
+
+    assert len(manager._expiry) == 10  # noqa: SLF001
+    assert len(_available(manager)) == 10
+
+
+def test_dead_node_revives_on_heartbeat():
+    clock = FakeClock()
+    manager = _cluster(count=1, clock=clock)
+    clock.now += 31
+    manager.check_node_health()
+
+    manager.heartbeat("host:0")
+
+    assert _available(manager) == ["host:0"]
+    assert manager.check_node_health()["dead_nodes"] == []
+    clock.now += 31
+    assert manager.check_node_health()["dead_nodes"] == ["host:0"]
+
+
+def test_available_nodes_follow_health_changes():
+    manager = _cluster(count=3)
+
+    manager.heartbeat("host:0", cpu_usage=95)
+    manager.nodes["host:1"].health = NodeHealth.UNREACHABLE
+    manager.remove_node("host:2")
+
+    assert _available(manager) == []
+    assert manager.state.healthy_nodes == 0
+    manager.heartbeat("host:0")
+    manager.nodes["host:1"].health = NodeHealth.HEALTHY
+    assert _available(manager) == ["host:0", "host:1"]
+    assert manager.is_available("host:1")
+    assert not manager.is_available("host:2")
+
+
+def test_get_available_nodes_expires_due_nodes():
+    clock = FakeClock()
+    manager = _cluster(count=2, clock=clock)
+    clock.now += 10
+    manager.heartbeat("host:0")
+    clock.now += 25
+
+    assert _available(manager) == ["host:0"]
+
+
+def test_capacity_totals_are_maintained():
+    manager = _cluster(count=3)
+    manager.heartbeat("host:0", cpu_usage=10, memory_usage=20, disk_usage=30)
+    manager.heartbeat("host:1", cpu_usage=5)
+    manager.heartbeat("host:0", cpu_usage=1, memory_usage=2, disk_usage=3)
+    manager.remove_node("host:1")
+
+    state = manager.get_cluster_state()
+
+    assert state["total_capacity"] == 200.0
+    assert state["used_capacity"] == pytest.approx(6.0)
+    assert state["healthy_nodes"] == 2
+
+
+def test_health_monitor_expires_in_background():
+    manager = _cluster(count=2, clock=time.time)
+    manager.heartbeat_timeout_seconds = 0.05
+    dead = []
+    manager.register_event_handler("node_dead", lambda event: dead.append(event.node_id))
+
+    manager.start_health_monitor()
+    try:
+        deadline = time.monotonic() + 5
+        while len(dead) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        manager.stop_health_monitor()
+
+    assert sorted(dead) == ["host:0", "host:1"]
+    assert manager.get_available_nodes() == []
@@ -0,0 +1,138 @@
+"""Tests for SQL-aggregated, cached execution reports."""
+
+from __future__ import annotations
+
+import math
+import random
+
+import pytest
+
+from specify_cli.runtime import execution
+from specify_cli.runtime.state import ExecutionState, StateStore
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    store = StateStore(tmp_path / "executions.db")
+    monkeypatch.setattr(execution, "get_state_store", lambda: store)
+    monkeypatch.setattr(execution, "_report_cache", {})
+    yield store
+    store.close()
+
+
+def _save(store, i, *, phase="build", status="completed", duration=1.0, errors=()):
+    store.save_execution(
+        ExecutionState(
+            execution_id=f"e{i}",
+            phase=phase,
+            status=status,
+            start_time="2026-01-01T00:00:00",
+            duration=duration,
+            errors=list(errors),
+        )
+    )
+
+
+def _nearest_rank(values, p):
+    ordered = sorted(values)
+    return ordered[math.ceil(len(ordered) * p / 100) - 1]
+
+
+def test_phase_report_aggregates_in_sql(store):
+    rng = random.Random(3)
+    durations = [rng.uniform(0, 10) for _ in range(237)]
+    for i, duration in enumerate(durations):
+        _save(store, i, status="failed" if i % 4 == 0 else "completed", duration=duration)
+    _save(store, 999, phase="other")
+
+    report = execution.get_phase_report("build")
+
+    assert report["total_executions"] == 237
+    assert report["failed"] == 60
+    assert report["successful"] == 177
+    assert report["success_rate"] == pytest.approx(177 / 237)
+    assert report["average_duration"] == pytest.approx(sum(durations) / 237)
+    assert report["max_duration"] == max(durations)
+    for p in (50, 95, 99):
+        assert report["duration_percentiles"][f"p{p}"] == _nearest_rank(durations, p)
+    assert [e["id"] for e in report["recent_executions"]] == [f"e{i}" for i in range(236, 226, -1)]
+
+
+def test_recent_executions_count_errors(store):
+    _save(store, 1, status="failed", errors=["a", "b"])
+
+    recent = execution.get_phase_report("build")["recent_executions"]
+
+    assert recent == [{"id": "e1", "status": "failed", "duration": 1.0, "errors": 2}]
+
+
+def test_unknown_phase_report_is_empty(store):
+    report = execution.get_phase_report("missing")
+
+    assert report["total_executions"] == 0
+    assert report["success_rate"] == 0
+    assert report["recent_executions"] == []
+
+
+def test_overall_report_covers_all_phases(store):
+    for i in range(30):
+        _save(store, i, phase=("build", "test", "deploy")[i % 3], duration=float(i))
+
+    report = execution.get_overall_report()
+
+    assert report["total_executions"] == 30
+    assert report["average_duration"] == pytest.approx(14.5)
+    assert sorted(report["phases_executed"]) == ["build", "deploy", "test"]
+    assert report["phase_reports"]["test"]["total_executions"] == 10
+    assert report["phase_reports"]["test"]["recent_executions"][0]["id"] == "e28"
+
+
+def test_reports_are_cached_until_executions_change(store, monkeypatch):
+    _save(store, 1)
+    calls = []
+    summarize = store.summarize_phases
+
+    def counting(*args):
+        calls.append(args)
+        return summarize(*args)
+
+    monkeypatch.setattr(store, "summarize_phases", counting)
+
+    first = execution.get_overall_report()
+    first["total_executions"] = -1  # Callers get copies
+    assert execution.get_overall_report()["total_executions"] == 1
+    assert len(calls) == 1
+
+    _save(store, 1, status="failed")  # Replacing a record changes the revision
+    assert execution.get_overall_report()["failed"] == 1
+    assert len(calls) == 2
+
+    store._pool.connection().execute("UPDATE executions SET created_at = '2000-01-01'")  # noqa: SLF001
+    store._pool.connection().commit()  # noqa: SLF001
+    store.clear_old_executions(days=1)
+    assert execution.get_overall_report()["total_executions"] == 0
+    assert len(calls) == 3
+
+
+def test_iter_executions_streams_newest_first(store):
+    for i in range(25):
+        _save(store, i, phase="build" if i % 2 else "test")
+
+    streamed = [state.execution_id for state in store.iter_executions("build", batch_size=4)]
+
+    assert streamed == [f"e{i}" for i in range(23, 0, -2)]
+    assert sum(1 for _ in store.iter_executions(batch_size=7)) == 25
+
+
+def test_tracked_executions_appear_in_reports(store):
+    execution.execute_with_tracking("compile", lambda: 42)
+    with pytest.raises(ValueError, match="bad"):
+        execution.execute_with_tracking("compile", _raise)
+
+    report = execution.get_phase_report("compile")
+
+    assert (report["successful"], report["failed"]) == (1, 1)
+
+
+def _raise():
+    raise ValueError("bad")
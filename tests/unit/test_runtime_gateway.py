@@ -0,0 +1,153 @@
+"""Tests for endpoint selection and accounting in the API gateway."""
+
+from __future__ import annotations
+
+import random
+import threading
+from collections import Counter
+
+import pytest
+
+from specify_cli.runtime.gateway import (
+    AliasTable,
+    APIGateway,
+    APIGatewayConfig,
+    AtomicCounter,
+    Endpoint,
+    LoadBalancer,
+    LoadBalancingStrategy,
+    RateLimitingGateway,
+)
+
+
+def _balancer(strategy, count=4, capacity=100, **kwargs):
+    lb = LoadBalancer(strategy, seed=7, **kwargs)
+    for i in range(count):
+        lb.register_endpoint(Endpoint(f"e{i}", "localhost", 8000 + i, capacity=capacity))
+    return lb
+
+
+def test_alias_table_matches_weights():
+    table = AliasTable([1.0, 2.0, 7.0])
+    rng = random.Random(1)
+
+    counts = Counter(table.sample(rng) for _ in range(50_000))
+
+    assert counts[0] / 50_000 == pytest.approx(0.1, abs=0.01)
+    assert counts[1] / 50_000 == pytest.approx(0.2, abs=0.01)
+    assert counts[2] / 50_000 == pytest.approx(0.7, abs=0.01)
+
+
+def test_least_loaded_tracks_load_changes():
+    lb = _balancer(LoadBalancingStrategy.LEAST_LOADED, count=3)
+
+    ids = [lb.route_request({}) for _ in range(6)]
+    assert [e.current_load for e in lb.endpoints] == [2, 2, 2]
+
+    freed = lb.requests[ids[0]].endpoint
+    lb.complete_request(ids[0])
+
+    assert freed.current_load == 1
+    assert lb.requests[lb.route_request({})].endpoint is freed
+
+
+def test_full_and_unhealthy_endpoints_are_skipped():
+    for strategy in LoadBalancingStrategy:
+        lb = _balancer(strategy, count=3, capacity=2)
+        lb.update_endpoint("e0", healthy=False)
+
+        routed = [lb.requests[lb.route_request({})].endpoint.endpoint_id for _ in range(4)]
+
+        assert sorted(routed) == ["e1", "e1", "e2", "e2"], strategy
+        with pytest.raises(RuntimeError, match="No available endpoints"):
+            lb.route_request({})
+
+
+def test_weighted_routing_follows_weights():
+    lb = _balancer(LoadBalancingStrategy.WEIGHTED, count=2, capacity=10**6)
+    lb.update_endpoint("e1", weight=3.0)
+
+    counts = Counter(lb.requests[lb.route_request({})].endpoint.endpoint_id for _ in range(20_000))
+
+    assert counts["e1"] / 20_000 == pytest.approx(0.75, abs=0.02)
+
+
+def test_power_of_two_prefers_lighter_endpoint():
+    lb = _balancer(LoadBalancingStrategy.POWER_OF_TWO, count=2, capacity=1000)
+    lb.endpoints[0].current_load = 500
+
+    counts = Counter(lb.requests[lb.route_request({})].endpoint.endpoint_id for _ in range(200))
+
+    # Only a draw of (e0, e0) picks the loaded endpoint
+    assert counts["e1"] > counts["e0"]
+
+
+def test_completion_releases_load_once():
+    lb = _balancer(LoadBalancingStrategy.ROUND_ROBIN, count=1)
+    request_id = lb.route_request({"x": 1})
+
+    lb.complete_request(request_id, "ok")
+    lb.complete_request(request_id, "ok")
+    lb.fail_request(lb.route_request({}), "boom")
+
+    status = lb.get_status()
+    assert status["total_load"] == 0
+    assert status["pending_requests"] == 0
+    assert (status["requests_routed"], status["requests_completed"], status["requests_failed"]) == (
+        2,
+        1,
+        1,
+    )
+
+
+def test_concurrent_routing_keeps_accounting_consistent():
+    lb = _balancer(LoadBalancingStrategy.LEAST_LOADED, count=8, capacity=4)
+
+    def worker():
+        for _ in range(2_000):
+            request_id = lb.route_request({})
+            lb.complete_request(request_id)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert lb.get_status()["total_load"] == 0
+    assert lb.requests_routed.value == 16_000
+    assert lb.requests_completed.value == 16_000
+
+
+def test_atomic_counter_under_threads():
+    counter = AtomicCounter()
+
+    def bump():
+        for _ in range(10_000):
+            counter.increment()
+
+    threads = [threading.Thread(target=bump) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert counter.value == 40_000
+    assert counter.value == 40_000
+
+
+def test_rate_limiter_window():
+    limiter = RateLimitingGateway(max_requests_per_second=3)
+
+    assert [limiter.check_rate_limit() for _ in range(4)] == [True, True, True, False]
+    assert limiter.get_current_rate() == 3
+
+
+def test_gateway_handles_requests():
+    gateway = APIGateway(APIGatewayConfig(rate_limit_per_second=2))
+    gateway.load_balancer.register_endpoint(Endpoint("e0", "localhost", 8000))
+
+    assert gateway.handle_request({})["status"] == "processed"
+    gateway.handle_request({})
+    assert gateway.handle_request({}) == {"error": "Rate limit exceeded"}
+    assert gateway.get_status()["load_balancer"]["total_load"] == 0
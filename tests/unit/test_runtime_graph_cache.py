@@ -0,0 +1,212 @@
+"""
+Unit Tests for Parse-Once RDF Graph Reuse
+=========================================
+
+Tests for specify_cli.runtime.graph_cache and its use by the μ pipeline.
+
+Tests verify:
+1. Graphs are parsed once per set of input file hashes
+2. Edited inputs invalidate, re-ordered inputs still hit
+3. Normalize, SHACL and extract stages share one parsed graph
+4. Parse errors surface as normalize failures
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+from specify_cli.ops.transform import TransformConfig
+from specify_cli.runtime.ggen import _run_extract, _run_normalize
+from specify_cli.runtime.graph_cache import GraphCache, clear_graph_cache, get_graph_cache
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+FEATURES_TTL = """@prefix sk: <http://spec-kit.io/ontology#> .
+@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+
+sk:Feature1 a sk:Feature ; rdfs:label "Authentication" .
+"""
+
+MORE_TTL = """@prefix ex: <http://example.org/> .
+@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+
+ex:Feature2 a <http://spec-kit.io/ontology#Feature> ; rdfs:label "Authorization" .
+"""
+
+QUERY = """
+PREFIX sk: <http://spec-kit.io/ontology#>
+PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
+SELECT ?label WHERE { ?f a sk:Feature ; rdfs:label ?label } ORDER BY ?label
+"""
+
+
+@pytest.fixture
+def ttl_files(tmp_path: Path) -> list[str]:
+    """Write two ontology files."""
+    first = tmp_path / "features.ttl"
+    second = tmp_path / "more.ttl"
+    first.write_text(FEATURES_TTL)
+    second.write_text(MORE_TTL)
+    return [str(first), str(second)]
+
+
+@pytest.fixture(autouse=True)
+def _fresh_graph_cache() -> None:
+    """Isolate the process-wide graph cache between tests."""
+    clear_graph_cache()
+
+
+def test_load_parses_once(ttl_files: list[str]) -> None:
+    """Second load of the same files reuses the parsed graph."""
+    cache = GraphCache()
+    first = cache.load(ttl_files)
+    second = cache.load(ttl_files)
+
+    assert first.graph is second.graph
+    assert first.triple_count == 4
+    assert cache.stats.misses == 1
+    assert cache.stats.hits == 1
+
+
+def test_load_is_order_independent(ttl_files: list[str]) -> None:
+    """Re-ordered inputs share the graph but keep their own content order."""
+    cache = GraphCache()
+    forward = cache.load(ttl_files)
+    backward = cache.load(list(reversed(ttl_files)))
+
+    assert forward.graph is backward.graph
+    assert forward.content == FEATURES_TTL + "\n" + MORE_TTL + "\n"
+    assert backward.content == MORE_TTL + "\n" + FEATURES_TTL + "\n"
+    assert forward.content_hash != backward.content_hash
+
+
+def test_edited_file_is_reparsed(ttl_files: list[str], tmp_path: Path) -> None:
+    """Changing a file's content produces a new graph."""
+    cache = GraphCache()
+    before = cache.load(ttl_files)
+
+    time.sleep(0.01)
+    (tmp_path / "more.ttl").write_text(MORE_TTL + '\nex:Extra rdfs:label "x" .\n')
+    after = cache.load(ttl_files)
+
+    assert after.graph is not before.graph
+    assert after.triple_count == 5
+
+
+def test_lru_bound(tmp_path: Path) -> None:
+    """Cache keeps at most max_entries graphs."""
+    cache = GraphCache(max_entries=2)
+    for i in range(3):
+        path = tmp_path / f"f{i}.ttl"
+        path.write_text(f"<http://example.org/s{i}> <http://example.org/p> {i} .\n")
+        cache.load([str(path)])
+
+    assert len(cache) == 2
+    assert cache.stats.evictions == 1
+
+
+def test_file_memo_keeps_latest_version(tmp_path: Path) -> None:
+    """Edits replace a file's memo entry instead of adding one per version."""
+    cache = GraphCache(max_entries=1)
+    path = tmp_path / "f.ttl"
+    for i in range(5):
+        path.write_text(f"<http://example.org/s> <http://example.org/p> {i} .\n")
+        cache.load([str(path)])
+
+    assert cache.memoized_files == 1
+    assert cache.stats.evictions == 4
+
+
+def test_same_stat_rewrite_is_reread(tmp_path: Path) -> None:
+    """A same-size edit that keeps the mtime is seen while the file is racy."""
+    cache = GraphCache()
+    path = tmp_path / "f.ttl"
+    path.write_text("<http://example.org/s> <http://example.org/p> 1 .\n")
+    before = cache.load([str(path)])
+    st = path.stat()
+
+    path.write_text("<http://example.org/s> <http://example.org/p> 2 .\n")
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+    after = cache.load([str(path)])
+
+    assert after.content_hash != before.content_hash
+    assert after.graph is not before.graph
+
+
+def test_old_files_are_not_reread(tmp_path: Path) -> None:
+    """Files last modified well before they were read are served from the memo."""
+    cache = GraphCache()
+    path = tmp_path / "f.ttl"
+    path.write_text("<http://example.org/s> <http://example.org/p> 1 .\n")
+    old = time.time_ns() - 60_000_000_000
+    os.utime(path, ns=(old, old))
+    before = cache.load([str(path)])
+
+    path.write_text("<http://example.org/s> <http://example.org/p> 2 .\n")
+    os.utime(path, ns=(old, old))
+
+    assert cache.load([str(path)]).content_hash == before.content_hash
+
+
+def test_parse_error_not_cached(tmp_path: Path) -> None:
+    """Invalid Turtle raises and leaves no cache entry behind."""
+    bad = tmp_path / "bad.ttl"
+    bad.write_text("this is not turtle ...")
+    cache = GraphCache()
+
+    with pytest.raises(Exception):  # noqa: B017, PT011
+        cache.load([str(bad)])
+    assert len(cache) == 0
+
+
+def test_stages_share_one_parse(ttl_files: list[str], tmp_path: Path) -> None:
+    """Rules over the same ontology run normalize/extract on one parsed graph."""
+    query_file = tmp_path / "q.rq"
+    query_file.write_text(QUERY)
+
+    results = []
+    for name in ("rule-a", "rule-b"):
+        config = TransformConfig(
+            name=name,
+            description="",
+            input_files=ttl_files,
+            schema_files=[],
+            sparql_query=str(query_file),
+            template="unused.tera",
+            output_file=str(tmp_path / f"{name}.md"),
+        )
+        normalize_result, parsed = _run_normalize(config)
+        assert normalize_result.success
+        assert normalize_result.output == parsed.content
+        results.append(_run_extract(config, parsed))
+
+    assert get_graph_cache().stats.misses == 1
+    assert get_graph_cache().stats.hits == 1
+    assert '"Authentication"' in results[0].output
+    assert results[0].output == results[1].output
+
+
+def test_normalize_reports_parse_error(tmp_path: Path) -> None:
+    """A Turtle syntax error fails μ₁ instead of escaping from μ₂."""
+    bad = tmp_path / "bad.ttl"
+    bad.write_text("@prefix ex: <http://example.org/> .\nex:a ex:b")
+    config = TransformConfig(
+        name="bad",
+        description="",
+        input_files=[str(bad)],
+        schema_files=[],
+        sparql_query="unused.rq",
+        template="unused.tera",
+        output_file=str(tmp_path / "out.md"),
+    )
+
+    result, parsed = _run_normalize(config)
+
+    assert not result.success
+    assert parsed is None
+    assert result.errors[0].startswith("RDF parse error")
@@ -0,0 +1,243 @@
+"""
+Unit Tests for the Shared Parallel Executor
+===========================================
+
+Tests for specify_cli.runtime.parallel and the APIs built on it
+(parallelize_computation, BatchProcessor, ParallelWorkflowExecutor).
+
+Tests verify:
+1. Thread, process and asyncio modes return ordered results
+2. Unordered streaming yields results as they complete
+3. Per-item errors, timeouts and cancellation
+4. Process chunk sizes are tuned from measured run times
+5. The public APIs run their work concurrently
+"""
+
+from __future__ import annotations
+
+import asyncio
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import CancelledError
+
+import pytest
+
+from specify_cli.runtime.advanced_workflows import ParallelWorkflowExecutor
+from specify_cli.runtime.optimization import BatchProcessor, parallelize_computation
+from specify_cli.runtime.parallel import ParallelExecutor
+
+
+def _square(x: int) -> int:
+    return x * x
+
+
+def _reciprocal(x: int) -> float:
+    return 1 / x
+
+
+def _sleep_then_return(x: float) -> float:
+    time.sleep(x)
+    return x
+
+
+async def _async_sleep_then_return(x: float) -> float:
+    await asyncio.sleep(x)
+    return x
+
+
+@pytest.mark.parametrize("mode", ["thread", "process", "asyncio"])
+def test_modes_ordered(mode: str) -> None:
+    """Every mode returns results in input order."""
+    executor = ParallelExecutor(mode, max_workers=2)
+
+    assert executor.map(_square, range(20)) == [x * x for x in range(20)]
+
+
+def test_unordered_streaming() -> None:
+    """Unordered results arrive in completion order."""
+    executor = ParallelExecutor("thread", max_workers=3)
+
+    values = [r.value for r in executor.imap(_sleep_then_return, [0.3, 0.1, 0.2], ordered=False)]
+
+    assert values == [0.1, 0.2, 0.3]
+
+
+def test_item_errors_are_isolated() -> None:
+    """A failing item is reported without failing its neighbours."""
+    executor = ParallelExecutor("process", max_workers=2, chunk_size=3)
+
+    results = list(executor.imap(_reciprocal, [1, 0, 2]))
+
+    assert [r.ok for r in results] == [True, False, True]
+    assert isinstance(results[1].error, ZeroDivisionError)
+    with pytest.raises(ZeroDivisionError):
+        executor.map(_reciprocal, [1, 0])
+
+
+@pytest.mark.parametrize(
+    ("mode", "handler"), [("thread", _sleep_then_return), ("asyncio", _async_sleep_then_return)]
+)
+def test_timeouts(mode: str, handler: object) -> None:
+    """Slow items time out; fast items still return."""
+    executor = ParallelExecutor(mode, max_workers=2, timeout=0.2)
+
+    start = time.perf_counter()
+    results = list(executor.imap(handler, [0.01, 2.0]))
+
+    assert results[0].value == 0.01
+    assert isinstance(results[1].error, TimeoutError)
+    assert time.perf_counter() - start < 1.5
+
+
+def test_cancel() -> None:
+    """cancel() reports the remaining items as cancelled."""
+    executor = ParallelExecutor("thread", max_workers=1)
+    seen = []
+
+    for result in executor.imap(_sleep_then_return, [0.05] * 10):
+        seen.append(result)
+        if len(seen) == 2:
+            executor.cancel()
+
+    assert len(seen) == 10
+    assert all(r.ok for r in seen[:2])
+    assert all(isinstance(r.error, CancelledError) for r in seen[3:])
+
+
+def test_process_chunks_are_tuned() -> None:
+    """Fast process-mode items are batched after the first probe."""
+    executor = ParallelExecutor("process", max_workers=2)
+    submitted: list[int] = []
+    original = executor._submit  # noqa: SLF001
+
+    def record(fn: object, chunk: list[int], pool: object) -> object:
+        submitted.append(len(chunk))
+        return original(fn, chunk, pool)
+
+    executor._submit = record  # noqa: SLF001
+    assert executor.map(_square, range(2000)) == [x * x for x in range(2000)]
+
+    assert submitted[0] == 1
+    assert max(submitted) > 1
+    assert len(submitted) < 2000
+
+
+def test_timed_out_threads_do_not_starve_later_calls() -> None:
+    """Abandoned thread work does not hold workers another call needs."""
+    release = threading.Event()
+    executor = ParallelExecutor("thread", max_workers=2, timeout=0.1)
+
+    assert all(isinstance(r.error, TimeoutError) for r in executor.imap(release.wait, [5, 5]))
+    start = time.perf_counter()
+    assert parallelize_computation([1], _square, max_workers=2, timeout=2) == [1]
+    assert time.perf_counter() - start < 1
+    release.set()
+
+
+def test_nested_calls_do_not_deadlock() -> None:
+    """A handler may run parallel work with the same worker count."""
+
+    def outer(x: int) -> list[int]:
+        return parallelize_computation([x, x + 1], _square, max_workers=2)
+
+    assert parallelize_computation([1, 3], outer, max_workers=2, timeout=5) == [[1, 4], [9, 16]]
+
+
+def test_timed_out_process_pool_is_retired() -> None:
+    """A process pool with timed-out work is replaced, not reused."""
+    executor = ParallelExecutor("process", max_workers=1, timeout=0.2)
+
+    assert isinstance(next(executor.imap(time.sleep, [30])).error, TimeoutError)
+    assert executor.map(_square, [2, 3]) == [4, 9]
+
+
+def test_process_timeout_does_not_break_concurrent_calls() -> None:
+    """Terminating timed-out work leaves another caller's process work running."""
+    outcome: list[object] = []
+
+    def untimed() -> None:
+        try:
+            outcome.append(
+                ParallelExecutor("process", max_workers=2).map(_sleep_then_return, [1.5, 1.5])
+            )
+        except Exception as e:  # Reported through the assertion below
+            outcome.append(e)
+
+    thread = threading.Thread(target=untimed)
+    thread.start()
+    time.sleep(0.3)
+    timed = ParallelExecutor("process", max_workers=2, timeout=0.2)
+    assert isinstance(next(timed.imap(time.sleep, [30])).error, TimeoutError)
+    thread.join(timeout=30)
+
+    assert outcome == [[1.5, 1.5]]
+
+
+def test_abandoned_threads_do_not_block_exit() -> None:
+    """The interpreter exits without waiting for timed-out threads."""
+    script = (
+        "import time\n"
+        "from specify_cli.runtime.parallel import ParallelExecutor\n"
+        "print(list(ParallelExecutor('thread', 1, timeout=0.1).imap(time.sleep, [60])))\n"
+    )
+
+    completed = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, timeout=30, check=False
+    )
+
+    assert completed.returncode == 0
+    assert "TimeoutError" in completed.stdout
+
+
+def test_invalid_mode() -> None:
+    """Mode is validated."""
+    with pytest.raises(ValueError, match="Unknown executor mode"):
+        ParallelExecutor("gpu")
+
+
+def test_parallelize_computation_is_concurrent() -> None:
+    """Four sleeping items on four workers overlap."""
+    start = time.perf_counter()
+    results = parallelize_computation([0.2] * 4, _sleep_then_return, max_workers=4)
+
+    assert results == [0.2] * 4
+    assert time.perf_counter() - start < 0.6
+
+
+def test_batch_processor() -> None:
+    """Batches run concurrently and results keep their order."""
+    processor = BatchProcessor(batch_size=3, max_workers=4)
+    for i in range(10):
+        processor.add_item(i)
+    active = []
+    peak = []
+    lock = threading.Lock()
+
+    def handler(batch: list[int]) -> list[int]:
+        with lock:
+            active.append(1)
+            peak.append(len(active))
+        time.sleep(0.05)
+        with lock:
+            active.pop()
+        return [x * 2 for x in batch]
+
+    assert processor.process(handler) == [x * 2 for x in range(10)]
+    assert max(peak) > 1
+
+
+def test_parallel_workflow_executor() -> None:
+    """Tasks overlap; failures are reported per task."""
+    executor = ParallelWorkflowExecutor(max_workers=3)
+    executor.add_task("a", lambda: _sleep_then_return(0.2))
+    executor.add_task("b", lambda: _sleep_then_return(0.2))
+    executor.add_task("c", lambda: 1 / 0)
+
+    start = time.perf_counter()
+    outcome = executor.execute()
+
+    assert time.perf_counter() - start < 0.4
+    assert outcome["results"] == {"a": 0.2, "b": 0.2}
+    assert "division" in outcome["errors"]["c"]
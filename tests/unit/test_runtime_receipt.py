@@ -494,6 +494,41 @@ def test_generate_receipt_partial_stages(
     assert receipt.stages[1].stage == "extract"
 
 
+def test_generate_receipt_precomputed_hashes(
+    sample_input_file: Path,
+    sample_output_file: Path,
+    sample_stage_outputs: dict[str, str],
+) -> None:
+    """Test generate_receipt() with stage hashes computed while streaming.
+
+    Parameters
+    ----------
+    sample_input_file : Path
+        Sample input file.
+    sample_output_file : Path
+        Sample output file.
+    sample_stage_outputs : dict[str, str]
+        Sample stage outputs.
+    """
+    expected = generate_receipt(sample_input_file, sample_output_file, sample_stage_outputs)
+    outputs = dict(sample_stage_outputs)
+    hashes = {
+        "emit": sha256_string(outputs.pop("emit")),
+        "canonicalize": sha256_string(outputs.pop("canonicalize")),
+    }
+
+    receipt = generate_receipt(
+        sample_input_file,
+        sample_output_file,
+        outputs,
+        stage_hashes=hashes,
+        output_hash=expected.output_hash,
+    )
+
+    assert receipt.stages == expected.stages
+    assert receipt.output_hash == expected.output_hash
+
+
 def test_generate_receipt_timestamp_format(
     sample_input_file: Path,
     sample_output_file: Path,
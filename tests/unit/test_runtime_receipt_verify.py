@@ -0,0 +1,157 @@
+"""
+Unit Tests for Batch Receipt Verification
+=========================================
+
+Tests for specify_cli.runtime.receipt_verify.
+
+Tests verify:
+1. mmap hashing matches sha256_file (including empty files)
+2. A tree of valid receipts verifies; drift, missing files and broken
+   receipts are reported
+3. The hash database skips unchanged files on the next run
+4. `specify ggen verify` exits non-zero on drift
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from typer.testing import CliRunner
+
+from specify_cli.app import app
+from specify_cli.runtime import receipt_verify
+from specify_cli.runtime.receipt import generate_receipt, sha256_file
+from specify_cli.runtime.receipt_verify import (
+    HashDatabase,
+    find_receipts,
+    hash_file_mmap,
+    verify_receipts,
+    verify_tree,
+)
+
+
+def _age(path: Path, seconds: float = 60) -> None:
+    """Move a file's mtime into the past (outside the racy window)."""
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+
+@pytest.fixture
+def tree(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Three generated files with receipts (relative paths) sharing one input."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "spec.ttl").write_text("@prefix : <http://example.com/> .\n")
+    for name in ("a", "b", "c"):
+        out = tmp_path / "gen" / f"{name}.md"
+        out.parent.mkdir(exist_ok=True)
+        out.write_text(f"# {name}\n")
+        receipt = generate_receipt(tmp_path / "spec.ttl", out.relative_to(tmp_path), {"emit": name})
+        receipt.input_file = "spec.ttl"
+        (out.parent / f"{name}.md.receipt.json").write_text(receipt.to_json())
+    for path in [tmp_path / "spec.ttl", *(tmp_path / "gen").glob("*.md")]:
+        _age(path)
+    return tmp_path
+
+
+def test_hash_file_mmap(tmp_path: Path) -> None:
+    """mmap hashing agrees with the streaming hash."""
+    data = tmp_path / "data.bin"
+    data.write_bytes(os.urandom(300_000))
+    empty = tmp_path / "empty"
+    empty.write_bytes(b"")
+
+    assert hash_file_mmap(data) == sha256_file(data)
+    assert hash_file_mmap(empty) == sha256_file(empty)
+
+
+def test_valid_tree(tree: Path) -> None:
+    """All receipts verify; the shared input is hashed once."""
+    report = verify_tree(tree, db_path=None)
+
+    assert report.success
+    assert report.summary()["ok"] == 3
+    assert report.files_hashed == 4
+    assert len(find_receipts(tree)) == 3
+
+
+def test_drift_missing_and_invalid(tree: Path) -> None:
+    """Each failure kind is reported separately."""
+    (tree / "gen" / "a.md").write_text("# edited\n")
+    (tree / "gen" / "b.md").unlink()
+    (tree / "gen" / "c.md.receipt.json").write_text("{not json")
+
+    report = verify_tree(tree, db_path=None)
+    by_name = {Path(c.receipt_path).name: c for c in report.checks}
+
+    assert not report.success
+    assert by_name["a.md.receipt.json"].status == "drift"
+    assert by_name["a.md.receipt.json"].changed == ["output"]
+    assert by_name["b.md.receipt.json"].status == "missing"
+    assert by_name["c.md.receipt.json"].status == "invalid"
+    assert report.to_dict()["summary"]["drift"] == 1
+
+
+def test_monorepo_receipts_resolve_against_their_project(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Receipts written inside a project verify from the project or the monorepo root."""
+    for project in ("proj-a", "proj-b"):
+        root = tmp_path / project
+        (root / "gen").mkdir(parents=True)
+        (root / "ggen.toml").write_text('[project]\nname = "p"\n')
+        (root / "spec.ttl").write_text(f"# {project}\n")
+        (root / "gen" / "out.md").write_text(f"# {project}\n")
+        monkeypatch.chdir(root)
+        receipt = generate_receipt(Path("spec.ttl"), Path("gen/out.md"), {"emit": project})
+        (root / "gen" / "out.md.receipt.json").write_text(receipt.to_json())
+    monkeypatch.chdir(tmp_path)
+
+    from_root = verify_tree(tmp_path, db_path=None)
+    from_project = verify_tree(tmp_path / "proj-a", db_path=None)
+
+    assert from_root.summary()["ok"] == 2, from_root.to_dict()
+    assert from_project.success
+
+
+def test_hash_database_skips_unchanged(tree: Path) -> None:
+    """The second run hashes only the file that changed."""
+    first = verify_tree(tree)
+    assert first.files_hashed == 4
+    assert (tree / ".ggen" / "hashes.db").exists()
+
+    (tree / "gen" / "a.md").write_text("# edited\n")
+    _age(tree / "gen" / "a.md", 30)
+    with patch.object(receipt_verify, "hash_file_mmap", wraps=hash_file_mmap) as hashed:
+        second = verify_tree(tree)
+
+    assert second.cache_hits == 3
+    assert [call.args[0].name for call in hashed.call_args_list] == ["a.md"]
+    assert [c.status for c in second.checks] == ["drift", "ok", "ok"]
+
+
+def test_racy_files_not_stored(tree: Path, tmp_path: Path) -> None:
+    """Freshly modified files are hashed but not recorded."""
+    (tree / "gen" / "a.md").write_text("# a\n")  # mtime = now
+    db = HashDatabase(tmp_path / "db" / "hashes.db")
+
+    verify_receipts(find_receipts(tree), db=db, base_dir=tree)
+
+    assert str(tree / "gen" / "a.md") not in db.load()
+    assert str(tree / "spec.ttl") in db.load()
+
+
+def test_cli_exit_codes(tree: Path) -> None:
+    """`specify ggen verify` fails on drift."""
+    runner = CliRunner()
+
+    ok = runner.invoke(app, ["ggen", "verify", str(tree), "--json"])
+    assert ok.exit_code == 0, ok.output
+
+    (tree / "gen" / "b.md").write_text("# drifted\n")
+    drift = runner.invoke(app, ["ggen", "verify", str(tree)])
+    assert drift.exit_code == 1
+    assert "drift" in drift.output
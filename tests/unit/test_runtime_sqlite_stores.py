@@ -0,0 +1,179 @@
+"""Tests for pooled, write-behind SQLite persistence in the runtime stores."""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+
+import pytest
+
+from specify_cli.runtime.database import DatabaseStore, ExecutionRecord, WorkflowRecord
+from specify_cli.runtime.sqlite_pool import SQLitePool, WriteBehindQueue
+from specify_cli.runtime.state import ExecutionState, StateStore
+
+
+def _state(i, phase="build", status="completed"):
+    return ExecutionState(
+        execution_id=f"e{i}",
+        phase=phase,
+        status=status,
+        start_time=f"2026-01-01T00:00:{i % 60:02d}",
+        duration=float(i),
+        input_data={"i": i},
+        errors=["boom"] if status == "failed" else [],
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = StateStore(tmp_path / "executions.db", write_behind=True)
+    yield store
+    store.close()
+
+
+def test_pool_reuses_one_wal_connection_per_thread(tmp_path):
+    pool = SQLitePool(tmp_path / "pool.db")
+    conn = pool.connection()
+    other = []
+    thread = threading.Thread(target=lambda: other.append(pool.connection()))
+    thread.start()
+    thread.join()
+
+    assert pool.connection() is conn
+    assert other[0] is not conn
+    assert conn.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+    assert conn.execute("PRAGMA synchronous").fetchone() == (1,)  # NORMAL
+    pool.close()
+
+
+def test_write_behind_group_commits(tmp_path):
+    pool = SQLitePool(tmp_path / "queue.db")
+    with pool.transaction() as conn:
+        conn.execute("CREATE TABLE t (a INTEGER PRIMARY KEY)")
+    writer = WriteBehindQueue(pool, "INSERT INTO t (a) VALUES (?)", batch_size=100)
+    commits = []
+    real_transaction = pool.transaction
+
+    def counting_transaction():
+        commits.append(1)
+        return real_transaction()
+
+    pool.transaction = counting_transaction
+    for i in range(1000):
+        writer.put((i,))
+    writer.flush()
+
+    assert writer.pending == 0
+    assert pool.connection().execute("SELECT count(*) FROM t").fetchone() == (1000,)
+    assert 10 <= len(commits) < 1000
+    writer.close()
+    pool.close()
+
+
+def test_write_behind_keeps_good_rows_and_reports_failures(tmp_path):
+    pool = SQLitePool(tmp_path / "queue.db")
+    with pool.transaction() as conn:
+        conn.execute("CREATE TABLE t (a INTEGER PRIMARY KEY)")
+    writer = WriteBehindQueue(pool, "INSERT INTO t (a) VALUES (?)")
+
+    for a in (1, 2, 1, 3):
+        writer.put((a,))
+    with pytest.raises(sqlite3.IntegrityError):
+        writer.flush()
+    writer.flush()  # The error is reported once
+
+    assert pool.connection().execute("SELECT a FROM t ORDER BY a").fetchall() == [(1,), (2,), (3,)]
+    writer.close()
+    with pytest.raises(RuntimeError, match="closed"):
+        writer.put((4,))
+    pool.close()
+
+
+def test_state_store_reads_see_queued_writes(store):
+    for i in range(5):
+        store.save_execution(_state(i))
+    store.save_execution(_state(2, status="failed"))
+
+    assert store.get_execution("e2").status == "failed"
+    assert store.get_execution("missing") is None
+    assert store.get_latest_execution().execution_id == "e2"
+    history = store.get_execution_history(limit=3)
+    assert [e.execution_id for e in history] == ["e2", "e4", "e3"]
+
+
+def test_phase_queries_use_indexes(store):
+    for i in range(20):
+        store.save_execution(_state(i, phase="build" if i % 2 else "test"))
+
+    assert [e.execution_id for e in store.get_phase_executions("build")][:3] == [
+        "e19",
+        "e17",
+        "e15",
+    ]
+    conn = store._pool.connection()  # noqa: SLF001
+    plan = conn.execute(
+        "EXPLAIN QUERY PLAN SELECT * FROM executions WHERE phase = ? "
+        "ORDER BY created_at DESC, rowid DESC",
+        ("build",),
+    ).fetchall()
+    assert "idx_executions_phase" in str(plan)
+    assert "TEMP B-TREE" not in str(plan)
+
+
+def test_state_store_persists_across_instances(tmp_path):
+    store = StateStore(tmp_path / "executions.db", write_behind=True)
+    store.save_execution(_state(1))
+    store.close()
+
+    reopened = StateStore(tmp_path / "executions.db")
+    reopened.save_execution(_state(2))
+
+    assert [e.execution_id for e in reopened.get_phase_executions("build")] == ["e2", "e1"]
+    reopened.close()
+
+
+def test_concurrent_saves(store):
+    def save(offset):
+        for i in range(200):
+            store.save_execution(_state(offset + i))
+
+    threads = [threading.Thread(target=save, args=(n * 1000,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(store.get_execution_history(limit=10_000)) == 800
+
+
+def test_database_store_round_trip(tmp_path):
+    db = DatabaseStore(tmp_path / "database.db")
+    db.save_workflow(WorkflowRecord("w1", "build", {"steps": 2}, "2026-01-01"))
+    for i, status in enumerate(["completed", "failed", "completed"]):
+        db.save_execution(
+            ExecutionRecord(f"x{i}", "w1", status, {"i": i}, f"2026-01-0{i + 1}", 2.0)
+        )
+    artifact = db.save_artifact("x0", "log", "ok")
+
+    assert db.get_workflow("w1").config == {"steps": 2}
+    assert [e.execution_id for e in db.get_workflow_executions("w1")] == ["x2", "x1", "x0"]
+    assert db.get_execution_artifacts("x0") == {"log": "ok"}
+    assert len(artifact) == 8
+    stats = db.get_workflow_statistics("w1")
+    assert (stats["total_executions"], stats["successful"], stats["failed"]) == (3, 2, 1)
+    assert [w.workflow_id for w in db.list_workflows()] == ["w1"]
+
+    with pytest.raises(sqlite3.IntegrityError):
+        db.save_execution(ExecutionRecord("x0", "w1", "completed", {}, "2026-01-09"))
+    db.close()
+
+
+def test_database_store_write_behind_reports_rejected_rows(tmp_path):
+    db = DatabaseStore(tmp_path / "database.db", write_behind=True)
+    db.save_execution(ExecutionRecord("x0", "w1", "completed", {}, "2026-01-01"))
+    db.save_execution(ExecutionRecord("x0", "w1", "failed", {}, "2026-01-02"))
+
+    with pytest.raises(sqlite3.IntegrityError):
+        db.flush()
+    assert [e.status for e in db.get_workflow_executions("w1")] == ["completed"]
+    db.close()
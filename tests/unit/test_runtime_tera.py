@@ -0,0 +1,140 @@
+"""
+Unit Tests for the Shared Tera Renderer
+=======================================
+
+Tests for specify_cli.runtime.tera.
+
+Tests verify:
+1. Templates compile once and recompile only when their mtime changes
+2. Includes resolve relative to the including template and compile once
+3. The on-disk bytecode cache is written
+4. Tera-style filter keyword arguments work
+5. Streaming yields the same text as rendering
+"""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING, Any
+from unittest.mock import patch
+
+import pytest
+
+from specify_cli.runtime.tera import TeraRenderer, get_renderer
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture
+def renderer() -> TeraRenderer:
+    """Fresh renderer."""
+    return TeraRenderer()
+
+
+@pytest.fixture
+def templates(tmp_path: Path) -> Path:
+    """Two rule templates sharing a partial in a sub-directory."""
+    (tmp_path / "partials").mkdir()
+    (tmp_path / "partials" / "footer.tera").write_text("-- {{ project }} --\n")
+    (tmp_path / "a.tera").write_text('A\n{% include "partials/footer.tera" %}')
+    (tmp_path / "b.tera").write_text('B\n{% include "partials/footer.tera" %}')
+    return tmp_path
+
+
+def _count_compiles(renderer: TeraRenderer) -> Any:
+    """Spy on template compilation."""
+    return patch.object(renderer.env, "compile", wraps=renderer.env.compile)
+
+
+def test_file_compiled_once(renderer: TeraRenderer, templates: Path) -> None:
+    """Rendering the same file again reuses the compiled template."""
+    with _count_compiles(renderer) as compile_:
+        first = renderer.render_file(templates / "a.tera", {"project": "x"})
+        second = renderer.render_file(templates / "a.tera", {"project": "y"})
+
+    assert first == "A\n-- x --"
+    assert second == "A\n-- y --"
+    assert compile_.call_count == 2  # a.tera + footer.tera
+
+
+def test_shared_partial_compiled_once(renderer: TeraRenderer, templates: Path) -> None:
+    """Two templates including one partial compile it once."""
+    with _count_compiles(renderer) as compile_:
+        renderer.render_file(templates / "a.tera", {"project": "x"})
+        renderer.render_file(templates / "b.tera", {"project": "x"})
+
+    assert compile_.call_count == 3
+
+
+def test_edited_file_recompiled(renderer: TeraRenderer, templates: Path) -> None:
+    """A changed mtime invalidates the compiled template."""
+    path = templates / "a.tera"
+    renderer.render_file(path, {"project": "x"})
+
+    path.write_text("A2\n")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert renderer.render_file(path, {"project": "x"}) == "A2"
+
+
+def test_stream_file(renderer: TeraRenderer, templates: Path) -> None:
+    """Streamed chunks join to the rendered text."""
+    chunks = list(renderer.stream_file(templates / "a.tera", {"project": "x"}))
+
+    assert len(chunks) > 1
+    assert "".join(chunks) == renderer.render_file(templates / "a.tera", {"project": "x"})
+
+
+def test_string_compiled_once(renderer: TeraRenderer) -> None:
+    """Identical sources share one compiled template."""
+    with _count_compiles(renderer) as compile_:
+        for i in range(5):
+            assert renderer.render_string("{{ n }}", {"n": i}) == str(i)
+
+    assert compile_.call_count == 1
+
+
+def test_bytecode_cache(templates: Path, tmp_path: Path) -> None:
+    """Compiled bytecode is persisted when a cache directory is given."""
+    cache_dir = tmp_path / "bytecode"
+    renderer = TeraRenderer(bytecode_cache_dir=cache_dir)
+    renderer.render_file(templates / "a.tera", {"project": "x"})
+
+    assert len(list(cache_dir.iterdir())) == 2
+
+    # A new renderer (e.g. another process) loads bytecode instead of compiling
+    fresh = TeraRenderer(bytecode_cache_dir=cache_dir)
+    with _count_compiles(fresh) as compile_:
+        assert fresh.render_file(templates / "a.tera", {"project": "x"}) == "A\n-- x --"
+    compile_.assert_not_called()
+
+
+def test_tera_keyword_filters(renderer: TeraRenderer) -> None:
+    """Tera's keyword spellings of default/replace/filter are accepted."""
+    source = (
+        '{{ missing | default(value="none") }} '
+        "{{ name | replace(from='-', to='_') }} "
+        '{{ items | filter(attribute="on", value=true) | length }}'
+    )
+    data = {
+        "missing": None,
+        "name": "a-b",
+        "items": [{"on": True}, {"on": False}, {"on": True}],
+    }
+
+    assert renderer.render_string(source, data) == "none a_b 2"
+
+
+def test_errors_raise_value_error(renderer: TeraRenderer, tmp_path: Path) -> None:
+    """Missing templates and undefined variables surface as ValueError."""
+    with pytest.raises(ValueError, match="rendering failed"):
+        renderer.render_file(tmp_path / "missing.tera", {})
+    with pytest.raises(ValueError, match="rendering failed"):
+        renderer.render_string("{{ nope }}", {})
+
+
+def test_process_wide_renderer() -> None:
+    """get_renderer returns one shared instance."""
+    assert get_renderer() is get_renderer()
@@ -0,0 +1,168 @@
+"""
+Unit Tests for the Worker Pool
+==============================
+
+Tests for specify_cli.runtime.workers.
+
+Tests verify:
+1. Submitted work runs concurrently and resolves futures
+2. Priority order, failures and cancellation
+3. Backpressure on a bounded global queue
+4. Work stealing between workers
+5. Pool status (queue depth, utilization, latency percentiles)
+6. Process mode
+"""
+
+from __future__ import annotations
+
+import operator
+import threading
+import time
+from queue import Full
+
+import pytest
+
+from specify_cli.runtime.workers import Worker, WorkerPool, WorkItem
+
+
+def test_runs_in_parallel() -> None:
+    """Four sleeping items on four workers overlap."""
+    with WorkerPool(pool_size=4) as pool:
+        start = time.perf_counter()
+        futures = [pool.submit_work(time.sleep, 0.2) for _ in range(4)]
+        for future in futures:
+            future.result(timeout=5)
+        elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.6
+
+
+def test_futures_and_results() -> None:
+    """Futures carry results and exceptions; get_result still works."""
+    with WorkerPool(pool_size=2) as pool:
+        ok = pool.submit_work(operator.add, 2, 3)
+        failed = pool.submit_work(operator.truediv, 1, 0)
+
+        assert ok.result(timeout=5) == 5
+        with pytest.raises(ZeroDivisionError):
+            failed.result(timeout=5)
+        assert pool.execute_batch(timeout=5) >= 0
+        assert pool.get_result(ok.item_id) == 5
+        assert pool.completed_items[failed.item_id].status == "failed"
+
+
+def test_priority_order() -> None:
+    """A single worker runs queued items highest priority first."""
+    order: list[int] = []
+    gate = threading.Event()
+
+    with WorkerPool(pool_size=1) as pool:
+        pool.submit_work(gate.wait, 5)
+        time.sleep(0.05)  # Worker is now blocked on the gate
+        for priority in (1, 5, 3):
+            pool.submit_work(order.append, priority, priority=priority)
+        gate.set()
+        pool.execute_batch(timeout=5)
+
+    assert order == [5, 3, 1]
+
+
+def test_backpressure() -> None:
+    """submit_work blocks and then raises queue.Full on a full queue."""
+    gate = threading.Event()
+    pool = WorkerPool(pool_size=1, max_queue_size=1)
+    try:
+        pool.submit_work(gate.wait, 5)
+        time.sleep(0.05)
+        pool.submit_work(gate.wait, 5)  # Fills the global queue
+
+        start = time.perf_counter()
+        with pytest.raises(Full):
+            pool.submit_work(gate.wait, 5, queue_timeout=0.1)
+        assert time.perf_counter() - start >= 0.1
+    finally:
+        gate.set()
+        pool.shutdown_pool()
+
+
+def test_timeout_kwarg_reaches_task() -> None:
+    """A task's own ``timeout=`` keyword is not taken as the queue wait."""
+
+    def handler(*, timeout: float) -> float:
+        return timeout
+
+    with WorkerPool(pool_size=1, max_queue_size=1) as pool:
+        assert pool.submit_work(handler, timeout=5).result(timeout=5) == 5
+
+
+def test_work_stealing() -> None:
+    """An idle worker steals from a peer's deque."""
+    pool = WorkerPool(pool_size=2)
+    donor, thief = pool.workers.values()
+    for i in range(6):
+        donor.enqueue_work(WorkItem(item_id=str(i), task_handler=int, priority=i))
+
+    assert pool._steal(thief)  # noqa: SLF001
+    assert len(donor) == 3
+    assert len(thief) == 3
+    assert thief.metrics.items_stolen == 3
+    # The stolen half is the highest-priority half
+    assert sorted(entry[2].priority for entry in thief.work_queue) == [3, 4, 5]
+
+
+def test_worker_process_work() -> None:
+    """A worker records failures without raising."""
+    worker = Worker("w")
+    worker.enqueue_work(WorkItem(item_id="x", task_handler=operator.truediv, args=(1, 0)))
+
+    item = worker.process_work()
+
+    assert item is not None
+    assert item.status == "failed"
+    assert worker.get_metrics().items_failed == 1
+    assert worker.process_work() is None
+
+
+def test_pool_status() -> None:
+    """Status reports depth, utilization and latency percentiles."""
+    with WorkerPool(pool_size=2) as pool:
+        for _ in range(10):
+            pool.submit_work(time.sleep, 0.01)
+        pool.execute_batch(timeout=5)
+        status = pool.get_pool_status()
+
+    assert status["completed_items"] == 10
+    assert status["queued_items"] == 0
+    assert status["pending_items"] == 0
+    assert 0 < status["utilization"] <= 1
+    assert 0.01 <= status["latency_p50"] <= status["latency_p95"] <= status["latency_p99"]
+
+
+def test_shutdown_cancels_pending() -> None:
+    """Queued work is cancelled and later submissions are rejected."""
+    gate = threading.Event()
+    pool = WorkerPool(pool_size=1)
+    pool.submit_work(gate.wait, 5)
+    time.sleep(0.05)
+    queued = pool.submit_work(int, "1")
+
+    pool.shutdown_pool(wait=False, cancel_pending=True)
+    gate.set()
+
+    assert queued.cancelled()
+    with pytest.raises(RuntimeError, match="after shutdown"):
+        pool.submit_work(int, "1")
+
+
+def test_invalid_mode() -> None:
+    """Execution mode is validated."""
+    with pytest.raises(ValueError, match="Unknown worker mode"):
+        WorkerPool(mode="fiber")
+
+
+def test_process_mode() -> None:
+    """Handlers run in worker processes."""
+    with WorkerPool(pool_size=2, mode="process") as pool:
+        futures = [pool.submit_work(pow, 2, n) for n in range(5)]
+
+        assert [f.result(timeout=30) for f in futures] == [1, 2, 4, 8, 16]
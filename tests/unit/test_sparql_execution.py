@@ -146,6 +146,20 @@ def test_execute_sparql_invalid_query(sample_rdf: str) -> None:
         _execute_sparql(sample_rdf, invalid_query)
 
 
+@pytest.mark.unit
+def test_execute_sparql_data_prefixes(sample_rdf: str) -> None:
+    """
+    Test _execute_sparql() with a prefix declared only in the data.
+
+    Verifies:
+    - The query may use prefixes bound by the RDF without redeclaring them
+    """
+    result = _execute_sparql(sample_rdf, "SELECT ?f WHERE { ?f a sk:Feature } ORDER BY ?f")
+
+    assert result["count"] == 2
+    assert result["results"][0]["f"] == "http://spec-kit.io/ontology#Feature1"
+
+
 @pytest.mark.unit
 def test_execute_sparql_invalid_rdf() -> None:
     """
@@ -0,0 +1,172 @@
+"""
+Unit Tests for the SPARQL Worker Pool
+=====================================
+
+Tests for specify_cli.runtime.sparql_pool.
+
+Tests verify:
+1. Queries run in worker processes and return μ₂-shaped results
+2. Rows stream back in chunks
+3. A timed-out query kills its worker and the pool recovers
+4. Query errors and memory-limit failures surface as SPARQLWorkerError
+5. The μ pipeline's EXTRACT stage runs through the pool
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+from typing import TYPE_CHECKING
+
+import pytest
+
+from specify_cli.ops.ggen_timeout import SPARQLTimeoutError
+from specify_cli.ops.transform import TransformConfig
+from specify_cli.runtime.ggen import run_transform
+from specify_cli.runtime.sparql_pool import SPARQLWorkerError, SPARQLWorkerPool
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+ROWS = 300
+
+ROWS_QUERY = "PREFIX ex: <http://ex.org/> SELECT ?s ?o WHERE { ?s ex:p ?o } ORDER BY ?o"
+
+# Sorting the cartesian product of all triples materialises ROWS² rows
+HEAVY_QUERY = (
+    "PREFIX ex: <http://ex.org/> SELECT ?a ?b WHERE { ?a ex:p ?x . ?b ex:p ?y } ORDER BY ?x ?y"
+)
+
+# Cartesian product of all triples: far slower than any test timeout
+SLOW_QUERY = (
+    "PREFIX ex: <http://ex.org/> SELECT (COUNT(*) AS ?n) "
+    "WHERE { ?a ex:p ?x . ?b ex:p ?y . ?c ex:p ?z }"
+)
+
+
+@pytest.fixture(scope="module")
+def ontology(tmp_path_factory: pytest.TempPathFactory) -> str:
+    """Ontology with ROWS triples."""
+    path = tmp_path_factory.mktemp("sparql_pool") / "data.ttl"
+    triples = "\n".join(f"ex:s{i} ex:p {i} ." for i in range(ROWS))
+    path.write_text(f"@prefix ex: <http://ex.org/> .\n{triples}\n")
+    return str(path)
+
+
+@pytest.fixture(scope="module")
+def pool() -> Iterator[SPARQLWorkerPool]:
+    """One pool for the module (spawning workers takes a few seconds)."""
+    with SPARQLWorkerPool(size=1, timeout=30, chunk_size=100) as shared:
+        yield shared
+
+
+def test_execute(pool: SPARQLWorkerPool, ontology: str) -> None:
+    """Results come back as {"results", "count"} with Python values."""
+    result = pool.execute([ontology], ROWS_QUERY)
+
+    assert result["count"] == ROWS
+    assert result["results"][0] == {"s": "http://ex.org/s0", "o": 0}
+
+
+def test_data_prefixes(pool: SPARQLWorkerPool, ontology: str) -> None:
+    """Workers resolve prefixes declared only in the ontology."""
+    result = pool.execute([ontology], "SELECT ?s WHERE { ?s ex:p 0 }")
+
+    assert result["results"] == [{"s": "http://ex.org/s0"}]
+
+
+def test_stream_chunks(pool: SPARQLWorkerPool, ontology: str) -> None:
+    """Rows arrive in chunk_size chunks and the variables are known."""
+    stream = pool.stream([ontology], ROWS_QUERY, chunk_size=120)
+    sizes = [len(chunk) for chunk in stream]
+
+    assert sizes == [120, 120, 60]
+    assert stream.vars == ["s", "o"]
+    assert stream.count == ROWS
+
+
+def test_stream_closed_early(pool: SPARQLWorkerPool, ontology: str) -> None:
+    """Abandoning a stream leaves the pool usable."""
+    stream = pool.stream([ontology], ROWS_QUERY, chunk_size=10)
+    assert len(next(iter(stream))) == 10
+    stream.close()
+
+    assert pool.execute([ontology], ROWS_QUERY)["count"] == ROWS
+
+
+def test_timeout_kills_worker(pool: SPARQLWorkerPool, ontology: str) -> None:
+    """A runaway query is killed and its worker replaced."""
+    respawns = pool.stats.respawns
+
+    with pytest.raises(SPARQLTimeoutError):
+        pool.execute([ontology], SLOW_QUERY, timeout=1.0)
+
+    assert pool.stats.respawns == respawns + 1
+    assert pool.execute([ontology], ROWS_QUERY)["count"] == ROWS
+
+
+def test_query_error(pool: SPARQLWorkerPool, ontology: str) -> None:
+    """Worker-side errors are re-raised with their type."""
+    with pytest.raises(SPARQLWorkerError) as excinfo:
+        pool.execute([ontology], "SELECT nonsense {")
+
+    assert excinfo.value.error_type
+    assert pool.execute([ontology], ROWS_QUERY)["count"] == ROWS
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="RLIMIT_AS is enforced on Linux")
+def test_memory_limit(pool: SPARQLWorkerPool, ontology: str) -> None:
+    """A query over its memory limit fails and the worker is replaced."""
+    respawns = pool.stats.respawns
+
+    with pytest.raises(SPARQLWorkerError):
+        pool.execute([ontology], HEAVY_QUERY, memory_limit_mb=1)
+
+    assert pool.stats.respawns == respawns + 1
+    assert pool.execute([ontology], ROWS_QUERY)["count"] == ROWS
+
+
+def _rule(tmp_path: Path, ontology: str, query: str, name: str) -> TransformConfig:
+    (tmp_path / f"{name}.rq").write_text(query)
+    (tmp_path / "rows.tera").write_text("# Rows\n")
+    return TransformConfig(
+        name=name,
+        description="",
+        input_files=[ontology],
+        schema_files=[],
+        sparql_query=str(tmp_path / f"{name}.rq"),
+        template=str(tmp_path / "rows.tera"),
+        output_file=str(tmp_path / f"{name}.md"),
+    )
+
+
+def test_transform_extracts_through_pool(
+    pool: SPARQLWorkerPool, ontology: str, tmp_path: Path
+) -> None:
+    """Pooled and in-process EXTRACT produce identical stage output."""
+    config = _rule(tmp_path, ontology, ROWS_QUERY, "rows")
+
+    local = run_transform(config)
+    pooled = run_transform(config, sparql_pool=pool)
+
+    assert pooled.success
+    assert pooled.stage_results["extract"].output == local.stage_results["extract"].output
+    assert pooled.output_hash == local.output_hash
+    assert json.loads(pooled.stage_results["extract"].output)["count"] == ROWS
+
+
+def test_transform_pool_timeout_fails_extract(
+    pool: SPARQLWorkerPool, ontology: str, tmp_path: Path
+) -> None:
+    """A runaway pipeline query is killed and fails only its stage."""
+    config = _rule(tmp_path, ontology, SLOW_QUERY, "slow")
+    pool.timeout, timeout = 1.0, pool.timeout
+    try:
+        result = run_transform(config, sparql_pool=pool)
+    finally:
+        pool.timeout = timeout
+
+    assert not result.success
+    assert "timed out" in result.stage_results["extract"].errors[0]
+    assert pool.execute([ontology], ROWS_QUERY)["count"] == ROWS